@@ -0,0 +1,111 @@
+"""Promote the refresh-token version to a dedicated user column.
+
+Revision ID: 38ff9bb67437
+Revises: e2f6a8c1d403
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "38ff9bb67437"
+down_revision: Union[str, None] = "e2f6a8c1d403"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+METADATA_KEY = "refresh_token_version"
+BATCH_SIZE = 1000
+
+user_table = sa.table(
+    "user",
+    sa.column("id", sa.Uuid()),
+    sa.column("primary_meta_data", sa.JSON()),
+    sa.column("refresh_token_version", sa.Integer()),
+)
+
+
+def _metadata_version(metadata: dict[str, Any]) -> int:
+    try:
+        return max(0, int(metadata.get(METADATA_KEY, 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _user_batches(connection):
+    last_id = None
+    while True:
+        query = (
+            sa.select(
+                user_table.c.id,
+                user_table.c.primary_meta_data,
+                user_table.c.refresh_token_version,
+            )
+            .order_by(user_table.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(user_table.c.id > last_id)
+        rows = connection.execute(query).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column(
+            "refresh_token_version",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+
+    connection = op.get_bind()
+    statement = (
+        user_table.update()
+        .where(user_table.c.id == sa.bindparam("row_id"))
+        .values(
+            refresh_token_version=sa.bindparam("version"),
+            primary_meta_data=sa.bindparam("metadata"),
+        )
+    )
+    for rows in _user_batches(connection):
+        parameters = []
+        for row in rows:
+            metadata = dict(row.primary_meta_data or {})
+            if METADATA_KEY not in metadata:
+                continue
+            version = _metadata_version(metadata)
+            metadata.pop(METADATA_KEY)
+            parameters.append(
+                {"row_id": row.id, "version": version, "metadata": metadata}
+            )
+        if parameters:
+            connection.execute(statement, parameters)
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    statement = (
+        user_table.update()
+        .where(user_table.c.id == sa.bindparam("row_id"))
+        .values(primary_meta_data=sa.bindparam("metadata"))
+    )
+    for rows in _user_batches(connection):
+        parameters = []
+        for row in rows:
+            metadata = dict(row.primary_meta_data or {})
+            metadata[METADATA_KEY] = row.refresh_token_version
+            parameters.append({"row_id": row.id, "metadata": metadata})
+        connection.execute(statement, parameters)
+
+    with op.batch_alter_table("user") as batch_op:
+        batch_op.drop_column("refresh_token_version")
@@ -0,0 +1,70 @@
+"""Add the access-token revocation log used by stateless verification.
+
+Revision ID: 5b1d9c3e7a20
+Revises: 38ff9bb67437
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "5b1d9c3e7a20"
+down_revision: Union[str, None] = "38ff9bb67437"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _audit_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "_created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("_closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("primary_meta_data", sa.JSON(), nullable=False),
+        sa.Column("secondary_meta_data", sa.JSON(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_revocation",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("refresh_token_version", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        *_audit_columns(),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_auth_revocation_created",
+        "auth_revocation",
+        ["_created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_auth_revocation_expires",
+        "auth_revocation",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_revocation_expires", table_name="auth_revocation")
+    op.drop_index("ix_auth_revocation_created", table_name="auth_revocation")
+    op.drop_table("auth_revocation")
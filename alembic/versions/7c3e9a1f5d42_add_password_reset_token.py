@@ -0,0 +1,173 @@
+"""Move password-reset tokens out of user metadata into an indexed table.
+
+Revision ID: 7c3e9a1f5d42
+Revises: 5b1d9c3e7a20
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Sequence, Union
+from uuid import uuid4
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "7c3e9a1f5d42"
+down_revision: Union[str, None] = "5b1d9c3e7a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+METADATA_KEY = "password_reset"
+METHODS = {"otp", "magic_link"}
+BATCH_SIZE = 1000
+
+user_table = sa.table(
+    "user",
+    sa.column("id", sa.Uuid()),
+    sa.column("primary_meta_data", sa.JSON()),
+)
+token_table = sa.table(
+    "password_reset_token",
+    sa.column("id", sa.Uuid()),
+    sa.column("user_id", sa.Uuid()),
+    sa.column("method", sa.String()),
+    sa.column("token_hash", sa.String()),
+    sa.column("expires_at", sa.DateTime(timezone=True)),
+    sa.column("primary_meta_data", sa.JSON()),
+    sa.column("secondary_meta_data", sa.JSON()),
+)
+
+
+def _audit_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "_created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("_closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("primary_meta_data", sa.JSON(), nullable=False),
+        sa.Column("secondary_meta_data", sa.JSON(), nullable=False),
+    ]
+
+
+def _token_hash(method: str, token: str, user_id) -> str:
+    # Mirrors app.repository.user_password.password_reset_token_hash.
+    scope = str(user_id) if method == "otp" else ""
+    return hashlib.sha256(f"{method}:{scope}:{token}".encode()).hexdigest()
+
+
+def _token_row(user_id, record: Any, now: datetime) -> dict[str, Any] | None:
+    """Build a table row from a JSON record, or None if it is unusable or expired."""
+    if not isinstance(record, dict):
+        return None
+    method, token = record.get("method"), record.get("token")
+    if method not in METHODS or not isinstance(token, str) or not token:
+        return None
+    try:
+        expires_at = datetime.fromisoformat(record["expires_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    if expires_at <= now:
+        return None
+    return {
+        "id": uuid4(),
+        "user_id": user_id,
+        "method": method,
+        "token_hash": _token_hash(method, token, user_id),
+        "expires_at": expires_at,
+        "primary_meta_data": {},
+        "secondary_meta_data": {},
+    }
+
+
+def _user_batches(connection):
+    last_id = None
+    while True:
+        query = (
+            sa.select(user_table.c.id, user_table.c.primary_meta_data)
+            .order_by(user_table.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(user_table.c.id > last_id)
+        rows = connection.execute(query).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    op.create_table(
+        "password_reset_token",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("method", sa.String(length=32), nullable=False),
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        *_audit_columns(),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_password_reset_token_hash",
+        "password_reset_token",
+        ["token_hash"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_password_reset_token_user",
+        "password_reset_token",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_password_reset_token_expires",
+        "password_reset_token",
+        ["expires_at"],
+        unique=False,
+    )
+
+    connection = op.get_bind()
+    statement = (
+        user_table.update()
+        .where(user_table.c.id == sa.bindparam("row_id"))
+        .values(primary_meta_data=sa.bindparam("metadata"))
+    )
+    now = datetime.now(timezone.utc)
+    for rows in _user_batches(connection):
+        tokens, parameters = {}, []
+        for row in rows:
+            metadata = dict(row.primary_meta_data or {})
+            if METADATA_KEY not in metadata:
+                continue
+            token = _token_row(row.id, metadata.pop(METADATA_KEY), now)
+            if token is not None:
+                tokens.setdefault(token["token_hash"], token)
+            parameters.append({"row_id": row.id, "metadata": metadata})
+        if tokens:
+            connection.execute(token_table.insert(), list(tokens.values()))
+        if parameters:
+            connection.execute(statement, parameters)
+
+
+def downgrade() -> None:
+    # Only digests are stored, so outstanding resets cannot be moved back;
+    # users with a pending reset must request a new one.
+    op.drop_index("ix_password_reset_token_expires", table_name="password_reset_token")
+    op.drop_index("ix_password_reset_token_user", table_name="password_reset_token")
+    op.drop_index("ix_password_reset_token_hash", table_name="password_reset_token")
+    op.drop_table("password_reset_token")
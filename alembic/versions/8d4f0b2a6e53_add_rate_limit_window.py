@@ -0,0 +1,64 @@
+"""Add the shared sliding-window rate-limit table.
+
+Revision ID: 8d4f0b2a6e53
+Revises: 7c3e9a1f5d42
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "8d4f0b2a6e53"
+down_revision: Union[str, None] = "7c3e9a1f5d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _audit_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "_created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("_closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("primary_meta_data", sa.JSON(), nullable=False),
+        sa.Column("secondary_meta_data", sa.JSON(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_window",
+        sa.Column("key_hash", sa.String(length=64), nullable=False),
+        sa.Column("namespace", sa.String(length=64), nullable=False),
+        sa.Column("hits", sa.JSON(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        *_audit_columns(),
+        sa.PrimaryKeyConstraint("key_hash"),
+    )
+    op.create_index(
+        "ix_rate_limit_window_namespace",
+        "rate_limit_window",
+        ["namespace"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_rate_limit_window_expires",
+        "rate_limit_window",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limit_window_expires", table_name="rate_limit_window")
+    op.drop_index("ix_rate_limit_window_namespace", table_name="rate_limit_window")
+    op.drop_table("rate_limit_window")
@@ -0,0 +1,69 @@
+"""Add the cross-worker cache invalidation counters.
+
+Revision ID: a4c8e2f6b913
+Revises: f3a7c9e1b254
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "a4c8e2f6b913"
+down_revision: Union[str, None] = "f3a7c9e1b254"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of the keys in app.repository.cache_generation at this revision.
+# Seeding every key up front means writes only ever UPDATE an existing row.
+CACHE_PARTITIONS = 64
+SEEDED_KEYS = [
+    f"{scope}:{partition}"
+    for scope in ("company_permissions", "users")
+    for partition in range(CACHE_PARTITIONS)
+]
+
+
+def _audit_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "_created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("_closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("primary_meta_data", sa.JSON(), nullable=False),
+        sa.Column("secondary_meta_data", sa.JSON(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    cache_generation = op.create_table(
+        "cache_generation",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("generation", sa.BigInteger(), nullable=False),
+        *_audit_columns(),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.bulk_insert(
+        cache_generation,
+        [
+            {
+                "key": key,
+                "generation": 0,
+                "primary_meta_data": {},
+                "secondary_meta_data": {},
+            }
+            for key in SEEDED_KEYS
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("cache_generation")
@@ -0,0 +1,50 @@
+"""Seed the cache generation counter of the default role catalog.
+
+Revision ID: b7d1f3a5c820
+Revises: a4c8e2f6b913
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "b7d1f3a5c820"
+down_revision: Union[str, None] = "a4c8e2f6b913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DEFAULT_ROLES_KEY = "default_roles"
+
+
+def upgrade() -> None:
+    cache_generation = sa.table(
+        "cache_generation",
+        sa.column("key", sa.String()),
+        sa.column("generation", sa.BigInteger()),
+        sa.column("primary_meta_data", sa.JSON()),
+        sa.column("secondary_meta_data", sa.JSON()),
+    )
+    op.bulk_insert(
+        cache_generation,
+        [
+            {
+                "key": DEFAULT_ROLES_KEY,
+                "generation": 0,
+                "primary_meta_data": {},
+                "secondary_meta_data": {},
+            }
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        sa.text("DELETE FROM cache_generation WHERE key = :key").bindparams(
+            key=DEFAULT_ROLES_KEY
+        )
+    )
@@ -0,0 +1,42 @@
+"""Index memberships for keyset pagination.
+
+Revision ID: c2e4a6b8d015
+Revises: b7d1f3a5c820
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "c2e4a6b8d015"
+down_revision: Union[str, None] = "b7d1f3a5c820"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_association_user_company_company_created",
+        "association_user_company",
+        ["company_id", "_created_at"],
+    )
+    op.create_index(
+        "ix_association_user_company_user_created",
+        "association_user_company",
+        ["user_id", "_created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_association_user_company_user_created",
+        table_name="association_user_company",
+    )
+    op.drop_index(
+        "ix_association_user_company_company_created",
+        table_name="association_user_company",
+    )
@@ -0,0 +1,200 @@
+"""Materialize effective company role permissions.
+
+Revision ID: f3a7c9e1b254
+Revises: 8d4f0b2a6e53
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "f3a7c9e1b254"
+down_revision: Union[str, None] = "8d4f0b2a6e53"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _audit_columns() -> list[sa.Column]:
+    return [
+        sa.Column(
+            "_created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        ),
+        sa.Column("_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("_closed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("primary_meta_data", sa.JSON(), nullable=False),
+        sa.Column("secondary_meta_data", sa.JSON(), nullable=False),
+    ]
+
+
+def _source_tables():
+    def closable(name: str, *columns: sa.ColumnClause) -> sa.TableClause:
+        return sa.table(
+            name, *columns, sa.column("_closed_at", sa.DateTime(timezone=True))
+        )
+
+    company = closable("company", sa.column("id", sa.Uuid()))
+    role = closable("role", sa.column("id", sa.Uuid()))
+    company_role = closable(
+        "company_role",
+        sa.column("company_id", sa.Uuid()),
+        sa.column("role_id", sa.Uuid()),
+    )
+
+    def permission_columns() -> tuple[sa.ColumnClause, ...]:
+        return (
+            sa.column("id", sa.Uuid()),
+            sa.column("name", sa.String()),
+            sa.column("description", sa.String()),
+        )
+
+    global_permission = closable("global_permission", *permission_columns())
+    company_permission = closable(
+        "company_permission", sa.column("company_id", sa.Uuid()), *permission_columns()
+    )
+    role_global_permission = closable(
+        "role_global_permission",
+        sa.column("role_id", sa.Uuid()),
+        sa.column("global_permission_id", sa.Uuid()),
+    )
+    company_role_permission = closable(
+        "company_role_permission",
+        sa.column("company_id", sa.Uuid()),
+        sa.column("role_id", sa.Uuid()),
+        sa.column("company_permission_id", sa.Uuid()),
+    )
+    return (
+        company,
+        role,
+        company_role,
+        global_permission,
+        company_permission,
+        role_global_permission,
+        company_role_permission,
+    )
+
+
+def _populate(effective: sa.Table) -> None:
+    (
+        company,
+        role,
+        company_role,
+        global_permission,
+        company_permission,
+        role_global_permission,
+        company_role_permission,
+    ) = _source_tables()
+
+    def active_assignments(scope: str, permission: sa.TableClause) -> sa.Select:
+        return (
+            sa.select(
+                company_role.c.company_id,
+                company_role.c.role_id,
+                sa.literal(scope, sa.String()),
+                permission.c.id,
+                permission.c.name,
+                permission.c.description,
+                sa.literal({}, sa.JSON()),
+                sa.literal({}, sa.JSON()),
+            )
+            .select_from(company_role)
+            .join(company, company.c.id == company_role.c.company_id)
+            .join(role, role.c.id == company_role.c.role_id)
+            .where(
+                company_role.c._closed_at.is_(None),
+                company.c._closed_at.is_(None),
+                role.c._closed_at.is_(None),
+            )
+        )
+
+    global_rows = (
+        active_assignments("global", global_permission)
+        .join(
+            role_global_permission,
+            role_global_permission.c.role_id == company_role.c.role_id,
+        )
+        .join(
+            global_permission,
+            global_permission.c.id == role_global_permission.c.global_permission_id,
+        )
+        .where(
+            role_global_permission.c._closed_at.is_(None),
+            global_permission.c._closed_at.is_(None),
+        )
+    )
+    company_rows = (
+        active_assignments("company", company_permission)
+        .join(
+            company_role_permission,
+            (company_role_permission.c.company_id == company_role.c.company_id)
+            & (company_role_permission.c.role_id == company_role.c.role_id),
+        )
+        .join(
+            company_permission,
+            (company_permission.c.company_id == company_role_permission.c.company_id)
+            & (
+                company_permission.c.id
+                == company_role_permission.c.company_permission_id
+            ),
+        )
+        .where(
+            company_role_permission.c._closed_at.is_(None),
+            company_permission.c._closed_at.is_(None),
+        )
+    )
+    columns = [
+        "company_id",
+        "role_id",
+        "scope",
+        "permission_id",
+        "name",
+        "description",
+        "primary_meta_data",
+        "secondary_meta_data",
+    ]
+    for rows in (global_rows, company_rows):
+        op.execute(effective.insert().from_select(columns, rows))
+
+
+def upgrade() -> None:
+    effective = op.create_table(
+        "effective_company_role_permission",
+        sa.Column("company_id", sa.Uuid(), nullable=False),
+        sa.Column("role_id", sa.Uuid(), nullable=False),
+        sa.Column("scope", sa.String(length=16), nullable=False),
+        sa.Column("permission_id", sa.Uuid(), nullable=False),
+        sa.Column("name", sa.String(length=256), nullable=False),
+        sa.Column("description", sa.String(length=256), nullable=True),
+        *_audit_columns(),
+        sa.ForeignKeyConstraint(["company_id"], ["company.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["role_id"], ["role.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "company_id",
+            "role_id",
+            "scope",
+            "permission_id",
+            name="pk_effective_company_role_permission",
+        ),
+    )
+    op.create_index(
+        "ix_effective_company_role_permission_permission",
+        "effective_company_role_permission",
+        ["permission_id"],
+        unique=False,
+    )
+    _populate(effective)
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_effective_company_role_permission_permission",
+        table_name="effective_company_role_permission",
+    )
+    op.drop_table("effective_company_role_permission")
@@ -0,0 +1,210 @@
+"""Declarative per-route rate limits applied before any other route dependency."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import enum
+import hashlib
+import math
+from dataclasses import dataclass
+from typing import Callable
+
+from fastapi import Request, status
+from fastapi.security.utils import get_authorization_scheme_param
+from prometheus_client import Counter
+
+from app.api.security.jwt import JWTManager
+from app.configs import settings
+from app.models.security_messages import SecurityResponseMessages
+from app.utils.app_error import AppError
+from app.utils.auth_cache import VERIFIED_TOKEN_CACHE
+from app.utils.rate_limiter import RateLimitExceeded, RateLimiter, build_rate_limiter
+
+ROUTE_RATE_LIMIT_REJECTIONS = Counter(
+    "userverse_route_rate_limit_rejections_total",
+    "Requests rejected by a route rate limit, by route and key.",
+    ["route", "key"],
+)
+
+
+class RateLimitKey(str, enum.Enum):
+    IP = "ip"
+    EMAIL = "email"
+    USER = "user"
+    API_TOKEN = "api_token"
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    key: RateLimitKey
+    limit: int
+    window_seconds: int
+
+
+def _credentials(request: Request, scheme: str) -> str | None:
+    found, value = get_authorization_scheme_param(request.headers.get("Authorization"))
+    return value if value and found.lower() == scheme else None
+
+
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+def _basic_auth_email(request: Request) -> str | None:
+    credentials = _credentials(request, "basic")
+    if credentials is None:
+        return None
+    try:
+        username = base64.b64decode(credentials).decode("utf-8").partition(":")[0]
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    return username.strip().lower() or None
+
+
+def _token_user_id(request: Request) -> str | None:
+    token = _credentials(request, "bearer")
+    if token is None:
+        return None
+    try:
+        principal, _ = JWTManager(token_cache=VERIFIED_TOKEN_CACHE).decode_access_token(
+            token
+        )
+    except AppError:
+        # Rejected by the authentication dependency that runs next.
+        return None
+    return str(principal.id)
+
+
+def _api_token(request: Request) -> str | None:
+    token = request.headers.get("X-API-Key") or _credentials(request, "bearer")
+    if not token:
+        return None
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+_IDENTITIES: dict[RateLimitKey, Callable[[Request], str | None]] = {
+    RateLimitKey.IP: _client_ip,
+    RateLimitKey.EMAIL: _basic_auth_email,
+    RateLimitKey.USER: _token_user_id,
+    RateLimitKey.API_TOKEN: _api_token,
+}
+
+
+ROUTE_RATE_LIMITS: list[RouteRateLimit] = []
+
+
+class RouteRateLimit:
+    """
+    Dependency enforcing ``policies`` for one route.
+
+    Add it to the route decorator's ``dependencies``: FastAPI resolves those
+    before the endpoint's own parameters, so rejected requests never open a
+    database session or reach password hashing. Identities come only from the
+    request itself; a policy whose identity is missing, such as an email
+    limit on a request without Basic credentials, is skipped.
+    """
+
+    def __init__(self, name: str, *policies: RateLimitPolicy):
+        self.name = name
+        self._limiters: list[tuple[RateLimitPolicy, RateLimiter]] = [
+            (
+                policy,
+                build_rate_limiter(
+                    limit=policy.limit,
+                    window_seconds=policy.window_seconds,
+                    namespace=f"route:{name}:{policy.key.value}",
+                ),
+            )
+            for policy in policies
+        ]
+        ROUTE_RATE_LIMITS.append(self)
+
+    def __call__(self, request: Request) -> None:
+        if not settings.ROUTE_RATE_LIMITS_ENABLED:
+            return
+        for policy, limiter in self._limiters:
+            identity = _IDENTITIES[policy.key](request)
+            if identity is None:
+                continue
+            try:
+                limiter.hit(identity)
+            except RateLimitExceeded as exc:
+                ROUTE_RATE_LIMIT_REJECTIONS.labels(
+                    route=self.name, key=policy.key.value
+                ).inc()
+                raise AppError(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    message=SecurityResponseMessages.RATE_LIMITED.value,
+                    error="route_rate_limited",
+                    log_error=False,
+                    headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+                ) from exc
+
+    def reset(self) -> None:
+        for _, limiter in self._limiters:
+            limiter.reset()
+
+
+LOGIN_RATE_LIMIT = RouteRateLimit(
+    "user_login",
+    RateLimitPolicy(RateLimitKey.IP, limit=30, window_seconds=60),
+    RateLimitPolicy(RateLimitKey.EMAIL, limit=10, window_seconds=60),
+)
+USER_CREATE_RATE_LIMIT = RouteRateLimit(
+    "user_create",
+    RateLimitPolicy(RateLimitKey.IP, limit=20, window_seconds=3600),
+    RateLimitPolicy(RateLimitKey.EMAIL, limit=5, window_seconds=3600),
+)
+TOKEN_REFRESH_RATE_LIMIT = RouteRateLimit(
+    "token_refresh",
+    RateLimitPolicy(RateLimitKey.IP, limit=60, window_seconds=60),
+)
+COMPANY_MEMBERSHIP_RATE_LIMIT = RouteRateLimit(
+    "company_membership",
+    RateLimitPolicy(RateLimitKey.IP, limit=120, window_seconds=60),
+    RateLimitPolicy(RateLimitKey.USER, limit=60, window_seconds=60),
+)
+
+
+def reset_route_rate_limits() -> None:
+    for route_limit in ROUTE_RATE_LIMITS:
+        route_limit.reset()
+
+
+def validate_route_rate_limits() -> None:
+    """
+    Fail startup when the ``shared_memory`` backend cannot hold every hit a
+    route limit needs, rather than failing each request that reaches it.
+    """
+    if (
+        settings.RATE_LIMIT_BACKEND != "shared_memory"
+        or settings.RATE_LIMIT_ALGORITHM != "sliding_window"
+    ):
+        return
+    capacity = settings.RATE_LIMIT_SHARED_MEMORY_CAPACITY
+    too_large = [
+        f"{route_limit.name}:{policy.key.value}={policy.limit}"
+        for route_limit in ROUTE_RATE_LIMITS
+        for policy, _ in route_limit._limiters
+        if policy.limit > capacity
+    ]
+    if too_large:
+        raise RuntimeError(
+            f"Route rate limits exceed RATE_LIMIT_SHARED_MEMORY_CAPACITY={capacity}: "
+            + ", ".join(too_large)
+        )
+
+
+__all__ = [
+    "COMPANY_MEMBERSHIP_RATE_LIMIT",
+    "LOGIN_RATE_LIMIT",
+    "ROUTE_RATE_LIMITS",
+    "RateLimitKey",
+    "RateLimitPolicy",
+    "RouteRateLimit",
+    "TOKEN_REFRESH_RATE_LIMIT",
+    "USER_CREATE_RATE_LIMIT",
+    "reset_route_rate_limits",
+    "validate_route_rate_limits",
+]
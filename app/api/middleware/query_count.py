@@ -0,0 +1,45 @@
+"""Debug header reporting how many SQL statements each request executed."""
+
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp
+
+_QUERY_COUNT: ContextVar[list[int] | None] = ContextVar("query_count", default=None)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _QUERY_COUNT.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class QueryCountMiddleware(BaseHTTPMiddleware):
+    """
+    Add ``X-Query-Count`` to every response when ``DEBUG_QUERY_COUNT`` is on.
+
+    Counts statements sent by any engine while the request's context is
+    active, including sync dependencies and endpoints run in the threadpool.
+    Statements issued after the response starts, such as a session commit in
+    dependency teardown, are not included.
+    """
+
+    HEADER = "X-Query-Count"
+
+    def __init__(self, app: ASGIApp):
+        super().__init__(app)
+        if not event.contains(Engine, "before_cursor_execute", _count_query):
+            event.listen(Engine, "before_cursor_execute", _count_query)
+
+    async def dispatch(self, request: Request, call_next):
+        counter = [0]
+        token = _QUERY_COUNT.set(counter)
+        try:
+            response = await call_next(request)
+        finally:
+            _QUERY_COUNT.reset(token)
+        response.headers[self.HEADER] = str(counter[0])
+        return response
@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+
+from app.api.dependencies.common import CommonJWTRouteDependencies
+from app.models.app_error import AppErrorResponseModel
+from app.models.authorization import AccessCheckRequestModel, AccessCheckResponseModel
+from app.models.generic_response import GenericResponseModel
+from app.models.security_messages import SecurityResponseMessages
+from app.models.tags import UserverseApiTag
+from app.services.company.authorization import CompanyAuthorizationService
+from app.utils.shared_context import SharedContext
+
+router = APIRouter(
+    prefix="/authz",
+    tags=[UserverseApiTag.ACCESS_DECISIONS.name],
+    responses={
+        400: {"model": AppErrorResponseModel},
+        401: {"model": AppErrorResponseModel},
+        403: {"model": AppErrorResponseModel},
+        404: {"model": AppErrorResponseModel},
+    },
+)
+
+
+@router.post(
+    "/check",
+    description=UserverseApiTag.ACCESS_DECISIONS.description,
+    status_code=status.HTTP_200_OK,
+    response_model=GenericResponseModel[AccessCheckResponseModel],
+)
+def check_access_api(
+    payload: AccessCheckRequestModel,
+    common: CommonJWTRouteDependencies = Depends(),
+):
+    """
+    Bulk access-decision API endpoint.
+    - **Requires**: Bearer token; `user_id` other than the caller needs a superuser
+    - **Returns**: One allow/deny decision per `(company_id, permission)` pair
+    """
+    service = CompanyAuthorizationService(
+        SharedContext(user=common.user, db_session=common.session)
+    )
+    response = service.check_access(payload)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "message": SecurityResponseMessages.ACCESS_CHECKED.value,
+            "data": response.model_dump(mode="json"),
+        },
+    )
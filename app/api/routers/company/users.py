@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from app.api.dependencies.common import CommonJWTRouteDependencies
+from app.api.dependencies.rate_limit import COMPANY_MEMBERSHIP_RATE_LIMIT
 from fastapi import APIRouter, Depends, status, Path
 from fastapi.responses import JSONResponse
 
@@ -79,8 +80,10 @@ def get_company_users_api(
     responses={
         201: {"model": GenericResponseModel[CompanyReadModel]},
         400: {"model": AppErrorResponseModel},
+        429: {"model": AppErrorResponseModel},
         500: {"model": AppErrorResponseModel},
     },
+    dependencies=[Depends(COMPANY_MEMBERSHIP_RATE_LIMIT)],
 )
 def add_user_to_company_api(
     payload: CompanyUserAddModel,
@@ -118,8 +121,10 @@ def add_user_to_company_api(
     responses={
         200: {"model": GenericResponseModel[CompanyUserReadModel]},
         400: {"model": AppErrorResponseModel},
+        429: {"model": AppErrorResponseModel},
         500: {"model": AppErrorResponseModel},
     },
+    dependencies=[Depends(COMPANY_MEMBERSHIP_RATE_LIMIT)],
 )
 def delete_user_from_company_api(
     company_id: UUID = Path(..., description=company_id_description),
@@ -159,8 +164,10 @@ def delete_user_from_company_api(
         400: {"model": AppErrorResponseModel},
         403: {"model": AppErrorResponseModel},
         404: {"model": AppErrorResponseModel},
+        429: {"model": AppErrorResponseModel},
         500: {"model": AppErrorResponseModel},
     },
+    dependencies=[Depends(COMPANY_MEMBERSHIP_RATE_LIMIT)],
 )
 def update_user_role_api(
     payload: CompanyUserRoleUpdateModel,
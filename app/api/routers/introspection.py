@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.api.security.api_key import require_introspection_api_key
+from app.models.app_error import AppErrorResponseModel
+from app.models.generic_response import GenericResponseModel
+from app.models.introspection import (
+    TokenIntrospectionBatchRequestModel,
+    TokenIntrospectionBatchResponseModel,
+)
+from app.models.security_messages import SecurityResponseMessages
+from app.models.tags import UserverseApiTag
+from app.repository.database.session_manager import get_session
+from app.services.introspection import TokenIntrospectionService
+from app.utils.shared_context import SharedContext
+
+router = APIRouter(
+    prefix="/auth",
+    tags=[UserverseApiTag.TOKEN_INTROSPECTION.name],
+    dependencies=[Depends(require_introspection_api_key)],
+    responses={
+        400: {"model": AppErrorResponseModel},
+        401: {"model": AppErrorResponseModel},
+    },
+)
+
+
+@router.post(
+    "/introspect/batch",
+    description=UserverseApiTag.TOKEN_INTROSPECTION.description,
+    status_code=status.HTTP_200_OK,
+    response_model=GenericResponseModel[TokenIntrospectionBatchResponseModel],
+)
+def introspect_tokens_batch_api(
+    payload: TokenIntrospectionBatchRequestModel,
+    session: Session = Depends(get_session),
+):
+    """
+    Batch token introspection API endpoint.
+    - **Requires**: `X-API-Key` header matching one of `INTROSPECTION_API_KEYS`
+    - **Returns**: One active/inactive result per submitted access token
+    """
+    service = TokenIntrospectionService(SharedContext(user=None, db_session=session))
+    response = service.introspect_batch(payload.tokens)
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content={
+            "message": SecurityResponseMessages.TOKENS_INTROSPECTED.value,
+            "data": response.model_dump(mode="json"),
+        },
+    )
@@ -1,10 +1,18 @@
+from functools import partial
+
 from fastapi import APIRouter, BackgroundTasks, Depends, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 # Dependencies
 from app.api.dependencies.common import CommonBasicAuthRouteDependencies
+from app.api.dependencies.rate_limit import (
+    LOGIN_RATE_LIMIT,
+    TOKEN_REFRESH_RATE_LIMIT,
+    USER_CREATE_RATE_LIMIT,
+)
 from app.repository.database.session_manager import get_session
+from app.utils.hashing_pool import PASSWORD_HASHING_POOL
 from app.utils.shared_context import SharedContext
 
 # Tags & Models
@@ -29,6 +37,7 @@ router = APIRouter(
     responses={
         400: {"model": AppErrorResponseModel},
         404: {"model": AppErrorResponseModel},
+        429: {"model": AppErrorResponseModel},
         500: {"model": AppErrorResponseModel},
     },
 )
@@ -39,8 +48,9 @@ router = APIRouter(
     description=UserverseApiTag.USER_MANAGEMENT_BASIC_AUTH.description,
     status_code=status.HTTP_202_ACCEPTED,
     response_model=GenericResponseModel[TokenResponseModel],
+    dependencies=[Depends(LOGIN_RATE_LIMIT)],
 )
-def user_login_api(
+async def user_login_api(
     common: CommonBasicAuthRouteDependencies = Depends(),
 ):
     """
@@ -49,7 +59,9 @@ def user_login_api(
     - **Returns**: JWT token on successful login
     """
     service = UserBasicAuthService(SharedContext(user=None, db_session=common.session))
-    response = service.user_login(user_credentials=common.user)
+    response = await PASSWORD_HASHING_POOL.offload(
+        partial(service.user_login, user_credentials=common.user)
+    )
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
         content={
@@ -64,6 +76,7 @@ def user_login_api(
     description=UserverseApiTag.USER_MANAGEMENT_BASIC_AUTH.description,
     status_code=status.HTTP_202_ACCEPTED,
     response_model=GenericResponseModel[TokenResponseModel],
+    dependencies=[Depends(TOKEN_REFRESH_RATE_LIMIT)],
 )
 def refresh_user_token_api(
     payload: RefreshTokenRequestModel,
@@ -117,8 +130,9 @@ def revoke_refresh_token_api(
     description=UserverseApiTag.USER_MANAGEMENT_BASIC_AUTH.description,
     status_code=status.HTTP_201_CREATED,
     response_model=GenericResponseModel[UserReadModel],
+    dependencies=[Depends(USER_CREATE_RATE_LIMIT)],
 )
-def create_user_api(
+async def create_user_api(
     user: UserCreateModel,
     background_tasks: BackgroundTasks,
     common: CommonBasicAuthRouteDependencies = Depends(),
@@ -129,10 +143,13 @@ def create_user_api(
     - **Returns**: Created user data on successful creation
     """
     service = UserBasicAuthService(SharedContext(user=None, db_session=common.session))
-    response = service.create_user(
-        user_credentials=common.user,
-        user_data=user,
-        background_tasks=background_tasks,
+    response = await PASSWORD_HASHING_POOL.offload(
+        partial(
+            service.create_user,
+            user_credentials=common.user,
+            user_data=user,
+            background_tasks=background_tasks,
+        )
     )
     return JSONResponse(
         status_code=status.HTTP_201_CREATED,
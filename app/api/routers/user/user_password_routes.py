@@ -1,3 +1,5 @@
+from functools import partial
+
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, status
 from fastapi.responses import JSONResponse
 
@@ -14,6 +16,7 @@ from app.models.user.password import (
 from app.api.dependencies.common import CommonBasicAuthRouteDependencies
 from app.services.user.password import UserPasswordService
 from app.repository.database.session_manager import get_session
+from app.utils.hashing_pool import PASSWORD_HASHING_POOL
 from sqlalchemy.orm import Session
 
 router = APIRouter(
@@ -62,7 +65,7 @@ def password_reset_request_api(
     status_code=status.HTTP_202_ACCEPTED,
     response_model=GenericResponseModel[None],
 )
-def password_reset_with_token_api(
+async def password_reset_with_token_api(
     payload: MagicLinkPasswordResetConfirmRequest,
     session: Session = Depends(get_session),
 ):
@@ -72,9 +75,12 @@ def password_reset_with_token_api(
     - **Requires**: `token` and `new_password` in the request body
     - **Returns**: Success message
     """
-    response = UserPasswordService(session).reset_password_with_token(
-        token=payload.token,
-        new_password=payload.new_password,
+    response = await PASSWORD_HASHING_POOL.offload(
+        partial(
+            UserPasswordService(session).reset_password_with_token,
+            token=payload.token,
+            new_password=payload.new_password,
+        )
     )
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
@@ -87,7 +93,7 @@ def password_reset_with_token_api(
     status_code=status.HTTP_202_ACCEPTED,
     response_model=GenericResponseModel[None],
 )
-def password_reset_validate_otp_api(
+async def password_reset_validate_otp_api(
     one_time_pin: str,
     common: CommonBasicAuthRouteDependencies = Depends(),
     session: Session = Depends(get_session),
@@ -100,10 +106,13 @@ def password_reset_validate_otp_api(
     - **Returns**: Success message
     """
 
-    response = UserPasswordService(session).validate_otp_and_change_password(
-        user_email=common.user.email,
-        new_password=common.user.password,
-        otp=one_time_pin,
+    response = await PASSWORD_HASHING_POOL.offload(
+        partial(
+            UserPasswordService(session).validate_otp_and_change_password,
+            user_email=common.user.email,
+            new_password=common.user.password,
+            otp=one_time_pin,
+        )
     )
     return JSONResponse(
         status_code=status.HTTP_202_ACCEPTED,
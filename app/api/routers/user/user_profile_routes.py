@@ -1,8 +1,10 @@
+import anyio
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 
 # Dependencies
 from app.api.dependencies.common import CommonJWTRouteDependencies
+from app.utils.hashing_pool import PASSWORD_HASHING_POOL
 from app.utils.shared_context import SharedContext
 
 # Tags & Models
@@ -63,7 +65,7 @@ def get_user_api(
     status_code=status.HTTP_201_CREATED,
     response_model=GenericResponseModel[UserReadModel],
 )
-def update_user_api(
+async def update_user_api(
     user_updates: UserUpdateModel,
     common: CommonJWTRouteDependencies = Depends(),
 ):
@@ -75,11 +77,15 @@ def update_user_api(
     service = UserProfileService(
         SharedContext(user=common.user, db_session=common.session)
     )
-    user_db = service.get_user(user_email=common.user.email)
-    response = service.update_user(
-        user_id=user_db.id,
-        user_data=user_updates,
-    )
+
+    def _update() -> UserReadModel:
+        user_db = service.get_user(user_email=common.user.email)
+        return service.update_user(user_id=user_db.id, user_data=user_updates)
+
+    if user_updates.password:
+        response = await PASSWORD_HASHING_POOL.offload(_update)
+    else:
+        response = await anyio.to_thread.run_sync(_update)
     return JSONResponse(
         status_code=status.HTTP_201_CREATED,
         content={
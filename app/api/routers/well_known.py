@@ -0,0 +1,31 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.api.security.keyring import get_keyring
+from app.configs import settings
+from app.models.tags import UserverseApiTag
+
+router = APIRouter(
+    prefix="/.well-known",
+    tags=[UserverseApiTag.TOKEN_VERIFICATION.name],
+)
+
+
+@router.get(
+    "/jwks.json",
+    description=UserverseApiTag.TOKEN_VERIFICATION.description,
+    status_code=status.HTTP_200_OK,
+)
+def jwks_api():
+    """
+    Public JSON Web Key Set for verifying Userverse access tokens.
+    - **Requires**: nothing; the response is public and cacheable
+    - **Returns**: every key that may have signed a currently valid token
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=get_keyring().jwks(),
+        headers={
+            "Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}"
+        },
+    )
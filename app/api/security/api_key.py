@@ -0,0 +1,29 @@
+import hmac
+
+from fastapi import Security, status
+from fastapi.security import APIKeyHeader
+
+from app.configs import settings
+from app.models.security_messages import SecurityResponseMessages
+from app.utils.app_error import AppError
+
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+def require_introspection_api_key(
+    api_key: str | None = Security(api_key_header),
+) -> None:
+    """
+    Allow the request only when ``X-API-Key`` matches one of
+    ``INTROSPECTION_API_KEYS``. With no keys configured, every call is rejected.
+    """
+    if api_key:
+        candidate = api_key.encode()
+        for configured in settings.INTROSPECTION_API_KEYS:
+            if hmac.compare_digest(candidate, configured.encode()):
+                return
+    raise AppError(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        message=SecurityResponseMessages.INVALID_API_KEY.value,
+        log_error=False,
+    )
@@ -1,10 +1,14 @@
+import anyio
 import jwt
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 from fastapi import status, Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 # app imports
+from app.api.security.keyring import get_keyring
 from app.configs import settings
 from app.models.security_messages import SecurityResponseMessages
 from app.models.user.account_status import UserAccountStatus
@@ -13,60 +17,131 @@ from app.models.user.user import TokenResponseModel, UserReadModel
 from app.repository.database.session_manager import get_session
 from app.repository.user import UserRepository
 from app.utils.app_error import AppError
+from app.utils.auth_cache import (
+    AUTH_PRINCIPAL_CACHE,
+    VERIFIED_TOKEN_CACHE,
+    AuthPrincipal,
+    VerifiedTokenCache,
+)
+from app.utils.revocation_list import REVOCATION_LIST, RevocationStatus
 
 http_bearer = HTTPBearer()
+_auth_limiter: anyio.CapacityLimiter | None = None
 
 
-def _status_allowed_for_authenticated_access(user_status: str | None) -> bool:
+def _get_auth_limiter() -> anyio.CapacityLimiter:
+    global _auth_limiter
+    if _auth_limiter is None:
+        _auth_limiter = anyio.CapacityLimiter(settings.AUTH_THREAD_LIMIT)
+    return _auth_limiter
+
+
+def status_allows_authenticated_access(user_status: str | None) -> bool:
     allowed_statuses = {UserAccountStatus.ACTIVE.name_value}
     if not settings.REQUIRE_EMAIL_VERIFICATION:
         allowed_statuses.add(UserAccountStatus.AWAITING_VERIFICATION.name_value)
     return user_status in allowed_statuses
 
 
+@dataclass(frozen=True, slots=True)
+class TokenPrincipal:
+    """
+    Identity carried by a verified token, read without validating profile
+    fields. Accepts both compact (``sub``) and full-profile (``user``) claims.
+    """
+
+    id: UUID
+    status: str | None = None
+    is_superuser: bool = False
+    expires_at: int | None = None
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "TokenPrincipal":
+        if "sub" in claims:
+            return cls(
+                id=UUID(claims["sub"]),
+                status=claims.get("st"),
+                is_superuser=bool(claims.get("su", False)),
+                expires_at=claims.get("exp"),
+            )
+        user = claims["user"]
+        return cls(
+            id=UUID(str(user["id"])),
+            status=user.get("status"),
+            is_superuser=bool(user.get("is_superuser", False)),
+            expires_at=claims.get("exp"),
+        )
+
+
 class JWTManager:
     """
     JWT Manager for handling JWT operations like signing, decoding, and refreshing tokens.
     This class is responsible for creating and validating JWT tokens used in the application.
     """
 
-    def __init__(self):
+    def __init__(self, *, token_cache: VerifiedTokenCache | None = None):
         self.JWT_SECRET = settings.JWT_SECRET
         self.JWT_ALGORITHM = settings.JWT_ALGORITHM
         self.SESSION_TIMEOUT = int(settings.JWT_TIMEOUT)
         self.REFRESH_TIMEOUT = int(settings.JWT_REFRESH_TIMEOUT)
+        self.COMPACT_CLAIMS = settings.JWT_COMPACT_CLAIMS
+        self.keyring = get_keyring()
+        self.token_cache = token_cache
+
+    def _encode(self, payload: dict) -> str:
+        return jwt.encode(
+            payload,
+            self.keyring.signing_key,
+            algorithm=self.JWT_ALGORITHM,
+            headers=self.keyring.headers,
+        )
+
+    def _decode(self, token: str) -> dict:
+        if self.token_cache is not None:
+            cached = self.token_cache.get(token, keyring=self.keyring)
+            if cached is not None:
+                return cached
+        decoded = jwt.decode(
+            token,
+            self.keyring.verification_key_for(token),
+            algorithms=[self.JWT_ALGORITHM],
+        )
+        if self.token_cache is not None:
+            self.token_cache.set(token, decoded, keyring=self.keyring)
+        return decoded
+
+    def _identity_claims(self, user: UserReadModel, refresh_token_version: int) -> dict:
+        if not self.COMPACT_CLAIMS:
+            return {
+                "user": user.model_dump(mode="json"),
+                "refresh_token_version": refresh_token_version,
+            }
+        return {
+            "sub": str(user.id),
+            "ver": refresh_token_version,
+            "st": user.status,
+            "su": user.is_superuser,
+        }
 
     def sign_jwt(
         self, user: UserReadModel, *, refresh_token_version: int = 0
     ) -> TokenResponseModel:
-        """Sign a JWT token with user data and return the token response model."""
+        """
+        Sign an access/refresh token pair for ``user``.
+        With ``JWT_COMPACT_CLAIMS`` the tokens carry only the subject id,
+        refresh-token version, status, and superuser flag instead of the full
+        user profile.
+        """
         now = datetime.now(timezone.utc)
         access_expire = now + timedelta(minutes=self.SESSION_TIMEOUT)
         refresh_expire = now + timedelta(minutes=self.REFRESH_TIMEOUT)
+        identity = self._identity_claims(user, refresh_token_version)
 
-        access_payload = {
-            "user": user.model_dump(mode="json"),
-            "type": "access",
-            "refresh_token_version": refresh_token_version,
-            "exp": access_expire,
-        }
-
-        refresh_payload = {
-            "user": user.model_dump(mode="json"),
-            "type": "refresh",
-            "refresh_token_version": refresh_token_version,
-            "exp": refresh_expire,
-        }
-
-        access_token = jwt.encode(
-            payload=access_payload,
-            key=self.JWT_SECRET,
-            algorithm=self.JWT_ALGORITHM,
+        access_token = self._encode(
+            {**identity, "type": "access", "exp": access_expire}
         )
-        refresh_token = jwt.encode(
-            payload=refresh_payload,
-            key=self.JWT_SECRET,
-            algorithm=self.JWT_ALGORITHM,
+        refresh_token = self._encode(
+            {**identity, "type": "refresh", "exp": refresh_expire}
         )
 
         return TokenResponseModel(
@@ -81,7 +156,7 @@ class JWTManager:
         """Sign a payload with JWT and return the token."""
         payload = payload.copy()
         payload["exp"] = datetime.now(timezone.utc) + expires_delta
-        return jwt.encode(payload, self.JWT_SECRET, algorithm=self.JWT_ALGORITHM)
+        return self._encode(payload)
 
     def decode_verification_token(self, token: str) -> dict:
         """
@@ -89,9 +164,7 @@ class JWTManager:
         Raises AppError if the token is invalid or expired.
         """
         try:
-            decoded = jwt.decode(
-                token, self.JWT_SECRET, algorithms=[self.JWT_ALGORITHM]
-            )
+            decoded = self._decode(token)
             if decoded.get("type") != "verification":
                 raise AppError(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -112,9 +185,7 @@ class JWTManager:
 
     def _decode_token_payload(self, token: str, *, expected_type: str) -> dict:
         try:
-            decoded = jwt.decode(
-                token, self.JWT_SECRET, algorithms=[self.JWT_ALGORITHM]
-            )
+            decoded = self._decode(token)
             token_type = decoded.get("type")
             if token_type != expected_type:
                 raise AppError(
@@ -123,8 +194,7 @@ class JWTManager:
                     + f" for {expected_type} token",
                 )
 
-            user = decoded.get("user")
-            if not user:
+            if not decoded.get("user") and not decoded.get("sub"):
                 raise AppError(
                     status_code=status.HTTP_403_FORBIDDEN,
                     message=SecurityResponseMessages.MISSING_USER_DATA.value,
@@ -152,31 +222,56 @@ class JWTManager:
 
     def decode_token(self, token: str) -> UserReadModel:
         """
-        Decode a JWT access token and return the user data.
+        Decode a JWT access token and return the embedded user profile.
+        Compact tokens carry no profile and are rejected as missing user data.
         Raises AppError if the token is invalid or expired.
         """
         decoded = self._decode_token_payload(token, expected_type="access")
+        if not decoded.get("user"):
+            raise AppError(
+                status_code=status.HTTP_403_FORBIDDEN,
+                message=SecurityResponseMessages.MISSING_USER_DATA.value,
+            )
         return UserReadModel(**decoded["user"])
 
-    def decode_access_token(self, token: str) -> tuple[UserReadModel, int]:
-        decoded = self._decode_token_payload(token, expected_type="access")
-        refresh_token_version = decoded.get("refresh_token_version", 0)
-        try:
-            normalized_version = int(refresh_token_version)
-        except (TypeError, ValueError):
-            normalized_version = 0
+    def decode_access_claims(self, token: str) -> dict:
+        """Return the verified claims of an access token."""
+        return self._decode_token_payload(token, expected_type="access")
 
-        return UserReadModel(**decoded["user"]), normalized_version
+    def principal_from_claims(self, decoded: dict) -> tuple[TokenPrincipal, int]:
+        """
+        Read the token principal and refresh-token version from verified claims.
+        Raises AppError if the identity claims are malformed.
+        """
+        try:
+            principal = TokenPrincipal.from_claims(decoded)
+        except (KeyError, TypeError, ValueError) as e:
+            raise AppError(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                message=SecurityResponseMessages.INVALID_TOKEN.value,
+            ) from e
 
-    def decode_refresh_token(self, token: str) -> tuple[UserReadModel, int]:
-        decoded = self._decode_token_payload(token, expected_type="refresh")
-        refresh_token_version = decoded.get("refresh_token_version", 0)
+        refresh_token_version = decoded.get(
+            "ver", decoded.get("refresh_token_version", 0)
+        )
         try:
             normalized_version = int(refresh_token_version)
         except (TypeError, ValueError):
             normalized_version = 0
 
-        return UserReadModel(**decoded["user"]), normalized_version
+        return principal, normalized_version
+
+    def _decode_principal(
+        self, token: str, *, expected_type: str
+    ) -> tuple[TokenPrincipal, int]:
+        decoded = self._decode_token_payload(token, expected_type=expected_type)
+        return self.principal_from_claims(decoded)
+
+    def decode_access_token(self, token: str) -> tuple[TokenPrincipal, int]:
+        return self._decode_principal(token, expected_type="access")
+
+    def decode_refresh_token(self, token: str) -> tuple[TokenPrincipal, int]:
+        return self._decode_principal(token, expected_type="refresh")
 
     def refresh_token(
         self,
@@ -195,12 +290,60 @@ class JWTManager:
         return self.sign_jwt(user, refresh_token_version=refresh_token_version)
 
 
+def _load_principal(session: Session, user_id: UUID) -> AuthPrincipal:
+    principal = UserRepository(session).get_auth_principal(user_id)
+    AUTH_PRINCIPAL_CACHE.set(principal)
+    return principal
+
+
+def _authorize_principal(principal: AuthPrincipal, token_version: int) -> UserReadModel:
+    if token_version != principal.refresh_token_version:
+        raise AppError(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message=SecurityResponseMessages.INVALID_TOKEN.value,
+        )
+    if not status_allows_authenticated_access(principal.status):
+        raise AppError(
+            status_code=status.HTTP_403_FORBIDDEN,
+            message=UserResponseMessages.USER_ACCOUNT_INACTIVE.value,
+            log_error=False,
+        )
+    return principal.user
+
+
+def _authorize_stateless(
+    claims: dict, token_user: TokenPrincipal, token_version: int
+) -> UserReadModel | None:
+    """
+    Trust a full-profile access token without a database lookup when the
+    revocation list clears it. Returns None when the caller must fall back to
+    the principal cache or database: compact tokens, statuses that need a
+    fresh check, Bloom-filter hits, and a revocation list that is not fresh.
+    """
+    profile = claims.get("user")
+    if not profile or not status_allows_authenticated_access(token_user.status):
+        return None
+    outcome = REVOCATION_LIST.lookup(token_user.id, token_version)
+    if outcome is RevocationStatus.REVOKED:
+        raise AppError(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            message=SecurityResponseMessages.INVALID_TOKEN.value,
+        )
+    if outcome is RevocationStatus.UNKNOWN:
+        return None
+    return UserReadModel(**profile)
+
+
 async def get_current_user_from_jwt_token(
     session: Session = Depends(get_session),
     credentials: HTTPAuthorizationCredentials = Depends(http_bearer),
 ) -> UserReadModel:
     """
     Get the current user from the JWT token in the Authorization header.
+    With ``AUTH_STATELESS_VERIFICATION`` tokens cleared by the revocation list
+    are trusted as issued. Otherwise cached principals are served directly;
+    cache misses load the user on a bounded worker pool so the database lookup
+    never blocks the event loop.
     Raises AppError if the token is missing or invalid.
     """
     authorization = credentials.credentials if credentials else None
@@ -213,22 +356,26 @@ async def get_current_user_from_jwt_token(
         )
 
     try:
-        jwt_manager = JWTManager()
-        user_repository = UserRepository(session)
-        token_user, token_version = jwt_manager.decode_access_token(authorization)
-        current_user = user_repository.get_user_by_id(token_user.id)
-        current_version = user_repository.get_refresh_token_version(current_user.id)
-        if token_version != current_version:
-            raise AppError(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                message=SecurityResponseMessages.INVALID_TOKEN.value,
-            )
-        if not _status_allowed_for_authenticated_access(current_user.status):
-            raise AppError(
-                status_code=status.HTTP_403_FORBIDDEN,
-                message=UserResponseMessages.USER_ACCOUNT_INACTIVE.value,
-                log_error=False,
+        jwt_manager = JWTManager(token_cache=VERIFIED_TOKEN_CACHE)
+        if settings.AUTH_STATELESS_VERIFICATION:
+            claims = jwt_manager.decode_access_claims(authorization)
+            token_user, token_version = jwt_manager.principal_from_claims(claims)
+            user = _authorize_stateless(claims, token_user, token_version)
+            if user is not None:
+                return user
+        else:
+            token_user, token_version = jwt_manager.decode_access_token(authorization)
+        principal = AUTH_PRINCIPAL_CACHE.get(
+            token_user.id, refresh_token_version=token_version
+        )
+        if principal is None:
+            principal = await anyio.to_thread.run_sync(
+                _load_principal,
+                session,
+                token_user.id,
+                limiter=_get_auth_limiter(),
             )
+        return _authorize_principal(principal, token_version)
     except AppError:
         raise
     except Exception as e:
@@ -237,5 +384,3 @@ async def get_current_user_from_jwt_token(
             message=SecurityResponseMessages.INVALID_REQUEST.value,
             error=str(e),
         ) from e
-
-    return current_user
@@ -0,0 +1,131 @@
+"""Signing and verification keys for Userverse-issued JWTs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Mapping
+
+import jwt
+
+from app.configs import HMAC_JWT_ALGORITHMS, Settings, settings
+
+
+def is_asymmetric_algorithm(algorithm: str) -> bool:
+    return algorithm not in HMAC_JWT_ALGORITHMS
+
+
+def _read_pem(value: str) -> bytes:
+    """Accept inline PEM text or a path to a PEM file."""
+    text = value.strip()
+    if text.startswith("-----BEGIN"):
+        return text.encode()
+    return Path(text).expanduser().read_bytes()
+
+
+@dataclass(frozen=True)
+class JWTKeyring:
+    """
+    Keys used to sign and verify tokens.
+
+    For HMAC algorithms the shared secret is both the signing and verification
+    key and tokens carry no ``kid``. For asymmetric algorithms the active
+    private key signs, and every configured key (private or public-only) is
+    kept for verification so tokens issued before a rotation stay valid.
+    """
+
+    algorithm: str
+    signing_key: Any
+    active_kid: str | None = None
+    verification_keys: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_asymmetric(self) -> bool:
+        return self.active_kid is not None
+
+    @classmethod
+    def from_settings(cls, source: Settings | None = None) -> "JWTKeyring":
+        source = source or settings
+        return _build_keyring(
+            source.JWT_ALGORITHM,
+            source.JWT_SECRET,
+            tuple(sorted((source.JWT_PRIVATE_KEYS or {}).items())),
+            tuple(sorted((source.JWT_PUBLIC_KEYS or {}).items())),
+            source.JWT_ACTIVE_KEY_ID,
+        )
+
+    @property
+    def headers(self) -> dict[str, str] | None:
+        if not self.is_asymmetric:
+            return None
+        return {"kid": self.active_kid}
+
+    def verification_key_for(self, token: str) -> Any:
+        """
+        Select the key that should verify ``token`` from its ``kid`` header.
+        Raises ``jwt.InvalidTokenError`` for unknown or missing key ids.
+        """
+        if not self.is_asymmetric:
+            return self.signing_key
+        kid = jwt.get_unverified_header(token).get("kid")
+        try:
+            return self.verification_keys[kid]
+        except KeyError as exc:
+            raise jwt.InvalidTokenError(f"Unknown signing key id: {kid!r}") from exc
+
+    def jwks(self) -> dict[str, list[dict[str, Any]]]:
+        """Public keys in JWK Set form; empty when tokens are HMAC-signed."""
+        if not self.is_asymmetric:
+            return {"keys": []}
+        algorithm = jwt.get_algorithm_by_name(self.algorithm)
+        keys = []
+        for kid, public_key in self.verification_keys.items():
+            jwk = algorithm.to_jwk(public_key, as_dict=True)
+            jwk.update({"kid": kid, "use": "sig", "alg": self.algorithm})
+            keys.append(jwk)
+        return {"keys": keys}
+
+
+@lru_cache(maxsize=8)
+def _build_keyring(
+    algorithm: str,
+    secret: str,
+    private_keys: tuple[tuple[str, str], ...],
+    public_keys: tuple[tuple[str, str], ...],
+    active_kid: str | None,
+) -> JWTKeyring:
+    if not is_asymmetric_algorithm(algorithm):
+        return JWTKeyring(algorithm=algorithm, signing_key=secret)
+
+    # Settings validation guarantees at least one private key and that an
+    # explicit active key id names one of them.
+    active_kid = active_kid or private_keys[0][0]
+    prepare_key = jwt.get_algorithm_by_name(algorithm).prepare_key
+    signing_key = None
+    verification_keys: dict[str, Any] = {}
+    for kid, pem in public_keys:
+        verification_keys[kid] = prepare_key(_read_pem(pem))
+    for kid, pem in private_keys:
+        private_key = prepare_key(_read_pem(pem))
+        verification_keys[kid] = private_key.public_key()
+        if kid == active_kid:
+            signing_key = private_key
+
+    return JWTKeyring(
+        algorithm=algorithm,
+        signing_key=signing_key,
+        active_kid=active_kid,
+        verification_keys=verification_keys,
+    )
+
+
+def get_keyring() -> JWTKeyring:
+    return JWTKeyring.from_settings()
+
+
+__all__ = [
+    "JWTKeyring",
+    "get_keyring",
+    "is_asymmetric_algorithm",
+]
@@ -0,0 +1,51 @@
+"""Offline verification of Userverse access tokens for downstream services."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import jwt
+
+DEFAULT_VERIFIER_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
+
+class OfflineTokenVerifier:
+    """
+    Verify Userverse access tokens against the published JWKS.
+
+    Resource servers construct one instance per process and call ``verify``
+    per request. Keys are fetched from ``jwks_url`` on first use and whenever
+    a token names an unknown ``kid``; otherwise verification needs no network
+    round trip or call back to Userverse.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        *,
+        algorithms: Iterable[str] = DEFAULT_VERIFIER_ALGORITHMS,
+        cache_seconds: int = 3600,
+        timeout: int = 5,
+    ):
+        self.algorithms = list(algorithms)
+        self._client = jwt.PyJWKClient(
+            jwks_url,
+            cache_jwk_set=True,
+            lifespan=cache_seconds,
+            timeout=timeout,
+        )
+
+    def verify(self, token: str, *, expected_type: str = "access") -> dict:
+        """
+        Return the verified claims of ``token``.
+        Raises ``jwt.InvalidTokenError`` (or a subclass) when the signature,
+        expiry, key id, or token type is not acceptable.
+        """
+        signing_key = self._client.get_signing_key_from_jwt(token)
+        claims = jwt.decode(token, signing_key.key, algorithms=self.algorithms)
+        if claims.get("type") != expected_type:
+            raise jwt.InvalidTokenError(f"Expected token type {expected_type!r}")
+        return claims
+
+
+__all__ = ["DEFAULT_VERIFIER_ALGORITHMS", "OfflineTokenVerifier"]
@@ -3,12 +3,21 @@ from __future__ import annotations
 from uuid import UUID
 
 import click
+import jwt
 from pydantic import ValidationError
 from sqlalchemy.engine import make_url
 from sqlalchemy.exc import ArgumentError
 
+from app.api.security.keyring import JWTKeyring
 from app.repository.database.session_manager import DatabaseSessionManager
+from app.repository.default_catalog import DefaultRoleCatalogRepository
+from app.repository.effective_permission import (
+    EffectivePermissionDrift,
+    EffectivePermissionRepository,
+)
 from app.configs import Settings
+from app.services.expired_artifacts import ExpiredArtifactPurger
+from app.utils.hash_password import calibrate_rounds
 from app.services.superuser_bootstrap import (
     SuperuserBootstrapCandidate,
     SuperuserBootstrapError,
@@ -45,6 +54,23 @@ def _bootstrap(
         session.close()
 
 
+def _effective_permissions(
+    *, batch_size: int, rebuild: bool
+) -> EffectivePermissionDrift:
+    manager = DatabaseSessionManager()
+    try:
+        session = manager.session_object()
+        try:
+            repository = EffectivePermissionRepository(session)
+            if rebuild:
+                return repository.rebuild(batch_size=batch_size)
+            return repository.check(batch_size=batch_size)
+        finally:
+            session.close()
+    finally:
+        manager.engine.dispose()
+
+
 @click.group()
 def cli() -> None:
     """Run trusted Userverse administration commands."""
@@ -80,10 +106,116 @@ def config_check() -> None:
     if runtime_settings.EMAIL_SSL and runtime_settings.EMAIL_TLS:
         raise click.ClickException("EMAIL_SSL and EMAIL_TLS cannot both be enabled.")
 
+    try:
+        JWTKeyring.from_settings(runtime_settings)
+    except (OSError, ValueError, jwt.PyJWTError) as exc:
+        raise click.ClickException(
+            f"JWT signing keys could not be loaded: {exc}"
+        ) from exc
+
     click.echo(f"Configuration is valid for {runtime_settings.ENVIRONMENT}.")
     click.echo(f"Database: {database_url.render_as_string(hide_password=True)}")
 
 
+@cli.command("bench-hash")
+@click.option(
+    "--target-ms",
+    type=click.FloatRange(min=1),
+    default=250.0,
+    show_default=True,
+    help="Longest acceptable time for one password hash on this machine.",
+)
+def bench_hash(target_ms: float) -> None:
+    """Recommend a PASSWORD_HASH_ROUNDS value for this machine."""
+    timings = calibrate_rounds(target_ms)
+    for rounds, elapsed_ms in timings:
+        click.echo(f"rounds={rounds:<2} {elapsed_ms:8.1f} ms")
+
+    within_target = [
+        rounds for rounds, elapsed_ms in timings if elapsed_ms <= target_ms
+    ]
+    if not within_target:
+        raise click.ClickException(
+            f"Even the cheapest cost takes longer than {target_ms:g} ms."
+        )
+    click.echo(f"PASSWORD_HASH_ROUNDS={within_target[-1]}")
+
+
+@cli.command("purge-expired")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Rows deleted or rewritten per transaction.",
+)
+def purge_expired(batch_size: int) -> None:
+    """Delete expired auth artifacts and compact stale user metadata."""
+    manager = DatabaseSessionManager()
+    try:
+        report = ExpiredArtifactPurger(
+            manager.session_object, batch_size=batch_size, compact_metadata=True
+        ).purge_once()
+    finally:
+        manager.engine.dispose()
+
+    click.echo(f"Expired password-reset tokens deleted: {report.reset_tokens}")
+    click.echo(f"Expired access-token revocations deleted: {report.revocations}")
+    click.echo(f"Expired rate-limit windows deleted: {report.rate_limit_windows}")
+    click.echo(f"Users with stale metadata compacted: {report.compacted_users}")
+    click.echo(f"Rows touched: {report.rows_touched} in {report.seconds:.2f}s")
+
+
+_EFFECTIVE_PERMISSION_BATCH_SIZE = click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=500,
+    show_default=True,
+    help="Companies compared or rewritten per transaction.",
+)
+
+
+@cli.command("rebuild-effective-permissions")
+@_EFFECTIVE_PERMISSION_BATCH_SIZE
+def rebuild_effective_permissions(batch_size: int) -> None:
+    """Recompute the materialized effective company role permissions."""
+    drift = _effective_permissions(batch_size=batch_size, rebuild=True)
+    click.echo(f"Effective permission rows inserted: {drift.missing}")
+    click.echo(f"Effective permission rows deleted: {drift.stale}")
+    click.echo(f"Effective permission rows updated: {drift.outdated}")
+
+
+@cli.command("check-effective-permissions")
+@_EFFECTIVE_PERMISSION_BATCH_SIZE
+def check_effective_permissions(batch_size: int) -> None:
+    """Fail if the materialized effective permissions drifted from their sources."""
+    drift = _effective_permissions(batch_size=batch_size, rebuild=False)
+    if drift.total:
+        raise click.ClickException(
+            f"Effective permissions drifted: {drift.missing} missing, "
+            f"{drift.stale} stale, {drift.outdated} outdated. "
+            "Run rebuild-effective-permissions."
+        )
+    click.echo("Effective permissions are consistent.")
+
+
+@cli.command("reconcile-default-roles")
+def reconcile_default_roles() -> None:
+    """Create missing default company roles and seed their system permissions."""
+    manager = DatabaseSessionManager()
+    try:
+        session = manager.session_object()
+        try:
+            roles = DefaultRoleCatalogRepository(session).reconcile()
+            role_ids = {name: role.id for name, role in roles.items()}
+        finally:
+            session.close()
+    finally:
+        manager.engine.dispose()
+    for name, role_id in role_ids.items():
+        click.echo(f"{name}: {role_id}")
+
+
 @cli.command("bootstrap-superuser")
 @click.option(
     "--email",
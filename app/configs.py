@@ -15,6 +15,12 @@ load_dotenv()
 _PROJECT_DEFAULTS = load_project_defaults(Path(__file__).resolve().parent.parent)
 DEFAULT_JWT_SECRET = "secret1234"
 INSECURE_JWT_SECRET_ALLOWED_ENVIRONMENTS = {"development", "testing", "test"}
+HMAC_JWT_ALGORITHMS = frozenset({"HS256", "HS384", "HS512"})
+DEFAULT_PASSWORD_HASH_ROUNDS = 12
+MIN_PASSWORD_HASH_ROUNDS = 4
+MAX_PASSWORD_HASH_ROUNDS = 31
+RATE_LIMIT_BACKENDS = frozenset({"memory", "shared_memory", "sql"})
+RATE_LIMIT_ALGORITHMS = frozenset({"gcra", "sliding_window"})
 
 
 class Settings(BaseSettings):
@@ -125,6 +131,98 @@ class Settings(BaseSettings):
         default=False,
         validation_alias=AliasChoices("ENABLE_PROFILING"),
     )
+    CACHE_INVALIDATION_POLL_SECONDS: float = Field(
+        default=2.0,
+        validation_alias=AliasChoices("CACHE_INVALIDATION_POLL_SECONDS"),
+    )
+    CACHE_INVALIDATION_LISTEN: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("CACHE_INVALIDATION_LISTEN"),
+    )
+    DEBUG_QUERY_COUNT: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("DEBUG_QUERY_COUNT"),
+    )
+    AUTH_THREAD_LIMIT: int = Field(
+        default=8,
+        validation_alias=AliasChoices("AUTH_THREAD_LIMIT"),
+    )
+    AUTH_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        validation_alias=AliasChoices("AUTH_CACHE_TTL_SECONDS"),
+    )
+    AUTH_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        validation_alias=AliasChoices("AUTH_CACHE_MAX_ENTRIES"),
+    )
+    COMPANY_PERMISSION_CACHE_TTL_SECONDS: int = Field(
+        default=30,
+        validation_alias=AliasChoices("COMPANY_PERMISSION_CACHE_TTL_SECONDS"),
+    )
+    COMPANY_PERMISSION_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        validation_alias=AliasChoices("COMPANY_PERMISSION_CACHE_MAX_ENTRIES"),
+    )
+    PASSWORD_HASH_ROUNDS: int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("PASSWORD_HASH_ROUNDS"),
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4,
+        validation_alias=AliasChoices("PASSWORD_HASH_WORKERS"),
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = Field(
+        default=16,
+        validation_alias=AliasChoices("PASSWORD_HASH_MAX_QUEUE"),
+    )
+    PURGE_EXPIRED_INTERVAL_SECONDS: int = Field(
+        default=0,
+        validation_alias=AliasChoices("PURGE_EXPIRED_INTERVAL_SECONDS"),
+    )
+    RATE_LIMIT_BACKEND: str = Field(
+        default="memory",
+        validation_alias=AliasChoices("RATE_LIMIT_BACKEND"),
+    )
+    ROUTE_RATE_LIMITS_ENABLED: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("ROUTE_RATE_LIMITS_ENABLED"),
+    )
+    RATE_LIMIT_ALGORITHM: str = Field(
+        default="sliding_window",
+        validation_alias=AliasChoices("RATE_LIMIT_ALGORITHM"),
+    )
+    RATE_LIMIT_MAX_KEYS: int = Field(
+        default=100000,
+        validation_alias=AliasChoices("RATE_LIMIT_MAX_KEYS"),
+    )
+    RATE_LIMIT_SWEEP_SECONDS: int = Field(
+        default=60,
+        validation_alias=AliasChoices("RATE_LIMIT_SWEEP_SECONDS"),
+    )
+    RATE_LIMIT_SHARED_MEMORY_PATH: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("RATE_LIMIT_SHARED_MEMORY_PATH"),
+    )
+    RATE_LIMIT_SHARED_MEMORY_SLOTS: int = Field(
+        default=4096,
+        validation_alias=AliasChoices("RATE_LIMIT_SHARED_MEMORY_SLOTS"),
+    )
+    RATE_LIMIT_SHARED_MEMORY_CAPACITY: int = Field(
+        default=128,
+        validation_alias=AliasChoices("RATE_LIMIT_SHARED_MEMORY_CAPACITY"),
+    )
+    AUTH_STATELESS_VERIFICATION: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("AUTH_STATELESS_VERIFICATION"),
+    )
+    AUTH_REVOCATION_SYNC_SECONDS: int = Field(
+        default=5,
+        validation_alias=AliasChoices("AUTH_REVOCATION_SYNC_SECONDS"),
+    )
+    AUTH_REVOCATION_REBUILD_SECONDS: int = Field(
+        default=300,
+        validation_alias=AliasChoices("AUTH_REVOCATION_REBUILD_SECONDS"),
+    )
 
     CORS_ALLOWED: list[str] = Field(
         default_factory=lambda: [
@@ -148,6 +246,54 @@ class Settings(BaseSettings):
         default="HS256",
         validation_alias=AliasChoices("JWT_ALGORITHM", "JWT__ALGORITHM"),
     )
+    INTROSPECTION_API_KEYS: list[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("INTROSPECTION_API_KEYS"),
+    )
+    INTROSPECTION_MAX_BATCH: int = Field(
+        default=100,
+        validation_alias=AliasChoices("INTROSPECTION_MAX_BATCH"),
+    )
+    AUTHZ_CHECK_MAX_BATCH: int = Field(
+        default=100,
+        validation_alias=AliasChoices("AUTHZ_CHECK_MAX_BATCH"),
+    )
+    ROLE_ASSIGNMENT_BATCH_SIZE: int = Field(
+        default=500,
+        validation_alias=AliasChoices("ROLE_ASSIGNMENT_BATCH_SIZE"),
+    )
+    PAGINATION_ESTIMATE_MIN_ROWS: int = Field(
+        default=10000,
+        validation_alias=AliasChoices("PAGINATION_ESTIMATE_MIN_ROWS"),
+    )
+    JWT_DECODE_CACHE_TTL_SECONDS: int = Field(
+        default=300,
+        validation_alias=AliasChoices("JWT_DECODE_CACHE_TTL_SECONDS"),
+    )
+    JWT_DECODE_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        validation_alias=AliasChoices("JWT_DECODE_CACHE_MAX_ENTRIES"),
+    )
+    JWT_COMPACT_CLAIMS: bool = Field(
+        default=False,
+        validation_alias=AliasChoices("JWT_COMPACT_CLAIMS", "JWT__COMPACT_CLAIMS"),
+    )
+    JWT_PRIVATE_KEYS: dict[str, str] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("JWT_PRIVATE_KEYS", "JWT__PRIVATE_KEYS"),
+    )
+    JWT_PUBLIC_KEYS: dict[str, str] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("JWT_PUBLIC_KEYS", "JWT__PUBLIC_KEYS"),
+    )
+    JWT_ACTIVE_KEY_ID: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("JWT_ACTIVE_KEY_ID", "JWT__ACTIVE_KEY_ID"),
+    )
+    JWKS_CACHE_MAX_AGE_SECONDS: int = Field(
+        default=3600,
+        validation_alias=AliasChoices("JWKS_CACHE_MAX_AGE_SECONDS"),
+    )
     JWT_TIMEOUT: int = Field(
         default=15,
         validation_alias=AliasChoices("JWT_TIMEOUT", "JWT__TIMEOUT"),
@@ -207,6 +353,7 @@ class Settings(BaseSettings):
 
         if (
             self.JWT_SECRET == DEFAULT_JWT_SECRET
+            and self.JWT_ALGORITHM in HMAC_JWT_ALGORITHMS
             and not self.TESTING
             and self.ENVIRONMENT not in INSECURE_JWT_SECRET_ALLOWED_ENVIRONMENTS
         ):
@@ -214,6 +361,57 @@ class Settings(BaseSettings):
                 "JWT_SECRET must be explicitly set outside development/testing environments"
             )
 
+        if self.JWT_ALGORITHM not in HMAC_JWT_ALGORITHMS:
+            if not self.JWT_PRIVATE_KEYS:
+                raise ValueError(
+                    f"JWT_PRIVATE_KEYS must define at least one {self.JWT_ALGORITHM} key"
+                )
+            if (
+                self.JWT_ACTIVE_KEY_ID
+                and self.JWT_ACTIVE_KEY_ID not in self.JWT_PRIVATE_KEYS
+            ):
+                raise ValueError(
+                    "JWT_ACTIVE_KEY_ID must name a key in JWT_PRIVATE_KEYS"
+                )
+
+        object.__setattr__(
+            self, "RATE_LIMIT_BACKEND", self.RATE_LIMIT_BACKEND.strip().lower()
+        )
+        if self.RATE_LIMIT_BACKEND not in RATE_LIMIT_BACKENDS:
+            raise ValueError(
+                "RATE_LIMIT_BACKEND must be one of: "
+                + ", ".join(sorted(RATE_LIMIT_BACKENDS))
+            )
+
+        object.__setattr__(
+            self, "RATE_LIMIT_ALGORITHM", self.RATE_LIMIT_ALGORITHM.strip().lower()
+        )
+        if self.RATE_LIMIT_ALGORITHM not in RATE_LIMIT_ALGORITHMS:
+            raise ValueError(
+                "RATE_LIMIT_ALGORITHM must be one of: "
+                + ", ".join(sorted(RATE_LIMIT_ALGORITHMS))
+            )
+
+        if self.PASSWORD_HASH_ROUNDS is None:
+            object.__setattr__(
+                self,
+                "PASSWORD_HASH_ROUNDS",
+                (
+                    MIN_PASSWORD_HASH_ROUNDS
+                    if self.TESTING
+                    else DEFAULT_PASSWORD_HASH_ROUNDS
+                ),
+            )
+        if not (
+            MIN_PASSWORD_HASH_ROUNDS
+            <= self.PASSWORD_HASH_ROUNDS
+            <= MAX_PASSWORD_HASH_ROUNDS
+        ):
+            raise ValueError(
+                f"PASSWORD_HASH_ROUNDS must be between {MIN_PASSWORD_HASH_ROUNDS} "
+                f"and {MAX_PASSWORD_HASH_ROUNDS}"
+            )
+
         if not self.DATABASE_URL:
             object.__setattr__(self, "DATABASE_URL", self._build_database_url())
 
@@ -191,7 +191,7 @@ def register_exception_handlers(app: FastAPI) -> None:
                 "status_code": exc.status_code,
             },
         )
-        return json_error(
+        response = json_error(
             status_code=exc.status_code,
             correlation_id=correlation_id,
             message=message,
@@ -200,6 +200,9 @@ def register_exception_handlers(app: FastAPI) -> None:
             # even when the originating AppError did not include a specific code.
             extra={"error": error},
         )
+        if exc.headers:
+            response.headers.update(exc.headers)
+        return response
 
     @app.exception_handler(Exception)
     async def unhandled_exception_handler(request: Request, exc: Exception):
@@ -3,6 +3,7 @@ import logging.config
 import os
 from contextlib import asynccontextmanager
 
+import anyio
 import click
 import uvicorn
 from fastapi import FastAPI
@@ -12,12 +13,18 @@ from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from uvicorn.config import Config
 from uvicorn.server import Server
 
-from app.repository.database.session_manager import get_engine
+from app.repository.database.session_manager import get_engine, session_local
+from app.repository.default_catalog import DEFAULT_ROLE_CATALOG
 from app.exceptions import register_exception_handlers
+from app.services.cache_invalidation import CacheInvalidationBus
+from app.services.expired_artifacts import ExpiredArtifactPurger
+from app.services.revocation_sync import RevocationListSynchronizer
 
 # user routers
+from app.api.dependencies.rate_limit import validate_route_rate_limits
 from app.api.middleware.logging import LogMiddleware
 from app.api.middleware.profiling import ProfilingMiddleware
+from app.api.middleware.query_count import QueryCountMiddleware
 
 # from app.models.tags import UserverseApiTag
 from app.api.routers.user import (
@@ -34,18 +41,41 @@ from app.api.routers.company import (
 from app.api.routers import roles as global_roles
 from app.api.routers import permissions as global_permissions
 from app.api.routers import platform_roles
+from app.api.routers import authorization
+from app.api.routers import well_known
+from app.api.routers import introspection
 from app.api.routers.company import permissions as company_permissions
 
 # utils
 from app.configs import settings
 from app.utils.logging import get_uvicorn_log_config, logger
+from app.utils.rate_limiter import run_rate_limit_sweeper
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Userverse API starting up")
+    validate_route_rate_limits()
     get_engine()
-    yield
+    if not settings.TESTING:
+        try:
+            await anyio.to_thread.run_sync(DEFAULT_ROLE_CATALOG.warm, session_local)
+        except Exception:
+            logger.exception("Failed to reconcile default roles; retrying on use")
+    async with anyio.create_task_group() as task_group:
+        if settings.AUTH_STATELESS_VERIFICATION:
+            task_group.start_soon(RevocationListSynchronizer().run)
+        if settings.RATE_LIMIT_ALGORITHM == "gcra":
+            task_group.start_soon(run_rate_limit_sweeper)
+        if settings.PURGE_EXPIRED_INTERVAL_SECONDS > 0:
+            task_group.start_soon(ExpiredArtifactPurger().run)
+        if settings.CACHE_INVALIDATION_POLL_SECONDS > 0 and not settings.TESTING:
+            bus = CacheInvalidationBus()
+            task_group.start_soon(bus.run)
+            if settings.CACHE_INVALIDATION_LISTEN:
+                task_group.start_soon(bus.listen)
+        yield
+        task_group.cancel_scope.cancel()
     logger.info("Userverse API shutting down")
 
 
@@ -76,6 +106,8 @@ def create_app() -> FastAPI:
         app.add_middleware(LogMiddleware)
     if settings.ENABLE_PROFILING and not settings.TESTING:
         app.add_middleware(ProfilingMiddleware)
+    if settings.DEBUG_QUERY_COUNT:
+        app.add_middleware(QueryCountMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=origins,
@@ -97,6 +129,9 @@ def create_app() -> FastAPI:
     app.include_router(global_roles.router)
     app.include_router(global_permissions.router)
     app.include_router(platform_roles.router)
+    app.include_router(well_known.router)
+    app.include_router(introspection.router)
+    app.include_router(authorization.router)
 
     # Root route
     @app.get("/", tags=["Root"])
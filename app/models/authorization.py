@@ -0,0 +1,34 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.models.system_permissions import SystemPermission
+
+
+class AccessCheckModel(BaseModel):
+    company_id: UUID = Field(..., description="Company to check")
+    permission: SystemPermission = Field(..., description="System permission name")
+
+
+class AccessCheckRequestModel(BaseModel):
+    user_id: Optional[UUID] = Field(
+        None,
+        description="User to check; defaults to the caller. Superusers only.",
+    )
+    checks: list[AccessCheckModel] = Field(
+        ...,
+        min_length=1,
+        description="Pairs to decide; at most AUTHZ_CHECK_MAX_BATCH",
+    )
+
+
+class AccessDecisionModel(AccessCheckModel):
+    allowed: bool = Field(..., description="Whether the user holds the permission")
+
+
+class AccessCheckResponseModel(BaseModel):
+    user_id: UUID = Field(..., description="User the decisions apply to")
+    results: list[AccessDecisionModel] = Field(
+        ..., description="One decision per submitted pair, in request order"
+    )
@@ -1,10 +1,23 @@
 # app/models/generic_pagination.py
-from typing import Any, Generic, Iterable, List, TypeVar
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Generic, Iterable, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from fastapi import status
 from pydantic import BaseModel, Field
 from enum import Enum
+from sqlalchemy import func, literal, tuple_
+
+from app.configs import settings
+from app.utils.app_error import AppError
 
 T = TypeVar("T")
 
+INVALID_CURSOR_MESSAGE = "Invalid pagination cursor."
+
 
 class MatchType(str, Enum):
     PARTIAL = "partial"
@@ -17,16 +30,35 @@ class FilterLogic(str, Enum):
     AND = "and"
 
 
+class TotalMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
 class PaginationParams(BaseModel):
     limit: int = Field(10, ge=1, le=100)
     page: int = Field(1, ge=1)  # Page is 1-indexed
+    cursor: Optional[str] = Field(
+        None,
+        description="next_cursor from the previous page. Takes precedence over page.",
+    )
+    total: TotalMode = Field(
+        TotalMode.EXACT,
+        description=(
+            "Use 'estimate' to accept the planner's row estimate on large "
+            "listings, or 'none' to skip counting the matching records."
+        ),
+    )
 
 
 class PaginationMeta(BaseModel):
-    total_records: int
+    total_records: Optional[int]
     limit: int
     current_page: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -43,13 +75,24 @@ def get_total_pages(*, total_records: int, limit: int) -> int:
 
 
 def build_pagination_meta(
-    *, total_records: int, limit: int, page: int
+    *,
+    total_records: int | None,
+    limit: int,
+    page: int,
+    next_cursor: str | None = None,
+    total_is_estimate: bool = False,
 ) -> PaginationMeta:
     return PaginationMeta(
         total_records=total_records,
         limit=limit,
         current_page=page,
-        total_pages=get_total_pages(total_records=total_records, limit=limit),
+        total_pages=(
+            None
+            if total_records is None
+            else get_total_pages(total_records=total_records, limit=limit)
+        ),
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
     )
 
 
@@ -59,3 +102,127 @@ def apply_pagination(query: Any, *, page: int, limit: int, order_by: Iterable[An
         .offset(get_page_offset(page=page, limit=limit))
         .limit(limit)
     )
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else str(value)
+            for value in values
+        ],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> list[Any]:
+    """Read the order key values that ``encode_cursor`` wrote for ``keys``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match this listing")
+        return [_parse_key(key, value) for key, value in zip(keys, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise AppError(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            message=INVALID_CURSOR_MESSAGE,
+            error=str(exc),
+        ) from exc
+
+
+def _parse_key(key: Any, value: str) -> Any:
+    # encode_cursor writes every value as a string; anything else is forged.
+    if not isinstance(value, str):
+        raise ValueError("cursor values must be strings")
+    python_type = key.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is UUID:
+        return UUID(value)
+    return python_type(value)
+
+
+def supports_window_count(dialect: Any) -> bool:
+    """Whether ``COUNT(*) OVER ()`` can ride along with the page query."""
+    if dialect.name == "postgresql":
+        return True
+    if dialect.name == "sqlite":
+        return (dialect.server_version_info or (0,)) >= (3, 25)
+    return False
+
+
+def planner_row_estimate(query: Any) -> int:
+    """Rows the Postgres planner expects ``query`` to return, without running it."""
+    connection = query.session.connection()
+    compiled = query.statement.compile(dialect=connection.dialect)
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def paginate_query(
+    query: Any, params: PaginationParams, *, keys: Sequence[Any]
+) -> tuple[list[Any], PaginationMeta]:
+    """
+    Return one page of ``query`` ordered ascending by ``keys``, which must
+    identify a row uniquely. With ``params.cursor`` the page starts after the
+    row the cursor names, so deep pages cost the same as the first and
+    concurrent inserts never shift rows between pages. Otherwise
+    ``params.page`` selects an offset page. Either way ``next_cursor`` names
+    the last row returned when more rows follow.
+
+    Offset pages read the total through ``COUNT(*) OVER ()`` in the page query
+    itself. Cursor pages, and databases without window functions, count in a
+    separate query, since the cursor filter would shrink the windowed count.
+    ``TotalMode.ESTIMATE`` takes the Postgres planner's estimate instead when
+    it reaches ``PAGINATION_ESTIMATE_MIN_ROWS`` and counts exactly otherwise.
+    """
+    dialect = query.session.get_bind().dialect
+    total = None
+    total_is_estimate = False
+    if params.total is TotalMode.ESTIMATE and dialect.name == "postgresql":
+        estimate = planner_row_estimate(query)
+        if estimate >= settings.PAGINATION_ESTIMATE_MIN_ROWS:
+            total, total_is_estimate = estimate, True
+    counting = params.total is not TotalMode.NONE and not total_is_estimate
+    window_count = counting and not params.cursor and supports_window_count(dialect)
+    if counting and not window_count:
+        total = query.count()
+
+    offset = 0
+    page_query = query
+    if params.cursor:
+        values = decode_cursor(params.cursor, keys)
+        page_query = query.filter(
+            tuple_(*keys)
+            > tuple_(*(literal(value, key.type) for key, value in zip(keys, values)))
+        )
+    else:
+        offset = get_page_offset(page=params.page, limit=params.limit)
+    columns = [*keys, func.count().over()] if window_count else keys
+    rows = (
+        page_query.add_columns(*columns)
+        .order_by(*(key.asc() for key in keys))
+        .offset(offset)
+        .limit(params.limit + 1)
+        .all()
+    )
+    if window_count:
+        # A page past the end carries no rows, and so no count, with it.
+        total = rows[0][-1] if rows else (query.count() if offset else 0)
+    next_cursor = (
+        encode_cursor(tuple(rows[params.limit - 1])[1 : len(keys) + 1])
+        if len(rows) > params.limit
+        else None
+    )
+    return [row[0] for row in rows[: params.limit]], build_pagination_meta(
+        total_records=total,
+        limit=params.limit,
+        page=params.page,
+        next_cursor=next_cursor,
+        total_is_estimate=total_is_estimate,
+    )
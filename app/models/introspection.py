@@ -0,0 +1,30 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class TokenIntrospectionBatchRequestModel(BaseModel):
+    tokens: list[str] = Field(
+        ...,
+        min_length=1,
+        description="Access tokens to check; at most INTROSPECTION_MAX_BATCH",
+    )
+
+
+class TokenIntrospectionResultModel(BaseModel):
+    active: bool = Field(
+        ..., description="Whether the token is currently valid for its user"
+    )
+    sub: Optional[UUID] = Field(None, description="User id, for active tokens only")
+    exp: Optional[int] = Field(None, description="Token expiry as a Unix timestamp")
+    status: Optional[str] = Field(None, description="Current account status")
+    is_superuser: Optional[bool] = Field(
+        None, description="Current superuser flag of the user"
+    )
+
+
+class TokenIntrospectionBatchResponseModel(BaseModel):
+    results: list[TokenIntrospectionResultModel] = Field(
+        ..., description="One result per submitted token, in request order"
+    )
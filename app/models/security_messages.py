@@ -16,3 +16,13 @@ class SecurityResponseMessages(str, Enum):
     EXPIRED_TOKEN = "Token has expired"
     ERROR_DECODING = "Error decoding token"
     INVALID_REQUEST = "Invalid request"
+    INVALID_API_KEY = "Invalid or missing API key"
+    INTROSPECTION_BATCH_TOO_LARGE = "Too many tokens in introspection batch"
+    TOKENS_INTROSPECTED = "Tokens introspected successfully"
+    ACCESS_CHECK_BATCH_TOO_LARGE = "Too many pairs in access check"
+    ACCESS_CHECK_OTHER_USER_FORBIDDEN = (
+        "Only superusers can check access for another user"
+    )
+    ACCESS_CHECKED = "Access decisions resolved successfully"
+    PASSWORD_HASHING_BUSY = "Too many sign-in requests, please retry shortly"
+    RATE_LIMITED = "Too many requests, please retry later"
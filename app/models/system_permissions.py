@@ -30,6 +30,11 @@ class SystemPermission(str, Enum):
     def permission_id(self) -> UUID:
         return uuid5(SYSTEM_PERMISSION_NAMESPACE, self.value)
 
+    @property
+    def bit(self) -> int:
+        """This permission's flag in a compiled permission bitmask."""
+        return SYSTEM_PERMISSION_BITS[self]
+
 
 @dataclass(frozen=True)
 class SystemPermissionDefinition:
@@ -142,6 +147,10 @@ SYSTEM_PERMISSION_BY_NAME = {
     definition.name: definition for definition in SYSTEM_PERMISSION_DEFINITIONS
 }
 
+SYSTEM_PERMISSION_BITS = {
+    permission: 1 << index for index, permission in enumerate(SystemPermission)
+}
+
 
 def is_system_permission_id(permission_id: UUID) -> bool:
     return permission_id in SYSTEM_PERMISSION_BY_ID
@@ -28,6 +28,21 @@ class UserverseApiTag(Enum):
         "Manage roles and permissions for company users",
     )
 
+    TOKEN_VERIFICATION = (
+        "Token Verification",
+        "Public signing keys for verifying Userverse tokens offline",
+    )
+
+    TOKEN_INTROSPECTION = (
+        "Token Introspection",
+        "Endpoints for trusted services to check whether user tokens are active",
+    )
+
+    ACCESS_DECISIONS = (
+        "Access Decisions",
+        "Endpoints to decide many company permission checks in one call",
+    )
+
     def __init__(self, tag: str, description: str):
         self._tag = tag
         self._description = description
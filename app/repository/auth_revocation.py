@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.configs import settings
+from app.repository.base import BaseSQLRepository
+from app.repository.database.tables import AuthRevocation
+
+
+class AuthRevocationRepository(BaseSQLRepository[AuthRevocation]):
+    model = AuthRevocation
+
+    def record(
+        self, user_id: UUID, refresh_token_version: int, *, reason: str
+    ) -> AuthRevocation | None:
+        """
+        Stage a revocation of every access token carrying ``user_id`` and
+        ``refresh_token_version``. The caller commits it together with the
+        change that caused it. Nothing is recorded unless
+        ``AUTH_STATELESS_VERIFICATION`` is enabled.
+        """
+        if not settings.AUTH_STATELESS_VERIFICATION:
+            return None
+        now = datetime.now(timezone.utc)
+        revocation = AuthRevocation(
+            user_id=user_id,
+            refresh_token_version=refresh_token_version,
+            reason=reason,
+            expires_at=now + timedelta(minutes=int(settings.JWT_TIMEOUT)),
+        )
+        self.db_session.add(revocation)
+        return revocation
+
+    def live_pairs(self, *, since: datetime | None = None) -> list[tuple[UUID, int]]:
+        """Return unexpired ``(user_id, version)`` pairs, optionally only recent ones."""
+        query = self.db_session.query(
+            AuthRevocation.user_id, AuthRevocation.refresh_token_version
+        ).filter(AuthRevocation.expires_at > datetime.now(timezone.utc))
+        if since is not None:
+            query = query.filter(AuthRevocation._created_at >= since)
+        return [(row.user_id, row.refresh_token_version) for row in query]
+
+    def purge_expired(self, *, batch_size: int = 1000) -> int:
+        """Delete expired revocations in batches; returns the number removed."""
+        now = datetime.now(timezone.utc)
+        deleted = 0
+        while True:
+            ids = [
+                row.id
+                for row in self.db_session.query(AuthRevocation.id)
+                .filter(AuthRevocation.expires_at <= now)
+                .limit(batch_size)
+            ]
+            if not ids:
+                return deleted
+            self.db_session.query(AuthRevocation).filter(
+                AuthRevocation.id.in_(ids)
+            ).delete(synchronize_session=False)
+            self.db_session.commit()
+            deleted += len(ids)
@@ -1,14 +1,67 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+from contextlib import contextmanager
+from typing import Any, Callable, Generic, Iterator, TypeVar
 
 from sqlalchemy.orm import Session
 
-from app.models.generic_pagination import apply_pagination, build_pagination_meta
+from app.models.generic_pagination import PaginationParams, paginate_query
 from app.repository.database.base_model import RecordNotFoundError, to_dict
 
 TModel = TypeVar("TModel")
 
+_UNIT_OF_WORK = "unit_of_work"
+
+
+class _UnitOfWork:
+    def __init__(self) -> None:
+        self.after_commit: list[Callable[[], None]] = []
+
+
+@contextmanager
+def unit_of_work(session: Session) -> Iterator[Session]:
+    """
+    Run every repository write in the block as one transaction.
+
+    Inside the block, repository commits only flush, so later queries still
+    see earlier writes, and the block commits once when it exits. An
+    exception rolls the whole block back. Nested blocks on the same session
+    join the outermost one. Callbacks passed to ``after_commit`` wait for the
+    final commit and are dropped on rollback.
+    """
+    if _UNIT_OF_WORK in session.info:
+        yield session
+        return
+    unit = session.info[_UNIT_OF_WORK] = _UnitOfWork()
+    try:
+        yield session
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(_UNIT_OF_WORK, None)
+    for callback in unit.after_commit:
+        callback()
+
+
+def commit_or_flush(session: Session, *records: Any) -> None:
+    """Commit and refresh ``records``, or only flush inside ``unit_of_work``."""
+    if _UNIT_OF_WORK in session.info:
+        session.flush()
+        return
+    session.commit()
+    for record in records:
+        session.refresh(record)
+
+
+def after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """Run ``callback`` now, or after the enclosing ``unit_of_work`` commits."""
+    if _UNIT_OF_WORK in session.info:
+        session.info[_UNIT_OF_WORK].after_commit.append(callback)
+        return
+    callback()
+
 
 class BaseSQLRepository(Generic[TModel]):
     model: type[TModel]
@@ -19,6 +72,13 @@ class BaseSQLRepository(Generic[TModel]):
     def _base_query(self):
         return self.db_session.query(self.model)
 
+    def transaction(self):
+        """Group several writes into one commit; see ``unit_of_work``."""
+        return unit_of_work(self.db_session)
+
+    def _after_commit(self, callback: Callable[[], None]) -> None:
+        after_commit(self.db_session, callback)
+
     def get_by_id(self, record_id: Any) -> TModel:
         record = self._base_query().filter_by(id=record_id).one_or_none()
         if record is None:
@@ -28,22 +88,20 @@ class BaseSQLRepository(Generic[TModel]):
     def create(self, **kwargs: Any) -> TModel:
         record = self.model(**kwargs)
         self.db_session.add(record)
-        self.db_session.commit()
-        self.db_session.refresh(record)
+        commit_or_flush(self.db_session, record)
         return record
 
     def update(self, record: TModel, **kwargs: Any) -> TModel:
         for field, value in kwargs.items():
             setattr(record, field, value)
         self.db_session.add(record)
-        self.db_session.commit()
-        self.db_session.refresh(record)
+        commit_or_flush(self.db_session, record)
         return record
 
     def soft_delete(self, record: TModel) -> None:
         setattr(record, "_closed_at", self._now_sql())
         self.db_session.add(record)
-        self.db_session.commit()
+        commit_or_flush(self.db_session)
 
     def update_json_field(
         self,
@@ -65,27 +123,16 @@ class BaseSQLRepository(Generic[TModel]):
 
         json_field[key] = value
         self.db_session.add(record)
-        self.db_session.commit()
-        self.db_session.refresh(record)
+        commit_or_flush(self.db_session, record)
         return record
 
     def paginate(
-        self, query, *, page: int, limit: int, order_by: list[Any]
+        self, query, params: PaginationParams, *, keys: list[Any]
     ) -> dict[str, Any]:
-        total_records = query.count()
-        records = apply_pagination(
-            query,
-            page=page,
-            limit=limit,
-            order_by=order_by,
-        ).all()
+        records, pagination = paginate_query(query, params, keys=keys)
         return {
             "records": [to_dict(record) for record in records],
-            "pagination": build_pagination_meta(
-                total_records=total_records,
-                limit=limit,
-                page=page,
-            ),
+            "pagination": pagination,
         }
 
     @staticmethod
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import select, text, update
+from sqlalchemy.orm import Session
+
+from app.repository.database.tables import CacheGeneration
+
+# Postgres channel that carries each bumped key, sent when the bump commits.
+CACHE_GENERATION_CHANNEL = "userverse_cache_generation"
+# Scopes keyed by a user or company id are split so one write only invalidates
+# a slice of every worker's cache and never contends on one row.
+CACHE_PARTITIONS = 64
+
+
+class CacheScope(str, Enum):
+    USERS = "users"
+    COMPANY_PERMISSIONS = "company_permissions"
+    DEFAULT_ROLES = "default_roles"
+
+
+def cache_partition(key: UUID) -> int:
+    return key.int % CACHE_PARTITIONS
+
+
+def generation_key(scope: CacheScope, partition: int | None = None) -> str:
+    return scope.value if partition is None else f"{scope.value}:{partition}"
+
+
+def parse_generation_key(key: str) -> tuple[CacheScope, int | None] | None:
+    """Split a stored key into its scope and partition; None for unknown scopes."""
+    scope, _, partition = key.partition(":")
+    try:
+        return CacheScope(scope), int(partition) if partition else None
+    except ValueError:
+        return None
+
+
+class CacheGenerationRepository:
+    """Publishes and reads the cross-worker cache invalidation counters."""
+
+    def __init__(self, session: Session):
+        self.db_session = session
+
+    def bump(self, scope: CacheScope, *, key: UUID | None = None) -> None:
+        """
+        Stage an invalidation of ``scope``, or only of the partition holding
+        ``key``. The caller commits it together with the change that caused
+        it, so other workers never see the bump without the write.
+        """
+        generation = generation_key(
+            scope, None if key is None else cache_partition(key)
+        )
+        updated = self.db_session.execute(
+            update(CacheGeneration)
+            .where(CacheGeneration.key == generation)
+            .values(generation=CacheGeneration.generation + 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not updated:
+            self.db_session.add(CacheGeneration(key=generation, generation=1))
+            self.db_session.flush()
+        if self.db_session.get_bind().dialect.name == "postgresql":
+            self.db_session.execute(
+                text("SELECT pg_notify(:channel, :key)"),
+                {"channel": CACHE_GENERATION_CHANNEL, "key": generation},
+            )
+
+    def generations(self) -> dict[str, int]:
+        return {
+            row.key: row.generation
+            for row in self.db_session.execute(
+                select(CacheGeneration.key, CacheGeneration.generation)
+            )
+        }
+
+
+__all__ = [
+    "CACHE_GENERATION_CHANNEL",
+    "CACHE_PARTITIONS",
+    "CacheGenerationRepository",
+    "CacheScope",
+    "cache_partition",
+    "generation_key",
+    "parse_generation_key",
+]
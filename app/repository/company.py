@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from fastapi import status
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import contains_eager
 
@@ -16,8 +17,7 @@ from app.models.company.response_messages import CompanyResponseMessages
 from app.models.company.roles import CompanyDefaultRoles, RoleReadModel
 from app.models.generic_pagination import (
     PaginatedResponse,
-    apply_pagination,
-    build_pagination_meta,
+    paginate_query,
 )
 from app.repository.base import BaseSQLRepository
 from app.repository.company_user import CompanyUserRepository
@@ -27,7 +27,10 @@ from app.repository.database.tables import (
     CompanyRole,
     Role,
 )
+from app.repository.default_catalog import DEFAULT_ROLE_CATALOG
+from app.repository.effective_permission import EffectivePermissionRepository
 from app.utils.app_error import AppError
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
 
 
 class CompanyRepository(BaseSQLRepository[Company]):
@@ -58,38 +61,6 @@ class CompanyRepository(BaseSQLRepository[Company]):
             .one_or_none()
         )
 
-    def _ensure_default_roles(self) -> dict[str, Role]:
-        default_roles: dict[str, Role] = {}
-        created_role_names: set[str] = set()
-        for default_role in CompanyDefaultRoles:
-            role = (
-                self.db_session.query(Role)
-                .filter(
-                    Role.name == default_role.name_value,
-                    Role._closed_at.is_(None),
-                )
-                .one_or_none()
-            )
-            if role is None:
-                role = Role(
-                    name=default_role.name_value,
-                    description=default_role.description,
-                )
-                self.db_session.add(role)
-                self.db_session.flush()
-                created_role_names.add(default_role.name_value)
-            elif role.description != default_role.description:
-                role.description = default_role.description
-            default_roles[default_role.name_value] = role
-        from app.repository.permission import SystemPermissionRepository
-
-        SystemPermissionRepository(self.db_session).seed_new_default_roles(
-            default_roles,
-            created_role_names,
-        )
-        self.db_session.commit()
-        return default_roles
-
     def create_company(
         self, payload: CompanyCreateModel, created_by
     ) -> CompanyReadModel:
@@ -100,40 +71,48 @@ class CompanyRepository(BaseSQLRepository[Company]):
                 message=CompanyResponseMessages.COMPANY_ALREADY_EXISTS.value,
             )
 
-        try:
-            company = self.create(**payload.model_dump(exclude={"address"}))
-        except IntegrityError as exc:
-            self.db_session.rollback()
-            raise AppError(
-                status_code=status.HTTP_409_CONFLICT,
-                message=CompanyResponseMessages.COMPANY_ALREADY_EXISTS.value,
-            ) from exc
+        with self.transaction():
+            try:
+                company = self.create(**payload.model_dump(exclude={"address"}))
+            except IntegrityError as exc:
+                raise AppError(
+                    status_code=status.HTTP_409_CONFLICT,
+                    message=CompanyResponseMessages.COMPANY_ALREADY_EXISTS.value,
+                ) from exc
+
+            if payload.address:
+                company = self.update_json_field(
+                    company,
+                    column_name="primary_meta_data",
+                    key="address",
+                    value=payload.address.model_dump(),
+                )
 
-        if payload.address:
-            company = self.update_json_field(
-                company,
-                column_name="primary_meta_data",
-                key="address",
-                value=payload.address.model_dump(),
+            catalog = DEFAULT_ROLE_CATALOG.get(self.db_session)
+            self.db_session.execute(
+                insert(CompanyRole),
+                [
+                    {"company_id": company.id, "role_id": role_id}
+                    for role_id in catalog.role_ids.values()
+                ],
+            )
+            EffectivePermissionRepository(self.db_session).refresh(
+                company_id=company.id, company_created=True
             )
 
-        default_roles = self._ensure_default_roles()
-        for role in default_roles.values():
-            self.db_session.add(CompanyRole(company_id=company.id, role_id=role.id))
-        self.db_session.commit()
-
-        CompanyUserRepository(self.db_session).add_user_to_company(
-            company_id=company.id,
-            payload=type(
-                "Payload",
-                (),
-                {
-                    "email": created_by.email,
-                    "role": CompanyDefaultRoles.OWNER.name_value,
-                },
-            )(),
-            added_by=created_by,
-        )
+            CompanyUserRepository(self.db_session).add_user_to_company(
+                company_id=company.id,
+                payload=type(
+                    "Payload",
+                    (),
+                    {
+                        "email": created_by.email,
+                        "role": CompanyDefaultRoles.OWNER.name_value,
+                    },
+                )(),
+                added_by=created_by,
+                company_created=True,
+            )
         company = self._get_company_record_by_id(company.id)
         return self._to_read_model(company)
 
@@ -166,15 +145,16 @@ class CompanyRepository(BaseSQLRepository[Company]):
             )
 
         update_payload = payload.model_dump(exclude={"address"}, exclude_none=True)
-        if update_payload:
-            company = self.update(company, **update_payload)
-        if payload.address:
-            company = self.update_json_field(
-                company,
-                column_name="primary_meta_data",
-                key="address",
-                value=payload.address.model_dump(),
-            )
+        with self.transaction():
+            if update_payload:
+                company = self.update(company, **update_payload)
+            if payload.address:
+                company = self.update_json_field(
+                    company,
+                    column_name="primary_meta_data",
+                    key="address",
+                    value=payload.address.model_dump(),
+                )
         return self._to_read_model(company)
 
     def delete_company(self, company_id: UUID) -> None:
@@ -185,7 +165,11 @@ class CompanyRepository(BaseSQLRepository[Company]):
                 message=CompanyResponseMessages.COMPANY_NOT_FOUND.value,
             )
 
-        self.soft_delete(company)
+        company._closed_at = self._now_sql()
+        self.db_session.add(company)
+        EffectivePermissionRepository(self.db_session).refresh(company_id=company_id)
+        self.db_session.commit()
+        COMPANY_PERMISSION_CACHE.invalidate_company(company_id)
 
     def get_user_companies(
         self, user_id: UUID, params: CompanyQueryParamsModel
@@ -211,19 +195,14 @@ class CompanyRepository(BaseSQLRepository[Company]):
         if params.email:
             query = query.filter(Company.email.ilike(f"%{params.email}%"))
 
-        total = query.count()
-        results = apply_pagination(
+        results, pagination = paginate_query(
             query.options(
                 contains_eager(AssociationUserCompany.company),
                 contains_eager(AssociationUserCompany.role),
             ),
-            page=params.page,
-            limit=params.limit,
-            order_by=[
-                AssociationUserCompany._created_at.asc(),
-                Company.id.asc(),
-            ],
-        ).all()
+            params,
+            keys=[AssociationUserCompany._created_at, Company.id],
+        )
         from app.repository.permission import RolePermissionRepository
 
         permission_map = RolePermissionRepository(
@@ -247,10 +226,5 @@ class CompanyRepository(BaseSQLRepository[Company]):
             for assoc in results
         ]
         return PaginatedResponse[UserCompanyReadModel](
-            records=companies,
-            pagination=build_pagination_meta(
-                total_records=total,
-                limit=params.limit,
-                page=params.page,
-            ),
+            records=companies, pagination=pagination
         )
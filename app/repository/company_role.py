@@ -1,9 +1,13 @@
+from dataclasses import dataclass
+from typing import Callable
 from uuid import UUID
 
 from fastapi import status
+from sqlalchemy import insert, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.configs import settings
 from app.models.company.response_messages import (
     CompanyRoleResponseMessages,
     CompanyUserResponseMessages,
@@ -20,6 +24,7 @@ from app.models.user.user import UserReadModel
 from app.repository.base import BaseSQLRepository
 from app.repository.database.tables import (
     AssociationUserCompany,
+    Company,
     CompanyRole,
     CompanyRolePermission,
     Role,
@@ -27,7 +32,20 @@ from app.repository.database.tables import (
     User,
     UserRole,
 )
+from app.repository.default_catalog import (
+    DEFAULT_ROLE_CATALOG,
+    DefaultRoleCatalogRepository,
+)
+from app.repository.effective_permission import EffectivePermissionRepository
 from app.utils.app_error import AppError
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
+
+
+@dataclass(frozen=True)
+class RoleAssignmentProgress:
+    processed: int
+    total: int
+    assigned: int
 
 
 class RoleRepository(BaseSQLRepository[Role]):
@@ -77,12 +95,7 @@ class RoleRepository(BaseSQLRepository[Role]):
                 query = query.filter(Role.name.ilike(f"%{payload.name}%"))
             if payload.description:
                 query = query.filter(Role.description.ilike(f"%{payload.description}%"))
-            result = self.paginate(
-                query,
-                page=payload.page,
-                limit=payload.limit,
-                order_by=[Role.name.asc()],
-            )
+            result = self.paginate(query, payload, keys=[Role.name, Role.id])
             from app.repository.permission import RolePermissionRepository
 
             permission_map = RolePermissionRepository(
@@ -93,6 +106,8 @@ class RoleRepository(BaseSQLRepository[Role]):
             for record in result["records"]:
                 record["permissions"] = permission_map.get(record["id"], [])
             return result
+        except AppError:
+            raise
         except Exception as exc:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -192,11 +207,17 @@ class RoleRepository(BaseSQLRepository[Role]):
                         f"Role with company_id={self.company_id} and name='{role_id}' not found."
                     )
                 raise ValueError(f"Role with id='{role_id}' not found.")
+            renamed = False
             if payload.name:
+                renamed = DefaultRoleCatalogRepository(self.db_session).publish_change(
+                    role.name, payload.name
+                )
                 role.name = payload.name
             if payload.description is not None:
                 role.description = payload.description
             self.db_session.commit()
+            if renamed:
+                DEFAULT_ROLE_CATALOG.reset()
             self.db_session.refresh(role)
             return self._to_scoped_read_model(role, self.db_session)
         except Exception as exc:
@@ -227,13 +248,19 @@ class RoleRepository(BaseSQLRepository[Role]):
                     error="deleted_by is required for role deletion.",
                 )
             try:
-                return Role.delete_role_and_reassign_users(
+                result = Role.delete_role_and_reassign_users(
                     session=self.db_session,
                     company_id=self.company_id,
                     name_to_delete=payload.role_name_to_delete,
                     replacement_name=payload.replacement_role_name,
                     deleted_by=deleted_by,
                 )
+                EffectivePermissionRepository(self.db_session).refresh(
+                    company_id=self.company_id
+                )
+                self.db_session.commit()
+                COMPANY_PERMISSION_CACHE.invalidate_company(self.company_id)
+                return result
             except Exception as exc:
                 self.db_session.rollback()
                 raise AppError(
@@ -285,7 +312,13 @@ class RoleRepository(BaseSQLRepository[Role]):
 
             role._closed_at = self._now_sql()
             self.db_session.add(role)
+            EffectivePermissionRepository(self.db_session).refresh(role_id=role_id)
+            closed_default = DefaultRoleCatalogRepository(
+                self.db_session
+            ).publish_change(role.name)
             self.db_session.commit()
+            if closed_default:
+                DEFAULT_ROLE_CATALOG.reset()
             self.update_json_field(
                 role,
                 column_name="primary_meta_data",
@@ -309,6 +342,18 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
         super().__init__(session)
         self.company_id = company_id
 
+    def _create_assignment(self, role_id: UUID) -> CompanyRole:
+        assignment = CompanyRole(company_id=self.company_id, role_id=role_id)
+        self.db_session.add(assignment)
+        EffectivePermissionRepository(self.db_session).refresh(
+            company_id=self.company_id,
+            role_id=role_id,
+        )
+        self.db_session.commit()
+        self.db_session.refresh(assignment)
+        COMPANY_PERMISSION_CACHE.invalidate_company(self.company_id)
+        return assignment
+
     def get_company_roles(self, payload: RoleQueryParamsModel) -> dict:
         try:
             query = (
@@ -324,12 +369,7 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
                 query = query.filter(Role.name.ilike(f"%{payload.name}%"))
             if payload.description:
                 query = query.filter(Role.description.ilike(f"%{payload.description}%"))
-            result = self.paginate(
-                query,
-                page=payload.page,
-                limit=payload.limit,
-                order_by=[Role.name.asc()],
-            )
+            result = self.paginate(query, payload, keys=[Role.name, Role.id])
             from app.repository.permission import RolePermissionRepository
 
             permission_map = RolePermissionRepository(
@@ -343,6 +383,8 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
                     [],
                 )
             return result
+        except AppError:
+            raise
         except Exception as exc:
             raise AppError(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -439,7 +481,7 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
                 error="Role is already assigned to the company",
             )
 
-        assignment = self.create(company_id=self.company_id, role_id=role.id)
+        assignment = self._create_assignment(role.id)
         self.update_json_field(
             assignment,
             column_name="primary_meta_data",
@@ -457,22 +499,93 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
         role: Role,
         payload: RoleAssignCompaniesModel,
         assigned_by: UserReadModel,
+        *,
+        batch_size: int | None = None,
+        progress: Callable[[RoleAssignmentProgress], None] | None = None,
     ) -> dict:
-        assigned_companies: list[str] = []
+        """
+        Enable ``role`` in every listed company that does not have it yet,
+        committing once per ``batch_size`` companies. Unknown or deleted
+        companies are skipped. ``progress`` is called after each commit.
+        """
+        requested: dict[UUID, str] = {}
         for company_id in payload.company_ids:
-            company_uuid = UUID(company_id)
-            repository = CompanyRoleAssignmentRepository(company_uuid, self.db_session)
-            if repository.get_assignment(role.id):
-                continue
-            assignment = repository.create(company_id=company_uuid, role_id=role.id)
-            repository.update_json_field(
-                assignment,
-                column_name="primary_meta_data",
-                key="assigned_by",
-                value=assigned_by.model_dump(mode="json"),
+            requested.setdefault(UUID(company_id), company_id)
+        company_ids = list(requested)
+        batch_size = batch_size or settings.ROLE_ASSIGNMENT_BATCH_SIZE
+        metadata = {"assigned_by": assigned_by.model_dump(mode="json")}
+
+        assigned: list[UUID] = []
+        for start in range(0, len(company_ids), batch_size):
+            batch = company_ids[start : start + batch_size]
+            assigned.extend(self._assign_batch(role.id, batch, metadata))
+            if progress is not None:
+                progress(
+                    RoleAssignmentProgress(
+                        processed=start + len(batch),
+                        total=len(company_ids),
+                        assigned=len(assigned),
+                    )
+                )
+        return {
+            "role_id": str(role.id),
+            "company_ids": [requested[company_id] for company_id in assigned],
+        }
+
+    def _assign_batch(
+        self, role_id: UUID, company_ids: list[UUID], metadata: dict
+    ) -> list[UUID]:
+        """Link one batch with one read, at most two writes, and one commit."""
+        links = dict(
+            self.db_session.query(Company.id, CompanyRole._closed_at)
+            .outerjoin(
+                CompanyRole,
+                (CompanyRole.company_id == Company.id)
+                & (CompanyRole.role_id == role_id),
             )
-            assigned_companies.append(company_id)
-        return {"role_id": str(role.id), "company_ids": assigned_companies}
+            .filter(
+                Company.id.in_(company_ids),
+                Company._closed_at.is_(None),
+                CompanyRole._closed_at.is_not(None) | CompanyRole.role_id.is_(None),
+            )
+            .all()
+        )
+        if not links:
+            return []
+        reopened = [company_id for company_id, closed_at in links.items() if closed_at]
+        inserted = [
+            company_id for company_id, closed_at in links.items() if not closed_at
+        ]
+        if reopened:
+            # An unassigned role keeps its row, so assigning it again reopens it.
+            self.db_session.execute(
+                update(CompanyRole)
+                .where(
+                    CompanyRole.role_id == role_id,
+                    CompanyRole.company_id.in_(reopened),
+                )
+                .values(_closed_at=None, primary_meta_data=metadata)
+                .execution_options(synchronize_session=False)
+            )
+        if inserted:
+            self.db_session.execute(
+                insert(CompanyRole),
+                [
+                    {
+                        "company_id": company_id,
+                        "role_id": role_id,
+                        "primary_meta_data": metadata,
+                    }
+                    for company_id in inserted
+                ],
+            )
+        assigned = [company_id for company_id in company_ids if company_id in links]
+        EffectivePermissionRepository(self.db_session).refresh(
+            company_ids=assigned, role_id=role_id
+        )
+        self.db_session.commit()
+        COMPANY_PERMISSION_CACHE.invalidate_companies(assigned)
+        return assigned
 
     def unassign_role(self, role_id: UUID) -> dict:
         assignment = self.get_assignment(role_id)
@@ -502,7 +615,12 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
             CompanyRolePermission.role_id == role_id,
         ).delete(synchronize_session=False)
         self.db_session.add(assignment)
+        EffectivePermissionRepository(self.db_session).refresh(
+            company_id=self.company_id,
+            role_id=role_id,
+        )
         self.db_session.commit()
+        COMPANY_PERMISSION_CACHE.invalidate_company(self.company_id)
         return {"message": "Role unassigned successfully."}
 
     def reassign_and_delete_role(
@@ -557,7 +675,12 @@ class CompanyRoleAssignmentRepository(BaseSQLRepository[CompanyRole]):
             CompanyRolePermission.role_id == role_to_delete.id,
         ).delete(synchronize_session=False)
         self.db_session.add(assignment)
+        EffectivePermissionRepository(self.db_session).refresh(
+            company_id=self.company_id,
+            role_id=role_to_delete.id,
+        )
         self.db_session.commit()
+        COMPANY_PERMISSION_CACHE.invalidate_company(self.company_id)
         self.update_json_field(
             assignment,
             column_name="primary_meta_data",
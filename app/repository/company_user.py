@@ -13,14 +13,15 @@ from app.models.permissions import PermissionReadModel
 from app.models.company.user import CompanyUserAddModel, CompanyUserReadModel
 from app.models.generic_pagination import (
     PaginatedResponse,
-    apply_pagination,
-    build_pagination_meta,
+    paginate_query,
 )
 from app.models.user.user import UserQueryParams
-from app.repository.base import BaseSQLRepository
+from app.repository.base import BaseSQLRepository, commit_or_flush
+from app.repository.cache_generation import CacheGenerationRepository, CacheScope
 from app.repository.company_role import CompanyRoleAssignmentRepository
 from app.repository.database.tables import AssociationUserCompany, Role, User
 from app.utils.app_error import AppError
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
 
 
 class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
@@ -29,6 +30,12 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
     def __init__(self, session: Session):
         super().__init__(session)
 
+    def _publish_membership_change(self, company_id: UUID) -> None:
+        """Stage a cross-worker permission cache bump; it commits with the change."""
+        CacheGenerationRepository(self.db_session).bump(
+            CacheScope.COMPANY_PERMISSIONS, key=company_id
+        )
+
     @staticmethod
     def _to_company_user(
         user: User,
@@ -83,7 +90,12 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
         return linked_company
 
     def add_user_to_company(
-        self, company_id: UUID, payload: CompanyUserAddModel, added_by
+        self,
+        company_id: UUID,
+        payload: CompanyUserAddModel,
+        added_by,
+        *,
+        company_created: bool = False,
     ) -> CompanyUserReadModel:
         user = self.db_session.query(User).filter(User.email == payload.email).first()
         if not user:
@@ -108,6 +120,9 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
                 message=CompanyUserResponseMessages.ADD_EXISTING_USER_FAILED.value,
             )
 
+        if not company_created:
+            # No worker can have cached a company created in this transaction.
+            self._publish_membership_change(company_id)
         assoc = self.create(
             user_id=user.id,
             company_id=company_id,
@@ -115,6 +130,9 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
             primary_meta_data={"added_by": added_by.model_dump(mode="json")},
             secondary_meta_data={"_legacy_role_name": role.name},
         )
+        self._after_commit(
+            lambda: COMPANY_PERMISSION_CACHE.invalidate(user.id, company_id)
+        )
         from app.repository.permission import RolePermissionRepository
 
         permissions = RolePermissionRepository(
@@ -149,8 +167,11 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
         flag_modified(assoc, "primary_meta_data")
         assoc._closed_at = self._now_sql()
         self.db_session.add(assoc)
-        self.db_session.commit()
-        self.db_session.refresh(assoc)
+        self._publish_membership_change(company_id)
+        commit_or_flush(self.db_session, assoc)
+        self._after_commit(
+            lambda: COMPANY_PERMISSION_CACHE.invalidate(user_id, company_id)
+        )
 
         user = self.db_session.query(User).filter(User.id == user_id).one()
         from app.repository.permission import RolePermissionRepository
@@ -185,8 +206,11 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
         flag_modified(assoc, "primary_meta_data")
         flag_modified(assoc, "secondary_meta_data")
         self.db_session.add(assoc)
-        self.db_session.commit()
-        self.db_session.refresh(assoc)
+        self._publish_membership_change(company_id)
+        commit_or_flush(self.db_session, assoc)
+        self._after_commit(
+            lambda: COMPANY_PERMISSION_CACHE.invalidate(user_id, company_id)
+        )
 
         user = self.db_session.query(User).filter(User.id == user_id).one()
         from app.repository.permission import RolePermissionRepository
@@ -219,19 +243,14 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
         if params.email:
             query = query.filter(User.email.ilike(f"%{params.email}%"))
 
-        total = query.count()
-        results = apply_pagination(
+        results, pagination = paginate_query(
             query.options(
                 joinedload(AssociationUserCompany.user),
                 joinedload(AssociationUserCompany.role),
             ),
-            page=params.page,
-            limit=params.limit,
-            order_by=[
-                AssociationUserCompany._created_at.asc(),
-                User.id.asc(),
-            ],
-        ).all()
+            params,
+            keys=[AssociationUserCompany._created_at, User.id],
+        )
 
         from app.repository.permission import RolePermissionRepository
 
@@ -249,10 +268,5 @@ class CompanyUserRepository(BaseSQLRepository[AssociationUserCompany]):
             for assoc in results
         ]
         return PaginatedResponse[CompanyUserReadModel](
-            records=users,
-            pagination=build_pagination_meta(
-                total_records=total,
-                limit=params.limit,
-                page=params.page,
-            ),
+            records=users, pagination=pagination
         )
@@ -15,20 +15,32 @@ from app.repository.database import Base
 class DatabaseSessionManager:
     expected_tables = (
         "association_user_company",
+        "auth_revocation",
+        "cache_generation",
         "company",
         "company_permission",
         "company_role",
         "company_role_permission",
+        "effective_company_role_permission",
         "global_permission",
+        "password_reset_token",
         "role",
         "role_global_permission",
         "privileged_access_event",
+        "rate_limit_window",
         "superuser_bootstrap_control",
         "user",
         "user_role",
     )
     expected_columns = {
         "association_user_company": {"user_id", "company_id", "role_id"},
+        "auth_revocation": {
+            "id",
+            "user_id",
+            "refresh_token_version",
+            "expires_at",
+        },
+        "cache_generation": {"key", "generation"},
         "company": {"id", "email"},
         "company_permission": {"id", "company_id", "name"},
         "company_role": {"company_id", "role_id"},
@@ -37,7 +49,20 @@ class DatabaseSessionManager:
             "role_id",
             "company_permission_id",
         },
+        "effective_company_role_permission": {
+            "company_id",
+            "role_id",
+            "scope",
+            "permission_id",
+        },
         "global_permission": {"id", "name"},
+        "password_reset_token": {
+            "id",
+            "user_id",
+            "method",
+            "token_hash",
+            "expires_at",
+        },
         "role": {"id", "name", "description"},
         "role_global_permission": {"role_id", "global_permission_id"},
         "privileged_access_event": {
@@ -49,13 +74,20 @@ class DatabaseSessionManager:
             "previous_superuser",
             "resulting_superuser",
         },
+        "rate_limit_window": {"key_hash", "namespace", "hits", "expires_at"},
         "superuser_bootstrap_control": {
             "id",
             "bootstrap_user_id",
             "bootstrap_completed_at",
             "bootstrap_method",
         },
-        "user": {"id", "email", "password", "is_superuser"},
+        "user": {
+            "id",
+            "email",
+            "password",
+            "is_superuser",
+            "refresh_token_version",
+        },
         "user_role": {"user_id", "role_id"},
     }
     forbidden_columns = {
@@ -121,14 +153,19 @@ class DatabaseSessionManager:
     def _import_models(self) -> None:
         from app.repository.database.tables import (  # noqa: F401
             AssociationUserCompany,
+            AuthRevocation,
+            CacheGeneration,
             Company,
             CompanyPermission,
             CompanyRole,
             CompanyRolePermission,
+            EffectiveCompanyRolePermission,
             GlobalPermission,
+            PasswordResetToken,
             Role,
             RoleGlobalPermission,
             PrivilegedAccessEvent,
+            RateLimitWindow,
             SuperuserBootstrapControl,
             User,
             UserRole,
@@ -1,12 +1,21 @@
 from app.repository.database.tables.association_user_company import (
     AssociationUserCompany,
 )
+from app.repository.database.tables.auth_revocation import AuthRevocation
+from app.repository.database.tables.cache_generation import CacheGeneration
 from app.repository.database.tables.company import Company
 from app.repository.database.tables.company_role import CompanyRole
+from app.repository.database.tables.effective_company_role_permission import (
+    EffectiveCompanyRolePermission,
+)
+from app.repository.database.tables.password_reset_token import (
+    PasswordResetToken,
+)
 from app.repository.database.tables.permission import (
     CompanyPermission,
     GlobalPermission,
 )
+from app.repository.database.tables.rate_limit_window import RateLimitWindow
 from app.repository.database.tables.role import Role
 from app.repository.database.tables.role_permission import (
     CompanyRolePermission,
@@ -21,11 +30,16 @@ from app.repository.database.tables.superuser import (
 
 __all__ = [
     "AssociationUserCompany",
+    "AuthRevocation",
+    "CacheGeneration",
     "Company",
     "CompanyPermission",
     "CompanyRole",
     "CompanyRolePermission",
+    "EffectiveCompanyRolePermission",
     "GlobalPermission",
+    "PasswordResetToken",
+    "RateLimitWindow",
     "Role",
     "RoleGlobalPermission",
     "PrivilegedAccessEvent",
@@ -1,6 +1,6 @@
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, Uuid
+from sqlalchemy import ForeignKey, Index, Uuid
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -33,6 +33,15 @@ class AssociationUserCompany(BaseModel):
         nullable=False,
     )
 
+    # Keyset pagination of a company's members and of a user's companies
+    # seeks on these instead of sorting every membership.
+    __table_args__ = (
+        Index(
+            "ix_association_user_company_company_created", "company_id", "_created_at"
+        ),
+        Index("ix_association_user_company_user_created", "user_id", "_created_at"),
+    )
+
     role = relationship("Role", back_populates="users", overlaps="company,users")
     company = relationship("Company", back_populates="users", overlaps="role")
     user = relationship("User", back_populates="companies", overlaps="company,role")
@@ -0,0 +1,35 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.repository.database.base_model import BaseModel
+
+
+class AuthRevocation(BaseModel):
+    """
+    One revoked ``(user_id, refresh_token_version)`` pair. Access tokens that
+    carry the pair stop being valid; the row is only needed until every such
+    token has expired (``expires_at``).
+    """
+
+    __tablename__ = "auth_revocation"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    refresh_token_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    reason: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_auth_revocation_created", "_created_at"),
+        Index("ix_auth_revocation_expires", "expires_at"),
+    )
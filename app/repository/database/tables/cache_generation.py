@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.repository.database.base_model import BaseModel
+
+
+class CacheGeneration(BaseModel):
+    """
+    A counter bumped in the same transaction as every write that makes
+    in-process caches stale. ``key`` is a cache scope, optionally followed by
+    ``:<partition>`` when only part of the scope changed. Workers poll the
+    table and drop cached entries whose counter moved.
+    """
+
+    __tablename__ = "cache_generation"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, PrimaryKeyConstraint, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.repository.database.base_model import BaseModel
+
+
+class EffectiveCompanyRolePermission(BaseModel):
+    """
+    Materialized permissions of each active company role assignment.
+
+    Holds one row per global permission linked to the role and per company
+    permission linked to the company role, for active companies, roles,
+    assignments, links, and permissions only. ``scope`` is the
+    ``PermissionScope`` value. Rows are derived data: the repositories that
+    write the source tables keep them in step, and ``EffectivePermissionRepository``
+    can check or rebuild them.
+    """
+
+    __tablename__ = "effective_company_role_permission"
+
+    company_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("company.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    role_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("role.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    scope: Mapped[str] = mapped_column(String(16), nullable=False)
+    permission_id: Mapped[UUID] = mapped_column(Uuid, nullable=False)
+    name: Mapped[str] = mapped_column(String(256), nullable=False)
+    description: Mapped[str | None] = mapped_column(String(256), nullable=True)
+
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "company_id",
+            "role_id",
+            "scope",
+            "permission_id",
+            name="pk_effective_company_role_permission",
+        ),
+        Index("ix_effective_company_role_permission_permission", "permission_id"),
+    )
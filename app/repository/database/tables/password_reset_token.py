@@ -0,0 +1,36 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.repository.database.base_model import BaseModel
+
+
+class PasswordResetToken(BaseModel):
+    """
+    An outstanding OTP or magic-link password reset. Only a SHA-256 digest of
+    the token is stored; OTP digests also cover the user id, so short codes
+    issued to different users cannot collide on the unique index.
+    """
+
+    __tablename__ = "password_reset_token"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True, default=uuid4)
+    user_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    method: Mapped[str] = mapped_column(String(32), nullable=False)
+    token_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_password_reset_token_hash", "token_hash", unique=True),
+        Index("ix_password_reset_token_user", "user_id"),
+        Index("ix_password_reset_token_expires", "expires_at"),
+    )
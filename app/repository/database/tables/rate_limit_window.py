@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.repository.database.base_model import BaseModel
+
+
+class RateLimitWindow(BaseModel):
+    """
+    Recent hits for one rate-limit key, shared by every worker. ``hits`` holds
+    the epoch timestamps still inside the window; the row can be deleted once
+    ``expires_at`` has passed.
+    """
+
+    __tablename__ = "rate_limit_window"
+
+    key_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    namespace: Mapped[str] = mapped_column(String(64), nullable=False)
+    hits: Mapped[list[float]] = mapped_column(JSON, nullable=False, default=list)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_rate_limit_window_namespace", "namespace"),
+        Index("ix_rate_limit_window_expires", "expires_at"),
+    )
@@ -0,0 +1,137 @@
+"""Ids of the built-in company roles, reconciled once per process."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.company.roles import CompanyDefaultRoles
+from app.repository.base import after_commit, commit_or_flush
+from app.repository.cache_generation import CacheGenerationRepository, CacheScope
+from app.repository.database.tables import Role
+
+DEFAULT_ROLE_NAMES = frozenset(role.name_value for role in CompanyDefaultRoles)
+
+
+@dataclass(frozen=True)
+class DefaultRoleCatalog:
+    role_ids: Mapping[str, UUID]
+
+
+class DefaultRoleCatalogRepository:
+    def __init__(self, session: Session):
+        self.db_session = session
+
+    def reconcile(self) -> dict[str, Role]:
+        """
+        Create missing default roles, restore their descriptions, and seed the
+        system permissions of roles created here. Existing roles keep the
+        permissions an administrator gave them.
+        """
+        roles = {
+            role.name: role
+            for role in self.db_session.query(Role).filter(
+                Role.name.in_(DEFAULT_ROLE_NAMES),
+                Role._closed_at.is_(None),
+            )
+        }
+        created_role_names: set[str] = set()
+        for default_role in CompanyDefaultRoles:
+            role = roles.get(default_role.name_value)
+            if role is None:
+                role = Role(
+                    name=default_role.name_value,
+                    description=default_role.description,
+                )
+                self.db_session.add(role)
+                created_role_names.add(default_role.name_value)
+            elif role.description != default_role.description:
+                role.description = default_role.description
+            roles[default_role.name_value] = role
+        if created_role_names:
+            self.db_session.flush()
+        from app.repository.permission import SystemPermissionRepository
+
+        SystemPermissionRepository(self.db_session).seed_new_default_roles(
+            roles,
+            created_role_names,
+        )
+        commit_or_flush(self.db_session)
+        return roles
+
+    def publish_change(self, *role_names: str | None) -> bool:
+        """
+        Stage a catalog reset for other workers when a write renames or closes
+        a default role; it commits with the write. Returns whether one was
+        staged, so the caller resets this worker's catalog after its commit.
+        """
+        if DEFAULT_ROLE_NAMES.isdisjoint(role_names):
+            return False
+        CacheGenerationRepository(self.db_session).bump(CacheScope.DEFAULT_ROLES)
+        return True
+
+
+class DefaultRoleCatalogCache:
+    """
+    Process-wide ``DefaultRoleCatalog``, reconciled on first use.
+
+    A catalog loaded inside a ``unit_of_work`` is kept only once that unit
+    commits, so a rollback never leaves ids of roles that were never written.
+    A load that overlaps a ``reset`` is discarded rather than kept.
+    """
+
+    def __init__(self) -> None:
+        self._catalog: DefaultRoleCatalog | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, session: Session) -> DefaultRoleCatalog:
+        catalog = self._catalog
+        if catalog is not None:
+            return catalog
+        generation = self._generation
+        roles = DefaultRoleCatalogRepository(session).reconcile()
+        catalog = DefaultRoleCatalog(
+            role_ids=MappingProxyType({name: role.id for name, role in roles.items()})
+        )
+        after_commit(session, lambda: self._store(catalog, generation))
+        return catalog
+
+    def warm(self, session_factory: Callable[[], Session]) -> None:
+        """Reconcile at startup so company creation never waits on it."""
+        session = session_factory()
+        try:
+            self.get(session)
+        finally:
+            session.close()
+
+    def _store(self, catalog: DefaultRoleCatalog, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._catalog = catalog
+
+    def reset(self) -> None:
+        with self._lock:
+            self._catalog = None
+            self._generation += 1
+
+    @property
+    def loaded(self) -> bool:
+        return self._catalog is not None
+
+
+DEFAULT_ROLE_CATALOG = DefaultRoleCatalogCache()
+
+
+__all__ = [
+    "DEFAULT_ROLE_CATALOG",
+    "DEFAULT_ROLE_NAMES",
+    "DefaultRoleCatalog",
+    "DefaultRoleCatalogCache",
+    "DefaultRoleCatalogRepository",
+]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.models.permissions import PermissionScope
+from app.repository.cache_generation import (
+    CacheGenerationRepository,
+    CacheScope,
+    cache_partition,
+)
+from app.repository.database.tables import (
+    Company,
+    CompanyPermission,
+    CompanyRole,
+    CompanyRolePermission,
+    EffectiveCompanyRolePermission,
+    GlobalPermission,
+    Role,
+    RoleGlobalPermission,
+)
+
+EffectiveKey = tuple[UUID, UUID, str, UUID]
+
+
+@dataclass(frozen=True)
+class EffectivePermissionDrift:
+    """Rows the materialized table lacks, should not have, or has out of date."""
+
+    missing: int = 0
+    stale: int = 0
+    outdated: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.missing + self.stale + self.outdated
+
+    def __add__(self, other: EffectivePermissionDrift) -> EffectivePermissionDrift:
+        return EffectivePermissionDrift(
+            missing=self.missing + other.missing,
+            stale=self.stale + other.stale,
+            outdated=self.outdated + other.outdated,
+        )
+
+
+class EffectivePermissionRepository:
+    """
+    Maintains ``effective_company_role_permission`` from its source tables.
+
+    Every repository that changes a company role assignment, a role
+    permission link, or a permission calls ``refresh`` with the narrowest
+    filter it knows before committing, so the rows change in the same
+    transaction as the write that caused them. ``check`` and ``rebuild``
+    cover anything written around the repositories.
+    """
+
+    def __init__(self, session: Session):
+        self.db_session = session
+
+    def refresh(
+        self,
+        *,
+        company_id: UUID | None = None,
+        company_ids: list[UUID] | None = None,
+        role_id: UUID | None = None,
+        permission_id: UUID | None = None,
+        company_created: bool = False,
+    ) -> EffectivePermissionDrift:
+        """
+        Stage the row changes for the filtered slice; the caller commits.
+        A ``company_permissions`` cache bump is staged too for the partition
+        of every company whose rows changed, so other workers drop
+        permissions compiled from the old rows. Pass ``company_created`` when
+        ``company_id`` was created in this transaction: no worker can have
+        cached it, so pure inserts publish nothing.
+        """
+        changed: set[UUID] = set()
+        drift = self._sync(
+            company_ids=company_ids if company_id is None else [company_id],
+            role_id=role_id,
+            permission_id=permission_id,
+            apply=True,
+            changed=changed,
+        )
+        if company_created and not (drift.stale or drift.outdated):
+            return drift
+        # One bump per partition, in a fixed order so concurrent refreshes
+        # lock the counter rows in the same sequence.
+        partitions = {cache_partition(company): company for company in changed}
+        generations = CacheGenerationRepository(self.db_session)
+        for partition in sorted(partitions):
+            generations.bump(CacheScope.COMPANY_PERMISSIONS, key=partitions[partition])
+        return drift
+
+    def check(self, *, batch_size: int = 500) -> EffectivePermissionDrift:
+        """Compare the whole table with its sources without changing anything."""
+        return self._walk(batch_size=batch_size, apply=False)
+
+    def rebuild(self, *, batch_size: int = 500) -> EffectivePermissionDrift:
+        """Resynchronize the whole table, committing once per ``batch_size`` companies."""
+        return self._walk(batch_size=batch_size, apply=True)
+
+    def _walk(self, *, batch_size: int, apply: bool) -> EffectivePermissionDrift:
+        drift = self._sync(orphans_only=True, apply=apply)
+        last_id: UUID | None = None
+        while True:
+            if apply:
+                self.db_session.commit()
+            query = self.db_session.query(Company.id).order_by(Company.id.asc())
+            if last_id is not None:
+                query = query.filter(Company.id > last_id)
+            company_ids = [row.id for row in query.limit(batch_size)]
+            if not company_ids:
+                return drift
+            drift += self._sync(company_ids=company_ids, apply=apply)
+            last_id = company_ids[-1]
+
+    def _sync(
+        self,
+        *,
+        company_ids: list[UUID] | None = None,
+        role_id: UUID | None = None,
+        permission_id: UUID | None = None,
+        orphans_only: bool = False,
+        apply: bool,
+        changed: set[UUID] | None = None,
+    ) -> EffectivePermissionDrift:
+        self.db_session.flush()
+        current_query = self.db_session.query(EffectiveCompanyRolePermission)
+        if orphans_only:
+            # Rows whose company no longer exists at all; per-company batches
+            # never see them.
+            current_query = current_query.filter(
+                ~self.db_session.query(Company.id)
+                .filter(Company.id == EffectiveCompanyRolePermission.company_id)
+                .exists()
+            )
+            desired: dict[EffectiveKey, tuple[str, str | None]] = {}
+        else:
+            if company_ids is not None:
+                current_query = current_query.filter(
+                    EffectiveCompanyRolePermission.company_id.in_(company_ids)
+                )
+            if role_id is not None:
+                current_query = current_query.filter(
+                    EffectiveCompanyRolePermission.role_id == role_id
+                )
+            if permission_id is not None:
+                current_query = current_query.filter(
+                    EffectiveCompanyRolePermission.permission_id == permission_id
+                )
+            desired = self._desired(company_ids, role_id, permission_id)
+        current = {
+            (row.company_id, row.role_id, row.scope, row.permission_id): row
+            for row in current_query
+        }
+
+        missing = [key for key in desired if key not in current]
+        stale = [row for key, row in current.items() if key not in desired]
+        outdated = [
+            (row, desired[key])
+            for key, row in current.items()
+            if key in desired and (row.name, row.description) != desired[key]
+        ]
+        if changed is not None:
+            changed.update(key[0] for key in missing)
+            changed.update(row.company_id for row in stale)
+            changed.update(row.company_id for row, _ in outdated)
+        if apply:
+            for key in missing:
+                name, description = desired[key]
+                self.db_session.add(
+                    EffectiveCompanyRolePermission(
+                        company_id=key[0],
+                        role_id=key[1],
+                        scope=key[2],
+                        permission_id=key[3],
+                        name=name,
+                        description=description,
+                    )
+                )
+            for row in stale:
+                self.db_session.delete(row)
+            for row, (name, description) in outdated:
+                row.name = name
+                row.description = description
+            self.db_session.flush()
+        return EffectivePermissionDrift(
+            missing=len(missing),
+            stale=len(stale),
+            outdated=len(outdated),
+        )
+
+    def _desired(
+        self,
+        company_ids: list[UUID] | None,
+        role_id: UUID | None,
+        permission_id: UUID | None,
+    ) -> dict[EffectiveKey, tuple[str, str | None]]:
+        global_query = (
+            self._active_assignments(
+                GlobalPermission.id,
+                GlobalPermission.name,
+                GlobalPermission.description,
+            )
+            .join(
+                RoleGlobalPermission,
+                RoleGlobalPermission.role_id == CompanyRole.role_id,
+            )
+            .join(
+                GlobalPermission,
+                GlobalPermission.id == RoleGlobalPermission.global_permission_id,
+            )
+            .filter(
+                RoleGlobalPermission._closed_at.is_(None),
+                GlobalPermission._closed_at.is_(None),
+            )
+        )
+        company_query = (
+            self._active_assignments(
+                CompanyPermission.id,
+                CompanyPermission.name,
+                CompanyPermission.description,
+            )
+            .join(
+                CompanyRolePermission,
+                tuple_(CompanyRolePermission.company_id, CompanyRolePermission.role_id)
+                == tuple_(CompanyRole.company_id, CompanyRole.role_id),
+            )
+            .join(
+                CompanyPermission,
+                tuple_(CompanyPermission.company_id, CompanyPermission.id)
+                == tuple_(
+                    CompanyRolePermission.company_id,
+                    CompanyRolePermission.company_permission_id,
+                ),
+            )
+            .filter(
+                CompanyRolePermission._closed_at.is_(None),
+                CompanyPermission._closed_at.is_(None),
+            )
+        )
+
+        desired: dict[EffectiveKey, tuple[str, str | None]] = {}
+        for scope, query, permission_column in (
+            (PermissionScope.GLOBAL, global_query, GlobalPermission.id),
+            (PermissionScope.COMPANY, company_query, CompanyPermission.id),
+        ):
+            if company_ids is not None:
+                query = query.filter(CompanyRole.company_id.in_(company_ids))
+            if role_id is not None:
+                query = query.filter(CompanyRole.role_id == role_id)
+            if permission_id is not None:
+                query = query.filter(permission_column == permission_id)
+            for row in query:
+                key = (row.company_id, row.role_id, scope.value, row.id)
+                desired[key] = (row.name, row.description)
+        return desired
+
+    def _active_assignments(self, *columns):
+        return (
+            self.db_session.query(CompanyRole.company_id, CompanyRole.role_id, *columns)
+            .join(Company, Company.id == CompanyRole.company_id)
+            .join(Role, Role.id == CompanyRole.role_id)
+            .filter(
+                CompanyRole._closed_at.is_(None),
+                Company._closed_at.is_(None),
+                Role._closed_at.is_(None),
+            )
+        )
+
+
+__all__ = ["EffectivePermissionDrift", "EffectivePermissionRepository"]
@@ -9,7 +9,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.company.roles import RoleReadModel
-from app.models.generic_pagination import PaginatedResponse
+from app.models.generic_pagination import PaginatedResponse, paginate_query
 from app.models.permission_response_messages import (
     PermissionResponseMessages,
     PlatformRoleResponseMessages,
@@ -33,13 +33,17 @@ from app.repository.database.tables import (
     CompanyPermission,
     CompanyRole,
     CompanyRolePermission,
+    EffectiveCompanyRolePermission,
     GlobalPermission,
     Role,
     RoleGlobalPermission,
     User,
     UserRole,
 )
+from app.repository.effective_permission import EffectivePermissionRepository
 from app.utils.app_error import AppError
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
+from app.utils.request_cache import RequestLookupCache, memoized
 
 
 def _global_permission_model(permission: GlobalPermission) -> PermissionReadModel:
@@ -121,22 +125,12 @@ class GlobalPermissionRepository(BaseSQLRepository[GlobalPermission]):
             query = query.filter(
                 GlobalPermission.description.ilike(f"%{payload.description}%")
             )
-        total = query.count()
-        records = (
-            query.order_by(GlobalPermission.name.asc(), GlobalPermission.id.asc())
-            .offset((payload.page - 1) * payload.limit)
-            .limit(payload.limit)
-            .all()
+        records, pagination = paginate_query(
+            query, payload, keys=[GlobalPermission.name, GlobalPermission.id]
         )
-        from app.models.generic_pagination import build_pagination_meta
-
         return PaginatedResponse[PermissionReadModel](
             records=[_global_permission_model(record) for record in records],
-            pagination=build_pagination_meta(
-                total_records=total,
-                limit=payload.limit,
-                page=payload.page,
-            ),
+            pagination=pagination,
         )
 
     def update_permission(
@@ -160,6 +154,9 @@ class GlobalPermissionRepository(BaseSQLRepository[GlobalPermission]):
             permission.description = payload.description
         try:
             self.db_session.add(permission)
+            EffectivePermissionRepository(self.db_session).refresh(
+                permission_id=permission.id
+            )
             self.db_session.commit()
             self.db_session.refresh(permission)
         except IntegrityError as exc:
@@ -181,6 +178,9 @@ class GlobalPermissionRepository(BaseSQLRepository[GlobalPermission]):
             RoleGlobalPermission.global_permission_id == permission_id
         ).delete(synchronize_session=False)
         self.db_session.delete(permission)
+        EffectivePermissionRepository(self.db_session).refresh(
+            permission_id=permission_id
+        )
         self.db_session.commit()
         return {"message": f"Permission '{permission.name}' deleted successfully."}
 
@@ -190,16 +190,25 @@ class SystemPermissionRepository:
         self.db_session = session
 
     def ensure_permissions(self) -> dict[UUID, GlobalPermission]:
-        permissions: dict[UUID, GlobalPermission] = {}
-        for definition in SYSTEM_PERMISSION_DEFINITIONS:
-            records = (
-                self.db_session.query(GlobalPermission)
-                .filter(
-                    (GlobalPermission.id == definition.id)
-                    | (GlobalPermission.name == definition.name)
+        existing = (
+            self.db_session.query(GlobalPermission)
+            .filter(
+                GlobalPermission.id.in_(
+                    [definition.id for definition in SYSTEM_PERMISSION_DEFINITIONS]
+                )
+                | GlobalPermission.name.in_(
+                    [definition.name for definition in SYSTEM_PERMISSION_DEFINITIONS]
                 )
-                .all()
             )
+            .all()
+        )
+        permissions: dict[UUID, GlobalPermission] = {}
+        for definition in SYSTEM_PERMISSION_DEFINITIONS:
+            records = [
+                record
+                for record in existing
+                if record.id == definition.id or record.name == definition.name
+            ]
             permission = self._resolve_definition(definition, records)
             if permission is None:
                 permission = GlobalPermission(
@@ -212,8 +221,8 @@ class SystemPermissionRepository:
                     },
                 )
                 self.db_session.add(permission)
-                self.db_session.flush()
             permissions[definition.id] = permission
+        self.db_session.flush()
         return permissions
 
     def seed_new_default_roles(
@@ -261,12 +270,19 @@ class SystemPermissionRepository:
 class CompanyPermissionRepository(BaseSQLRepository[CompanyPermission]):
     model = CompanyPermission
 
-    def __init__(self, company_id: UUID, session: Session):
+    def __init__(
+        self,
+        company_id: UUID,
+        session: Session,
+        *,
+        lookups: RequestLookupCache | None = None,
+    ):
         super().__init__(session)
         self.company_id = company_id
+        self.lookups = lookups
 
-    def ensure_company(self) -> Company:
-        company = (
+    def _load_company(self) -> Company | None:
+        return (
             self.db_session.query(Company)
             .filter(
                 Company.id == self.company_id,
@@ -274,6 +290,11 @@ class CompanyPermissionRepository(BaseSQLRepository[CompanyPermission]):
             )
             .one_or_none()
         )
+
+    def ensure_company(self) -> Company:
+        company = memoized(
+            self.lookups, ("company", self.company_id), self._load_company
+        )
         if company is None:
             raise AppError(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -340,22 +361,12 @@ class CompanyPermissionRepository(BaseSQLRepository[CompanyPermission]):
             query = query.filter(
                 CompanyPermission.description.ilike(f"%{payload.description}%")
             )
-        total = query.count()
-        records = (
-            query.order_by(CompanyPermission.name.asc(), CompanyPermission.id.asc())
-            .offset((payload.page - 1) * payload.limit)
-            .limit(payload.limit)
-            .all()
+        records, pagination = paginate_query(
+            query, payload, keys=[CompanyPermission.name, CompanyPermission.id]
         )
-        from app.models.generic_pagination import build_pagination_meta
-
         return PaginatedResponse[PermissionReadModel](
             records=[_company_permission_model(record) for record in records],
-            pagination=build_pagination_meta(
-                total_records=total,
-                limit=payload.limit,
-                page=payload.page,
-            ),
+            pagination=pagination,
         )
 
     def update_permission(
@@ -370,6 +381,10 @@ class CompanyPermissionRepository(BaseSQLRepository[CompanyPermission]):
             permission.description = payload.description
         try:
             self.db_session.add(permission)
+            EffectivePermissionRepository(self.db_session).refresh(
+                company_id=self.company_id,
+                permission_id=permission.id,
+            )
             self.db_session.commit()
             self.db_session.refresh(permission)
         except IntegrityError as exc:
@@ -387,20 +402,35 @@ class CompanyPermissionRepository(BaseSQLRepository[CompanyPermission]):
             CompanyRolePermission.company_permission_id == permission_id,
         ).delete(synchronize_session=False)
         self.db_session.delete(permission)
+        EffectivePermissionRepository(self.db_session).refresh(
+            company_id=self.company_id,
+            permission_id=permission_id,
+        )
         self.db_session.commit()
         return {"message": f"Permission '{permission.name}' deleted successfully."}
 
 
 class RolePermissionRepository:
-    def __init__(self, session: Session):
+    def __init__(
+        self,
+        session: Session,
+        *,
+        lookups: RequestLookupCache | None = None,
+    ):
         self.db_session = session
+        self.lookups = lookups
 
-    def _ensure_role(self, role_id: UUID) -> Role:
-        role = (
+    def _load_role(self, role_id: UUID) -> Role | None:
+        return (
             self.db_session.query(Role)
             .filter(Role.id == role_id, Role._closed_at.is_(None))
             .one_or_none()
         )
+
+    def _ensure_role(self, role_id: UUID) -> Role:
+        role = memoized(
+            self.lookups, ("role", role_id), lambda: self._load_role(role_id)
+        )
         if role is None:
             raise AppError(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -408,8 +438,8 @@ class RolePermissionRepository:
             )
         return role
 
-    def _ensure_company_role(self, company_id: UUID, role_id: UUID) -> CompanyRole:
-        assignment = (
+    def _load_company_role(self, company_id: UUID, role_id: UUID) -> CompanyRole | None:
+        return (
             self.db_session.query(CompanyRole)
             .filter(
                 CompanyRole.company_id == company_id,
@@ -418,6 +448,13 @@ class RolePermissionRepository:
             )
             .one_or_none()
         )
+
+    def _ensure_company_role(self, company_id: UUID, role_id: UUID) -> CompanyRole:
+        assignment = memoized(
+            self.lookups,
+            ("company_role", company_id, role_id),
+            lambda: self._load_company_role(company_id, role_id),
+        )
         if assignment is None:
             raise AppError(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -428,6 +465,16 @@ class RolePermissionRepository:
     def global_permissions_by_role_ids(
         self,
         role_ids: list[UUID] | set[UUID],
+    ) -> dict[UUID, list[PermissionReadModel]]:
+        return memoized(
+            self.lookups,
+            ("global_permissions", frozenset(role_ids)),
+            lambda: self._load_global_permissions(role_ids),
+        )
+
+    def _load_global_permissions(
+        self,
+        role_ids: list[UUID] | set[UUID],
     ) -> dict[UUID, list[PermissionReadModel]]:
         result: dict[UUID, list[PermissionReadModel]] = defaultdict(list)
         if not role_ids:
@@ -456,41 +503,39 @@ class RolePermissionRepository:
         assignments: list[tuple[UUID, UUID]],
     ) -> dict[tuple[UUID, UUID], list[PermissionReadModel]]:
         pairs = list(dict.fromkeys(assignments))
-        result: dict[tuple[UUID, UUID], list[PermissionReadModel]] = {}
+        return memoized(
+            self.lookups,
+            ("effective_permissions", tuple(pairs)),
+            lambda: self._load_effective_permissions(pairs),
+        )
+
+    def _load_effective_permissions(
+        self,
+        pairs: list[tuple[UUID, UUID]],
+    ) -> dict[tuple[UUID, UUID], list[PermissionReadModel]]:
+        result: dict[tuple[UUID, UUID], list[PermissionReadModel]] = {
+            pair: [] for pair in pairs
+        }
         if not pairs:
             return result
-        global_map = self.global_permissions_by_role_ids(
-            {role_id for _, role_id in pairs}
+        rows = self.db_session.query(EffectiveCompanyRolePermission).filter(
+            tuple_(
+                EffectiveCompanyRolePermission.company_id,
+                EffectiveCompanyRolePermission.role_id,
+            ).in_(pairs)
         )
-        for company_id, role_id in pairs:
-            result[(company_id, role_id)] = list(global_map.get(role_id, []))
-
-        rows = (
-            self.db_session.query(CompanyRolePermission, CompanyPermission)
-            .join(
-                CompanyPermission,
-                tuple_(
-                    CompanyPermission.company_id,
-                    CompanyPermission.id,
+        for row in rows:
+            scope = PermissionScope(row.scope)
+            result[(row.company_id, row.role_id)].append(
+                PermissionReadModel(
+                    id=row.permission_id,
+                    name=row.name,
+                    description=row.description,
+                    scope=scope,
+                    company_id=(
+                        row.company_id if scope is PermissionScope.COMPANY else None
+                    ),
                 )
-                == tuple_(
-                    CompanyRolePermission.company_id,
-                    CompanyRolePermission.company_permission_id,
-                ),
-            )
-            .filter(
-                tuple_(
-                    CompanyRolePermission.company_id,
-                    CompanyRolePermission.role_id,
-                ).in_(pairs),
-                CompanyRolePermission._closed_at.is_(None),
-                CompanyPermission._closed_at.is_(None),
-            )
-            .all()
-        )
-        for link, permission in rows:
-            result[(link.company_id, link.role_id)].append(
-                _company_permission_model(permission)
             )
         for permissions in result.values():
             permissions.sort(key=_permission_sort_key)
@@ -555,7 +600,12 @@ class RolePermissionRepository:
                 global_permission_id=permission.id,
             )
         )
+        EffectivePermissionRepository(self.db_session).refresh(
+            role_id=role_id,
+            permission_id=permission.id,
+        )
         self.db_session.commit()
+        COMPANY_PERMISSION_CACHE.clear()
         return self.global_role_read(role)
 
     def remove_global_permission(
@@ -576,7 +626,12 @@ class RolePermissionRepository:
                 message=PermissionResponseMessages.ASSIGNMENT_NOT_FOUND.value,
             )
         self.db_session.delete(link)
+        EffectivePermissionRepository(self.db_session).refresh(
+            role_id=role_id,
+            permission_id=permission_id,
+        )
         self.db_session.commit()
+        COMPANY_PERMISSION_CACHE.clear()
         return self.global_role_read(role)
 
     def assign_company_permission(
@@ -590,6 +645,7 @@ class RolePermissionRepository:
         permission = CompanyPermissionRepository(
             company_id,
             self.db_session,
+            lookups=self.lookups,
         ).ensure_record(permission_id)
         existing = (
             self.db_session.query(CompanyRolePermission)
@@ -613,6 +669,11 @@ class RolePermissionRepository:
             )
         )
         try:
+            EffectivePermissionRepository(self.db_session).refresh(
+                company_id=company_id,
+                role_id=role_id,
+                permission_id=permission.id,
+            )
             self.db_session.commit()
         except IntegrityError as exc:
             self.db_session.rollback()
@@ -630,9 +691,9 @@ class RolePermissionRepository:
     ) -> RoleReadModel:
         self._ensure_company_role(company_id, role_id)
         role = self._ensure_role(role_id)
-        CompanyPermissionRepository(company_id, self.db_session).ensure_record(
-            permission_id
-        )
+        CompanyPermissionRepository(
+            company_id, self.db_session, lookups=self.lookups
+        ).ensure_record(permission_id)
         link = (
             self.db_session.query(CompanyRolePermission)
             .filter_by(
@@ -648,6 +709,11 @@ class RolePermissionRepository:
                 message=PermissionResponseMessages.ASSIGNMENT_NOT_FOUND.value,
             )
         self.db_session.delete(link)
+        EffectivePermissionRepository(self.db_session).refresh(
+            company_id=company_id,
+            role_id=role_id,
+            permission_id=permission_id,
+        )
         self.db_session.commit()
         return self.company_role_read(company_id, role)
 
@@ -0,0 +1,119 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.repository.base import BaseSQLRepository
+from app.repository.database.session_manager import session_local
+from app.repository.database.tables import RateLimitWindow
+from app.utils.rate_limit_backends import (
+    RateLimitBackend,
+    sliding_window_retry_after,
+)
+
+
+def rate_limit_key_hash(namespace: str, key: str) -> str:
+    return hashlib.sha256(f"{namespace}\x00{key}".encode("utf-8")).hexdigest()
+
+
+class RateLimitWindowRepository(BaseSQLRepository[RateLimitWindow]):
+    model = RateLimitWindow
+
+    def _insert_if_missing(self, key_hash: str, namespace: str, now: float) -> None:
+        values = {
+            "key_hash": key_hash,
+            "namespace": namespace,
+            "hits": [],
+            "expires_at": datetime.fromtimestamp(now, timezone.utc),
+        }
+        dialect = self.db_session.get_bind().dialect.name
+        if dialect == "postgresql":
+            statement = postgresql.insert(RateLimitWindow).on_conflict_do_nothing()
+        elif dialect == "sqlite":
+            statement = sqlite.insert(RateLimitWindow).on_conflict_do_nothing()
+        else:
+            statement = insert(RateLimitWindow).prefix_with("IGNORE")
+        self.db_session.execute(statement.values(**values))
+
+    def hit(
+        self,
+        namespace: str,
+        key: str,
+        *,
+        limit: int,
+        window_seconds: float,
+        now: float,
+    ) -> float | None:
+        """
+        Apply one sliding-window hit under a row lock: the row is upserted,
+        locked, pruned and rewritten in a single transaction.
+        """
+        key_hash = rate_limit_key_hash(namespace, key)
+        self._insert_if_missing(key_hash, namespace, now)
+        window = (
+            self.db_session.query(RateLimitWindow)
+            .filter(RateLimitWindow.key_hash == key_hash)
+            .with_for_update()
+            .one()
+        )
+        live = sorted(t for t in window.hits if now - t <= window_seconds)
+        retry_after = sliding_window_retry_after(live, limit, window_seconds, now)
+        if retry_after is None:
+            live.append(now)
+        window.hits = live
+        window.expires_at = datetime.fromtimestamp(
+            live[-1] + window_seconds, timezone.utc
+        )
+        self.db_session.commit()
+        return retry_after
+
+    def reset(self, namespace: str) -> None:
+        self.db_session.query(RateLimitWindow).filter(
+            RateLimitWindow.namespace == namespace
+        ).delete(synchronize_session=False)
+        self.db_session.commit()
+
+    def purge_expired(self, *, batch_size: int = 1000) -> int:
+        """Delete windows with no live hits in batches; returns the number removed."""
+        now = datetime.now(timezone.utc)
+        deleted = 0
+        while True:
+            key_hashes = [
+                row.key_hash
+                for row in self.db_session.query(RateLimitWindow.key_hash)
+                .filter(RateLimitWindow.expires_at <= now)
+                .limit(batch_size)
+            ]
+            if not key_hashes:
+                return deleted
+            self.db_session.query(RateLimitWindow).filter(
+                RateLimitWindow.key_hash.in_(key_hashes)
+            ).delete(synchronize_session=False)
+            self.db_session.commit()
+            deleted += len(key_hashes)
+
+
+class SQLRateLimitBackend(RateLimitBackend):
+    """Hit log in the ``rate_limit_window`` table, shared by every worker and host."""
+
+    def __init__(self, session_factory: Callable[[], Session] = session_local):
+        self.session_factory = session_factory
+
+    def hit(self, namespace, key, *, limit, window_seconds, now):
+        session = self.session_factory()
+        try:
+            return RateLimitWindowRepository(session).hit(
+                namespace, key, limit=limit, window_seconds=window_seconds, now=now
+            )
+        finally:
+            session.close()
+
+    def reset(self, namespace: str) -> None:
+        session = self.session_factory()
+        try:
+            RateLimitWindowRepository(session).reset(namespace)
+        finally:
+            session.close()
@@ -1,25 +1,49 @@
+from datetime import datetime, timezone
+from typing import Iterable
 from uuid import UUID
 
 from fastapi import status
+from sqlalchemy import or_, update
 from sqlalchemy.exc import IntegrityError
 
 from app.models.user.account_status import UserAccountStatus
 from app.models.user.password import PasswordResetMethod
 from app.models.user.response_messages import UserResponseMessages
 from app.models.user.user import UserReadModel
-from app.repository.base import BaseSQLRepository
-from app.repository.database.tables import User
+from app.repository.auth_revocation import AuthRevocationRepository
+from app.repository.base import BaseSQLRepository, commit_or_flush
+from app.repository.cache_generation import CacheGenerationRepository, CacheScope
+from app.repository.database.tables import PasswordResetToken, User
+from app.repository.user_password import password_reset_token_hash
 from app.utils.app_error import AppError
-from app.utils.hash_password import UnknownHashError, hash_password, verify_password
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE, AuthPrincipal
+from app.utils.hash_password import (
+    UnknownHashError,
+    hash_password,
+    needs_rehash,
+    verify_password,
+)
+from app.utils.revocation_list import REVOCATION_LIST
 
 
 class UserRepository(BaseSQLRepository[User]):
     model = User
-    REFRESH_TOKEN_VERSION_KEY = "refresh_token_version"
 
     def _active_user_query(self):
         return self._base_query().filter(User._closed_at.is_(None))
 
+    def _revoke_access_tokens(
+        self, user_id: UUID, refresh_token_version: int, *, reason: str
+    ) -> None:
+        """Stage a revocation row; it is committed with the triggering change."""
+        AuthRevocationRepository(self.db_session).record(
+            user_id, refresh_token_version, reason=reason
+        )
+
+    def _publish_change(self, user_id: UUID) -> None:
+        """Stage a cross-worker principal cache bump; it commits with the change."""
+        CacheGenerationRepository(self.db_session).bump(CacheScope.USERS, key=user_id)
+
     @staticmethod
     def _to_read_model(
         user: User, *, status_override: str | None = None
@@ -52,6 +76,35 @@ class UserRepository(BaseSQLRepository[User]):
             ) from exc
         return self._to_read_model(user)
 
+    def get_auth_principal(self, user_id: UUID) -> AuthPrincipal:
+        """Load the user and refresh-token version for authentication in one query."""
+        user = self._active_user_query().filter(User.id == user_id).one_or_none()
+        if user is None:
+            raise AppError(
+                status_code=status.HTTP_404_NOT_FOUND,
+                message=UserResponseMessages.USER_NOT_FOUND.value,
+            )
+        return AuthPrincipal(
+            user=self._to_read_model(user),
+            refresh_token_version=user.refresh_token_version,
+        )
+
+    def get_auth_principals(
+        self, user_ids: Iterable[UUID]
+    ) -> dict[UUID, AuthPrincipal]:
+        """Load authentication principals for many users with a single IN query."""
+        unique_ids = set(user_ids)
+        if not unique_ids:
+            return {}
+        users = self._active_user_query().filter(User.id.in_(unique_ids)).all()
+        return {
+            user.id: AuthPrincipal(
+                user=self._to_read_model(user),
+                refresh_token_version=user.refresh_token_version,
+            )
+            for user in users
+        }
+
     def get_user_by_email(
         self, user_email: str, password: str | None = None
     ) -> UserReadModel:
@@ -67,10 +120,9 @@ class UserRepository(BaseSQLRepository[User]):
                 is_valid = verify_password(password, user.password)
             except UnknownHashError:
                 is_valid = password == user.password
-                if is_valid:
-                    user.password = hash_password(password)
-                    self.db_session.commit()
-                    self.db_session.refresh(user)
+            if is_valid and needs_rehash(user.password):
+                user.password = hash_password(password)
+                commit_or_flush(self.db_session, user)
 
             if not is_valid:
                 raise AppError(
@@ -98,19 +150,17 @@ class UserRepository(BaseSQLRepository[User]):
                 message=UserResponseMessages.USER_ALREADY_EXISTS.value,
             )
 
-        try:
-            user = self.create(**data)
-        except IntegrityError as exc:
-            self.db_session.rollback()
-            if "UNIQUE constraint failed: user.email" in str(exc):
-                raise AppError(
-                    status_code=status.HTTP_409_CONFLICT,
-                    message=UserResponseMessages.USER_ALREADY_EXISTS.value,
-                ) from exc
-            raise
-
-        self.update_user_status(user_id=user.id, account_status=account_status)
-        self.db_session.refresh(user)
+        with self.transaction():
+            try:
+                user = self.create(**data)
+            except IntegrityError as exc:
+                if "UNIQUE constraint failed: user.email" in str(exc):
+                    raise AppError(
+                        status_code=status.HTTP_409_CONFLICT,
+                        message=UserResponseMessages.USER_ALREADY_EXISTS.value,
+                    ) from exc
+                raise
+            self.update_user_status(user_id=user.id, account_status=account_status)
         return self._to_read_model(user, status_override=account_status)
 
     def update_user(self, user_id: UUID, data: dict) -> UserReadModel:
@@ -120,7 +170,9 @@ class UserRepository(BaseSQLRepository[User]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 message=UserResponseMessages.USER_UPDATE_FAILED.value,
             )
+        self._publish_change(user_id)
         updated = self.update(user, **data)
+        self._after_commit(lambda: AUTH_PRINCIPAL_CACHE.invalidate(user_id))
         return self._to_read_model(updated)
 
     def update_user_status(self, user_id: UUID, account_status: str) -> UserReadModel:
@@ -130,48 +182,75 @@ class UserRepository(BaseSQLRepository[User]):
                 status_code=status.HTTP_400_BAD_REQUEST,
                 message=UserResponseMessages.USER_ACCOUNT_STATUS_UPDATE_FAILED.value,
             )
+        previous_status = (user.primary_meta_data or {}).get("status")
+        revoke = (
+            previous_status is not None
+            and previous_status != account_status
+            and account_status != UserAccountStatus.ACTIVE.name_value
+        )
+        if revoke:
+            token_version = user.refresh_token_version
+            self._revoke_access_tokens(user_id, token_version, reason="status_change")
+        self._publish_change(user_id)
         updated = self.update_json_field(
             user,
             column_name="primary_meta_data",
             key="status",
             value=account_status,
         )
+        self._after_commit(lambda: AUTH_PRINCIPAL_CACHE.invalidate(user_id))
+        if revoke:
+            self._after_commit(lambda: REVOCATION_LIST.add(user_id, token_version))
         return self._to_read_model(updated, status_override=account_status)
 
     def get_refresh_token_version(self, user_id: UUID) -> int:
-        user = self._active_user_query().filter(User.id == user_id).first()
-        if not user:
+        refresh_token_version = (
+            self.db_session.query(User.refresh_token_version)
+            .filter(User.id == user_id, User._closed_at.is_(None))
+            .scalar()
+        )
+        if refresh_token_version is None:
             raise AppError(
                 status_code=status.HTTP_404_NOT_FOUND,
                 message=UserResponseMessages.USER_NOT_FOUND.value,
             )
-
-        metadata = user.primary_meta_data or {}
-        refresh_token_version = metadata.get(self.REFRESH_TOKEN_VERSION_KEY, 0)
-        try:
-            return int(refresh_token_version)
-        except (TypeError, ValueError):
-            return 0
+        return refresh_token_version
 
     def increment_refresh_token_version(self, user_id: UUID) -> int:
-        user = self._active_user_query().filter(User.id == user_id).first()
-        if not user:
+        """
+        Atomically bump the version in a single UPDATE so concurrent logins
+        never lose an increment. Uses RETURNING where the dialect supports it.
+        """
+        statement = (
+            update(User)
+            .where(User.id == user_id, User._closed_at.is_(None))
+            .values(refresh_token_version=User.refresh_token_version + 1)
+        )
+        if self.db_session.get_bind().dialect.update_returning:
+            next_version = self.db_session.execute(
+                statement.returning(User.refresh_token_version)
+            ).scalar_one_or_none()
+        elif self.db_session.execute(statement).rowcount:
+            next_version = (
+                self.db_session.query(User.refresh_token_version)
+                .filter(User.id == user_id)
+                .scalar()
+            )
+        else:
+            next_version = None
+
+        if next_version is None:
             raise AppError(
                 status_code=status.HTTP_404_NOT_FOUND,
                 message=UserResponseMessages.USER_NOT_FOUND.value,
             )
-        next_version = self.get_refresh_token_version(user_id) + 1
-        updated_user = self.update_json_field(
-            user,
-            column_name="primary_meta_data",
-            key=self.REFRESH_TOKEN_VERSION_KEY,
-            value=next_version,
-        )
-        return int(
-            updated_user.primary_meta_data.get(
-                self.REFRESH_TOKEN_VERSION_KEY, next_version
-            )
-        )
+        # No cache bump: other workers' cached principals carry the old
+        # version, so tokens issued from here on never match them.
+        self._revoke_access_tokens(user_id, next_version - 1, reason="version_bump")
+        commit_or_flush(self.db_session)
+        self._after_commit(lambda: AUTH_PRINCIPAL_CACHE.invalidate(user_id))
+        self._after_commit(lambda: REVOCATION_LIST.add(user_id, next_version - 1))
+        return next_version
 
     def delete_user(self, user_id: UUID):
         user = self._active_user_query().filter(User.id == user_id).one_or_none()
@@ -180,7 +259,55 @@ class UserRepository(BaseSQLRepository[User]):
                 status_code=status.HTTP_404_NOT_FOUND,
                 message=UserResponseMessages.USER_NOT_FOUND.value,
             )
+        token_version = user.refresh_token_version
+        self._revoke_access_tokens(user_id, token_version, reason="user_deleted")
+        self._publish_change(user_id)
         self.soft_delete(user)
+        self._after_commit(lambda: AUTH_PRINCIPAL_CACHE.invalidate(user_id))
+        self._after_commit(lambda: REVOCATION_LIST.add(user_id, token_version))
+
+    def compact_stale_metadata(
+        self, keys: Iterable[str], *, batch_size: int = 1000
+    ) -> int:
+        """
+        Strip superseded ``keys`` from the ``primary_meta_data`` of users that
+        still carry them, one batch at a time in id order. Each batch is read
+        ``FOR UPDATE``, so a concurrent metadata write waits for the rewrite
+        instead of being overwritten by it. Returns the number of users
+        rewritten.
+        """
+        keys = frozenset(keys)
+        carries_keys = or_(
+            *(User.primary_meta_data[key].as_string().is_not(None) for key in keys)
+        )
+        compacted, last_id = 0, None
+        while True:
+            query = self.db_session.query(User.id, User.primary_meta_data).filter(
+                carries_keys
+            )
+            if last_id is not None:
+                query = query.filter(User.id > last_id)
+            rows = query.order_by(User.id).limit(batch_size).with_for_update().all()
+            if not rows:
+                self.db_session.commit()
+                return compacted
+            self.db_session.execute(
+                update(User),
+                [
+                    {
+                        "id": row.id,
+                        "primary_meta_data": {
+                            key: value
+                            for key, value in row.primary_meta_data.items()
+                            if key not in keys
+                        },
+                    }
+                    for row in rows
+                ],
+            )
+            self.db_session.commit()
+            compacted += len(rows)
+            last_id = rows[-1].id
 
     def get_user_record_by_password_reset_token(
         self,
@@ -188,13 +315,18 @@ class UserRepository(BaseSQLRepository[User]):
         token: str,
         method: PasswordResetMethod,
     ) -> User | None:
-        for user in self._active_user_query().all():
-            password_reset_data = (user.primary_meta_data or {}).get(
-                "password_reset", {}
+        """
+        Find the active user holding an unexpired reset token. Only magic-link
+        tokens can be resolved this way; OTPs need the user's email as well.
+        """
+        return (
+            self._active_user_query()
+            .join(PasswordResetToken, PasswordResetToken.user_id == User.id)
+            .filter(
+                PasswordResetToken.token_hash
+                == password_reset_token_hash(method, token),
+                PasswordResetToken.method == method.value,
+                PasswordResetToken.expires_at > datetime.now(timezone.utc),
             )
-            if (
-                password_reset_data.get("method") == method.value
-                and password_reset_data.get("token") == token
-            ):
-                return user
-        return None
+            .first()
+        )
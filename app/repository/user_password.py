@@ -1,4 +1,6 @@
+import hashlib
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 from fastapi import status
 from sqlalchemy.orm import Session
@@ -6,33 +8,28 @@ from sqlalchemy.orm import Session
 from app.models.user.password import PasswordResetMethod
 from app.models.user.response_messages import UserResponseMessages
 from app.repository.base import BaseSQLRepository
-from app.repository.database.tables import User
+from app.repository.database.tables import PasswordResetToken, User
 from app.utils.app_error import AppError
 from app.utils.hash_password import hash_password
 
 
+def password_reset_token_hash(
+    method: PasswordResetMethod, token: str, user_id: UUID | None = None
+) -> str:
+    """
+    Digest stored for a reset token. OTPs are scoped to their user, so an OTP
+    can only be matched together with the user it was issued to.
+    """
+    scope = str(user_id) if method == PasswordResetMethod.OTP else ""
+    return hashlib.sha256(f"{method.value}:{scope}:{token}".encode()).hexdigest()
+
+
 class UserPasswordRepository(BaseSQLRepository[User]):
     model = User
 
     def __init__(self, session: Session):
         super().__init__(session)
 
-    @staticmethod
-    def _build_password_reset_record(
-        *,
-        method: PasswordResetMethod,
-        token: str,
-        expires_in: timedelta,
-    ) -> dict[str, str]:
-        created_at = datetime.now(timezone.utc)
-        expires_at = created_at + expires_in
-        return {
-            "method": method.value,
-            "token": token,
-            "created_at": created_at.isoformat(),
-            "expires_at": expires_at.isoformat(),
-        }
-
     def _get_user(self, user_email: str) -> User:
         user = self._base_query().filter(User.email == user_email).first()
         if not user:
@@ -50,17 +47,18 @@ class UserPasswordRepository(BaseSQLRepository[User]):
         token: str,
         expires_in: timedelta,
     ) -> None:
+        """Issue a reset token for the user, replacing any outstanding one."""
         user = self._get_user(user_email)
-        self.update_json_field(
-            user,
-            column_name="primary_meta_data",
-            key="password_reset",
-            value=self._build_password_reset_record(
-                method=method,
-                token=token,
-                expires_in=expires_in,
-            ),
+        self._delete_tokens(user.id)
+        self.db_session.add(
+            PasswordResetToken(
+                user_id=user.id,
+                method=method.value,
+                token_hash=password_reset_token_hash(method, token, user.id),
+                expires_at=datetime.now(timezone.utc) + expires_in,
+            )
         )
+        self.db_session.commit()
 
     def verify_password_reset_token(
         self,
@@ -70,18 +68,18 @@ class UserPasswordRepository(BaseSQLRepository[User]):
         token: str,
     ) -> bool:
         user = self._get_user(user_email)
-        password_reset_data = (user.primary_meta_data or {}).get("password_reset", {})
-        if password_reset_data.get("method") != method.value:
-            return False
-
-        if password_reset_data.get("token") != token:
-            return False
-
-        expires_at = password_reset_data.get("expires_at")
-        if not expires_at:
-            return False
-
-        return datetime.fromisoformat(expires_at) > datetime.now(timezone.utc)
+        live_token = (
+            self.db_session.query(PasswordResetToken.id)
+            .filter(
+                PasswordResetToken.token_hash
+                == password_reset_token_hash(method, token, user.id),
+                PasswordResetToken.user_id == user.id,
+                PasswordResetToken.method == method.value,
+                PasswordResetToken.expires_at > datetime.now(timezone.utc),
+            )
+            .first()
+        )
+        return live_token is not None
 
     def update_password(self, user_email: str, new_password: str) -> None:
         user = self._get_user(user_email)
@@ -91,6 +89,29 @@ class UserPasswordRepository(BaseSQLRepository[User]):
         self.db_session.refresh(user)
 
     def clear_password_reset_record(self, user: User) -> None:
-        password_reset_data = (user.primary_meta_data or {}).copy()
-        password_reset_data.pop("password_reset", None)
-        user.primary_meta_data = password_reset_data
+        """Consume the user's reset tokens; the caller commits."""
+        self._delete_tokens(user.id)
+
+    def purge_expired_tokens(self, *, batch_size: int = 1000) -> int:
+        """Delete expired reset tokens in batches; returns the number removed."""
+        now = datetime.now(timezone.utc)
+        deleted = 0
+        while True:
+            ids = [
+                row.id
+                for row in self.db_session.query(PasswordResetToken.id)
+                .filter(PasswordResetToken.expires_at <= now)
+                .limit(batch_size)
+            ]
+            if not ids:
+                return deleted
+            self.db_session.query(PasswordResetToken).filter(
+                PasswordResetToken.id.in_(ids)
+            ).delete(synchronize_session=False)
+            self.db_session.commit()
+            deleted += len(ids)
+
+    def _delete_tokens(self, user_id: UUID) -> None:
+        self.db_session.query(PasswordResetToken).filter(
+            PasswordResetToken.user_id == user_id
+        ).delete(synchronize_session=False)
@@ -0,0 +1,148 @@
+"""Drop this worker's cached entries when another worker's write makes them stale."""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Callable
+
+import anyio
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.configs import settings
+from app.repository.cache_generation import (
+    CACHE_GENERATION_CHANNEL,
+    CacheGenerationRepository,
+    CacheScope,
+    cache_partition,
+    parse_generation_key,
+)
+from app.repository.database.session_manager import get_engine, session_local
+from app.repository.default_catalog import DEFAULT_ROLE_CATALOG
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE
+from app.utils.logging import logger
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
+
+# Receives the partition that changed, or None when the whole scope did.
+Subscriber = Callable[[int | None], None]
+
+
+def _invalidate_principals(partition: int | None) -> None:
+    if partition is None:
+        AUTH_PRINCIPAL_CACHE.clear()
+    else:
+        AUTH_PRINCIPAL_CACHE.discard_where(
+            lambda user_id: cache_partition(user_id) == partition
+        )
+
+
+def _invalidate_company_permissions(partition: int | None) -> None:
+    if partition is None:
+        COMPANY_PERMISSION_CACHE.clear()
+    else:
+        COMPANY_PERMISSION_CACHE.discard_where(
+            lambda company_id: cache_partition(company_id) == partition
+        )
+
+
+def _reset_default_role_catalog(partition: int | None) -> None:
+    DEFAULT_ROLE_CATALOG.reset()
+
+
+DEFAULT_SUBSCRIBERS: dict[CacheScope, list[Subscriber]] = {
+    CacheScope.USERS: [_invalidate_principals],
+    CacheScope.COMPANY_PERMISSIONS: [_invalidate_company_permissions],
+    CacheScope.DEFAULT_ROLES: [_reset_default_role_catalog],
+}
+
+
+class CacheInvalidationBus:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = session_local,
+        engine_factory: Callable[[], Engine] = get_engine,
+        subscribers: dict[CacheScope, list[Subscriber]] | None = None,
+    ):
+        self.session_factory = session_factory
+        self.engine_factory = engine_factory
+        self._subscribers: dict[CacheScope, list[Subscriber]] = defaultdict(list)
+        for scope, callbacks in (subscribers or DEFAULT_SUBSCRIBERS).items():
+            self._subscribers[scope].extend(callbacks)
+        self._seen: dict[str, int] | None = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, scope: CacheScope, callback: Subscriber) -> None:
+        self._subscribers[scope].append(callback)
+
+    def poll_once(self) -> int:
+        """
+        Read every counter and notify the subscribers of each scope or
+        partition that moved since the last poll. The first poll invalidates
+        every subscribed scope, since writes may have landed while this
+        worker was starting. Returns the number of changes dispatched.
+        """
+        session = self.session_factory()
+        try:
+            current = CacheGenerationRepository(session).generations()
+        finally:
+            session.close()
+
+        with self._lock:
+            if self._seen is None:
+                changed = [(scope, None) for scope in self._subscribers]
+            else:
+                changed = [
+                    parsed
+                    for key, generation in current.items()
+                    if self._seen.get(key) != generation
+                    and (parsed := parse_generation_key(key)) is not None
+                ]
+            self._seen = current
+        for scope, partition in changed:
+            for callback in self._subscribers.get(scope, ()):
+                callback(partition)
+        return len(changed)
+
+    async def run(self) -> None:
+        """Poll forever on a worker thread; failures leave caches to their TTLs."""
+        while True:
+            try:
+                await anyio.to_thread.run_sync(self.poll_once)
+            except Exception:
+                logger.exception("Failed to poll cache generations")
+            await anyio.sleep(settings.CACHE_INVALIDATION_POLL_SECONDS)
+
+    async def listen(self) -> None:
+        """
+        Poll as soon as Postgres announces a bump, reconnecting after failures.
+        Returns at once on other databases, where polling alone applies.
+        """
+        if self.engine_factory().dialect.name != "postgresql":
+            return
+        while True:
+            try:
+                await self._listen_once()
+            except Exception:
+                logger.exception("Cache invalidation listener disconnected")
+            await anyio.sleep(settings.CACHE_INVALIDATION_POLL_SECONDS)
+
+    async def _listen_once(self) -> None:
+        connection = self.engine_factory().raw_connection()
+        try:
+            driver = connection.driver_connection
+            driver.autocommit = True
+            with driver.cursor() as cursor:
+                cursor.execute(f"LISTEN {CACHE_GENERATION_CHANNEL}")
+            while True:
+                await anyio.wait_readable(driver.fileno())
+                driver.poll()
+                if driver.notifies:
+                    driver.notifies.clear()
+                    await anyio.to_thread.run_sync(self.poll_once)
+        finally:
+            # Never hand a LISTENing autocommit connection back to the pool.
+            connection.invalidate()
+
+
+__all__ = ["CacheInvalidationBus", "DEFAULT_SUBSCRIBERS"]
@@ -2,19 +2,67 @@ from uuid import UUID
 
 from fastapi import status
 
+from app.models.authorization import (
+    AccessCheckModel,
+    AccessCheckRequestModel,
+    AccessCheckResponseModel,
+    AccessDecisionModel,
+)
 from app.models.company.response_messages import CompanyResponseMessages
+from app.models.permissions import PermissionScope
+from app.models.security_messages import SecurityResponseMessages
 from app.models.system_permissions import SystemPermission
 from app.repository.database.tables import (
     AssociationUserCompany,
     Company,
     CompanyRole,
-    GlobalPermission,
+    EffectiveCompanyRolePermission,
     Role,
-    RoleGlobalPermission,
 )
+from app.repository.user import UserRepository
 from app.utils.app_error import AppError
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
 from app.utils.shared_context import SharedContext
 
+_SYSTEM_PERMISSIONS = {
+    (permission.permission_id, permission.value): permission
+    for permission in SystemPermission
+}
+
+
+def _join_live_grants(query):
+    """
+    Join live memberships to their materialized permissions. Closed companies
+    and closed roles are filtered here as well, so a missed refresh
+    of the materialized table can never grant access through them.
+    """
+    return (
+        query.join(
+            EffectiveCompanyRolePermission,
+            (
+                EffectiveCompanyRolePermission.company_id
+                == AssociationUserCompany.company_id
+            )
+            & (
+                EffectiveCompanyRolePermission.role_id == AssociationUserCompany.role_id
+            ),
+        )
+        .join(Company, Company.id == AssociationUserCompany.company_id)
+        .join(
+            CompanyRole,
+            (CompanyRole.company_id == AssociationUserCompany.company_id)
+            & (CompanyRole.role_id == AssociationUserCompany.role_id),
+        )
+        .join(Role, Role.id == AssociationUserCompany.role_id)
+        .filter(
+            AssociationUserCompany._closed_at.is_(None),
+            Company._closed_at.is_(None),
+            CompanyRole._closed_at.is_(None),
+            Role._closed_at.is_(None),
+            EffectiveCompanyRolePermission.scope == PermissionScope.GLOBAL.value,
+        )
+    )
+
 
 class CompanyAuthorizationService:
     def __init__(self, context: SharedContext):
@@ -28,43 +76,127 @@ class CompanyAuthorizationService:
         if self.context.user.is_superuser:
             return
 
-        authorized = (
-            self.context.db_session.query(AssociationUserCompany)
-            .join(
-                Company,
-                Company.id == AssociationUserCompany.company_id,
-            )
-            .join(
-                CompanyRole,
-                (CompanyRole.company_id == AssociationUserCompany.company_id)
-                & (CompanyRole.role_id == AssociationUserCompany.role_id),
+        if not self.permission_mask(company_id) & permission.bit:
+            raise AppError(
+                status_code=status.HTTP_403_FORBIDDEN,
+                message=CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value,
             )
-            .join(Role, Role.id == AssociationUserCompany.role_id)
-            .join(
-                RoleGlobalPermission,
-                RoleGlobalPermission.role_id == AssociationUserCompany.role_id,
+
+    def permission_mask(self, company_id: UUID) -> int:
+        """
+        Return the caller's system permissions in ``company_id`` as a bitmask
+        of ``SystemPermission.bit`` flags, memoized for the request and served
+        from the per-worker cache.
+        """
+        return self.context.lookups.get_or_load(
+            ("company_permission_mask", company_id),
+            lambda: self._cached_permission_mask(company_id),
+        )
+
+    def _cached_permission_mask(self, company_id: UUID) -> int:
+        user_id = self.context.user.id
+        mask = COMPANY_PERMISSION_CACHE.get(user_id, company_id)
+        if mask is None:
+            generation = COMPANY_PERMISSION_CACHE.generation
+            mask = self._load_permission_mask(company_id)
+            COMPANY_PERMISSION_CACHE.set(
+                user_id, company_id, mask, generation=generation
             )
-            .join(
-                GlobalPermission,
-                GlobalPermission.id == RoleGlobalPermission.global_permission_id,
+        return mask
+
+    def _load_permission_mask(self, company_id: UUID) -> int:
+        rows = (
+            _join_live_grants(
+                self.context.db_session.query(
+                    EffectiveCompanyRolePermission.permission_id,
+                    EffectiveCompanyRolePermission.name,
+                ).select_from(AssociationUserCompany)
             )
             .filter(
                 AssociationUserCompany.user_id == self.context.user.id,
                 AssociationUserCompany.company_id == company_id,
-                AssociationUserCompany._closed_at.is_(None),
-                Company._closed_at.is_(None),
-                CompanyRole._closed_at.is_(None),
-                Role._closed_at.is_(None),
-                RoleGlobalPermission._closed_at.is_(None),
-                GlobalPermission.id == permission.permission_id,
-                GlobalPermission.name == permission.value,
-                GlobalPermission._closed_at.is_(None),
             )
-            .first()
-            is not None
+            .all()
         )
-        if not authorized:
+        mask = 0
+        for row in rows:
+            # Both id and name must match, so a renamed custom permission
+            # can never stand in for a system one.
+            permission = _SYSTEM_PERMISSIONS.get((row.permission_id, row.name))
+            if permission is not None:
+                mask |= permission.bit
+        return mask
+
+    def check_access(
+        self, payload: AccessCheckRequestModel
+    ) -> AccessCheckResponseModel:
+        """
+        Decide many ``(company_id, permission)`` pairs for one user with a
+        single query. Only superusers may ask about a user other than
+        themselves. Results follow the order of ``payload.checks``.
+        """
+        max_batch = self.context.configs.AUTHZ_CHECK_MAX_BATCH
+        if len(payload.checks) > max_batch:
             raise AppError(
-                status_code=status.HTTP_403_FORBIDDEN,
-                message=CompanyResponseMessages.UNAUTHORIZED_COMPANY_ACCESS.value,
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=SecurityResponseMessages.ACCESS_CHECK_BATCH_TOO_LARGE.value,
+                error=f"At most {max_batch} pairs may be checked per request",
+            )
+
+        user = self.context.user
+        if payload.user_id is not None and payload.user_id != user.id:
+            if not user.is_superuser:
+                raise AppError(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    message=(
+                        SecurityResponseMessages.ACCESS_CHECK_OTHER_USER_FORBIDDEN.value
+                    ),
+                )
+            user = UserRepository(self.context.db_session).get_user_by_id(
+                payload.user_id
             )
+
+        if user.is_superuser:
+            allowed = {(check.company_id, check.permission) for check in payload.checks}
+        else:
+            allowed = self._load_allowed_pairs(user.id, payload.checks)
+        return AccessCheckResponseModel(
+            user_id=user.id,
+            results=[
+                AccessDecisionModel(
+                    company_id=check.company_id,
+                    permission=check.permission,
+                    allowed=(check.company_id, check.permission) in allowed,
+                )
+                for check in payload.checks
+            ],
+        )
+
+    def _load_allowed_pairs(
+        self, user_id: UUID, checks: list[AccessCheckModel]
+    ) -> set[tuple[UUID, SystemPermission]]:
+        rows = (
+            _join_live_grants(
+                self.context.db_session.query(
+                    AssociationUserCompany.company_id,
+                    EffectiveCompanyRolePermission.permission_id,
+                    EffectiveCompanyRolePermission.name,
+                ).select_from(AssociationUserCompany)
+            )
+            .filter(
+                AssociationUserCompany.user_id == user_id,
+                AssociationUserCompany.company_id.in_(
+                    {check.company_id for check in checks}
+                ),
+                EffectiveCompanyRolePermission.permission_id.in_(
+                    {check.permission.permission_id for check in checks}
+                ),
+            )
+            .all()
+        )
+        allowed = set()
+        for row in rows:
+            permission = _SYSTEM_PERMISSIONS.get((row.permission_id, row.name))
+            if permission is not None:
+                allowed.add((row.company_id, permission))
+        return allowed
@@ -19,6 +19,7 @@ from app.repository.company_role import (
 )
 from app.services.company.authorization import CompanyAuthorizationService
 from app.utils.app_error import AppError
+from app.utils.logging import logger
 from app.utils.shared_context import SharedContext
 
 
@@ -129,7 +130,20 @@ class RoleService:
         return CompanyRoleAssignmentRepository(
             company_id=UUID(payload.company_ids[0]),
             session=self.context.db_session,
-        ).assign_role_to_companies(role, payload, self.context.user)
+        ).assign_role_to_companies(
+            role,
+            payload,
+            self.context.user,
+            progress=lambda report: logger.info(
+                "Assigned role to company batch",
+                extra={
+                    "role_id": str(role.id),
+                    "processed": report.processed,
+                    "total": report.total,
+                    "assigned": report.assigned,
+                },
+            ),
+        )
 
     def create_role_for_company(
         self, payload: RoleCreateModel, company_id: UUID
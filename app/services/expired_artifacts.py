@@ -0,0 +1,115 @@
+"""Delete expired auth artifacts and compact superseded user metadata."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import anyio
+from sqlalchemy.orm import Session
+
+from app.configs import settings
+from app.repository.auth_revocation import AuthRevocationRepository
+from app.repository.database.session_manager import session_local
+from app.repository.rate_limit import RateLimitWindowRepository
+from app.repository.user import UserRepository
+from app.repository.user_password import UserPasswordRepository
+from app.utils.logging import logger
+
+# Keys that older releases kept in ``user.primary_meta_data`` and that now
+# live in dedicated columns or tables.
+STALE_USER_METADATA_KEYS = ("password_reset", "refresh_token_version")
+
+
+@dataclass(frozen=True)
+class PurgeReport:
+    reset_tokens: int
+    revocations: int
+    rate_limit_windows: int
+    compacted_users: int
+    seconds: float
+
+    @property
+    def rows_touched(self) -> int:
+        return (
+            self.reset_tokens
+            + self.revocations
+            + self.rate_limit_windows
+            + self.compacted_users
+        )
+
+
+class ExpiredArtifactPurger:
+    """
+    Delete expired rows in batches. Metadata compaction walks the whole user
+    table, so only the ``purge-expired`` command enables it; the in-process
+    schedule every worker runs leaves it off.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = session_local,
+        *,
+        batch_size: int = 1000,
+        compact_metadata: bool = False,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.compact_metadata = compact_metadata
+
+    def purge_once(self) -> PurgeReport:
+        started = time.perf_counter()
+        session = self.session_factory()
+        try:
+            reset_tokens = UserPasswordRepository(session).purge_expired_tokens(
+                batch_size=self.batch_size
+            )
+            revocations = AuthRevocationRepository(session).purge_expired(
+                batch_size=self.batch_size
+            )
+            rate_limit_windows = RateLimitWindowRepository(session).purge_expired(
+                batch_size=self.batch_size
+            )
+            compacted_users = (
+                UserRepository(session).compact_stale_metadata(
+                    STALE_USER_METADATA_KEYS, batch_size=self.batch_size
+                )
+                if self.compact_metadata
+                else 0
+            )
+        finally:
+            session.close()
+        report = PurgeReport(
+            reset_tokens=reset_tokens,
+            revocations=revocations,
+            rate_limit_windows=rate_limit_windows,
+            compacted_users=compacted_users,
+            seconds=time.perf_counter() - started,
+        )
+        logger.info(
+            "Purged expired auth artifacts",
+            extra={
+                "extra": {
+                    "reset_tokens": report.reset_tokens,
+                    "revocations": report.revocations,
+                    "rate_limit_windows": report.rate_limit_windows,
+                    "compacted_users": report.compacted_users,
+                    "rows_touched": report.rows_touched,
+                    "seconds": round(report.seconds, 3),
+                }
+            },
+        )
+        return report
+
+    async def run(self) -> None:
+        """Purge on a worker thread every ``PURGE_EXPIRED_INTERVAL_SECONDS``."""
+        while True:
+            await anyio.sleep(settings.PURGE_EXPIRED_INTERVAL_SECONDS)
+            try:
+                await anyio.to_thread.run_sync(self.purge_once)
+            except Exception:
+                logger.exception("Failed to purge expired auth artifacts")
+
+
+__all__ = ["ExpiredArtifactPurger", "PurgeReport", "STALE_USER_METADATA_KEYS"]
@@ -0,0 +1,111 @@
+from uuid import UUID
+
+from fastapi import status
+
+from app.api.security.jwt import (
+    JWTManager,
+    TokenPrincipal,
+    status_allows_authenticated_access,
+)
+from app.models.introspection import (
+    TokenIntrospectionBatchResponseModel,
+    TokenIntrospectionResultModel,
+)
+from app.models.security_messages import SecurityResponseMessages
+from app.repository.user import UserRepository
+from app.utils.app_error import AppError
+from app.utils.auth_cache import (
+    AUTH_PRINCIPAL_CACHE,
+    VERIFIED_TOKEN_CACHE,
+    AuthPrincipal,
+)
+from app.utils.shared_context import SharedContext
+
+
+class TokenIntrospectionService:
+    def __init__(self, context: SharedContext):
+        self.context = context
+        self.user_repository = UserRepository(context.db_session)
+
+    def _decode(
+        self, jwt_manager: JWTManager, token: str
+    ) -> tuple[TokenPrincipal, int] | None:
+        try:
+            return jwt_manager.decode_access_token(token)
+        except AppError:
+            return None
+
+    def _load_principals(
+        self, decoded: list[tuple[TokenPrincipal, int] | None]
+    ) -> dict[UUID, AuthPrincipal]:
+        """
+        Resolve the principal of every decoded token. A user is served from
+        the principal cache only when every token for that user hits it at
+        the token's own version; otherwise the user is loaded from the
+        database, in one query for the whole batch.
+        """
+        principals: dict[UUID, AuthPrincipal] = {}
+        missing: set[UUID] = set()
+        checked: set[tuple[UUID, int]] = set()
+        for entry in decoded:
+            if entry is None:
+                continue
+            user_id, token_version = entry[0].id, entry[1]
+            if user_id in missing or (user_id, token_version) in checked:
+                continue
+            checked.add((user_id, token_version))
+            cached = AUTH_PRINCIPAL_CACHE.get(
+                user_id, refresh_token_version=token_version
+            )
+            if cached is None:
+                missing.add(user_id)
+                principals.pop(user_id, None)
+            else:
+                principals[user_id] = cached
+
+        loaded = self.user_repository.get_auth_principals(missing)
+        for principal in loaded.values():
+            AUTH_PRINCIPAL_CACHE.set(principal)
+        principals.update(loaded)
+        return principals
+
+    def introspect_batch(
+        self, tokens: list[str]
+    ) -> TokenIntrospectionBatchResponseModel:
+        """
+        Check many access tokens at once: verify each signature, resolve every
+        referenced user with one query, and compare refresh-token versions and
+        account statuses. Results follow the order of ``tokens``.
+        """
+        max_batch = self.context.configs.INTROSPECTION_MAX_BATCH
+        if len(tokens) > max_batch:
+            raise AppError(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=SecurityResponseMessages.INTROSPECTION_BATCH_TOO_LARGE.value,
+                error=f"At most {max_batch} tokens may be introspected per request",
+            )
+
+        jwt_manager = JWTManager(token_cache=VERIFIED_TOKEN_CACHE)
+        decoded = [self._decode(jwt_manager, token) for token in tokens]
+        principals = self._load_principals(decoded)
+
+        results = []
+        for entry in decoded:
+            principal = principals.get(entry[0].id) if entry is not None else None
+            if (
+                principal is None
+                or principal.refresh_token_version != entry[1]
+                or not status_allows_authenticated_access(principal.status)
+            ):
+                results.append(TokenIntrospectionResultModel(active=False))
+                continue
+            results.append(
+                TokenIntrospectionResultModel(
+                    active=True,
+                    sub=principal.user.id,
+                    exp=entry[0].expires_at,
+                    status=principal.status,
+                    is_superuser=principal.user.is_superuser,
+                )
+            )
+        return TokenIntrospectionBatchResponseModel(results=results)
@@ -43,6 +43,7 @@ class PermissionService:
         repository = CompanyPermissionRepository(
             company_id,
             self.context.db_session,
+            lookups=self.context.lookups,
         )
         repository.ensure_company()
         self.company_authorization.require(company_id, permission)
@@ -94,6 +95,7 @@ class PermissionService:
         return CompanyPermissionRepository(
             company_id,
             self.context.db_session,
+            lookups=self.context.lookups,
         ).create_permission(payload, self.context.user)
 
     def get_company_permissions(
@@ -108,6 +110,7 @@ class PermissionService:
         return CompanyPermissionRepository(
             company_id,
             self.context.db_session,
+            lookups=self.context.lookups,
         ).get_permissions(payload)
 
     def update_company_permission(
@@ -123,6 +126,7 @@ class PermissionService:
         return CompanyPermissionRepository(
             company_id,
             self.context.db_session,
+            lookups=self.context.lookups,
         ).update_permission(permission_id, payload)
 
     def delete_company_permission(
@@ -137,6 +141,7 @@ class PermissionService:
         return CompanyPermissionRepository(
             company_id,
             self.context.db_session,
+            lookups=self.context.lookups,
         ).delete_permission(permission_id)
 
     def get_global_role_permissions(
@@ -145,7 +150,7 @@ class PermissionService:
     ) -> list[PermissionReadModel]:
         self._ensure_superuser()
         return RolePermissionRepository(
-            self.context.db_session
+            self.context.db_session, lookups=self.context.lookups
         ).get_global_role_permissions(role_id)
 
     def assign_global_permission(
@@ -155,7 +160,7 @@ class PermissionService:
     ) -> RoleReadModel:
         self._ensure_superuser()
         return RolePermissionRepository(
-            self.context.db_session
+            self.context.db_session, lookups=self.context.lookups
         ).assign_global_permission(role_id, permission_id)
 
     def remove_global_permission(
@@ -165,7 +170,7 @@ class PermissionService:
     ) -> RoleReadModel:
         self._ensure_superuser()
         return RolePermissionRepository(
-            self.context.db_session
+            self.context.db_session, lookups=self.context.lookups
         ).remove_global_permission(role_id, permission_id)
 
     def get_company_role_permissions(
@@ -178,7 +183,7 @@ class PermissionService:
             SystemPermission.COMPANY_PERMISSIONS_READ,
         )
         return RolePermissionRepository(
-            self.context.db_session
+            self.context.db_session, lookups=self.context.lookups
         ).get_company_role_permissions(company_id, role_id)
 
     def assign_company_permission(
@@ -192,7 +197,7 @@ class PermissionService:
             SystemPermission.COMPANY_PERMISSIONS_ASSIGN,
         )
         return RolePermissionRepository(
-            self.context.db_session
+            self.context.db_session, lookups=self.context.lookups
         ).assign_company_permission(company_id, role_id, permission_id)
 
     def remove_company_permission(
@@ -206,7 +211,7 @@ class PermissionService:
             SystemPermission.COMPANY_PERMISSIONS_UNASSIGN,
         )
         return RolePermissionRepository(
-            self.context.db_session
+            self.context.db_session, lookups=self.context.lookups
         ).remove_company_permission(company_id, role_id, permission_id)
 
     def get_platform_roles(self, user_id: UUID) -> list[RoleReadModel]:
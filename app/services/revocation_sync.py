@@ -0,0 +1,62 @@
+"""Keep each worker's revocation list in step with the ``auth_revocation`` table."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import anyio
+from sqlalchemy.orm import Session
+
+from app.repository.auth_revocation import AuthRevocationRepository
+from app.repository.database.session_manager import session_local
+from app.utils.logging import logger
+from app.utils.revocation_list import REVOCATION_LIST, RevocationList
+
+# Incremental syncs re-read this much history so rows committed slightly after
+# their ``_created_at`` timestamp are not missed. Re-reading is idempotent.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+
+class RevocationListSynchronizer:
+    def __init__(
+        self,
+        revocation_list: RevocationList = REVOCATION_LIST,
+        session_factory: Callable[[], Session] = session_local,
+    ):
+        self.revocation_list = revocation_list
+        self.session_factory = session_factory
+        self._cursor: datetime | None = None
+
+    def sync_once(self) -> None:
+        """
+        Pull revocations into the list: a full Bloom rebuild on the first run
+        and whenever the list asks for one, otherwise only recent rows.
+        Expired rows are deleted before each rebuild.
+        """
+        started = datetime.now(timezone.utc)
+        session = self.session_factory()
+        try:
+            repository = AuthRevocationRepository(session)
+            if self._cursor is None or self.revocation_list.needs_rebuild:
+                repository.purge_expired()
+                self.revocation_list.rebuild(repository.live_pairs())
+            else:
+                self.revocation_list.merge(
+                    repository.live_pairs(since=self._cursor - SYNC_OVERLAP)
+                )
+            self._cursor = started
+        finally:
+            session.close()
+
+    async def run(self) -> None:
+        """Sync forever on a worker thread; failures leave the list to go stale."""
+        while True:
+            try:
+                await anyio.to_thread.run_sync(self.sync_once)
+            except Exception:
+                logger.exception("Failed to sync the access-token revocation list")
+            await anyio.sleep(self.revocation_list.sync_seconds)
+
+
+__all__ = ["RevocationListSynchronizer", "SYNC_OVERLAP"]
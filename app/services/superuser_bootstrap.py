@@ -8,11 +8,15 @@ from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 
 from app.models.user.account_status import UserAccountStatus
+from app.repository.auth_revocation import AuthRevocationRepository
+from app.repository.cache_generation import CacheGenerationRepository, CacheScope
 from app.repository.database.tables import (
     PrivilegedAccessEvent,
     SuperuserBootstrapControl,
     User,
 )
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE
+from app.utils.revocation_list import REVOCATION_LIST
 
 
 class SuperuserBootstrapError(RuntimeError):
@@ -139,13 +143,11 @@ class SuperuserBootstrapService:
                     "A superuser already exists, so initial bootstrap is disabled."
                 )
 
-            metadata = dict(target.primary_meta_data or {})
-            try:
-                refresh_token_version = int(metadata.get("refresh_token_version", 0))
-            except (TypeError, ValueError):
-                refresh_token_version = 0
-            metadata["refresh_token_version"] = refresh_token_version + 1
-            target.primary_meta_data = metadata
+            previous_version = target.refresh_token_version
+            AuthRevocationRepository(self.db_session).record(
+                target.id, previous_version, reason="superuser_bootstrap"
+            )
+            target.refresh_token_version = User.refresh_token_version + 1
             target.is_superuser = True
 
             completed_at = datetime.now(timezone.utc)
@@ -166,7 +168,12 @@ class SuperuserBootstrapService:
                     secondary_meta_data={},
                 )
             )
+            CacheGenerationRepository(self.db_session).bump(
+                CacheScope.USERS, key=target.id
+            )
             self.db_session.commit()
+            AUTH_PRINCIPAL_CACHE.invalidate(target.id)
+            REVOCATION_LIST.add(target.id, previous_version)
             return SuperuserBootstrapResult(user_id=target.id, changed=True)
         except Exception:
             self.db_session.rollback()
@@ -16,6 +16,7 @@ class AppError(HTTPException):
         error: Optional[str] = None,
         log_error: bool = True,
         depth: int = 3,
+        headers: Optional[dict[str, str]] = None,
     ):
         # Capture the caller's details
         caller_details = self.get_caller_details(depth)
@@ -31,7 +32,7 @@ class AppError(HTTPException):
             )
             # self.log_exception()
 
-        super().__init__(status_code, detail=details)
+        super().__init__(status_code, detail=details, headers=headers)
 
     @staticmethod
     def get_caller_details(depth):
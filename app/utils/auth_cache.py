@@ -0,0 +1,224 @@
+"""Bounded in-process cache of the principals resolved by JWT authentication."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+from uuid import UUID
+
+from prometheus_client import Counter
+
+from app.configs import settings
+from app.models.user.user import UserReadModel
+
+AUTH_CACHE_HITS = Counter(
+    "userverse_auth_principal_cache_hits_total",
+    "JWT authentications served from the in-process principal cache.",
+)
+AUTH_CACHE_MISSES = Counter(
+    "userverse_auth_principal_cache_misses_total",
+    "JWT authentications that had to load the principal from the database.",
+)
+TOKEN_CACHE_HITS = Counter(
+    "userverse_jwt_verified_token_cache_hits_total",
+    "Access tokens whose verified payload was served from the in-process cache.",
+)
+TOKEN_CACHE_MISSES = Counter(
+    "userverse_jwt_verified_token_cache_misses_total",
+    "Access tokens that had to be signature-verified and parsed.",
+)
+
+
+@dataclass(frozen=True)
+class AuthPrincipal:
+    user: UserReadModel
+    refresh_token_version: int
+
+    @property
+    def status(self) -> str | None:
+        return self.user.status
+
+
+class AuthPrincipalCache:
+    """
+    TTL/LRU cache of ``user_id -> AuthPrincipal``.
+
+    Writes through ``UserRepository`` invalidate entries explicitly. Other
+    workers learn of them through ``CacheInvalidationBus``; the TTL bounds
+    staleness if the bus falls behind.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[UUID, tuple[float, AuthPrincipal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.AUTH_CACHE_MAX_ENTRIES
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return settings.AUTH_CACHE_TTL_SECONDS
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, user_id: UUID, *, refresh_token_version: int) -> AuthPrincipal | None:
+        """
+        Return the cached principal when it is fresh and matches the token's
+        refresh-token version; otherwise record a miss and return None.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                principal = entry[1]
+                if principal.refresh_token_version == refresh_token_version:
+                    self._entries.move_to_end(user_id)
+                    AUTH_CACHE_HITS.inc()
+                    return principal
+            if entry is not None:
+                self._entries.pop(user_id, None)
+        AUTH_CACHE_MISSES.inc()
+        return None
+
+    def set(self, principal: AuthPrincipal) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[principal.user.id] = (expires_at, principal)
+            self._entries.move_to_end(principal.user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def discard_where(self, predicate: Callable[[UUID], bool]) -> None:
+        with self._lock:
+            for user_id in [user_id for user_id in self._entries if predicate(user_id)]:
+                del self._entries[user_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class VerifiedTokenCache:
+    """
+    TTL/LRU cache of verified JWT payloads keyed by a digest of the raw token.
+
+    Entries live until the earlier of the token's ``exp`` and the configured
+    TTL. Only tokens that passed signature verification are stored, and the
+    cache empties itself when it is used with a different keyring, so a key
+    rotation never serves payloads verified under retired keys.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._keyring: object | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.JWT_DECODE_CACHE_MAX_ENTRIES
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return settings.JWT_DECODE_CACHE_TTL_SECONDS
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def _bind(self, keyring: object) -> None:
+        if keyring is not self._keyring:
+            self._entries.clear()
+            self._keyring = keyring
+
+    def get(self, token: str, *, keyring: object) -> dict[str, Any] | None:
+        digest = self._digest(token)
+        now = time.monotonic()
+        with self._lock:
+            self._bind(keyring)
+            entry = self._entries.get(digest)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(digest)
+                TOKEN_CACHE_HITS.inc()
+                return entry[1]
+            if entry is not None:
+                self._entries.pop(digest, None)
+        TOKEN_CACHE_MISSES.inc()
+        return None
+
+    def set(self, token: str, payload: dict[str, Any], *, keyring: object) -> None:
+        if not self.enabled:
+            return
+        lifetime = self.ttl_seconds
+        if "exp" in payload:
+            lifetime = min(lifetime, float(payload["exp"]) - time.time())
+        if lifetime <= 0:
+            return
+        expires_at = time.monotonic() + lifetime
+        digest = self._digest(token)
+        with self._lock:
+            self._bind(keyring)
+            self._entries[digest] = (expires_at, payload)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+AUTH_PRINCIPAL_CACHE = AuthPrincipalCache()
+VERIFIED_TOKEN_CACHE = VerifiedTokenCache()
+
+__all__ = [
+    "AuthPrincipal",
+    "AuthPrincipalCache",
+    "AUTH_PRINCIPAL_CACHE",
+    "VerifiedTokenCache",
+    "VERIFIED_TOKEN_CACHE",
+]
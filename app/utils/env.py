@@ -28,6 +28,36 @@ SETTINGS_ENV_KEYS = (
     "TESTING",
     "REQUIRE_EMAIL_VERIFICATION",
     "ENFORCE_EMAIL_VERIFICATION",
+    "DEBUG_QUERY_COUNT",
+    "CACHE_INVALIDATION_POLL_SECONDS",
+    "CACHE_INVALIDATION_LISTEN",
+    "AUTH_THREAD_LIMIT",
+    "AUTH_CACHE_TTL_SECONDS",
+    "AUTH_CACHE_MAX_ENTRIES",
+    "COMPANY_PERMISSION_CACHE_TTL_SECONDS",
+    "COMPANY_PERMISSION_CACHE_MAX_ENTRIES",
+    "PASSWORD_HASH_ROUNDS",
+    "PASSWORD_HASH_WORKERS",
+    "PASSWORD_HASH_MAX_QUEUE",
+    "PURGE_EXPIRED_INTERVAL_SECONDS",
+    "ROUTE_RATE_LIMITS_ENABLED",
+    "RATE_LIMIT_BACKEND",
+    "RATE_LIMIT_ALGORITHM",
+    "RATE_LIMIT_MAX_KEYS",
+    "RATE_LIMIT_SWEEP_SECONDS",
+    "RATE_LIMIT_SHARED_MEMORY_PATH",
+    "RATE_LIMIT_SHARED_MEMORY_SLOTS",
+    "RATE_LIMIT_SHARED_MEMORY_CAPACITY",
+    "AUTH_STATELESS_VERIFICATION",
+    "AUTH_REVOCATION_SYNC_SECONDS",
+    "AUTH_REVOCATION_REBUILD_SECONDS",
+    "JWT_DECODE_CACHE_TTL_SECONDS",
+    "JWT_DECODE_CACHE_MAX_ENTRIES",
+    "INTROSPECTION_API_KEYS",
+    "INTROSPECTION_MAX_BATCH",
+    "AUTHZ_CHECK_MAX_BATCH",
+    "ROLE_ASSIGNMENT_BATCH_SIZE",
+    "PAGINATION_ESTIMATE_MIN_ROWS",
     "CORS_ALLOWED",
     "CORS_BLOCKED",
     "COR_ORIGINS__ALLOWED",
@@ -36,10 +66,19 @@ SETTINGS_ENV_KEYS = (
     "JWT_ALGORITHM",
     "JWT_TIMEOUT",
     "JWT_REFRESH_TIMEOUT",
+    "JWT_COMPACT_CLAIMS",
+    "JWT_PRIVATE_KEYS",
+    "JWT_PUBLIC_KEYS",
+    "JWT_ACTIVE_KEY_ID",
+    "JWKS_CACHE_MAX_AGE_SECONDS",
     "JWT__SECRET",
     "JWT__ALGORITHM",
     "JWT__TIMEOUT",
     "JWT__REFRESH_TIMEOUT",
+    "JWT__COMPACT_CLAIMS",
+    "JWT__PRIVATE_KEYS",
+    "JWT__PUBLIC_KEYS",
+    "JWT__ACTIVE_KEY_ID",
     "EMAIL_HOST",
     "EMAIL_PORT",
     "EMAIL_USERNAME",
@@ -1,5 +1,10 @@
+import time
+
 import bcrypt
 
+from app.configs import MAX_PASSWORD_HASH_ROUNDS, MIN_PASSWORD_HASH_ROUNDS, settings
+from app.utils.hashing_pool import PASSWORD_HASHING_POOL
+
 
 class UnknownHashError(Exception):
     """Raised when a stored password is not a recognized bcrypt hash."""
@@ -15,22 +20,64 @@ def hash_password(password: str) -> str:
     """Hash a plain password using bcrypt and return a UTF-8 string."""
     if not isinstance(password, str) or not password:
         raise ValueError("Password must be a non-empty string")
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
+    hashed = PASSWORD_HASHING_POOL.run(
+        "hash",
+        bcrypt.hashpw,
+        password.encode("utf-8"),
+        bcrypt.gensalt(rounds=settings.PASSWORD_HASH_ROUNDS),
+    )
     return hashed.decode("utf-8")
 
 
+def needs_rehash(hashed: str) -> bool:
+    """True when a bcrypt hash was made with a cost other than the configured one."""
+    try:
+        rounds = int(hashed.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return True
+    return rounds != settings.PASSWORD_HASH_ROUNDS
+
+
+def calibrate_rounds(
+    target_ms: float,
+    *,
+    min_rounds: int = MIN_PASSWORD_HASH_ROUNDS,
+    max_rounds: int = MAX_PASSWORD_HASH_ROUNDS,
+) -> list[tuple[int, float]]:
+    """
+    Time one hash per cost, cheapest first, on this machine.
+    Stops after the first cost slower than ``target_ms`` and returns every
+    ``(rounds, milliseconds)`` measured.
+    """
+    password, timings = b"calibration-password", []
+    for rounds in range(min_rounds, max_rounds + 1):
+        salt = bcrypt.gensalt(rounds=rounds)
+        started = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        timings.append((rounds, elapsed_ms))
+        if elapsed_ms > target_ms:
+            break
+    return timings
+
+
 def verify_password(password: str, hashed: str) -> bool:
     """
     Verify a plain password against a bcrypt hash.
     Returns True if it matches, False otherwise.
 
-    Raises UnknownHashError if the stored value doesn't look like a bcrypt hash.
+    Raises UnknownHashError if the stored value doesn't look like a bcrypt hash,
+    and PasswordHashingBusy if the hashing pool is saturated.
     """
     if not _is_bcrypt_hash(hashed):
         raise UnknownHashError("hash could not be identified")
     try:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+        return PASSWORD_HASHING_POOL.run(
+            "verify",
+            bcrypt.checkpw,
+            password.encode("utf-8"),
+            hashed.encode("utf-8"),
+        )
     except ValueError:
         # Malformed hash string
         raise UnknownHashError("hash could not be identified")
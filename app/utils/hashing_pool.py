@@ -0,0 +1,121 @@
+"""Bounded threads that run bcrypt off the default request threadpool."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+import anyio
+from fastapi import status
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.configs import settings
+from app.models.security_messages import SecurityResponseMessages
+from app.utils.app_error import AppError
+
+T = TypeVar("T")
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "userverse_password_hash_seconds",
+    "Time spent in bcrypt per operation, excluding time waiting for a worker.",
+    ["operation"],
+)
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "userverse_password_hash_queue_depth",
+    "Hashing handlers admitted to the pool and not yet finished.",
+)
+PASSWORD_HASH_REJECTIONS = Counter(
+    "userverse_password_hash_rejections_total",
+    "Hashing handlers rejected because the pool was saturated.",
+)
+
+
+class PasswordHashingBusy(AppError):
+    """Raised when the hashing pool has no free worker or queue slot."""
+
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            message=SecurityResponseMessages.PASSWORD_HASHING_BUSY.value,
+            error="password_hashing_saturated",
+            log_error=False,
+            headers={"Retry-After": "1"},
+        )
+
+
+class PasswordHashingPool:
+    """
+    Size-limited threads for request handlers that run bcrypt.
+
+    Handlers that hash enter through ``offload``, which runs them on one of
+    ``max_workers`` threads held by a dedicated limiter rather than on the
+    default threadpool. Up to ``max_queue`` more wait for a thread in the
+    event loop without holding any thread, so a burst of logins never
+    starves unrelated sync endpoints. Beyond that, callers are rejected
+    immediately with ``PasswordHashingBusy``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        max_queue: int | None = None,
+    ):
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._limiter: anyio.CapacityLimiter | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(
+        self,
+    ) -> tuple[anyio.CapacityLimiter, threading.BoundedSemaphore]:
+        with self._lock:
+            if self._limiter is None:
+                workers = self._max_workers or settings.PASSWORD_HASH_WORKERS
+                queue = (
+                    self._max_queue
+                    if self._max_queue is not None
+                    else settings.PASSWORD_HASH_MAX_QUEUE
+                )
+                self._limiter = anyio.CapacityLimiter(workers)
+                self._slots = threading.BoundedSemaphore(workers + queue)
+            return self._limiter, self._slots
+
+    def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """Run one bcrypt operation ``func(*args)`` and record its latency."""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            PASSWORD_HASH_SECONDS.labels(operation=operation).observe(
+                time.perf_counter() - started
+            )
+
+    async def offload(self, func: Callable[..., T], *args: Any) -> T:
+        """Run the sync handler ``func(*args)`` on a hashing thread."""
+        limiter, slots = self._ensure_started()
+        if not slots.acquire(blocking=False):
+            PASSWORD_HASH_REJECTIONS.inc()
+            raise PasswordHashingBusy()
+        PASSWORD_HASH_QUEUE_DEPTH.inc()
+        try:
+            return await anyio.to_thread.run_sync(func, *args, limiter=limiter)
+        finally:
+            PASSWORD_HASH_QUEUE_DEPTH.dec()
+            slots.release()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._limiter = None
+            self._slots = None
+
+
+PASSWORD_HASHING_POOL = PasswordHashingPool()
+
+__all__ = [
+    "PASSWORD_HASHING_POOL",
+    "PasswordHashingBusy",
+    "PasswordHashingPool",
+]
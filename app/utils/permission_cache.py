@@ -0,0 +1,139 @@
+"""Bounded in-process cache of compiled company permission sets."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterable
+from uuid import UUID
+
+from prometheus_client import Counter
+
+from app.configs import settings
+
+PERMISSION_CACHE_HITS = Counter(
+    "userverse_company_permission_cache_hits_total",
+    "Company authorization checks served from the in-process permission cache.",
+)
+PERMISSION_CACHE_MISSES = Counter(
+    "userverse_company_permission_cache_misses_total",
+    "Company authorization checks that had to load permissions from the database.",
+)
+
+MembershipKey = tuple[UUID, UUID]
+
+
+class CompanyPermissionCache:
+    """
+    TTL/LRU cache of ``(user_id, company_id) -> SystemPermission`` bitmask.
+
+    Membership, company role, and role permission writes invalidate entries
+    explicitly. Every invalidation bumps ``generation``; a mask loaded before
+    an invalidation is discarded by ``set`` rather than cached, so a slow
+    reader can never re-cache permissions that a concurrent write revoked.
+    Other workers learn of writes through ``CacheInvalidationBus``; the TTL
+    bounds staleness if the bus falls behind.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[MembershipKey, tuple[float, int]] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return settings.COMPANY_PERMISSION_CACHE_MAX_ENTRIES
+
+    @property
+    def ttl_seconds(self) -> float:
+        if self._ttl_seconds is not None:
+            return self._ttl_seconds
+        return settings.COMPANY_PERMISSION_CACHE_TTL_SECONDS
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, user_id: UUID, company_id: UUID) -> int | None:
+        key = (user_id, company_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                PERMISSION_CACHE_HITS.inc()
+                return entry[1]
+            if entry is not None:
+                self._entries.pop(key, None)
+        PERMISSION_CACHE_MISSES.inc()
+        return None
+
+    def set(
+        self, user_id: UUID, company_id: UUID, mask: int, *, generation: int
+    ) -> None:
+        """Cache ``mask`` unless an invalidation happened since ``generation``."""
+        if not self.enabled:
+            return
+        key = (user_id, company_id)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (expires_at, mask)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: UUID, company_id: UUID) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.pop((user_id, company_id), None)
+
+    def invalidate_company(self, company_id: UUID) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[1] == company_id]:
+                del self._entries[key]
+
+    def invalidate_companies(self, company_ids: Iterable[UUID]) -> None:
+        company_ids = set(company_ids)
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if key[1] in company_ids]:
+                del self._entries[key]
+
+    def discard_where(self, predicate: Callable[[UUID], bool]) -> None:
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if predicate(key[1])]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+COMPANY_PERMISSION_CACHE = CompanyPermissionCache()
+
+__all__ = [
+    "COMPANY_PERMISSION_CACHE",
+    "CompanyPermissionCache",
+]
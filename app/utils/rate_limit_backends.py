@@ -0,0 +1,244 @@
+"""Storage backends shared by the sliding-window rate limiters."""
+
+from __future__ import annotations
+
+import abc
+import contextlib
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterator, Sequence
+
+from app.configs import settings
+
+
+class RateLimitBackend(abc.ABC):
+    """
+    Sliding-window hit log keyed by ``(namespace, key)``.
+
+    ``hit`` drops hits older than ``window_seconds``, then either records a
+    hit at ``now`` and returns None, or, when ``limit`` hits are already in
+    the window, records nothing and returns the seconds until the oldest one
+    leaves it. Every backend must implement exactly these semantics.
+    """
+
+    @abc.abstractmethod
+    def hit(
+        self,
+        namespace: str,
+        key: str,
+        *,
+        limit: int,
+        window_seconds: float,
+        now: float,
+    ) -> float | None:
+        """Record a hit, or return the retry-after seconds if over the limit."""
+
+    @abc.abstractmethod
+    def reset(self, namespace: str) -> None:
+        """Forget every hit recorded under ``namespace``."""
+
+
+def sliding_window_retry_after(
+    live: Sequence[float], limit: int, window_seconds: float, now: float
+) -> float | None:
+    """Seconds until the oldest live hit expires, or None if under ``limit``."""
+    if len(live) >= limit:
+        return max(0.0, live[0] + window_seconds - now)
+    return None
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process hit log; each worker enforces its own limits."""
+
+    def __init__(self) -> None:
+        self._events: Dict[str, Dict[str, Deque[float]]] = defaultdict(
+            lambda: defaultdict(deque)
+        )
+        self._lock = threading.RLock()
+
+    def _prune(
+        self, namespace: str, key: str, *, window_seconds: float, now: float
+    ) -> None:
+        events = self._events[namespace]
+        dq = events[key]
+        while dq and now - dq[0] > window_seconds:
+            dq.popleft()
+        if not dq:
+            # Keep the dict tidy to avoid unbounded growth
+            events.pop(key, None)
+
+    def hit(self, namespace, key, *, limit, window_seconds, now):
+        with self._lock:
+            self._prune(namespace, key, window_seconds=window_seconds, now=now)
+            dq = self._events[namespace][key]
+            retry_after = sliding_window_retry_after(dq, limit, window_seconds, now)
+            if retry_after is None:
+                dq.append(now)
+            return retry_after
+
+    def reset(self, namespace: str) -> None:
+        with self._lock:
+            self._events.pop(namespace, None)
+
+
+class SharedMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Hit log in a memory-mapped file shared by every worker on one host.
+
+    The file is a fixed open-addressing table. Each slot holds a key digest,
+    a namespace digest, the time the slot's newest hit leaves its window, and
+    up to ``capacity`` hit timestamps. Access is serialized with ``flock``.
+    When every probed slot is live, the slot that expires soonest is evicted,
+    so under extreme key pressure a key can lose its history.
+    """
+
+    MAGIC = b"UVRLSHM1"
+    HEADER = struct.Struct("=8sII")
+    SLOT_PREFIX = struct.Struct("=16s8sd")
+    MAX_PROBES = 16
+
+    def __init__(self, path: str, *, slots: int = 4096, capacity: int = 32):
+        self.path = path
+        self.slots = slots
+        self.capacity = capacity
+        self._timestamps = struct.Struct(f"={capacity}d")
+        self._slot_size = self.SLOT_PREFIX.size + self._timestamps.size
+        size = self.HEADER.size + slots * self._slot_size
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._file_lock():
+            if os.fstat(self._fd).st_size != size:
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+            self._map = mmap.mmap(self._fd, size)
+            if self.HEADER.unpack_from(self._map, 0) != (
+                self.MAGIC,
+                slots,
+                capacity,
+            ):
+                self._map[:] = bytes(size)
+                self.HEADER.pack_into(self._map, 0, self.MAGIC, slots, capacity)
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _digest(value: str, size: int) -> bytes:
+        return hashlib.blake2b(value.encode("utf-8"), digest_size=size).digest()
+
+    def _offset(self, slot: int) -> int:
+        return self.HEADER.size + slot * self._slot_size
+
+    def _read(self, slot: int) -> tuple[bytes, bytes, float]:
+        return self.SLOT_PREFIX.unpack_from(self._map, self._offset(slot))
+
+    def _find_slot(self, key_digest: bytes, now: float) -> tuple[int, bool]:
+        """Return ``(slot, existing)`` for ``key_digest``, claiming one if new."""
+        start = int.from_bytes(key_digest[:8], "big") % self.slots
+        free, soonest = None, None
+        for probe in range(min(self.MAX_PROBES, self.slots)):
+            slot = (start + probe) % self.slots
+            digest, _, expires_at = self._read(slot)
+            if digest == key_digest:
+                return slot, True
+            if free is None and expires_at <= now:
+                free = slot
+            if soonest is None or expires_at < self._read(soonest)[2]:
+                soonest = slot
+        return (soonest if free is None else free), False
+
+    def hit(self, namespace, key, *, limit, window_seconds, now):
+        if limit > self.capacity:
+            raise ValueError(
+                f"limit {limit} exceeds the shared-memory capacity {self.capacity}"
+            )
+        key_digest = self._digest(f"{namespace}\x00{key}", 16)
+        with self._lock, self._file_lock():
+            slot, existing = self._find_slot(key_digest, now)
+            offset = self._offset(slot)
+            stamps = (
+                self._timestamps.unpack_from(self._map, offset + self.SLOT_PREFIX.size)
+                if existing
+                else ()
+            )
+            live = sorted(t for t in stamps if t and now - t <= window_seconds)
+            retry_after = sliding_window_retry_after(live, limit, window_seconds, now)
+            if retry_after is None:
+                live.append(now)
+            self.SLOT_PREFIX.pack_into(
+                self._map,
+                offset,
+                key_digest,
+                self._digest(namespace, 8),
+                (live[-1] + window_seconds) if live else 0.0,
+            )
+            self._timestamps.pack_into(
+                self._map,
+                offset + self.SLOT_PREFIX.size,
+                *live,
+                *([0.0] * (self.capacity - len(live))),
+            )
+            return retry_after
+
+    def reset(self, namespace: str) -> None:
+        namespace_digest = self._digest(namespace, 8)
+        with self._lock, self._file_lock():
+            for slot in range(self.slots):
+                if self._read(slot)[1] == namespace_digest:
+                    offset = self._offset(slot)
+                    self._map[offset : offset + self._slot_size] = bytes(
+                        self._slot_size
+                    )
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+
+_BACKENDS: dict[str, RateLimitBackend] = {}
+_BACKENDS_LOCK = threading.Lock()
+
+
+def get_rate_limit_backend(name: str | None = None) -> RateLimitBackend:
+    """Return the process-wide backend named by ``RATE_LIMIT_BACKEND``."""
+    name = name or settings.RATE_LIMIT_BACKEND
+    with _BACKENDS_LOCK:
+        backend = _BACKENDS.get(name)
+        if backend is None:
+            if name == "memory":
+                backend = MemoryRateLimitBackend()
+            elif name == "shared_memory":
+                backend = SharedMemoryRateLimitBackend(
+                    settings.RATE_LIMIT_SHARED_MEMORY_PATH
+                    or os.path.join(tempfile.gettempdir(), "userverse-rate-limits"),
+                    slots=settings.RATE_LIMIT_SHARED_MEMORY_SLOTS,
+                    capacity=settings.RATE_LIMIT_SHARED_MEMORY_CAPACITY,
+                )
+            elif name == "sql":
+                from app.repository.rate_limit import SQLRateLimitBackend
+
+                backend = SQLRateLimitBackend()
+            else:
+                raise ValueError(f"Unknown rate limit backend: {name}")
+            _BACKENDS[name] = backend
+        return backend
+
+
+__all__ = [
+    "MemoryRateLimitBackend",
+    "RateLimitBackend",
+    "SharedMemoryRateLimitBackend",
+    "get_rate_limit_backend",
+    "sliding_window_retry_after",
+]
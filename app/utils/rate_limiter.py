@@ -1,12 +1,18 @@
-"""Simple in-memory sliding window rate limiter utilities."""
+"""Sliding window and GCRA rate limiter utilities."""
 
 from __future__ import annotations
 
 import threading
 import time
-from collections import defaultdict, deque
+import weakref
 from dataclasses import dataclass
-from typing import Deque, Dict
+from typing import Protocol
+
+import anyio
+
+from app.configs import settings
+from app.utils.logging import logger
+from app.utils.rate_limit_backends import RateLimitBackend, get_rate_limit_backend
 
 
 class RateLimitExceeded(Exception):
@@ -24,35 +30,145 @@ class _WindowConfig:
 
 
 class SlidingWindowRateLimiter:
-    """Track request counts within a sliding time window."""
+    """
+    Track request counts within a sliding time window.
+
+    Hits are stored in ``backend``, or in the process-wide backend selected
+    by ``RATE_LIMIT_BACKEND`` when none is given. ``namespace`` keeps limiters
+    that share a backend apart.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int,
+        window_seconds: int,
+        namespace: str = "default",
+        backend: RateLimitBackend | None = None,
+    ):
+        self._config = _WindowConfig(limit=limit, window_seconds=window_seconds)
+        self.namespace = namespace
+        self._backend = backend
+
+    @property
+    def backend(self) -> RateLimitBackend:
+        return self._backend or get_rate_limit_backend()
+
+    def hit(self, key: str) -> None:
+        retry_after = self.backend.hit(
+            self.namespace,
+            key,
+            limit=self._config.limit,
+            window_seconds=self._config.window_seconds,
+            now=time.time(),
+        )
+        if retry_after is not None:
+            raise RateLimitExceeded(retry_after=retry_after)
 
-    def __init__(self, *, limit: int, window_seconds: int):
+    def reset(self) -> None:
+        self.backend.reset(self.namespace)
+
+
+class GCRARateLimiter:
+    """
+    Generic cell rate algorithm limiter with constant state per key.
+
+    Allows a burst of ``limit`` hits, then one hit every
+    ``window_seconds / limit``. Each key stores a single theoretical arrival
+    time in one of ``stripes`` independently locked shards. A key whose
+    arrival time has passed is idle and is removed by ``sweep``. Each shard
+    holds at most ``max_keys / stripes`` keys; past that the least recently
+    hit key is evicted, which can only make that key's limit more lenient.
+    State is per process, whatever ``RATE_LIMIT_BACKEND`` says.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int,
+        window_seconds: int,
+        stripes: int = 64,
+        max_keys: int | None = None,
+    ):
         self._config = _WindowConfig(limit=limit, window_seconds=window_seconds)
-        self._events: Dict[str, Deque[float]] = defaultdict(deque)
-        self._lock = threading.RLock()
-
-    def _prune(self, key: str, now: float) -> None:
-        window = self._config.window_seconds
-        dq = self._events[key]
-        while dq and now - dq[0] > window:
-            dq.popleft()
-        if not dq:
-            # Keep the dict tidy to avoid unbounded growth
-            self._events.pop(key, None)
+        self._interval = window_seconds / limit
+        self._stripes: list[tuple[threading.Lock, dict[str, float]]] = [
+            (threading.Lock(), {}) for _ in range(stripes)
+        ]
+        max_keys = settings.RATE_LIMIT_MAX_KEYS if max_keys is None else max_keys
+        self._stripe_capacity = max(1, max_keys // stripes)
+        _GCRA_LIMITERS.add(self)
+
+    def __len__(self) -> int:
+        return sum(len(arrivals) for _, arrivals in self._stripes)
 
     def hit(self, key: str) -> None:
-        now = time.time()
-        with self._lock:
-            self._prune(key, now)
-            dq = self._events[key]
-            if len(dq) >= self._config.limit:
-                retry_after = max(0.0, dq[0] + self._config.window_seconds - now)
-                raise RateLimitExceeded(retry_after=retry_after)
-            dq.append(now)
+        now = time.monotonic()
+        lock, arrivals = self._stripes[hash(key) % len(self._stripes)]
+        with lock:
+            # Re-inserting keeps each shard ordered from least to most recent.
+            arrival = max(arrivals.pop(key, now), now)
+            next_arrival = arrival + self._interval
+            if next_arrival - now > self._config.window_seconds:
+                arrivals[key] = arrival
+                raise RateLimitExceeded(
+                    retry_after=next_arrival - self._config.window_seconds - now
+                )
+            arrivals[key] = next_arrival
+            if len(arrivals) > self._stripe_capacity:
+                del arrivals[next(iter(arrivals))]
+
+    def sweep(self) -> int:
+        """Drop keys that have no hits left to forget; returns how many."""
+        now = time.monotonic()
+        removed = 0
+        for lock, arrivals in self._stripes:
+            with lock:
+                idle = [key for key, arrival in arrivals.items() if arrival <= now]
+                for key in idle:
+                    del arrivals[key]
+            removed += len(idle)
+        return removed
 
     def reset(self) -> None:
-        with self._lock:
-            self._events.clear()
+        for lock, arrivals in self._stripes:
+            with lock:
+                arrivals.clear()
+
+
+_GCRA_LIMITERS: weakref.WeakSet[GCRARateLimiter] = weakref.WeakSet()
+
+
+def sweep_idle_rate_limit_keys() -> int:
+    """Sweep every live GCRA limiter; returns the number of keys removed."""
+    return sum(limiter.sweep() for limiter in list(_GCRA_LIMITERS))
+
+
+async def run_rate_limit_sweeper() -> None:
+    """Sweep idle GCRA keys every ``RATE_LIMIT_SWEEP_SECONDS`` on a worker thread."""
+    while True:
+        await anyio.sleep(settings.RATE_LIMIT_SWEEP_SECONDS)
+        try:
+            await anyio.to_thread.run_sync(sweep_idle_rate_limit_keys)
+        except Exception:
+            logger.exception("Failed to sweep idle rate-limit keys")
+
+
+class RateLimiter(Protocol):
+    def hit(self, key: str) -> None: ...
+
+    def reset(self) -> None: ...
+
+
+def build_rate_limiter(
+    *, limit: int, window_seconds: int, namespace: str
+) -> RateLimiter:
+    """Create the limiter selected by ``RATE_LIMIT_ALGORITHM``."""
+    if settings.RATE_LIMIT_ALGORITHM == "gcra":
+        return GCRARateLimiter(limit=limit, window_seconds=window_seconds)
+    return SlidingWindowRateLimiter(
+        limit=limit, window_seconds=window_seconds, namespace=namespace
+    )
 
 
 class PasswordResetRateLimiter:
@@ -60,9 +176,15 @@ class PasswordResetRateLimiter:
 
     def __init__(self) -> None:
         # Tune these defaults as needed; they are intentionally conservative.
-        self._per_email = SlidingWindowRateLimiter(limit=5, window_seconds=3600)
-        self._per_ip = SlidingWindowRateLimiter(limit=20, window_seconds=3600)
-        self._per_pair = SlidingWindowRateLimiter(limit=5, window_seconds=3600)
+        self._per_email = build_rate_limiter(
+            limit=5, window_seconds=3600, namespace="password_reset"
+        )
+        self._per_ip = build_rate_limiter(
+            limit=20, window_seconds=3600, namespace="password_reset"
+        )
+        self._per_pair = build_rate_limiter(
+            limit=5, window_seconds=3600, namespace="password_reset"
+        )
 
     def check(self, *, email: str, ip_address: str | None) -> None:
         key_email = f"email:{email.lower()}"
@@ -83,9 +205,15 @@ class VerificationEmailRateLimiter:
     """Composite limiter that enforces multiple verification resend limits."""
 
     def __init__(self) -> None:
-        self._per_email = SlidingWindowRateLimiter(limit=5, window_seconds=3600)
-        self._per_ip = SlidingWindowRateLimiter(limit=20, window_seconds=3600)
-        self._per_pair = SlidingWindowRateLimiter(limit=5, window_seconds=3600)
+        self._per_email = build_rate_limiter(
+            limit=5, window_seconds=3600, namespace="verification_email"
+        )
+        self._per_ip = build_rate_limiter(
+            limit=20, window_seconds=3600, namespace="verification_email"
+        )
+        self._per_pair = build_rate_limiter(
+            limit=5, window_seconds=3600, namespace="verification_email"
+        )
 
     def check(self, *, email: str, ip_address: str | None) -> None:
         key_email = f"email:{email.lower()}"
@@ -106,8 +234,13 @@ PASSWORD_RESET_RATE_LIMITER = PasswordResetRateLimiter()
 VERIFICATION_EMAIL_RATE_LIMITER = VerificationEmailRateLimiter()
 
 __all__ = [
+    "GCRARateLimiter",
     "RateLimitExceeded",
+    "RateLimiter",
     "SlidingWindowRateLimiter",
+    "build_rate_limiter",
+    "run_rate_limit_sweeper",
+    "sweep_idle_rate_limit_keys",
     "PasswordResetRateLimiter",
     "VerificationEmailRateLimiter",
     "PASSWORD_RESET_RATE_LIMITER",
@@ -0,0 +1,56 @@
+"""Request-scoped memoization of authorization and permission lookups."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, TypeVar
+
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class RequestLookupCache:
+    """
+    Memoizes company, role, and permission lookups for one request.
+
+    One instance lives on each ``SharedContext``. Entries are valid only in
+    the database transaction that loaded them: after the session commits or
+    rolls back, the next lookup starts from an empty cache, so a request that
+    writes and then reads back sees its own change. Errors raised by a loader
+    are not cached.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+        self._transaction: Any = None
+        self._entries: dict[Hashable, Any] = {}
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        if self._session.get_transaction() is not self._transaction:
+            self._entries.clear()
+        if key in self._entries:
+            return self._entries[key]
+        value = loader()
+        transaction = self._session.get_transaction()
+        if transaction is not self._transaction:
+            self._entries.clear()
+            self._transaction = transaction
+        self._entries[key] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def memoized(
+    lookups: RequestLookupCache | None,
+    key: Hashable,
+    loader: Callable[[], T],
+) -> T:
+    """Run ``loader`` through ``lookups`` when a request cache is available."""
+    if lookups is None:
+        return loader()
+    return lookups.get_or_load(key, loader)
+
+
+__all__ = ["RequestLookupCache", "memoized"]
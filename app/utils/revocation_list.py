@@ -0,0 +1,196 @@
+"""Per-worker view of revoked access tokens for stateless JWT verification."""
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import math
+import threading
+import time
+from typing import Iterable
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+
+from app.configs import settings
+
+RevokedPair = tuple[UUID, int]
+
+REVOCATION_LOOKUPS = Counter(
+    "userverse_auth_revocation_lookups_total",
+    "Stateless access-token checks against the revocation list, by outcome.",
+    ["outcome"],
+)
+REVOCATION_ENTRIES = Gauge(
+    "userverse_auth_revocation_entries",
+    "Revocations held by this worker's revocation list.",
+    ["store"],
+)
+
+
+class RevocationStatus(enum.Enum):
+    CLEAR = "clear"
+    REVOKED = "revoked"
+    UNKNOWN = "unknown"
+
+
+def _pair_key(user_id: UUID, refresh_token_version: int) -> bytes:
+    return user_id.bytes + refresh_token_version.to_bytes(8, "big", signed=True)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over byte strings.
+
+    Sized for ``capacity`` items at roughly ``error_rate`` false positives;
+    bit positions come from double hashing a single blake2b digest.
+    """
+
+    def __init__(self, capacity: int, *, error_rate: float = 0.01):
+        capacity = max(1, capacity)
+        bits = -capacity * math.log(error_rate) / (math.log(2) ** 2)
+        self.size = max(64, math.ceil(bits))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: bytes) -> Iterable[int]:
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: bytes) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class RevocationList:
+    """
+    Revoked ``(user_id, refresh_token_version)`` pairs known to this worker.
+
+    A full rebuild loads every live revocation into a Bloom filter; between
+    rebuilds, revocations are pulled incrementally into a small exact set.
+    Lookups answer REVOKED for exact matches, UNKNOWN for Bloom-only hits
+    (possibly false positives) and whenever the list has not synced recently,
+    and CLEAR otherwise. Callers must fall back to an authoritative check on
+    UNKNOWN.
+    """
+
+    def __init__(
+        self,
+        *,
+        sync_seconds: float | None = None,
+        rebuild_seconds: float | None = None,
+        max_recent: int = 4096,
+    ):
+        self._sync_seconds = sync_seconds
+        self._rebuild_seconds = rebuild_seconds
+        self.max_recent = max_recent
+        self._bloom: BloomFilter | None = None
+        self._recent: set[RevokedPair] = set()
+        self._synced_at: float | None = None
+        self._rebuilt_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def sync_seconds(self) -> float:
+        if self._sync_seconds is not None:
+            return self._sync_seconds
+        return settings.AUTH_REVOCATION_SYNC_SECONDS
+
+    @property
+    def rebuild_seconds(self) -> float:
+        if self._rebuild_seconds is not None:
+            return self._rebuild_seconds
+        return settings.AUTH_REVOCATION_REBUILD_SECONDS
+
+    @property
+    def is_fresh(self) -> bool:
+        """True while the last successful sync is within three sync intervals."""
+        synced_at = self._synced_at
+        return (
+            synced_at is not None
+            and time.monotonic() - synced_at <= 3 * self.sync_seconds
+        )
+
+    @property
+    def needs_rebuild(self) -> bool:
+        return (
+            self._rebuilt_at is None
+            or time.monotonic() - self._rebuilt_at >= self.rebuild_seconds
+            or len(self._recent) >= self.max_recent
+        )
+
+    def rebuild(self, pairs: Iterable[RevokedPair]) -> None:
+        """Replace the Bloom snapshot with ``pairs`` and empty the exact set."""
+        pairs = list(pairs)
+        bloom = BloomFilter(len(pairs))
+        for user_id, version in pairs:
+            bloom.add(_pair_key(user_id, version))
+        now = time.monotonic()
+        with self._lock:
+            self._bloom = bloom
+            self._recent = set()
+            self._rebuilt_at = now
+            self._synced_at = now
+        REVOCATION_ENTRIES.labels(store="bloom").set(len(pairs))
+        REVOCATION_ENTRIES.labels(store="recent").set(0)
+
+    def merge(self, pairs: Iterable[RevokedPair]) -> None:
+        """Add incrementally synced revocations; repeated pairs are harmless."""
+        with self._lock:
+            self._recent.update(pairs)
+            self._synced_at = time.monotonic()
+            recent = len(self._recent)
+        REVOCATION_ENTRIES.labels(store="recent").set(recent)
+
+    def add(self, user_id: UUID, refresh_token_version: int) -> None:
+        """
+        Record a revocation made by this worker without waiting for a sync.
+        Ignored until the list has synced once: an unsynced list answers
+        UNKNOWN anyway, and its first rebuild reads the revocation table.
+        """
+        with self._lock:
+            if self._synced_at is not None:
+                self._recent.add((user_id, refresh_token_version))
+
+    def lookup(self, user_id: UUID, refresh_token_version: int) -> RevocationStatus:
+        if not self.is_fresh:
+            outcome = RevocationStatus.UNKNOWN
+        elif (user_id, refresh_token_version) in self._recent:
+            outcome = RevocationStatus.REVOKED
+        elif self._bloom is not None and (
+            _pair_key(user_id, refresh_token_version) in self._bloom
+        ):
+            outcome = RevocationStatus.UNKNOWN
+        else:
+            outcome = RevocationStatus.CLEAR
+        REVOCATION_LOOKUPS.labels(outcome=outcome.value).inc()
+        return outcome
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._recent = set()
+            self._synced_at = None
+            self._rebuilt_at = None
+
+
+REVOCATION_LIST = RevocationList()
+
+__all__ = [
+    "BloomFilter",
+    "REVOCATION_LIST",
+    "RevocationList",
+    "RevocationStatus",
+]
@@ -11,6 +11,7 @@ from app.models.user.user import UserReadModel
 from app.configs import Settings, settings
 from app.utils.app_error import AppError
 from app.utils.logging import logger
+from app.utils.request_cache import RequestLookupCache
 
 
 class SharedContext:
@@ -25,6 +26,7 @@ class SharedContext:
         if user:
             self.user: UserReadModel = user
         self.db_session = db_session
+        self.lookups = RequestLookupCache(db_session)
 
         if enforce_status_check:
             self._check_user_status()
@@ -0,0 +1,198 @@
+"""Measure event-loop lag while many authenticated requests are in flight.
+
+Compares the JWT dependency running its database lookups inline on the event
+loop (the original behaviour), on the bounded worker-thread offload, and with
+the in-process principal and verified-token caches serving repeat tokens.
+
+    uv run python -m benchmarks.auth_event_loop --requests 200 --db-latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+_DB_DIR = Path(tempfile.mkdtemp(prefix="userverse-bench-"))
+os.environ.update(
+    {
+        "ENVIRONMENT": "testing",
+        "TESTING": "true",
+        "DB_AUTO_CREATE": "true",
+        "DATABASE_URL": f"sqlite:///{_DB_DIR / 'bench.db'}",
+        "JWT_SECRET": "benchmark-secret-key-with-at-least-32-bytes",
+    }
+)
+
+from fastapi import Depends  # noqa: E402
+from fastapi.security import HTTPAuthorizationCredentials  # noqa: E402
+from httpx import ASGITransport, AsyncClient  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import QueuePool  # noqa: E402
+
+from app.configs import settings  # noqa: E402
+from app.api.security.jwt import (  # noqa: E402
+    JWTManager,
+    _authorize_principal,
+    get_current_user_from_jwt_token,
+    http_bearer,
+)
+from app.main import create_app  # noqa: E402
+from app.models.user.account_status import UserAccountStatus  # noqa: E402
+from app.repository.database.session_manager import (  # noqa: E402
+    _get_default_db,
+    get_session,
+    session_local,
+)
+from app.repository.user import UserRepository  # noqa: E402
+from app.utils.auth_cache import (  # noqa: E402
+    AUTH_PRINCIPAL_CACHE,
+    VERIFIED_TOKEN_CACHE,
+)
+from app.utils.hash_password import hash_password  # noqa: E402
+
+
+async def _inline_current_user(
+    session: Session = Depends(get_session),
+    credentials: HTTPAuthorizationCredentials = Depends(http_bearer),
+):
+    # The original dependency: the principal lookup blocks the event loop.
+    jwt_manager = JWTManager(token_cache=VERIFIED_TOKEN_CACHE)
+    token_user, token_version = jwt_manager.decode_access_token(credentials.credentials)
+    principal = AUTH_PRINCIPAL_CACHE.get(
+        token_user.id, refresh_token_version=token_version
+    )
+    if principal is None:
+        principal = UserRepository(session).get_auth_principal(token_user.id)
+        AUTH_PRINCIPAL_CACHE.set(principal)
+    return _authorize_principal(principal, token_version)
+
+
+def _seed_token() -> str:
+    session = session_local()
+    try:
+        repository = UserRepository(session)
+        user = repository.create_user(
+            {
+                "email": "bench@example.com",
+                "password": hash_password("bench-password"),
+                "first_name": "Bench",
+                "last_name": "User",
+            },
+            account_status=UserAccountStatus.ACTIVE.name_value,
+        )
+        version = repository.get_refresh_token_version(user.id)
+        return JWTManager().sign_jwt(user, refresh_token_version=version).access_token
+    finally:
+        session.close()
+
+
+_QUERY_COUNT = [0]
+
+
+def _configure_engine(pool_size: int, latency_ms: float) -> None:
+    # Size the pool to the request count so connection checkout never becomes
+    # the bottleneck; the default SQLite pool deadlocks once the loop blocks.
+    db = _get_default_db()
+    db.engine.dispose()
+    db.engine = create_engine(
+        db.database_url,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        connect_args={"check_same_thread": False},
+    )
+    db.SessionLocal.configure(bind=db.engine)
+
+    @event.listens_for(db.engine, "before_cursor_execute")
+    def _simulate_round_trip(*_args, **_kwargs):
+        _QUERY_COUNT[0] += 1
+        if latency_ms > 0:
+            time.sleep(latency_ms / 1000)
+
+
+async def _run(mode: str, token: str, requests: int) -> dict[str, float]:
+    app = create_app()
+    AUTH_PRINCIPAL_CACHE.clear()
+    VERIFIED_TOKEN_CACHE.clear()
+    settings.AUTH_CACHE_TTL_SECONDS = 300 if mode == "cached" else 0
+    settings.JWT_DECODE_CACHE_TTL_SECONDS = 300 if mode == "cached" else 0
+    if mode == "inline":
+        app.dependency_overrides[get_current_user_from_jwt_token] = _inline_current_user
+
+    lags: list[float] = []
+    done = asyncio.Event()
+
+    async def _monitor() -> None:
+        interval = 0.001
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(max(0.0, time.perf_counter() - started - interval))
+
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/user/get", headers=headers)
+        _QUERY_COUNT[0] = 0
+        monitor = asyncio.create_task(_monitor())
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get("/user/get", headers=headers) for _ in range(requests))
+        )
+        elapsed = time.perf_counter() - started
+        done.set()
+        await monitor
+
+    failures = sum(1 for response in responses if response.status_code != 200)
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "elapsed_s": elapsed,
+        "failures": failures,
+        "queries_per_request": _QUERY_COUNT[0] / requests,
+        "lag_p50_ms": statistics.median(lags_ms),
+        "lag_p99_ms": lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))],
+        "lag_max_ms": lags_ms[-1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--db-latency-ms",
+        type=float,
+        default=2.0,
+        help="Artificial delay added to every SQL statement to mimic a remote DB.",
+    )
+    args = parser.parse_args()
+
+    token = _seed_token()
+    _configure_engine(args.requests, args.db_latency_ms)
+
+    print(
+        f"{args.requests} concurrent GET /user/get, "
+        f"{args.db_latency_ms}ms simulated query latency"
+    )
+    print(
+        f"{'mode':<8} {'elapsed s':>10} {'queries/req':>12} "
+        f"{'p50 lag':>9} {'p99 lag':>9} {'max lag':>9}"
+    )
+    for mode in ("inline", "offload", "cached"):
+        result = asyncio.run(_run(mode, token, args.requests))
+        print(
+            f"{mode:<8} {result['elapsed_s']:>10.2f} "
+            f"{result['queries_per_request']:>12.1f} "
+            f"{result['lag_p50_ms']:>7.1f}ms {result['lag_p99_ms']:>7.1f}ms "
+            f"{result['lag_max_ms']:>7.1f}ms"
+            + (f"  ({result['failures']} failed)" if result["failures"] else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Compare full-profile and compact JWT claims: header size and throughput.
+
+The ``baseline`` row replays the original signing and decoding: the profile
+dumped once per token and every decode validated into a ``UserReadModel``.
+
+uv run python -m benchmarks.jwt_claims --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+os.environ.update(
+    {
+        "ENVIRONMENT": "testing",
+        "TESTING": "true",
+        "JWT_SECRET": "benchmark-secret-key-with-at-least-32-bytes",
+    }
+)
+
+from app.api.security.jwt import JWTManager  # noqa: E402
+from app.configs import settings  # noqa: E402
+from app.models.user.user import UserReadModel  # noqa: E402
+
+USER = UserReadModel(
+    id=uuid4(),
+    first_name="Benchmark",
+    last_name="User",
+    email="benchmark.user@example.com",
+    phone_number="+27821234567",
+    status="Active",
+)
+
+
+def _rate(iterations: int, func) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return iterations / (time.perf_counter() - started)
+
+
+def _baseline_sign(manager: JWTManager, user: UserReadModel, version: int) -> str:
+    now = datetime.now(timezone.utc)
+    tokens = [
+        manager._encode(
+            {
+                "user": user.model_dump(mode="json"),
+                "type": token_type,
+                "refresh_token_version": version,
+                "exp": now + timedelta(minutes=timeout),
+            }
+        )
+        for token_type, timeout in (
+            ("access", manager.SESSION_TIMEOUT),
+            ("refresh", manager.REFRESH_TIMEOUT),
+        )
+    ]
+    return tokens[0]
+
+
+def _baseline_decode(manager: JWTManager, token: str) -> UserReadModel:
+    decoded = manager._decode_token_payload(token, expected_type="access")
+    return UserReadModel(**decoded["user"])
+
+
+def _run(mode: str, iterations: int) -> dict[str, float]:
+    settings.JWT_COMPACT_CLAIMS = mode == "compact"
+    manager = JWTManager()
+    if mode == "baseline":
+        access_token = _baseline_sign(manager, USER, 3)
+
+        def sign():
+            _baseline_sign(manager, USER, 3)
+
+        def decode():
+            _baseline_decode(manager, access_token)
+
+    else:
+        access_token = manager.sign_jwt(USER, refresh_token_version=3).access_token
+
+        def sign():
+            manager.sign_jwt(USER)
+
+        def decode():
+            manager.decode_access_token(access_token)
+
+    header = f"Authorization: Bearer {access_token}"
+    return {
+        "header_bytes": len(header.encode()),
+        "sign_per_s": _rate(iterations, sign),
+        "decode_per_s": _rate(iterations, decode),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{settings.JWT_ALGORITHM}, {args.iterations} iterations per measurement")
+    print(f"{'claims':<9} {'header B':>9} {'sign pairs/s':>13} {'decode/s':>10}")
+    for mode in ("baseline", "full", "compact"):
+        result = _run(mode, args.iterations)
+        print(
+            f"{mode:<9} {result['header_bytes']:>9} "
+            f"{result['sign_per_s']:>13,.0f} {result['decode_per_s']:>10,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,18 @@
+import threading
+
+import anyio
 from app.models.user.response_messages import UserResponseMessages
 from app.models.user.account_status import UserAccountStatus
 from app.configs import settings
 from app.repository.database.session_manager import DatabaseSessionManager
 from app.repository.database.tables import User
+from app.services.revocation_sync import RevocationListSynchronizer
+from app.utils.hashing_pool import (
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASHING_POOL,
+    PasswordHashingBusy,
+)
+from app.utils.revocation_list import REVOCATION_LIST
 from tests.utils.basic_auth import get_basic_auth_header
 
 import pytest
@@ -148,6 +158,78 @@ async def test_user_login_invalid_credentials(client, test_user_data, seed_users
     assert json_details["message"] == UserResponseMessages.INVALID_CREDENTIALS.value
 
 
+async def test_user_login_returns_503_when_hashing_is_saturated(
+    client, monkeypatch, test_user_data, seed_users
+):
+    user_one = test_user_data["user_one"]
+
+    def _saturated(*args):
+        raise PasswordHashingBusy()
+
+    monkeypatch.setattr(PASSWORD_HASHING_POOL, "run", _saturated)
+
+    response = await client.patch(
+        "/user/login",
+        headers=get_basic_auth_header(
+            username=user_one["email"],
+            password=user_one["password"],
+        ),
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["detail"]["error"] == "password_hashing_saturated"
+
+
+async def test_sync_endpoints_respond_while_hashing_is_saturated(
+    client, monkeypatch, test_user_data, login_token
+):
+    user_one = test_user_data["user_one"]
+    login = {
+        "headers": get_basic_auth_header(
+            username=user_one["email"], password=user_one["password"]
+        )
+    }
+    default_threads = anyio.to_thread.current_default_thread_limiter()
+    release = threading.Event()
+    run = PASSWORD_HASHING_POOL.run
+
+    def _held_run(operation, func, *args):
+        release.wait(5)
+        return run(operation, func, *args)
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 3)
+    monkeypatch.setattr(PASSWORD_HASHING_POOL, "run", _held_run)
+    monkeypatch.setattr(default_threads, "total_tokens", 2)
+    PASSWORD_HASHING_POOL.shutdown()
+    statuses = []
+
+    async def _login():
+        statuses.append((await client.patch("/user/login", **login)).status_code)
+
+    try:
+        async with anyio.create_task_group() as task_group:
+            for _ in range(4):
+                task_group.start_soon(_login)
+            with anyio.fail_after(5):
+                while PASSWORD_HASH_QUEUE_DEPTH._value.get() < 4:
+                    await anyio.sleep(0.01)
+                # Queued logins hold no thread from the two left by default.
+                response = await client.get(
+                    "/user/get", headers={"Authorization": f"Bearer {login_token}"}
+                )
+                assert response.status_code == 200
+                busy = await client.patch("/user/login", **login)
+                assert busy.status_code == 503
+            release.set()
+    finally:
+        release.set()
+        PASSWORD_HASHING_POOL.shutdown()
+
+    assert statuses == [202] * 4
+
+
 async def test_user_refresh_success(client, test_user_data, seed_users):
     user_one = test_user_data["user_one"]
     _set_user_status(user_one["email"], UserAccountStatus.ACTIVE.name_value)
@@ -224,6 +306,31 @@ async def test_second_login_invalidates_first_login_tokens(
     assert latest_refresh_response.status_code == 202
 
 
+async def test_stateless_verification_honours_revocations(
+    client, test_user_data, seed_verified_users, monkeypatch
+):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", True)
+    user_one = test_user_data["user_one"]
+    token_data = await _login_for_tokens(client, user_one)
+    headers = {"Authorization": f"Bearer {token_data['access_token']}"}
+    try:
+        RevocationListSynchronizer().sync_once()
+        assert (await client.get("/user/get", headers=headers)).status_code == 200
+
+        await client.post(
+            "/user/revoke",
+            json={"refresh_token": token_data["refresh_token"]},
+        )
+        assert (await client.get("/user/get", headers=headers)).status_code == 401
+
+        # Another worker only learns about the revocation from the table.
+        REVOCATION_LIST.clear()
+        RevocationListSynchronizer().sync_once()
+        assert (await client.get("/user/get", headers=headers)).status_code == 401
+    finally:
+        REVOCATION_LIST.clear()
+
+
 async def test_user_refresh_rejects_inactive_user(
     client, test_user_data, seed_verified_users
 ):
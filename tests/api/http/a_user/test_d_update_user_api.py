@@ -40,6 +40,18 @@ async def test_a_update_user_success(client, login_token_user_two, test_user_dat
     assert json_response["data"]["phone_number"] == user_two["phone_number"]
 
 
+async def test_a_update_user_without_password(client, login_token_user_two):
+    """Profile edits that do not change the password skip the hashing pool."""
+    headers = {"Authorization": f"Bearer {login_token_user_two}"}
+    response = await client.patch(
+        BASE_URL,
+        json={"phone_number": "5550001111"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    assert response.json()["data"]["phone_number"] == "5550001111"
+
+
 async def test_b_update_user_fail_with_invalid_token(client, test_user_data):
     """Test updating user information with an invalid token."""
     user_two = test_user_data["user_two"]
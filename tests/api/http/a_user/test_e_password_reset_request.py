@@ -3,7 +3,7 @@ import pytest
 from app.models.user.password import PasswordResetMethod
 from app.models.user.response_messages import PasswordResetResponseMessages
 from app.repository.database.session_manager import DatabaseSessionManager
-from app.repository.database.tables import User
+from app.repository.database.tables import PasswordResetToken, User
 from app.utils.rate_limiter import PASSWORD_RESET_RATE_LIMITER
 
 pytestmark = pytest.mark.anyio
@@ -38,11 +38,13 @@ async def test_password_reset_success(client, test_user_data, seed_users):
     session = db.session_object()
     try:
         user_row = session.query(User).filter_by(email=user["email"]).one()
-        password_reset = (user_row.primary_meta_data or {}).get("password_reset", {})
-        assert password_reset["method"] == PasswordResetMethod.OTP.value
-        assert password_reset["token"]
-        assert password_reset["created_at"]
-        assert password_reset["expires_at"]
+        reset_token = (
+            session.query(PasswordResetToken).filter_by(user_id=user_row.id).one()
+        )
+        assert reset_token.method == PasswordResetMethod.OTP.value
+        assert len(reset_token.token_hash) == 64
+        assert reset_token._created_at
+        assert reset_token.expires_at
     finally:
         session.close()
 
@@ -63,11 +65,13 @@ async def test_password_reset_magic_link_success(client, test_user_data, seed_us
     session = db.session_object()
     try:
         user_row = session.query(User).filter_by(email=user["email"]).one()
-        password_reset = (user_row.primary_meta_data or {}).get("password_reset", {})
-        assert password_reset["method"] == PasswordResetMethod.MAGIC_LINK.value
-        assert password_reset["token"]
-        assert password_reset["created_at"]
-        assert password_reset["expires_at"]
+        reset_token = (
+            session.query(PasswordResetToken).filter_by(user_id=user_row.id).one()
+        )
+        assert reset_token.method == PasswordResetMethod.MAGIC_LINK.value
+        assert len(reset_token.token_hash) == 64
+        assert reset_token._created_at
+        assert reset_token.expires_at
     finally:
         session.close()
 
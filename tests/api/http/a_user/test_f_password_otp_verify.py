@@ -1,6 +1,6 @@
 from app.models.user.response_messages import PasswordResetResponseMessages
 from app.repository.database.session_manager import DatabaseSessionManager
-from app.repository.database.tables import User
+from app.repository.database.tables import PasswordResetToken, User
 from app.utils.hash_password import verify_password
 from tests.utils.basic_auth import get_basic_auth_header
 
@@ -75,7 +75,10 @@ async def test_b_password_reset_validate_otp_success(
         user_row = session.query(User).filter_by(email=user_one["email"]).one()
         assert user_row.password != new_password
         assert verify_password(new_password, user_row.password) is True
-        assert "password_reset" not in (user_row.primary_meta_data or {})
+        assert (
+            session.query(PasswordResetToken).filter_by(user_id=user_row.id).count()
+            == 0
+        )
     finally:
         session.close()
 
@@ -1,6 +1,6 @@
 from app.models.user.response_messages import PasswordResetResponseMessages
 from app.repository.database.session_manager import DatabaseSessionManager
-from app.repository.database.tables import User
+from app.repository.database.tables import PasswordResetToken, User
 from app.utils.hash_password import verify_password
 
 
@@ -38,7 +38,10 @@ async def test_a_password_reset_with_magic_link_success(
     try:
         user_row = session.query(User).filter_by(email=user["email"]).one()
         assert verify_password(new_password, user_row.password) is True
-        assert "password_reset" not in (user_row.primary_meta_data or {})
+        assert (
+            session.query(PasswordResetToken).filter_by(user_id=user_row.id).count()
+            == 0
+        )
     finally:
         session.close()
 
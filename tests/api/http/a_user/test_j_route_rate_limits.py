@@ -0,0 +1,65 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.routers.company.users import router as company_users_router
+from app.configs import settings
+from app.main import create_app
+from app.models.security_messages import SecurityResponseMessages
+from app.repository.database.session_manager import get_session
+from app.services.user.basic_auth import UserBasicAuthService
+from app.utils.app_error import AppError
+from tests.utils.basic_auth import get_basic_auth_header
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_login_is_rejected_before_opening_a_session(monkeypatch):
+    monkeypatch.setattr(settings, "ROUTE_RATE_LIMITS_ENABLED", True)
+    sessions = []
+    logins = []
+
+    def _session():
+        sessions.append(True)
+        yield None
+
+    def _login(self, user_credentials):
+        logins.append(user_credentials.email)
+        raise AppError(status_code=401, message="Invalid credentials")
+
+    monkeypatch.setattr(UserBasicAuthService, "user_login", _login)
+    app = create_app()
+    app.dependency_overrides[get_session] = _session
+    headers = get_basic_auth_header("throttled@example.com", "wrong-password")
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        for _ in range(10):
+            await client.patch("/user/login", headers=headers)
+        response = await client.patch("/user/login", headers=headers)
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "60"
+    assert response.json()["detail"]["message"] == (
+        SecurityResponseMessages.RATE_LIMITED.value
+    )
+    assert len(sessions) == 10
+    assert len(logins) == 10
+
+
+def test_company_membership_writes_are_rate_limited():
+    limited = {
+        (method, route.path)
+        for route in company_users_router.routes
+        for method in route.methods
+        if any(
+            getattr(dependency.call, "name", None) == "company_membership"
+            for dependency in route.dependant.dependencies
+        )
+    }
+
+    assert limited == {
+        ("POST", "/company/{company_id}/users"),
+        ("DELETE", "/company/{company_id}/user/{user_id}"),
+        ("PATCH", "/company/{company_id}/user/{user_id}"),
+    }
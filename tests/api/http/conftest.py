@@ -13,6 +13,7 @@ from dotenv import dotenv_values
 from unittest.mock import patch
 
 import app.configs as app_configs
+from app.api.dependencies.rate_limit import reset_route_rate_limits
 from app.api.security.jwt import JWTManager
 from app.main import create_app
 from app.models.company.roles import CompanyDefaultRoles
@@ -20,10 +21,14 @@ from app.models.user.account_status import UserAccountStatus
 from app.models.user.user import UserReadModel
 from app.configs import settings
 from app.repository.database.session_manager import DatabaseSessionManager
-from app.repository.company import CompanyRepository
 from app.repository.database.tables import AssociationUserCompany, Company, Role, User
 from app.repository.database.tables import CompanyRole
+from app.repository.default_catalog import DefaultRoleCatalogRepository
+from app.repository.effective_permission import EffectivePermissionRepository
 import app.repository.database.session_manager as session_manager
+from app.repository.user_password import UserPasswordRepository
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
 from app.utils.hash_password import hash_password
 from tests.utils.basic_auth import get_basic_auth_header
 
@@ -178,6 +183,24 @@ def setup_database(pytestconfig):
         db_dir.rmdir()
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_principal_cache():
+    # Fixtures below edit user rows directly, bypassing repository invalidation.
+    AUTH_PRINCIPAL_CACHE.clear()
+    COMPANY_PERMISSION_CACHE.clear()
+    yield
+    AUTH_PRINCIPAL_CACHE.clear()
+    COMPANY_PERMISSION_CACHE.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_route_rate_limits():
+    # Every test client shares one address, so limits would leak between tests.
+    reset_route_rate_limits()
+    yield
+    reset_route_rate_limits()
+
+
 @pytest.fixture
 def anyio_backend():
     return "asyncio"
@@ -267,9 +290,9 @@ async def _create_user_if_missing(client: AsyncClient, user: dict):
             user_row.password = hash_password(user["password"])
             user_row._closed_at = None
             user_row.primary_meta_data = {
-                "status": UserAccountStatus.AWAITING_VERIFICATION.name_value,
-                "refresh_token_version": 0,
+                "status": UserAccountStatus.AWAITING_VERIFICATION.name_value
             }
+            user_row.refresh_token_version = 0
             user_row.secondary_meta_data = {}
             session.commit()
         finally:
@@ -405,19 +428,24 @@ async def _create_role_if_missing(
 
 
 @pytest.fixture
-def get_user_two_otp(test_user_data):
+def get_user_two_otp(test_user_data, monkeypatch):
+    """
+    Return the last reset token issued to user two. Only token digests are
+    stored, so the plaintext is captured when the record is created.
+    """
+    issued_tokens = {}
+    create_record = UserPasswordRepository.create_password_reset_record
+
+    def _capture(self, user_email, **kwargs):
+        issued_tokens[user_email.lower()] = kwargs["token"]
+        return create_record(self, user_email, **kwargs)
+
+    monkeypatch.setattr(
+        UserPasswordRepository, "create_password_reset_record", _capture
+    )
+
     def _get_token():
-        user = test_user_data["user_two"]
-        session = session_manager.session_local()
-        try:
-            user_row = (
-                session.query(User).filter_by(email=user["email"].lower()).first()
-            )
-            if user_row:
-                return user_row.primary_meta_data.get("password_reset", {}).get("token")
-            return None
-        finally:
-            session.close()
+        return issued_tokens.get(test_user_data["user_two"]["email"].lower())
 
     return _get_token
 
@@ -471,10 +499,8 @@ async def login_token_superuser(client):
         user_row.password = hash_password(SUPERUSER_TEST_USER["password"])
         user_row.is_superuser = True
         user_row._closed_at = None
-        user_row.primary_meta_data = {
-            "status": UserAccountStatus.ACTIVE.name_value,
-            "refresh_token_version": 0,
-        }
+        user_row.primary_meta_data = {"status": UserAccountStatus.ACTIVE.name_value}
+        user_row.refresh_token_version = 0
         user_row.secondary_meta_data = {}
         session.commit()
     finally:
@@ -613,10 +639,7 @@ def seed_pagination_state():
                 phone_number=owner["phone_number"],
                 email=owner["email"],
                 password=hash_password(owner["password"]),
-                primary_meta_data={
-                    "status": UserAccountStatus.ACTIVE.name_value,
-                    "refresh_token_version": 0,
-                },
+                primary_meta_data={"status": UserAccountStatus.ACTIVE.name_value},
                 secondary_meta_data={},
             )
             session.add(owner_row)
@@ -626,10 +649,8 @@ def seed_pagination_state():
         owner_row.phone_number = owner["phone_number"]
         owner_row.password = hash_password(owner["password"])
         owner_row._closed_at = None
-        owner_row.primary_meta_data = {
-            "status": UserAccountStatus.ACTIVE.name_value,
-            "refresh_token_version": 0,
-        }
+        owner_row.primary_meta_data = {"status": UserAccountStatus.ACTIVE.name_value}
+        owner_row.refresh_token_version = 0
         owner_row.secondary_meta_data = {}
         session.commit()
         session.refresh(owner_row)
@@ -682,7 +703,7 @@ def seed_pagination_state():
         administrator_role_name = CompanyDefaultRoles.ADMINISTRATOR.name_value
         viewer_role_name = CompanyDefaultRoles.VIEWER.name_value
 
-        CompanyRepository(session)._ensure_default_roles()
+        DefaultRoleCatalogRepository(session).reconcile()
 
         for company_id in company_ids:
             for default_role in CompanyDefaultRoles:
@@ -759,10 +780,7 @@ def seed_pagination_state():
                     phone_number=user_data["phone_number"],
                     email=user_data["email"],
                     password=hash_password(user_data["password"]),
-                    primary_meta_data={
-                        "status": UserAccountStatus.ACTIVE.name_value,
-                        "refresh_token_version": 0,
-                    },
+                    primary_meta_data={"status": UserAccountStatus.ACTIVE.name_value},
                     secondary_meta_data={},
                 )
                 session.add(user_row)
@@ -772,10 +790,8 @@ def seed_pagination_state():
             user_row.phone_number = user_data["phone_number"]
             user_row.password = hash_password(user_data["password"])
             user_row._closed_at = None
-            user_row.primary_meta_data = {
-                "status": UserAccountStatus.ACTIVE.name_value,
-                "refresh_token_version": 0,
-            }
+            user_row.primary_meta_data = {"status": UserAccountStatus.ACTIVE.name_value}
+            user_row.refresh_token_version = 0
             user_row.secondary_meta_data = {}
             session.commit()
             session.refresh(user_row)
@@ -810,6 +826,10 @@ def seed_pagination_state():
                 existing_link._closed_at = None
             session.commit()
 
+        # The rows above bypass the repositories, so derive the materialized
+        # effective permissions the way the rebuild command would.
+        EffectivePermissionRepository(session).rebuild()
+
         owner_token = (
             JWTManager()
             .sign_jwt(
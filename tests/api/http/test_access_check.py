@@ -0,0 +1,144 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.configs import settings
+from app.models.security_messages import SecurityResponseMessages
+from app.models.system_permissions import SystemPermission
+from app.repository.database import session_manager
+from app.repository.database.tables import User
+
+pytestmark = pytest.mark.anyio
+BASE_URL = "/authz/check"
+
+
+def _headers(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _checks(*pairs):
+    return [
+        {"company_id": str(company_id), "permission": permission.value}
+        for company_id, permission in pairs
+    ]
+
+
+def _user_id(email: str):
+    session = session_manager.session_local()
+    try:
+        return session.query(User.id).filter_by(email=email).scalar()
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def decision_statements():
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if "effective_company_role_permission" in statement:
+            statements.append(statement)
+
+    engine = session_manager._get_default_db().engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+async def test_access_check_decides_all_pairs_for_caller_in_one_query(
+    client, seed_companies, login_token, decision_statements
+):
+    company_one = seed_companies["company_one"]
+    company_two = seed_companies["company_two"]
+
+    response = await client.post(
+        BASE_URL,
+        headers=_headers(login_token),
+        json={
+            "checks": _checks(
+                (company_one, SystemPermission.COMPANY_DELETE),
+                (company_two, SystemPermission.COMPANY_READ),
+                (company_one, SystemPermission.COMPANY_READ),
+                (uuid4(), SystemPermission.COMPANY_READ),
+            )
+        },
+    )
+
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["user_id"] == str(_user_id("user.one@email.com"))
+    assert [result["allowed"] for result in data["results"]] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert data["results"][0]["permission"] == "company.delete"
+    assert len(decision_statements) == 1
+
+
+async def test_access_check_for_another_user_requires_superuser(
+    client, seed_companies, login_token, login_token_superuser
+):
+    user_two_id = _user_id("user.two@email.com")
+    payload = {
+        "user_id": str(user_two_id),
+        "checks": _checks(
+            (seed_companies["company_one"], SystemPermission.COMPANY_READ),
+            (seed_companies["company_two"], SystemPermission.COMPANY_READ),
+        ),
+    }
+
+    response = await client.post(BASE_URL, headers=_headers(login_token), json=payload)
+    assert response.status_code == 403
+    assert (
+        response.json()["detail"]["message"]
+        == SecurityResponseMessages.ACCESS_CHECK_OTHER_USER_FORBIDDEN.value
+    )
+
+    response = await client.post(
+        BASE_URL, headers=_headers(login_token_superuser), json=payload
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["user_id"] == str(user_two_id)
+    assert [result["allowed"] for result in data["results"]] == [False, True]
+
+    response = await client.post(
+        BASE_URL,
+        headers=_headers(login_token_superuser),
+        json={**payload, "user_id": str(uuid4())},
+    )
+    assert response.status_code == 404
+
+
+async def test_access_check_allows_superusers_everything(
+    client, seed_companies, login_token_superuser
+):
+    response = await client.post(
+        BASE_URL,
+        headers=_headers(login_token_superuser),
+        json={"checks": _checks((uuid4(), SystemPermission.COMPANY_DELETE))},
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["results"][0]["allowed"] is True
+
+
+async def test_access_check_rejects_oversized_batches(client, login_token, monkeypatch):
+    monkeypatch.setattr(settings, "AUTHZ_CHECK_MAX_BATCH", 1)
+    checks = _checks(
+        (uuid4(), SystemPermission.COMPANY_READ),
+        (uuid4(), SystemPermission.COMPANY_READ),
+    )
+
+    response = await client.post(
+        BASE_URL, headers=_headers(login_token), json={"checks": checks}
+    )
+
+    assert response.status_code == 400
+    assert (
+        response.json()["detail"]["message"]
+        == SecurityResponseMessages.ACCESS_CHECK_BATCH_TOO_LARGE.value
+    )
@@ -75,3 +75,13 @@ async def test_create_app_keeps_credentials_for_explicit_cors_origins(monkeypatc
 
     assert cors_middleware.kwargs["allow_origins"] == ["http://localhost:3000"]
     assert cors_middleware.kwargs["allow_credentials"] is True
+
+
+async def test_jwks_endpoint_is_public_and_cacheable(client, monkeypatch):
+    monkeypatch.setattr(settings, "JWKS_CACHE_MAX_AGE_SECONDS", 600)
+
+    response = await client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.json() == {"keys": []}
+    assert response.headers["cache-control"] == "public, max-age=600"
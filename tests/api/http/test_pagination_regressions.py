@@ -1,9 +1,13 @@
+import base64
+import json
+
 import pytest
 
 from app.models.company.response_messages import (
     CompanyRoleResponseMessages,
     CompanyUserResponseMessages,
 )
+from app.models.generic_pagination import INVALID_CURSOR_MESSAGE
 
 pytestmark = pytest.mark.anyio
 
@@ -30,7 +34,10 @@ async def test_get_company_roles_page_two_is_stable(client, seed_pagination_stat
         "limit": 2,
         "current_page": 2,
         "total_pages": 3,
+        "next_cursor": pagination["next_cursor"],
+        "total_is_estimate": False,
     }
+    assert pagination["next_cursor"]
 
 
 async def test_get_company_users_page_two_is_stable(client, seed_pagination_state):
@@ -58,6 +65,8 @@ async def test_get_company_users_page_two_is_stable(client, seed_pagination_stat
         "limit": 2,
         "current_page": 2,
         "total_pages": 2,
+        "next_cursor": None,
+        "total_is_estimate": False,
     }
 
 
@@ -84,6 +93,8 @@ async def test_get_user_companies_page_two_is_stable(client, seed_pagination_sta
         "limit": 2,
         "current_page": 2,
         "total_pages": 2,
+        "next_cursor": None,
+        "total_is_estimate": False,
     }
 
 
@@ -132,4 +143,90 @@ async def test_get_user_companies_returns_company_specific_roles(
         "limit": 4,
         "current_page": 1,
         "total_pages": 1,
+        "next_cursor": None,
+        "total_is_estimate": False,
     }
+
+
+async def _walk_cursor(client, url, headers, key):
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, "total": "none"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(url, params=params, headers=headers)
+        assert response.status_code == 200, response.text
+        data = response.json()["data"]
+        assert data["pagination"]["total_records"] is None
+        assert data["pagination"]["total_pages"] is None
+        seen.extend(record[key] for record in data["records"])
+        cursor = data["pagination"]["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.parametrize(
+    "path, key",
+    [
+        ("/company/{role_company_id}/roles", "name"),
+        ("/company/{users_company_id}/users", "email"),
+        ("/user/companies", "id"),
+    ],
+)
+async def test_cursor_pages_match_offset_order(
+    client, seed_pagination_state, path, key
+):
+    headers = {"Authorization": f"Bearer {seed_pagination_state['owner_token']}"}
+    url = path.format(**seed_pagination_state)
+
+    response = await client.get(url, params={"limit": 100}, headers=headers)
+    assert response.status_code == 200
+    expected = [record[key] for record in response.json()["data"]["records"]]
+    assert len(expected) > 2
+
+    assert await _walk_cursor(client, url, headers, key) == expected
+
+
+async def test_cursor_pages_cover_global_listings(client, login_token_superuser):
+    headers = {"Authorization": f"Bearer {login_token_superuser}"}
+    for url in ("/roles", "/permissions"):
+        response = await client.get(url, params={"limit": 100}, headers=headers)
+        assert response.status_code == 200
+        expected = [record["id"] for record in response.json()["data"]["records"]]
+
+        assert await _walk_cursor(client, url, headers, "id") == expected
+
+
+async def test_invalid_cursor_is_rejected(client, seed_pagination_state):
+    headers = {"Authorization": f"Bearer {seed_pagination_state['owner_token']}"}
+
+    for cursor in ("not-a-cursor", "WyJPbmx5T25lIl0"):
+        response = await client.get(
+            "/user/companies", params={"cursor": cursor}, headers=headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["message"] == INVALID_CURSOR_MESSAGE
+
+
+async def test_cursor_values_of_the_wrong_type_are_rejected(
+    client, seed_pagination_state, login_token_superuser
+):
+    owner = {"Authorization": f"Bearer {seed_pagination_state['owner_token']}"}
+    superuser = {"Authorization": f"Bearer {login_token_superuser}"}
+    listings = [
+        (
+            f"/company/{seed_pagination_state['users_company_id']}/users",
+            owner,
+            ["2024-01-01T00:00:00", 5],
+        ),
+        (f"/company/{seed_pagination_state['role_company_id']}/roles", owner, [1, 2]),
+        ("/roles", superuser, [1, 2]),
+    ]
+
+    for url, headers, values in listings:
+        cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+        response = await client.get(
+            url, params={"cursor": cursor.rstrip("=")}, headers=headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["message"] == INVALID_CURSOR_MESSAGE
@@ -0,0 +1,30 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.api.middleware.query_count import QueryCountMiddleware
+from app.configs import settings
+from app.main import create_app
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_query_count_header_when_enabled(monkeypatch, login_token):
+    monkeypatch.setattr(settings, "DEBUG_QUERY_COUNT", True)
+
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        root = await client.get("/")
+        user = await client.get(
+            "/user/get",
+            headers={"Authorization": f"Bearer {login_token}"},
+        )
+
+    assert root.headers[QueryCountMiddleware.HEADER] == "0"
+    assert user.status_code == 200
+    assert int(user.headers[QueryCountMiddleware.HEADER]) > 0
+
+
+async def test_query_count_header_disabled_by_default(client):
+    response = await client.get("/")
+
+    assert QueryCountMiddleware.HEADER not in response.headers
@@ -0,0 +1,158 @@
+import pytest
+from sqlalchemy import event
+
+from app.api.security.jwt import JWTManager
+from app.configs import settings
+from app.models.security_messages import SecurityResponseMessages
+from app.repository.database import session_manager
+from app.repository.database.tables import User
+from app.repository.user import UserRepository
+from tests.utils.basic_auth import get_basic_auth_header
+
+pytestmark = pytest.mark.anyio
+BASE_URL = "/auth/introspect/batch"
+API_KEY = "introspection-test-key"
+
+
+@pytest.fixture
+def introspection_api_key(monkeypatch):
+    monkeypatch.setattr(settings, "INTROSPECTION_API_KEYS", ["other-key", API_KEY])
+    return {"X-API-Key": API_KEY}
+
+
+@pytest.fixture
+def user_statements():
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if 'FROM "user"' in statement or "FROM user" in statement:
+            statements.append(statement)
+
+    engine = session_manager._get_default_db().engine
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+async def test_introspection_requires_api_key(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTROSPECTION_API_KEYS", [API_KEY])
+
+    missing = await client.post(BASE_URL, json={"tokens": ["x"]})
+    wrong = await client.post(
+        BASE_URL, json={"tokens": ["x"]}, headers={"X-API-Key": "wrong"}
+    )
+
+    assert missing.status_code == 401
+    assert wrong.status_code == 401
+    assert (
+        wrong.json()["detail"]["message"]
+        == SecurityResponseMessages.INVALID_API_KEY.value
+    )
+
+
+async def test_introspection_resolves_users_with_one_query(
+    client,
+    introspection_api_key,
+    login_token,
+    login_token_user_two,
+    user_statements,
+):
+    user_statements.clear()
+    response = await client.post(
+        BASE_URL,
+        json={"tokens": [login_token, "not-a-jwt", login_token_user_two, login_token]},
+        headers=introspection_api_key,
+    )
+
+    assert response.status_code == 200, response.text
+    json_data = response.json()
+    assert json_data["message"] == SecurityResponseMessages.TOKENS_INTROSPECTED.value
+    results = json_data["data"]["results"]
+    assert [result["active"] for result in results] == [True, False, True, True]
+    assert results[0]["sub"] == results[3]["sub"] != results[2]["sub"]
+    assert results[0]["exp"] > 0
+    assert results[1] == {
+        "active": False,
+        "sub": None,
+        "exp": None,
+        "status": None,
+        "is_superuser": None,
+    }
+    assert len(user_statements) == 1
+
+    user_statements.clear()
+    repeat = await client.post(
+        BASE_URL, json={"tokens": [login_token]}, headers=introspection_api_key
+    )
+    assert repeat.json()["data"]["results"][0]["active"] is True
+    assert user_statements == []
+
+
+async def test_introspection_reports_revoked_tokens_inactive(
+    client, introspection_api_key, seed_verified_users, test_user_data
+):
+    user = test_user_data["user_three"]
+    credentials = get_basic_auth_header(user["email"], user["password"])
+    revoked = (await client.patch("/user/login", headers=credentials)).json()["data"]
+    revoke = await client.post(
+        "/user/revoke", json={"refresh_token": revoked["refresh_token"]}
+    )
+    assert revoke.status_code == 200
+    fresh = (await client.patch("/user/login", headers=credentials)).json()["data"]
+
+    response = await client.post(
+        BASE_URL,
+        json={"tokens": [revoked["access_token"], fresh["access_token"]]},
+        headers=introspection_api_key,
+    )
+
+    results = response.json()["data"]["results"]
+    assert [result["active"] for result in results] == [False, True]
+
+
+async def test_introspection_checks_cache_at_each_token_version(
+    client, introspection_api_key, login_token
+):
+    warm = await client.post(
+        BASE_URL, json={"tokens": [login_token]}, headers=introspection_api_key
+    )
+    assert warm.json()["data"]["results"][0]["active"] is True
+    principal, version = JWTManager().decode_access_token(login_token)
+    # Bump the version behind the principal cache, as another worker would.
+    session = session_manager.session_local()
+    try:
+        session.get(User, principal.id).refresh_token_version = version + 1
+        session.commit()
+        user = UserRepository(session).get_user_by_id(principal.id)
+    finally:
+        session.close()
+    newer = JWTManager().sign_jwt(user, refresh_token_version=version + 1)
+
+    response = await client.post(
+        BASE_URL,
+        json={"tokens": [login_token, newer.access_token]},
+        headers=introspection_api_key,
+    )
+
+    results = response.json()["data"]["results"]
+    assert [result["active"] for result in results] == [False, True]
+
+
+async def test_introspection_rejects_oversized_batch(
+    client, introspection_api_key, monkeypatch
+):
+    monkeypatch.setattr(settings, "INTROSPECTION_MAX_BATCH", 2)
+
+    too_many = await client.post(
+        BASE_URL, json={"tokens": ["a", "b", "c"]}, headers=introspection_api_key
+    )
+    empty = await client.post(
+        BASE_URL, json={"tokens": []}, headers=introspection_api_key
+    )
+
+    assert too_many.status_code == 400
+    assert (
+        too_many.json()["detail"]["message"]
+        == SecurityResponseMessages.INTROSPECTION_BATCH_TOO_LARGE.value
+    )
+    assert empty.status_code == 422
@@ -0,0 +1,70 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.repository.database import session_manager
+from tests.utils.basic_auth import get_basic_auth_header
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def commits():
+    committed = []
+
+    def _record(conn):
+        committed.append(conn)
+
+    engine = session_manager._get_default_db().engine
+    event.listen(engine, "commit", _record)
+    yield committed
+    event.remove(engine, "commit", _record)
+
+
+def _company_payload():
+    suffix = uuid4().hex[:12]
+    return {
+        "email": f"uow-{suffix}@email.com",
+        "name": f"Unit Of Work {suffix}",
+        "description": "Created in a single transaction.",
+        "industry": "Retail",
+        "phone_number": "+27123450000",
+        "address": {
+            "street": "1 Commit Lane",
+            "city": "Cape Town",
+            "state": "Western Cape",
+            "postal_code": "8001",
+            "country": "South Africa",
+        },
+    }
+
+
+async def test_create_user_commits_once(client, commits):
+    response = await client.post(
+        "/user/create",
+        json={"first_name": "Uni", "last_name": "Work", "phone_number": "0123456789"},
+        headers=get_basic_auth_header(f"uow-{uuid4().hex[:12]}@email.com", "secret1"),
+    )
+
+    assert response.status_code == 201, response.text
+    assert len(commits) == 1
+
+
+async def test_create_and_update_company_commit_once_each(client, login_token, commits):
+    headers = {"Authorization": f"Bearer {login_token}"}
+
+    response = await client.post("/company", json=_company_payload(), headers=headers)
+    assert response.status_code == 201, response.text
+    assert len(commits) == 1
+    company_id = response.json()["data"]["id"]
+
+    commits.clear()
+    response = await client.patch(
+        f"/company/{company_id}",
+        json={"name": "Unit Of Work Renamed", "address": _company_payload()["address"]},
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["name"] == "Unit Of Work Renamed"
+    assert len(commits) == 1
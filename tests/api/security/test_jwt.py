@@ -1,4 +1,5 @@
 import asyncio
+import threading
 from datetime import datetime, timedelta, timezone
 import jwt
 from uuid import uuid4
@@ -9,8 +10,17 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from app.models.user.user import UserReadModel
 from app.models.security_messages import SecurityResponseMessages
+import app.api.security.jwt as jwt_security
 from app.api.security.jwt import JWTManager, get_current_user_from_jwt_token
+from app.configs import settings
 from app.utils.app_error import AppError
+from app.utils.auth_cache import (
+    AUTH_PRINCIPAL_CACHE,
+    VERIFIED_TOKEN_CACHE,
+    AuthPrincipal,
+    VerifiedTokenCache,
+)
+from app.utils.revocation_list import REVOCATION_LIST
 
 # Sample user
 sample_user = UserReadModel(
@@ -22,6 +32,17 @@ sample_user = UserReadModel(
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_auth_principal_cache():
+    AUTH_PRINCIPAL_CACHE.clear()
+    VERIFIED_TOKEN_CACHE.clear()
+    REVOCATION_LIST.clear()
+    yield
+    AUTH_PRINCIPAL_CACHE.clear()
+    VERIFIED_TOKEN_CACHE.clear()
+    REVOCATION_LIST.clear()
+
+
 def test_sign_jwt_contains_access_and_refresh_tokens():
     jwt_manager = JWTManager()
     tokens = jwt_manager.sign_jwt(sample_user)
@@ -44,7 +65,7 @@ def test_decode_valid_access_token_returns_version():
     tokens = jwt_manager.sign_jwt(sample_user, refresh_token_version=7)
     user, refresh_token_version = jwt_manager.decode_access_token(tokens.access_token)
 
-    assert user.email == sample_user.email
+    assert user.id == sample_user.id
     assert refresh_token_version == 7
 
 
@@ -53,7 +74,7 @@ def test_decode_valid_refresh_token():
     tokens = jwt_manager.sign_jwt(sample_user, refresh_token_version=3)
     user, refresh_token_version = jwt_manager.decode_refresh_token(tokens.refresh_token)
 
-    assert user.email == sample_user.email
+    assert user.id == sample_user.id
     assert refresh_token_version == 3
 
 
@@ -72,7 +93,7 @@ def test_decode_refresh_token_invalid_version_defaults_to_zero():
 
     user, refresh_token_version = jwt_manager.decode_refresh_token(token)
 
-    assert user.email == sample_user.email
+    assert user.id == sample_user.id
     assert refresh_token_version == 0
 
 
@@ -91,10 +112,92 @@ def test_decode_access_token_invalid_version_defaults_to_zero():
 
     user, refresh_token_version = jwt_manager.decode_access_token(token)
 
-    assert user.email == sample_user.email
+    assert user.id == sample_user.id
     assert refresh_token_version == 0
 
 
+def test_sign_jwt_compact_claims_omit_profile(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_COMPACT_CLAIMS", True)
+    jwt_manager = JWTManager()
+    user = sample_user.model_copy(update={"status": "Active", "is_superuser": True})
+
+    tokens = jwt_manager.sign_jwt(user, refresh_token_version=4)
+    claims = jwt.decode(
+        tokens.access_token,
+        jwt_manager.JWT_SECRET,
+        algorithms=[jwt_manager.JWT_ALGORITHM],
+    )
+
+    assert set(claims) == {"sub", "ver", "st", "su", "type", "exp"}
+    assert sample_user.email not in tokens.access_token
+    principal, refresh_token_version = jwt_manager.decode_access_token(
+        tokens.access_token
+    )
+    assert principal.id == sample_user.id
+    assert principal.status == "Active"
+    assert principal.is_superuser is True
+    assert refresh_token_version == 4
+    refresh_principal, _ = jwt_manager.decode_refresh_token(tokens.refresh_token)
+    assert refresh_principal.id == sample_user.id
+
+
+def test_decode_token_rejects_compact_token_without_profile(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_COMPACT_CLAIMS", True)
+    jwt_manager = JWTManager()
+    tokens = jwt_manager.sign_jwt(sample_user)
+
+    with pytest.raises(AppError) as e:
+        jwt_manager.decode_token(tokens.access_token)
+
+    assert e.value.status_code == status.HTTP_403_FORBIDDEN
+    assert e.value.detail["message"] == SecurityResponseMessages.MISSING_USER_DATA.value
+
+
+def test_decode_access_token_rejects_malformed_subject():
+    jwt_manager = JWTManager()
+    token = jwt.encode(
+        {
+            "sub": "not-a-uuid",
+            "type": "access",
+            "exp": datetime.now(timezone.utc) + timedelta(minutes=5),
+        },
+        jwt_manager.JWT_SECRET,
+        algorithm=jwt_manager.JWT_ALGORITHM,
+    )
+
+    with pytest.raises(AppError) as e:
+        jwt_manager.decode_access_token(token)
+
+    assert e.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_token_cache_skips_repeat_verification(monkeypatch):
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=60)
+    jwt_manager = JWTManager(token_cache=cache)
+    token = jwt_manager.sign_jwt(sample_user).access_token
+    calls = []
+    real_decode = jwt_security.jwt.decode
+
+    def _counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr("app.api.security.jwt.jwt.decode", _counting_decode)
+
+    first, _ = jwt_manager.decode_access_token(token)
+    second, _ = JWTManager(token_cache=cache).decode_access_token(token)
+
+    assert first == second
+    assert calls == [token]
+
+    monkeypatch.setattr(settings, "JWT_SECRET", "rotated-secret-with-at-least-32-bytes")
+    with pytest.raises(AppError) as e:
+        JWTManager(token_cache=cache).decode_access_token(token)
+
+    assert e.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert len(cache) == 0
+
+
 def test_decode_token_missing_user_data():
     jwt_manager = JWTManager()
     token = jwt.encode(
@@ -258,12 +361,11 @@ def test_get_current_user_from_jwt_token_returns_decoded_user(monkeypatch):
         lambda self, token: (sample_user, 2),
     )
     monkeypatch.setattr(
-        "app.api.security.jwt.UserRepository.get_user_by_id",
-        lambda self, user_id: sample_user.model_copy(update={"status": "Active"}),
-    )
-    monkeypatch.setattr(
-        "app.api.security.jwt.UserRepository.get_refresh_token_version",
-        lambda self, user_id: 2,
+        "app.api.security.jwt.UserRepository.get_auth_principal",
+        lambda self, user_id: AuthPrincipal(
+            user=sample_user.model_copy(update={"status": "Active"}),
+            refresh_token_version=2,
+        ),
     )
     credentials = HTTPAuthorizationCredentials(
         scheme="Bearer", credentials="signed-token"
@@ -325,12 +427,10 @@ def test_get_current_user_from_jwt_token_rejects_inactive_database_user(monkeypa
     )
     inactive_user = sample_user.model_copy(update={"status": "Suspended"})
     monkeypatch.setattr(
-        "app.api.security.jwt.UserRepository.get_user_by_id",
-        lambda self, user_id: inactive_user,
-    )
-    monkeypatch.setattr(
-        "app.api.security.jwt.UserRepository.get_refresh_token_version",
-        lambda self, user_id: 3,
+        "app.api.security.jwt.UserRepository.get_auth_principal",
+        lambda self, user_id: AuthPrincipal(
+            user=inactive_user, refresh_token_version=3
+        ),
     )
     credentials = HTTPAuthorizationCredentials(
         scheme="Bearer", credentials="signed-token"
@@ -342,3 +442,182 @@ def test_get_current_user_from_jwt_token_rejects_inactive_database_user(monkeypa
         )
 
     assert e.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_current_user_from_jwt_token_runs_lookup_off_event_loop(monkeypatch):
+    lookup_threads = []
+
+    def _lookup(self, user_id):
+        lookup_threads.append(threading.get_ident())
+        return AuthPrincipal(
+            user=sample_user.model_copy(update={"status": "Active"}),
+            refresh_token_version=0,
+        )
+
+    monkeypatch.setattr(
+        "app.api.security.jwt.JWTManager.decode_access_token",
+        lambda self, token: (sample_user, 0),
+    )
+    monkeypatch.setattr(
+        "app.api.security.jwt.UserRepository.get_auth_principal", _lookup
+    )
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials="signed-token"
+    )
+
+    async def _authenticate():
+        loop_thread = threading.get_ident()
+        user = await get_current_user_from_jwt_token(
+            session=object(), credentials=credentials
+        )
+        return loop_thread, user
+
+    loop_thread, current_user = asyncio.run(_authenticate())
+
+    assert current_user.email == sample_user.email
+    assert lookup_threads and lookup_threads[0] != loop_thread
+
+
+def test_auth_limiter_is_sized_from_settings_and_reused(monkeypatch):
+    monkeypatch.setattr(jwt_security, "_auth_limiter", None)
+    monkeypatch.setattr(settings, "AUTH_THREAD_LIMIT", 3)
+
+    limiter = jwt_security._get_auth_limiter()
+
+    assert limiter.total_tokens == 3
+    assert jwt_security._get_auth_limiter() is limiter
+
+
+def _active_principal(version: int) -> AuthPrincipal:
+    return AuthPrincipal(
+        user=sample_user.model_copy(update={"status": "Active"}),
+        refresh_token_version=version,
+    )
+
+
+def test_get_current_user_from_jwt_token_serves_cached_principal(monkeypatch):
+    lookups = []
+
+    def _lookup(self, user_id):
+        lookups.append(user_id)
+        return _active_principal(4)
+
+    monkeypatch.setattr(
+        "app.api.security.jwt.JWTManager.decode_access_token",
+        lambda self, token: (sample_user, 4),
+    )
+    monkeypatch.setattr(
+        "app.api.security.jwt.UserRepository.get_auth_principal", _lookup
+    )
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials="signed-token"
+    )
+
+    for _ in range(3):
+        asyncio.run(
+            get_current_user_from_jwt_token(session=object(), credentials=credentials)
+        )
+
+    assert lookups == [sample_user.id]
+
+
+def test_get_current_user_from_jwt_token_reloads_on_newer_token_version(monkeypatch):
+    versions = iter([1, 2])
+    token_versions = iter([1, 2])
+    monkeypatch.setattr(
+        "app.api.security.jwt.JWTManager.decode_access_token",
+        lambda self, token: (sample_user, next(token_versions)),
+    )
+    monkeypatch.setattr(
+        "app.api.security.jwt.UserRepository.get_auth_principal",
+        lambda self, user_id: _active_principal(next(versions)),
+    )
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials="signed-token"
+    )
+
+    for _ in range(2):
+        current_user = asyncio.run(
+            get_current_user_from_jwt_token(session=object(), credentials=credentials)
+        )
+
+    assert current_user.email == sample_user.email
+
+
+@pytest.fixture
+def stateless_verification(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", True)
+    lookups = []
+
+    def _lookup(self, user_id):
+        lookups.append(user_id)
+        return _active_principal(3)
+
+    monkeypatch.setattr(
+        "app.api.security.jwt.UserRepository.get_auth_principal", _lookup
+    )
+    REVOCATION_LIST.rebuild([])
+    return lookups
+
+
+def _authenticate(token: str) -> UserReadModel:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return asyncio.run(
+        get_current_user_from_jwt_token(session=object(), credentials=credentials)
+    )
+
+
+def test_stateless_verification_trusts_cleared_token(stateless_verification):
+    active_user = sample_user.model_copy(update={"status": "Active"})
+    tokens = JWTManager().sign_jwt(active_user, refresh_token_version=3)
+
+    current_user = _authenticate(tokens.access_token)
+
+    assert current_user == active_user
+    assert stateless_verification == []
+
+
+def test_stateless_verification_rejects_revoked_version(stateless_verification):
+    active_user = sample_user.model_copy(update={"status": "Active"})
+    tokens = JWTManager().sign_jwt(active_user, refresh_token_version=2)
+    REVOCATION_LIST.add(active_user.id, 2)
+
+    with pytest.raises(AppError) as e:
+        _authenticate(tokens.access_token)
+
+    assert e.value.status_code == status.HTTP_401_UNAUTHORIZED
+    assert stateless_verification == []
+
+
+def test_stateless_verification_falls_back_when_list_is_uncertain(
+    stateless_verification,
+):
+    active_user = sample_user.model_copy(update={"status": "Active"})
+    tokens = JWTManager().sign_jwt(active_user, refresh_token_version=3)
+    REVOCATION_LIST.rebuild([(active_user.id, 3)])
+
+    _authenticate(tokens.access_token)
+    REVOCATION_LIST.clear()
+    AUTH_PRINCIPAL_CACHE.clear()
+    _authenticate(tokens.access_token)
+
+    assert stateless_verification == [active_user.id, active_user.id]
+
+
+def test_stateless_verification_checks_compact_tokens_and_statuses(
+    monkeypatch, stateless_verification
+):
+    monkeypatch.setattr(settings, "JWT_COMPACT_CLAIMS", True)
+    active_user = sample_user.model_copy(update={"status": "Active"})
+    compact = JWTManager().sign_jwt(active_user, refresh_token_version=3)
+    monkeypatch.setattr(settings, "JWT_COMPACT_CLAIMS", False)
+    awaiting = JWTManager().sign_jwt(
+        sample_user.model_copy(update={"status": "Awaiting Verification"}),
+        refresh_token_version=3,
+    )
+    monkeypatch.setattr(settings, "REQUIRE_EMAIL_VERIFICATION", True)
+
+    assert _authenticate(compact.access_token).status == "Active"
+    AUTH_PRINCIPAL_CACHE.clear()
+    assert _authenticate(awaiting.access_token).status == "Active"
+    assert stateless_verification == [active_user.id, active_user.id]
@@ -0,0 +1,155 @@
+from datetime import timedelta
+from uuid import uuid4
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from fastapi import status
+
+from app.api.security.jwt import JWTManager
+from app.api.security.keyring import JWTKeyring, get_keyring
+from app.api.security.verifier import OfflineTokenVerifier
+from app.configs import settings
+from app.models.user.user import UserReadModel
+from app.utils.app_error import AppError
+
+sample_user = UserReadModel(
+    id=uuid4(),
+    first_name="Key",
+    last_name="Ring",
+    email="keyring@example.com",
+)
+
+
+def _private_pem(private_key) -> str:
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+def _public_pem(private_key) -> str:
+    return (
+        private_key.public_key()
+        .public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+
+
+@pytest.fixture(scope="module")
+def rsa_keys():
+    return {
+        kid: rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        for kid in ("2026-04", "2026-10")
+    }
+
+
+@pytest.fixture
+def use_rs256(monkeypatch, rsa_keys):
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "RS256")
+    monkeypatch.setattr(
+        settings, "JWT_PRIVATE_KEYS", {"2026-10": _private_pem(rsa_keys["2026-10"])}
+    )
+    monkeypatch.setattr(
+        settings, "JWT_PUBLIC_KEYS", {"2026-04": _public_pem(rsa_keys["2026-04"])}
+    )
+    monkeypatch.setattr(settings, "JWT_ACTIVE_KEY_ID", "2026-10")
+    return rsa_keys
+
+
+def test_hmac_keyring_signs_with_secret_and_publishes_no_keys():
+    keyring = get_keyring()
+
+    assert not keyring.is_asymmetric
+    assert keyring.signing_key == settings.JWT_SECRET
+    assert keyring.headers is None
+    assert keyring.jwks() == {"keys": []}
+
+
+def test_rs256_tokens_carry_active_kid_and_round_trip(use_rs256):
+    manager = JWTManager()
+    tokens = manager.sign_jwt(sample_user, refresh_token_version=3)
+
+    assert jwt.get_unverified_header(tokens.access_token)["kid"] == "2026-10"
+    user, version = manager.decode_access_token(tokens.access_token)
+    assert user.id == sample_user.id
+    assert version == 3
+
+
+def test_rs256_accepts_tokens_signed_by_retired_public_key(use_rs256):
+    token = jwt.encode(
+        {"user": sample_user.model_dump(mode="json"), "type": "access"},
+        use_rs256["2026-04"],
+        algorithm="RS256",
+        headers={"kid": "2026-04"},
+    )
+
+    assert JWTManager().decode_token(token).id == sample_user.id
+
+
+def test_rs256_rejects_unknown_kid(use_rs256):
+    token = jwt.encode(
+        {"user": sample_user.model_dump(mode="json"), "type": "access"},
+        use_rs256["2026-10"],
+        algorithm="RS256",
+        headers={"kid": "unknown"},
+    )
+
+    with pytest.raises(AppError) as exc:
+        JWTManager().decode_token(token)
+
+    assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_rs256_verification_tokens_round_trip(use_rs256):
+    manager = JWTManager()
+    token = manager.sign_payload(
+        {"type": "verification", "email": sample_user.email},
+        expires_delta=timedelta(minutes=5),
+    )
+
+    assert manager.decode_verification_token(token)["email"] == sample_user.email
+
+
+def test_rs256_jwks_lists_every_verification_key(use_rs256):
+    jwks = get_keyring().jwks()
+
+    assert sorted(key["kid"] for key in jwks["keys"]) == ["2026-04", "2026-10"]
+    assert all(key["kty"] == "RSA" and key["alg"] == "RS256" for key in jwks["keys"])
+    assert all("d" not in key for key in jwks["keys"])
+
+
+def test_keyring_defaults_active_kid_and_reads_pem_files(monkeypatch, tmp_path):
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    key_path = tmp_path / "signing.pem"
+    key_path.write_text(_private_pem(private_key))
+    monkeypatch.setattr(settings, "JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setattr(settings, "JWT_PRIVATE_KEYS", {"ed": str(key_path)})
+    monkeypatch.setattr(settings, "JWT_PUBLIC_KEYS", {})
+    monkeypatch.setattr(settings, "JWT_ACTIVE_KEY_ID", None)
+
+    keyring = JWTKeyring.from_settings()
+    manager = JWTManager()
+    token = manager.sign_jwt(sample_user).access_token
+
+    assert keyring.active_kid == "ed"
+    assert keyring.jwks()["keys"][0]["kty"] == "OKP"
+    assert manager.decode_token(token).id == sample_user.id
+
+
+def test_offline_verifier_checks_tokens_against_published_jwks(monkeypatch, use_rs256):
+    jwks = get_keyring().jwks()
+    monkeypatch.setattr(jwt.PyJWKClient, "fetch_data", lambda self: jwks)
+    verifier = OfflineTokenVerifier("https://userverse.example.com/jwks.json")
+    tokens = JWTManager().sign_jwt(sample_user)
+
+    claims = verifier.verify(tokens.access_token)
+
+    assert claims["user"]["id"] == str(sample_user.id)
+    with pytest.raises(jwt.InvalidTokenError, match="Expected token type"):
+        verifier.verify(tokens.refresh_token)
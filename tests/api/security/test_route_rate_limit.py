@@ -0,0 +1,172 @@
+from uuid import uuid4
+
+import pytest
+from fastapi import status
+from starlette.requests import Request
+
+from app.api.dependencies import rate_limit
+from app.api.dependencies.rate_limit import (
+    ROUTE_RATE_LIMITS,
+    RateLimitKey,
+    RateLimitPolicy,
+    RouteRateLimit,
+    reset_route_rate_limits,
+    validate_route_rate_limits,
+)
+from app.api.security.jwt import JWTManager
+from app.configs import settings
+from app.models.user.user import UserReadModel
+from app.utils.app_error import AppError
+from app.utils.rate_limit_backends import SharedMemoryRateLimitBackend
+from tests.utils.basic_auth import get_basic_auth_header
+
+
+def _request(headers: dict | None = None, client=("203.0.113.7", 1234)) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+            "client": client,
+        }
+    )
+
+
+@pytest.fixture
+def route_limit(monkeypatch):
+    monkeypatch.setattr(settings, "ROUTE_RATE_LIMITS_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMIT_ALGORITHM", "sliding_window")
+    monkeypatch.setattr(rate_limit, "ROUTE_RATE_LIMITS", [])
+
+    def _build(key: RateLimitKey, limit: int = 1) -> RouteRateLimit:
+        return RouteRateLimit(
+            f"test_{uuid4().hex}",
+            RateLimitPolicy(key, limit=limit, window_seconds=60),
+        )
+
+    yield _build
+    reset_route_rate_limits()
+
+
+def test_ip_policy_rejects_with_retry_after(route_limit):
+    limit = route_limit(RateLimitKey.IP)
+    limit(_request())
+    limit(_request(client=("198.51.100.1", 1)))
+
+    with pytest.raises(AppError) as exc_info:
+        limit(_request())
+
+    assert exc_info.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert exc_info.value.headers == {"Retry-After": "60"}
+    assert rate_limit.ROUTE_RATE_LIMITS == [limit]
+    limit.reset()
+    limit(_request())
+
+
+def test_email_policy_reads_basic_credentials_case_insensitively(route_limit):
+    limit = route_limit(RateLimitKey.EMAIL)
+    limit(_request(get_basic_auth_header("User@Example.com", "secret")))
+
+    with pytest.raises(AppError):
+        limit(_request(get_basic_auth_header("user@example.com", "other")))
+    # Missing or malformed credentials are left to the auth dependency.
+    limit(_request())
+    limit(_request({"Authorization": "Basic abc"}))
+    limit(_request({"Authorization": "Bearer token"}))
+
+
+def test_user_policy_keys_on_the_verified_token_subject(route_limit):
+    limit = route_limit(RateLimitKey.USER)
+    user = UserReadModel(
+        id=uuid4(),
+        first_name="Rate",
+        last_name="Limited",
+        email="rate.limited@example.com",
+        phone_number="1234567890",
+    )
+    tokens = JWTManager().sign_jwt(user, refresh_token_version=0)
+    headers = {"Authorization": f"Bearer {tokens.access_token}"}
+    limit(_request(headers))
+
+    with pytest.raises(AppError):
+        limit(_request(headers))
+    limit(_request({"Authorization": "Bearer not-a-token"}))
+    limit(_request())
+
+
+def test_api_token_policy_hashes_the_presented_token(route_limit):
+    limit = route_limit(RateLimitKey.API_TOKEN)
+    limit(_request({"X-API-Key": "key-one"}))
+    limit(_request({"Authorization": "Bearer key-two"}))
+
+    with pytest.raises(AppError):
+        limit(_request({"Authorization": "Bearer key-one"}))
+    limit(_request())
+
+
+def test_route_limits_can_be_disabled(route_limit, monkeypatch):
+    limit = route_limit(RateLimitKey.IP)
+    limit(_request(client=None))
+    monkeypatch.setattr(settings, "ROUTE_RATE_LIMITS_ENABLED", False)
+
+    limit(_request(client=None))
+
+
+def test_declared_route_limits_are_registered():
+    names = {route_limit.name for route_limit in ROUTE_RATE_LIMITS}
+
+    assert {
+        "user_login",
+        "user_create",
+        "token_refresh",
+        "company_membership",
+    } <= names
+
+
+def test_every_registered_policy_fits_the_shared_memory_backend(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "shared_memory")
+    monkeypatch.setattr(settings, "RATE_LIMIT_ALGORITHM", "sliding_window")
+    validate_route_rate_limits()
+    backend = SharedMemoryRateLimitBackend(
+        str(tmp_path / "route-limits"),
+        slots=64,
+        capacity=settings.RATE_LIMIT_SHARED_MEMORY_CAPACITY,
+    )
+    try:
+        for route_limit in ROUTE_RATE_LIMITS:
+            for policy, _ in route_limit._limiters:
+                namespace = f"{route_limit.name}:{policy.key.value}"
+                window = policy.window_seconds
+                for hit in range(policy.limit):
+                    assert (
+                        backend.hit(
+                            namespace,
+                            "k",
+                            limit=policy.limit,
+                            window_seconds=window,
+                            now=1.0 + hit / 1000,
+                        )
+                        is None
+                    )
+                assert backend.hit(
+                    namespace, "k", limit=policy.limit, window_seconds=window, now=2.0
+                ) == pytest.approx(window - 1.0)
+    finally:
+        backend.close()
+
+
+def test_startup_rejects_limits_beyond_the_shared_memory_capacity(
+    route_limit, monkeypatch
+):
+    route_limit(RateLimitKey.IP, limit=3)
+    monkeypatch.setattr(settings, "RATE_LIMIT_SHARED_MEMORY_CAPACITY", 2)
+    validate_route_rate_limits()
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "shared_memory")
+    with pytest.raises(RuntimeError, match="RATE_LIMIT_SHARED_MEMORY_CAPACITY=2"):
+        validate_route_rate_limits()
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_ALGORITHM", "gcra")
+    validate_route_rate_limits()
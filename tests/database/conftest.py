@@ -6,6 +6,17 @@ from sqlalchemy.orm import sessionmaker
 
 from app.repository.database import Base
 from app.repository.database import tables as database_tables  # noqa: F401
+from app.repository.default_catalog import DEFAULT_ROLE_CATALOG
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_company_permission_cache():
+    COMPANY_PERMISSION_CACHE.clear()
+    DEFAULT_ROLE_CATALOG.reset()
+    yield
+    COMPANY_PERMISSION_CACHE.clear()
+    DEFAULT_ROLE_CATALOG.reset()
 
 
 @pytest.fixture
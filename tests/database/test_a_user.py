@@ -1,10 +1,14 @@
+from uuid import uuid4
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 from app.repository.database.tables import User
 from app.repository.database.base_model import RecordNotFoundError
 from app.models.user.response_messages import UserResponseMessages
 from app.repository.user import UserRepository
 from app.utils.app_error import AppError
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE
 
 
 def test_create_user(test_session, test_user_data):
@@ -148,25 +152,18 @@ def test_get_refresh_token_version_raises_when_user_missing(test_session):
     assert exc_info.value.detail["message"] == UserResponseMessages.USER_NOT_FOUND.value
 
 
-def test_get_refresh_token_version_defaults_to_zero_for_invalid_metadata(
+def test_get_refresh_token_version_defaults_to_zero_for_new_user(
     test_session, test_user_data
 ):
-    user_data = test_user_data["create_user"] | {"email": "refresh-invalid@example.com"}
+    user_data = test_user_data["create_user"] | {"email": "refresh-new@example.com"}
     created_user = User.create(test_session, **user_data)
-    User.update_json_field(
-        test_session,
-        created_user["id"],
-        "primary_meta_data",
-        UserRepository.REFRESH_TOKEN_VERSION_KEY,
-        "not-a-number",
-    )
 
     version = UserRepository(test_session).get_refresh_token_version(created_user["id"])
 
     assert version == 0
 
 
-def test_increment_refresh_token_version_updates_metadata(test_session, test_user_data):
+def test_increment_refresh_token_version_updates_column(test_session, test_user_data):
     user_data = test_user_data["create_user"] | {
         "email": "refresh-increment@example.com"
     }
@@ -176,7 +173,135 @@ def test_increment_refresh_token_version_updates_metadata(test_session, test_use
     version = repository.increment_refresh_token_version(created_user["id"])
 
     assert version == 1
+    assert repository.increment_refresh_token_version(created_user["id"]) == 2
     updated_user = User.get_by_id(test_session, created_user["id"])
-    assert (
-        updated_user["primary_meta_data"][UserRepository.REFRESH_TOKEN_VERSION_KEY] == 1
+    assert updated_user["refresh_token_version"] == 2
+    assert "refresh_token_version" not in (updated_user["primary_meta_data"] or {})
+
+
+@pytest.mark.parametrize("update_returning", [True, False])
+def test_increment_refresh_token_version_with_and_without_returning(
+    test_session, test_user_data, monkeypatch, update_returning
+):
+    user_data = test_user_data["create_user"] | {"email": "refresh-dialect@example.com"}
+    created_user = User.create(test_session, **user_data)
+    repository = UserRepository(test_session)
+    monkeypatch.setattr(
+        test_session.get_bind().dialect, "update_returning", update_returning
     )
+
+    assert repository.increment_refresh_token_version(created_user["id"]) == 1
+    with pytest.raises(AppError) as exc_info:
+        repository.increment_refresh_token_version(uuid4())
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail["message"] == UserResponseMessages.USER_NOT_FOUND.value
+
+
+def test_get_auth_principal_loads_user_and_version(test_session, test_user_data):
+    user_data = test_user_data["create_user"] | {"email": "principal@example.com"}
+    created_user = User.create(test_session, **user_data)
+    repository = UserRepository(test_session)
+    repository.increment_refresh_token_version(created_user["id"])
+
+    principal = repository.get_auth_principal(created_user["id"])
+
+    assert principal.user.email == "principal@example.com"
+    assert principal.refresh_token_version == 1
+
+
+def test_get_auth_principal_raises_when_user_missing(test_session):
+    with pytest.raises(AppError) as exc_info:
+        UserRepository(test_session).get_auth_principal(uuid4())
+
+    assert exc_info.value.status_code == 404
+
+
+def test_get_auth_principals_loads_active_users_in_one_query(
+    test_session, test_user_data
+):
+    repository = UserRepository(test_session)
+    first = User.create(
+        test_session, **(test_user_data["create_user"] | {"email": "bulk1@example.com"})
+    )
+    second = User.create(
+        test_session, **(test_user_data["create_user"] | {"email": "bulk2@example.com"})
+    )
+    repository.delete_user(second["id"])
+    statements = []
+
+    def _record(*args):
+        statements.append(args[2])
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        principals = repository.get_auth_principals(
+            [first["id"], second["id"], uuid4()]
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert list(principals) == [first["id"]]
+    assert principals[first["id"]].user.email == "bulk1@example.com"
+    assert len(statements) == 1
+    assert repository.get_auth_principals([]) == {}
+
+
+def test_user_writes_invalidate_cached_principal(test_session, test_user_data):
+    user_data = test_user_data["create_user"] | {"email": "invalidate@example.com"}
+    created_user = User.create(test_session, **user_data)
+    repository = UserRepository(test_session)
+    user_id = created_user["id"]
+
+    def _cache_principal():
+        AUTH_PRINCIPAL_CACHE.set(repository.get_auth_principal(user_id))
+        version = repository.get_refresh_token_version(user_id)
+        assert AUTH_PRINCIPAL_CACHE.get(user_id, refresh_token_version=version)
+
+    writes = (
+        lambda: repository.update_user(user_id, {"first_name": "Changed"}),
+        lambda: repository.update_user_status(user_id, "Suspended"),
+        lambda: repository.increment_refresh_token_version(user_id),
+        lambda: repository.delete_user(user_id),
+    )
+    try:
+        for write in writes:
+            _cache_principal()
+            write()
+            assert len(AUTH_PRINCIPAL_CACHE) == 0
+    finally:
+        AUTH_PRINCIPAL_CACHE.clear()
+
+
+def test_get_user_by_id_raises_when_user_missing(test_session):
+    with pytest.raises(AppError) as exc_info:
+        UserRepository(test_session).get_user_by_id(uuid4())
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail["message"] == UserResponseMessages.USER_NOT_FOUND.value
+
+
+def test_login_rehashes_passwords_made_with_another_cost(
+    test_session, test_user_data, monkeypatch
+):
+    from app.configs import settings
+    from app.utils.hash_password import hash_password, verify_password
+
+    repository = UserRepository(test_session)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ROUNDS", 5)
+    user_data = test_user_data["create_user"] | {
+        "email": "rehash-cost@example.com",
+        "password": hash_password("securepassword"),
+    }
+    user = repository.create_user(user_data)
+    stored = test_session.get(User, user.id).password
+
+    repository.get_user_by_email(user_data["email"], "securepassword")
+    assert test_session.get(User, user.id).password == stored
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ROUNDS", 4)
+    repository.get_user_by_email(user_data["email"], "securepassword")
+    rehashed = test_session.get(User, user.id).password
+    assert rehashed.startswith("$2b$04$")
+    assert verify_password("securepassword", rehashed)
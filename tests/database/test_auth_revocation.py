@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta, timezone
+
+import anyio
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.configs import settings
+from app.models.user.account_status import UserAccountStatus
+from app.repository.auth_revocation import AuthRevocationRepository
+from app.repository.database.tables import AuthRevocation
+from app.repository.user import UserRepository
+from app.services.revocation_sync import RevocationListSynchronizer
+from app.utils.revocation_list import (
+    REVOCATION_LIST,
+    RevocationList,
+    RevocationStatus,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_revocation_list(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", True)
+    REVOCATION_LIST.clear()
+    yield
+    REVOCATION_LIST.clear()
+
+
+def _create_user(test_session, test_user_data, email: str):
+    user_data = test_user_data["create_user"] | {"email": email}
+    return UserRepository(test_session).create_user(user_data)
+
+
+def _revocations(test_session):
+    return {
+        (row.user_id, row.refresh_token_version, row.reason)
+        for row in test_session.query(AuthRevocation)
+    }
+
+
+def test_user_writes_record_revocations(test_session, test_user_data):
+    repository = UserRepository(test_session)
+    user = _create_user(test_session, test_user_data, "revoke-writes@example.com")
+    assert _revocations(test_session) == set()
+    REVOCATION_LIST.rebuild([])
+
+    repository.increment_refresh_token_version(user.id)
+    repository.update_user_status(user.id, UserAccountStatus.ACTIVE.name_value)
+    repository.update_user_status(user.id, UserAccountStatus.SUSPENDED.name_value)
+    repository.update_user_status(user.id, UserAccountStatus.SUSPENDED.name_value)
+    repository.delete_user(user.id)
+
+    assert _revocations(test_session) == {
+        (user.id, 0, "version_bump"),
+        (user.id, 1, "status_change"),
+        (user.id, 1, "user_deleted"),
+    }
+    assert REVOCATION_LIST.lookup(user.id, 0) is RevocationStatus.REVOKED
+    assert REVOCATION_LIST.lookup(user.id, 1) is RevocationStatus.REVOKED
+
+
+def test_revocations_are_not_recorded_without_stateless_mode(
+    test_session, test_user_data, monkeypatch
+):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", False)
+    repository = UserRepository(test_session)
+    user = _create_user(test_session, test_user_data, "revoke-off@example.com")
+
+    repository.increment_refresh_token_version(user.id)
+    repository.delete_user(user.id)
+
+    assert _revocations(test_session) == set()
+
+
+def test_revocations_expire_with_access_tokens(test_session, test_user_data):
+    user = _create_user(test_session, test_user_data, "revoke-expiry@example.com")
+    repository = AuthRevocationRepository(test_session)
+    expired = repository.record(user.id, 0, reason="version_bump")
+    expired.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    old = repository.record(user.id, 1, reason="version_bump")
+    old._created_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    repository.record(user.id, 2, reason="version_bump")
+    test_session.commit()
+
+    assert sorted(repository.live_pairs()) == [(user.id, 1), (user.id, 2)]
+    since = datetime.now(timezone.utc) - timedelta(minutes=1)
+    assert repository.live_pairs(since=since) == [(user.id, 2)]
+
+
+def test_purge_expired_deletes_expired_rows_in_batches(test_session, test_user_data):
+    user = _create_user(test_session, test_user_data, "revoke-purge@example.com")
+    repository = AuthRevocationRepository(test_session)
+    for version in range(5):
+        expired = repository.record(user.id, version, reason="version_bump")
+        expired.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    repository.record(user.id, 5, reason="version_bump")
+    test_session.commit()
+
+    assert repository.purge_expired(batch_size=2) == 5
+    assert _revocations(test_session) == {(user.id, 5, "version_bump")}
+    assert repository.purge_expired() == 0
+
+
+def test_synchronizer_rebuilds_then_merges_recent_rows(test_session, test_user_data):
+    user = _create_user(test_session, test_user_data, "revoke-sync@example.com")
+    repository = AuthRevocationRepository(test_session)
+    repository.record(user.id, 0, reason="version_bump")
+    test_session.commit()
+    revocations = RevocationList(sync_seconds=5, rebuild_seconds=300)
+    synchronizer = RevocationListSynchronizer(
+        revocations, sessionmaker(bind=test_session.get_bind())
+    )
+
+    expired = repository.record(user.id, 9, reason="version_bump")
+    expired.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    test_session.commit()
+
+    synchronizer.sync_once()
+    assert revocations.lookup(user.id, 0) is RevocationStatus.UNKNOWN
+    assert (user.id, 9, "version_bump") not in _revocations(test_session)
+
+    repository.record(user.id, 1, reason="status_change")
+    test_session.commit()
+    synchronizer.sync_once()
+    assert revocations.lookup(user.id, 1) is RevocationStatus.REVOKED
+
+
+def test_synchronizer_run_survives_sync_failures(monkeypatch):
+    revocations = RevocationList(sync_seconds=0, rebuild_seconds=300)
+    synchronizer = RevocationListSynchronizer(revocations, lambda: None)
+    calls = []
+
+    def _sync_once():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(synchronizer, "sync_once", _sync_once)
+
+    async def _run():
+        with anyio.move_on_after(0.2):
+            await synchronizer.run()
+
+    anyio.run(_run)
+    assert len(calls) >= 2
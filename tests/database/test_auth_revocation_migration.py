@@ -0,0 +1,55 @@
+import importlib.util
+from pathlib import Path
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import (
+    Column,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    create_engine,
+    inspect,
+)
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2] / "alembic/versions/5b1d9c3e7a20_add_auth_revocation.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location(
+        "add_auth_revocation_migration",
+        MIGRATION_PATH,
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_auth_revocation_migration_upgrade_and_downgrade():
+    engine = create_engine("sqlite:///:memory:")
+    metadata = MetaData()
+    Table(
+        "user",
+        metadata,
+        Column("id", Uuid(), primary_key=True),
+        Column("email", String(255), nullable=False),
+    )
+    metadata.create_all(engine)
+    migration = _load_migration()
+
+    with engine.begin() as connection:
+        migration.op = Operations(MigrationContext.configure(connection))
+        migration.upgrade()
+
+        inspector = inspect(connection)
+        assert "auth_revocation" in inspector.get_table_names()
+        assert {
+            index["name"] for index in inspector.get_indexes("auth_revocation")
+        } == {"ix_auth_revocation_created", "ix_auth_revocation_expires"}
+
+        migration.downgrade()
+        assert set(inspect(connection).get_table_names()) == {"user"}
@@ -89,6 +89,8 @@ def test_get_all_uses_page_based_pagination(test_session):
         "limit": 2,
         "current_page": 2,
         "total_pages": 2,
+        "next_cursor": None,
+        "total_is_estimate": False,
     }
     assert len(result["records"]) == 1
     assert result["records"][0]["email"] == "page-three@example.com"
@@ -0,0 +1,27 @@
+from click.testing import CliRunner
+
+from app.cli.admin import cli
+
+runner = CliRunner()
+
+
+def test_bench_hash_recommends_the_slowest_cost_within_target(monkeypatch):
+    monkeypatch.setattr(
+        "app.cli.admin.calibrate_rounds",
+        lambda target_ms: [(4, 1.5), (5, 3.0), (6, 6.0), (7, 12.0)],
+    )
+
+    result = runner.invoke(cli, ["bench-hash", "--target-ms", "10"])
+
+    assert result.exit_code == 0
+    assert "rounds=6       6.0 ms" in result.output
+    assert result.output.rstrip().endswith("PASSWORD_HASH_ROUNDS=6")
+
+
+def test_bench_hash_fails_when_no_cost_meets_the_target(monkeypatch):
+    monkeypatch.setattr("app.cli.admin.calibrate_rounds", lambda target_ms: [(4, 2.0)])
+
+    result = runner.invoke(cli, ["bench-hash", "--target-ms", "1"])
+
+    assert result.exit_code == 1
+    assert "cheapest cost takes longer than 1 ms" in result.output
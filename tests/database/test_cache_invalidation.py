@@ -0,0 +1,283 @@
+import socket
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import anyio
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.configs import settings
+from app.models.user.user import UserReadModel
+from app.repository.cache_generation import (
+    CACHE_GENERATION_CHANNEL,
+    CACHE_PARTITIONS,
+    CacheGenerationRepository,
+    CacheScope,
+    cache_partition,
+    parse_generation_key,
+)
+from app.repository.database.tables import (
+    Company,
+    CompanyRole,
+    GlobalPermission,
+    Role,
+    RoleGlobalPermission,
+)
+from app.repository.effective_permission import EffectivePermissionRepository
+from app.repository.user import UserRepository
+from app.services.cache_invalidation import DEFAULT_SUBSCRIBERS, CacheInvalidationBus
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE, AuthPrincipal
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    AUTH_PRINCIPAL_CACHE.clear()
+    COMPANY_PERMISSION_CACHE.clear()
+    yield
+    AUTH_PRINCIPAL_CACHE.clear()
+    COMPANY_PERMISSION_CACHE.clear()
+
+
+def _recording_bus(test_session):
+    events = []
+    bus = CacheInvalidationBus(
+        sessionmaker(bind=test_session.get_bind()), subscribers={}
+    )
+    for scope in CacheScope:
+        bus.subscribe(
+            scope, lambda partition, scope=scope: events.append((scope, partition))
+        )
+    return bus, events
+
+
+def _principal(user_id):
+    return AuthPrincipal(
+        user=UserReadModel(
+            id=user_id,
+            first_name="Cache",
+            last_name="User",
+            email=f"{user_id.hex}@example.com",
+            status="Active",
+            is_superuser=False,
+        ),
+        refresh_token_version=0,
+    )
+
+
+def test_bumps_are_dispatched_once_per_moved_key(test_session):
+    bus, events = _recording_bus(test_session)
+    repository = CacheGenerationRepository(test_session)
+    user_id = uuid4()
+
+    assert bus.poll_once() == len(CacheScope)
+    assert set(events) == {(scope, None) for scope in CacheScope}
+    events.clear()
+
+    repository.bump(CacheScope.USERS, key=user_id)
+    repository.bump(CacheScope.USERS, key=user_id)
+    repository.bump(CacheScope.COMPANY_PERMISSIONS)
+    test_session.commit()
+    assert repository.generations() == {
+        f"users:{cache_partition(user_id)}": 2,
+        "company_permissions": 1,
+    }
+
+    assert bus.poll_once() == 2
+    assert sorted(events, key=str) == sorted(
+        [
+            (CacheScope.USERS, cache_partition(user_id)),
+            (CacheScope.COMPANY_PERMISSIONS, None),
+        ],
+        key=str,
+    )
+    assert bus.poll_once() == 0
+
+    assert parse_generation_key("retired_scope:3") is None
+    assert parse_generation_key("users:bad") is None
+
+
+def test_default_subscribers_drop_only_the_changed_partition(test_session):
+    bus = CacheInvalidationBus(sessionmaker(bind=test_session.get_bind()))
+    bus.poll_once()
+    changed, kept = uuid4(), uuid4()
+    while cache_partition(kept) == cache_partition(changed):
+        kept = uuid4()
+    AUTH_PRINCIPAL_CACHE.set(_principal(changed))
+    AUTH_PRINCIPAL_CACHE.set(_principal(kept))
+    for company_id in (changed, kept):
+        COMPANY_PERMISSION_CACHE.set(
+            uuid4(), company_id, 1, generation=COMPANY_PERMISSION_CACHE.generation
+        )
+
+    CacheGenerationRepository(test_session).bump(CacheScope.USERS, key=changed)
+    test_session.commit()
+    bus.poll_once()
+    assert AUTH_PRINCIPAL_CACHE.get(changed, refresh_token_version=0) is None
+    assert AUTH_PRINCIPAL_CACHE.get(kept, refresh_token_version=0) is not None
+    assert len(COMPANY_PERMISSION_CACHE) == 2
+
+    CacheGenerationRepository(test_session).bump(
+        CacheScope.COMPANY_PERMISSIONS, key=changed
+    )
+    test_session.commit()
+    bus.poll_once()
+    assert len(COMPANY_PERMISSION_CACHE) == 1
+
+    DEFAULT_SUBSCRIBERS[CacheScope.USERS][0](None)
+    DEFAULT_SUBSCRIBERS[CacheScope.COMPANY_PERMISSIONS][0](None)
+    assert len(AUTH_PRINCIPAL_CACHE) == 0
+    assert len(COMPANY_PERMISSION_CACHE) == 0
+
+
+def test_writes_publish_in_their_own_transaction(test_session, test_user_data):
+    repository = CacheGenerationRepository(test_session)
+    user = UserRepository(test_session).create_user(
+        test_user_data["create_user"] | {"email": "cache-bus@example.com"}
+    )
+    key = f"users:{cache_partition(user.id)}"
+    created = repository.generations()[key]
+    # Logins bump the refresh-token version, which cached principals already
+    # check, so they publish nothing.
+    UserRepository(test_session).increment_refresh_token_version(user.id)
+    assert repository.generations() == {key: created}
+    UserRepository(test_session).update_user(user.id, {"first_name": "Renamed"})
+    assert repository.generations() == {key: created + 1}
+
+    new_company, company = (
+        Company(name="New Bus Co", email="new-bus@example.com"),
+        Company(name="Bus Co", email="bus@example.com"),
+    )
+    role = Role(name="Bus Role", description=None)
+    permission = GlobalPermission(name="bus.view")
+    test_session.add_all([new_company, company, role, permission])
+    test_session.flush()
+    test_session.add_all(
+        [
+            CompanyRole(company_id=new_company.id, role_id=role.id),
+            CompanyRole(company_id=company.id, role_id=role.id),
+            RoleGlobalPermission(role_id=role.id, global_permission_id=permission.id),
+        ]
+    )
+    effective = EffectivePermissionRepository(test_session)
+    # A company created in this transaction has nothing cached to drop.
+    assert effective.refresh(company_id=new_company.id, company_created=True).missing
+    test_session.commit()
+    assert not any(
+        key.startswith("company_permissions") for key in repository.generations()
+    )
+
+    effective.refresh(company_id=company.id)
+    test_session.commit()
+    key = f"company_permissions:{cache_partition(company.id)}"
+    assert repository.generations()[key] == 1
+
+    effective.refresh(company_id=company.id)
+    test_session.commit()
+    assert repository.generations()[key] == 1
+
+
+def test_postgres_bumps_notify_listeners():
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.execute.return_value.rowcount = 1
+
+    CacheGenerationRepository(session).bump(CacheScope.COMPANY_PERMISSIONS)
+
+    assert session.execute.call_args.args[1] == {
+        "channel": CACHE_GENERATION_CHANNEL,
+        "key": "company_permissions",
+    }
+    assert CACHE_PARTITIONS == 64
+
+
+def test_bus_run_survives_poll_failures(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_POLL_SECONDS", 0)
+    bus = CacheInvalidationBus(lambda: None, subscribers={})
+    calls = []
+
+    def _poll_once():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(bus, "poll_once", _poll_once)
+
+    async def _run():
+        with anyio.move_on_after(0.2):
+            await bus.run()
+
+    anyio.run(_run)
+    assert len(calls) >= 2
+
+
+class _FakeDriver:
+    def __init__(self, sock):
+        self.sock = sock
+        self.autocommit = False
+        self.executed = []
+        self.notifies = []
+
+    @contextmanager
+    def cursor(self):
+        yield SimpleNamespace(execute=self.executed.append)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def poll(self):
+        self.notifies.extend(self.sock.recv(16))
+
+
+def test_listen_polls_on_notify_and_reconnects(monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_POLL_SECONDS", 0)
+    reader, writer = socket.socketpair()
+    driver = _FakeDriver(reader)
+    connections = []
+
+    def _raw_connection():
+        if not connections:
+            connections.append(None)
+            raise RuntimeError("database unavailable")
+        connection = SimpleNamespace(driver_connection=driver, invalidated=False)
+        connection.invalidate = lambda: setattr(connection, "invalidated", True)
+        connections.append(connection)
+        return connection
+
+    engine = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"), raw_connection=_raw_connection
+    )
+    bus = CacheInvalidationBus(lambda: None, lambda: engine, subscribers={})
+    polled = []
+    monkeypatch.setattr(bus, "poll_once", lambda: polled.append(True))
+
+    async def _run():
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(bus.listen)
+            while len(connections) < 2:
+                await anyio.sleep(0.01)
+            writer.send(b"\x01")
+            with anyio.fail_after(2):
+                while not polled:
+                    await anyio.sleep(0.01)
+            task_group.cancel_scope.cancel()
+
+    try:
+        anyio.run(_run)
+    finally:
+        reader.close()
+        writer.close()
+
+    assert driver.autocommit is True
+    assert driver.executed == [f"LISTEN {CACHE_GENERATION_CHANNEL}"]
+    assert driver.notifies == []
+    assert connections[1].invalidated is True
+
+
+def test_listen_is_a_no_op_without_postgres():
+    engine = SimpleNamespace(dialect=SimpleNamespace(name="sqlite"))
+    bus = CacheInvalidationBus(lambda: None, lambda: engine, subscribers={})
+
+    anyio.run(bus.listen)
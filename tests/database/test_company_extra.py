@@ -1,5 +1,4 @@
 import pytest
-from unittest.mock import Mock
 
 from sqlalchemy import event
 
@@ -196,26 +195,7 @@ def test_company_repository_get_user_companies_uses_fixed_select_count(test_sess
         event.remove(test_session.bind, "before_cursor_execute", record_select)
 
     assert len(result.records) == 3
-    # Count + page + one bulk query per permission scope. The query count stays
-    # constant as company memberships are added.
-    assert len(select_statements) == 4
-
-
-def test_company_repository_ensure_default_roles_updates_description(monkeypatch):
-    session = Mock()
-    repository = CompanyRepository(session)
-    role = Role(name="Owner", description="Old role")
-    query = Mock()
-    query.filter.return_value.one_or_none.side_effect = [role, None, None]
-    session.query.return_value = query
-    session.commit = Mock()
-    monkeypatch.setattr(
-        "app.repository.permission.SystemPermissionRepository.seed_new_default_roles",
-        lambda self, roles, created_role_names: None,
-    )
-
-    default_roles = repository._ensure_default_roles()
-
-    assert role.description == "Full access to manage users and data"
-    assert default_roles["Owner"] is role
-    session.commit.assert_called_once()
+    # The page with its windowed count + one lookup in the materialized
+    # effective permissions. The query count stays constant as company
+    # memberships are added.
+    assert len(select_statements) == 2
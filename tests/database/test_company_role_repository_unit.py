@@ -1,8 +1,10 @@
+from datetime import datetime, timezone
 from types import SimpleNamespace
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from app.models.company.response_messages import CompanyRoleResponseMessages
@@ -15,8 +17,13 @@ from app.models.company.roles import (
 )
 from app.models.user.account_status import UserAccountStatus
 from app.models.user.user import UserReadModel
-from app.repository.company_role import CompanyRoleAssignmentRepository, RoleRepository
-from app.repository.database.tables import Role
+from app.repository.company_role import (
+    CompanyRoleAssignmentRepository,
+    RoleAssignmentProgress,
+    RoleRepository,
+)
+from app.repository.database.tables import Company, CompanyRole, Role
+from app.repository.effective_permission import EffectivePermissionRepository
 from app.utils.app_error import AppError
 
 
@@ -262,6 +269,9 @@ def test_role_repository_update_role_error_paths(monkeypatch):
 
 def test_role_repository_delete_role_branches(monkeypatch):
     deleted_by = _acting_user()
+    monkeypatch.setattr(
+        EffectivePermissionRepository, "refresh", lambda self, **kwargs: None
+    )
 
     with pytest.raises(AppError) as exc_info:
         RoleRepository(session=Mock()).delete_role(
@@ -364,57 +374,96 @@ def test_role_repository_delete_role_branches(monkeypatch):
     )
 
 
-def test_company_role_assignment_assign_role_to_companies_skips_existing_and_adds_new(
-    monkeypatch,
+def test_company_role_assignment_assign_role_to_companies_is_set_based(
+    test_session,
 ):
-    session = Mock()
-    assigned_by = _acting_user()
-    role = _role_obj()
-    company_ids = [str(uuid4()), str(uuid4())]
-    created_assignments: list[tuple[str, str]] = []
-    updated_assignments: list[str] = []
-
-    def _get_assignment(self, role_id):
-        return object() if self.company_id == uuid4_obj else None
-
-    uuid4_obj = uuid4(company_ids[0]) if False else None
+    role = Role(name="Auditor", description="Reads audit trails")
+    companies = [
+        Company(name=f"Bulk {index}", email=f"bulk-{index}@example.com")
+        for index in range(5)
+    ]
+    deleted = companies[4]
+    deleted._closed_at = datetime.now(timezone.utc)
+    test_session.add_all([role, *companies])
+    test_session.flush()
+    already, reopened, fresh, other = (company.id for company in companies[:4])
+    test_session.add_all(
+        [
+            CompanyRole(company_id=already, role_id=role.id),
+            CompanyRole(
+                company_id=reopened,
+                role_id=role.id,
+                _closed_at=datetime.now(timezone.utc),
+            ),
+        ]
+    )
+    test_session.commit()
+    role_id = role.id
 
-    first_company = company_ids[0]
+    statements, reports = [], []
 
-    def _patched_get_assignment(self, role_id):
-        return object() if str(self.company_id) == first_company else None
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
 
-    monkeypatch.setattr(
-        CompanyRoleAssignmentRepository,
-        "get_assignment",
-        _patched_get_assignment,
-    )
-    monkeypatch.setattr(
-        CompanyRoleAssignmentRepository,
-        "create",
-        lambda self, **kwargs: created_assignments.append(
-            (str(kwargs["company_id"]), str(kwargs["role_id"]))
+    requested = [already, reopened, fresh, uuid4(), deleted.id, other, fresh]
+    event.listen(test_session.bind, "before_cursor_execute", _record)
+    try:
+        result = CompanyRoleAssignmentRepository(
+            uuid4(), test_session
+        ).assign_role_to_companies(
+            role=SimpleNamespace(id=role_id),
+            payload=RoleAssignCompaniesModel(
+                company_ids=[str(company_id) for company_id in requested]
+            ),
+            assigned_by=_acting_user(),
+            batch_size=3,
+            progress=reports.append,
         )
-        or SimpleNamespace(),
-    )
-    monkeypatch.setattr(
-        CompanyRoleAssignmentRepository,
-        "update_json_field",
-        lambda self, assignment, **kwargs: updated_assignments.append(
-            str(self.company_id)
-        ),
-    )
-
-    repository = CompanyRoleAssignmentRepository(uuid4(), session)
-    result = repository.assign_role_to_companies(
-        role=role,
-        payload=RoleAssignCompaniesModel(company_ids=company_ids),
-        assigned_by=assigned_by,
+    finally:
+        event.remove(test_session.bind, "before_cursor_execute", _record)
+
+    assert result == {
+        "role_id": str(role_id),
+        "company_ids": [str(reopened), str(fresh), str(other)],
+    }
+    assert reports == [
+        RoleAssignmentProgress(processed=3, total=6, assigned=2),
+        RoleAssignmentProgress(processed=6, total=6, assigned=3),
+    ]
+    writes = [
+        statement.split(" (")[0].split(" SET")[0]
+        for statement in statements
+        if statement.startswith(("INSERT INTO company_role", "UPDATE company_role"))
+    ]
+    assert writes == [
+        "UPDATE company_role",
+        "INSERT INTO company_role",
+        "INSERT INTO company_role",
+    ]
+    assert {
+        company_id
+        for (company_id,) in test_session.query(CompanyRole.company_id).filter(
+            CompanyRole.role_id == role_id, CompanyRole._closed_at.is_(None)
+        )
+    } == {already, reopened, fresh, other}
+    assert (
+        test_session.query(CompanyRole)
+        .filter_by(company_id=fresh, role_id=role_id)
+        .one()
+        .primary_meta_data["assigned_by"]["email"]
+        == _acting_user().email
     )
 
-    assert result == {"role_id": str(role.id), "company_ids": [company_ids[1]]}
-    assert created_assignments == [(company_ids[1], str(role.id))]
-    assert updated_assignments == [company_ids[1]]
+    assert CompanyRoleAssignmentRepository(
+        uuid4(), test_session
+    ).assign_role_to_companies(
+        role=SimpleNamespace(id=role_id),
+        payload=RoleAssignCompaniesModel(company_ids=[str(already)]),
+        assigned_by=_acting_user(),
+    ) == {
+        "role_id": str(role_id),
+        "company_ids": [],
+    }
 
 
 def test_company_role_assignment_get_roles_and_ensure_assigned_branches(monkeypatch):
@@ -456,7 +505,7 @@ def test_company_role_assignment_get_roles_and_ensure_assigned_branches(monkeypa
     monkeypatch.setattr(
         success_repository,
         "paginate",
-        lambda query, **kwargs: captured.update(kwargs)
+        lambda query, params, **kwargs: captured.update(kwargs, page=params.page)
         or {
             "records": [],
             "pagination": {
@@ -529,7 +578,9 @@ def test_company_role_assignment_update_company_role_and_assign_role(monkeypatch
 
     assign_repo = CompanyRoleAssignmentRepository(uuid4(), Mock())
     monkeypatch.setattr(assign_repo, "get_assignment", lambda role_id: None)
-    monkeypatch.setattr(assign_repo, "create", lambda **kwargs: SimpleNamespace())
+    monkeypatch.setattr(
+        assign_repo, "_create_assignment", lambda role_id: SimpleNamespace()
+    )
     update_calls = []
     monkeypatch.setattr(
         assign_repo,
@@ -558,7 +609,7 @@ def test_role_repository_get_roles_applies_name_and_description_filters(monkeypa
     monkeypatch.setattr(
         repository,
         "paginate",
-        lambda query_obj, **kwargs: captured.update(kwargs)
+        lambda query_obj, params, **kwargs: captured.update(kwargs, page=params.page)
         or {"records": [], "pagination": {}},
     )
 
@@ -572,6 +623,9 @@ def test_role_repository_get_roles_applies_name_and_description_filters(monkeypa
 
 
 def test_company_role_assignment_unassign_role_branches(monkeypatch):
+    monkeypatch.setattr(
+        EffectivePermissionRepository, "refresh", lambda self, **kwargs: None
+    )
     repository = CompanyRoleAssignmentRepository(uuid4(), Mock())
 
     monkeypatch.setattr(repository, "get_assignment", lambda role_id: None)
@@ -71,3 +71,13 @@ def test_config_check_rejects_conflicting_email_security():
 
     assert result.exit_code == 1
     assert "cannot both be enabled" in result.output
+
+
+def test_config_check_rejects_unreadable_jwt_keys(tmp_path):
+    result = _invoke(
+        JWT_ALGORITHM="RS256",
+        JWT_PRIVATE_KEYS=f'{{"k1": "{tmp_path / "missing.pem"}"}}',
+    )
+
+    assert result.exit_code == 1
+    assert "JWT signing keys could not be loaded" in result.output
@@ -0,0 +1,192 @@
+from uuid import uuid4
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.cli import admin
+from app.models.company.company import CompanyCreateModel
+from app.models.company.roles import CompanyDefaultRoles, RoleUpdateModel
+from app.models.user.user import UserReadModel
+from app.repository.base import unit_of_work
+from app.repository.cache_generation import CacheGenerationRepository, CacheScope
+from app.repository.company import CompanyRepository
+from app.repository.company_role import RoleRepository
+from app.repository.database import Base
+from app.repository.database.tables import CompanyRole, Role
+from app.repository.default_catalog import (
+    DEFAULT_ROLE_CATALOG,
+    DEFAULT_ROLE_NAMES,
+    DefaultRoleCatalogRepository,
+)
+from app.repository.user import UserRepository
+from app.services.cache_invalidation import DEFAULT_SUBSCRIBERS
+
+OWNER = CompanyDefaultRoles.OWNER.name_value
+VIEWER = CompanyDefaultRoles.VIEWER.name_value
+
+
+@pytest.fixture
+def statements(test_session):
+    executed = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _selects(statements) -> int:
+    return sum(statement.startswith("SELECT") for statement in statements)
+
+
+def _user(test_session, test_user_data) -> UserReadModel:
+    user = UserRepository(test_session).create_user(
+        test_user_data["create_user"] | {"email": f"{uuid4().hex}@example.com"}
+    )
+    return UserReadModel.model_validate(user, from_attributes=True)
+
+
+def _create_company(test_session, created_by: UserReadModel):
+    suffix = uuid4().hex
+    return CompanyRepository(test_session).create_company(
+        CompanyCreateModel(name=f"Catalog {suffix}", email=f"{suffix}@example.com"),
+        created_by,
+    )
+
+
+def test_reconcile_uses_one_query_per_catalog_table(test_session, statements):
+    roles = DefaultRoleCatalogRepository(test_session).reconcile()
+    assert _selects(statements) == 2
+    assert set(roles) == DEFAULT_ROLE_NAMES
+    role_ids = {name: role.id for name, role in roles.items()}
+
+    roles[OWNER].description = "Edited"
+    test_session.commit()
+    statements.clear()
+
+    again = DefaultRoleCatalogRepository(test_session).reconcile()
+
+    # Existing roles need no permission seeding, so only the role lookup runs.
+    assert _selects(statements) == 1
+    assert {name: role.id for name, role in again.items()} == role_ids
+    assert again[OWNER].description == CompanyDefaultRoles.OWNER.description
+
+
+def test_create_company_bulk_inserts_roles_from_the_catalog(
+    test_session, test_user_data, statements, monkeypatch
+):
+    owner = _user(test_session, test_user_data)
+    DEFAULT_ROLE_CATALOG.warm(lambda: test_session)
+    assert DEFAULT_ROLE_CATALOG.loaded
+
+    def _reconcile(self):
+        raise AssertionError("the catalog should not be reconciled again")
+
+    monkeypatch.setattr(DefaultRoleCatalogRepository, "reconcile", _reconcile)
+    statements.clear()
+
+    company = _create_company(test_session, owner)
+
+    inserts = [
+        statement
+        for statement in statements
+        if statement.startswith("INSERT INTO company_role ")
+    ]
+    assert len(inserts) == 1
+    assert test_session.query(CompanyRole).filter_by(
+        company_id=company.id
+    ).count() == len(DEFAULT_ROLE_NAMES)
+    # No other worker can have cached permissions for a brand new company.
+    assert not any("cache_generation" in statement for statement in statements)
+
+
+def test_catalog_loaded_in_a_rolled_back_unit_is_discarded(test_session):
+    with pytest.raises(RuntimeError):
+        with unit_of_work(test_session):
+            DEFAULT_ROLE_CATALOG.get(test_session)
+            raise RuntimeError("company creation failed")
+
+    assert not DEFAULT_ROLE_CATALOG.loaded
+    assert test_session.query(Role).count() == 0
+
+
+def test_a_reset_during_a_load_discards_the_stale_catalog(test_session):
+    with unit_of_work(test_session):
+        DEFAULT_ROLE_CATALOG.get(test_session)
+        DEFAULT_ROLE_CATALOG.reset()
+
+    assert not DEFAULT_ROLE_CATALOG.loaded
+
+
+def test_renaming_or_closing_a_default_role_resets_the_catalog(
+    test_session, test_user_data
+):
+    owner = _user(test_session, test_user_data)
+    _create_company(test_session, owner)
+    generations = CacheGenerationRepository(test_session)
+    assert DEFAULT_ROLE_CATALOG.loaded
+    viewer_id = DEFAULT_ROLE_CATALOG.get(test_session).role_ids[VIEWER]
+
+    RoleRepository(test_session).update_role(
+        viewer_id, RoleUpdateModel(name=None, description="Read only")
+    )
+    assert DEFAULT_ROLE_CATALOG.loaded
+    assert "default_roles" not in generations.generations()
+
+    RoleRepository(test_session).update_role(
+        viewer_id, RoleUpdateModel(name="Observer", description=None)
+    )
+    assert not DEFAULT_ROLE_CATALOG.loaded
+    assert generations.generations()["default_roles"] == 1
+
+    second = _create_company(test_session, owner)
+    new_viewer_id = DEFAULT_ROLE_CATALOG.get(test_session).role_ids[VIEWER]
+    assert new_viewer_id != viewer_id
+    assert (
+        test_session.query(CompanyRole)
+        .filter_by(company_id=second.id, role_id=new_viewer_id)
+        .count()
+        == 1
+    )
+
+    DEFAULT_ROLE_CATALOG.get(test_session)
+    test_session.query(CompanyRole).filter_by(role_id=new_viewer_id).delete()
+    test_session.commit()
+    RoleRepository(test_session).delete_role(new_viewer_id, deleted_by=owner)
+    assert not DEFAULT_ROLE_CATALOG.loaded
+    assert generations.generations()["default_roles"] == 2
+
+
+def test_bus_resets_the_catalog_of_other_workers(test_session):
+    DEFAULT_ROLE_CATALOG.warm(lambda: test_session)
+
+    for callback in DEFAULT_SUBSCRIBERS[CacheScope.DEFAULT_ROLES]:
+        callback(None)
+
+    assert not DEFAULT_ROLE_CATALOG.loaded
+
+
+def test_reconcile_default_roles_command(tmp_path, monkeypatch):
+    database_url = f"sqlite:///{tmp_path / 'catalog.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    class TestDatabaseManager:
+        def __init__(self):
+            self.engine = create_engine(database_url)
+            self.session_object = sessionmaker(bind=self.engine)
+
+    monkeypatch.setattr(admin, "DatabaseSessionManager", TestDatabaseManager)
+
+    result = CliRunner().invoke(admin.cli, ["reconcile-default-roles"])
+
+    assert result.exit_code == 0, result.output
+    assert {line.split(":")[0] for line in result.output.splitlines()} == (
+        DEFAULT_ROLE_NAMES
+    )
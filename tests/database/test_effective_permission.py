@@ -0,0 +1,216 @@
+import importlib.util
+from pathlib import Path
+from uuid import uuid4
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from click.testing import CliRunner
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.cli import admin
+from app.models.permissions import PermissionScope, PermissionUpdateModel
+from app.repository.database import Base
+from app.repository.database.tables import (
+    Company,
+    CompanyPermission,
+    CompanyRole,
+    CompanyRolePermission,
+    EffectiveCompanyRolePermission,
+    GlobalPermission,
+    Role,
+    RoleGlobalPermission,
+)
+from app.repository.effective_permission import (
+    EffectivePermissionDrift,
+    EffectivePermissionRepository,
+)
+from app.repository.permission import (
+    CompanyPermissionRepository,
+    GlobalPermissionRepository,
+    RolePermissionRepository,
+)
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "alembic/versions/f3a7c9e1b254_add_effective_company_role_permission.py"
+)
+runner = CliRunner()
+
+
+def _seed_sources(session):
+    # Written around the repositories, so nothing is materialized yet.
+    company = Company(name="Effective Co", email=f"effective-{uuid4().hex}@e.com")
+    role = Role(name=f"Effective Role {uuid4().hex}", description=None)
+    global_permission = GlobalPermission(name=f"app.view.{uuid4().hex}")
+    session.add_all([company, role, global_permission])
+    session.flush()
+    company_permission = CompanyPermission(
+        company_id=company.id, name="invoice.approve", description="Approve"
+    )
+    session.add_all(
+        [
+            company_permission,
+            CompanyRole(company_id=company.id, role_id=role.id),
+            RoleGlobalPermission(
+                role_id=role.id, global_permission_id=global_permission.id
+            ),
+        ]
+    )
+    session.flush()
+    session.add(
+        CompanyRolePermission(
+            company_id=company.id,
+            role_id=role.id,
+            company_permission_id=company_permission.id,
+        )
+    )
+    session.commit()
+    return company, role, global_permission, company_permission
+
+
+def _rows(session):
+    return {
+        (row.scope, row.name)
+        for row in session.query(EffectiveCompanyRolePermission).all()
+    }
+
+
+def test_rebuild_materializes_both_scopes_and_check_reports_drift(test_session):
+    company, role, global_permission, company_permission = _seed_sources(test_session)
+    repository = EffectivePermissionRepository(test_session)
+
+    assert repository.check() == EffectivePermissionDrift(missing=2)
+    assert repository.rebuild(batch_size=1).missing == 2
+    assert repository.check().total == 0
+    assert _rows(test_session) == {
+        ("global", global_permission.name),
+        ("company", "invoice.approve"),
+    }
+
+    permissions = RolePermissionRepository(
+        test_session
+    ).effective_permissions_by_assignments([(company.id, role.id)])[
+        (company.id, role.id)
+    ]
+    assert [(p.scope, p.company_id) for p in permissions] == [
+        (PermissionScope.COMPANY, company.id),
+        (PermissionScope.GLOBAL, None),
+    ]
+
+    company_permission.description = "Approve invoices"
+    test_session.query(RoleGlobalPermission).delete()
+    test_session.add(
+        EffectiveCompanyRolePermission(
+            company_id=uuid4(),
+            role_id=role.id,
+            scope="global",
+            permission_id=uuid4(),
+            name="orphan",
+        )
+    )
+    test_session.commit()
+
+    assert repository.check() == EffectivePermissionDrift(stale=2, outdated=1)
+    assert repository.rebuild().total == 3
+    assert _rows(test_session) == {("company", "invoice.approve")}
+
+
+def test_repository_writes_keep_the_table_in_step(test_session):
+    company, role, global_permission, company_permission = _seed_sources(test_session)
+    repository = EffectivePermissionRepository(test_session)
+    repository.rebuild()
+
+    GlobalPermissionRepository(test_session).update_permission(
+        global_permission.id, PermissionUpdateModel(name="app.view.renamed")
+    )
+    CompanyPermissionRepository(company.id, test_session).update_permission(
+        company_permission.id, PermissionUpdateModel(description="Changed")
+    )
+    assert ("global", "app.view.renamed") in _rows(test_session)
+    assert repository.check().total == 0
+
+    RolePermissionRepository(test_session).remove_company_permission(
+        company.id, role.id, company_permission.id
+    )
+    assert _rows(test_session) == {("global", "app.view.renamed")}
+    RolePermissionRepository(test_session).assign_company_permission(
+        company.id, role.id, company_permission.id
+    )
+    GlobalPermissionRepository(test_session).delete_permission(global_permission.id)
+    assert _rows(test_session) == {("company", "invoice.approve")}
+
+    CompanyPermissionRepository(company.id, test_session).delete_permission(
+        company_permission.id
+    )
+    assert _rows(test_session) == set()
+    assert repository.check().total == 0
+
+
+def test_migration_populates_from_existing_data():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            table
+            for table in Base.metadata.sorted_tables
+            if table.name != EffectiveCompanyRolePermission.__tablename__
+        ],
+    )
+    session = sessionmaker(bind=engine)()
+    _seed_sources(session)
+    session.close()
+    spec = importlib.util.spec_from_file_location(
+        "add_effective_company_role_permission_migration",
+        MIGRATION_PATH,
+    )
+    migration = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(migration)
+
+    with engine.begin() as connection:
+        migration.op = Operations(MigrationContext.configure(connection))
+        migration.upgrade()
+
+    session = sessionmaker(bind=engine)()
+    assert len(_rows(session)) == 2
+    assert EffectivePermissionRepository(session).check().total == 0
+    session.close()
+
+    with engine.begin() as connection:
+        migration.op = Operations(MigrationContext.configure(connection))
+        migration.downgrade()
+        assert not connection.dialect.has_table(
+            connection, EffectiveCompanyRolePermission.__tablename__
+        )
+
+
+def test_cli_check_fails_on_drift_until_rebuilt(monkeypatch, tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'effective-cli.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    _seed_sources(session)
+    session.close()
+    engine.dispose()
+
+    class TestDatabaseManager:
+        def __init__(self):
+            self.engine = create_engine(database_url)
+            self.session_object = sessionmaker(bind=self.engine)
+
+    monkeypatch.setattr(admin, "DatabaseSessionManager", TestDatabaseManager)
+
+    result = runner.invoke(admin.cli, ["check-effective-permissions"])
+    assert result.exit_code == 1
+    assert "2 missing, 0 stale, 0 outdated" in result.output
+
+    result = runner.invoke(
+        admin.cli, ["rebuild-effective-permissions", "--batch-size", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Effective permission rows inserted: 2" in result.output
+
+    result = runner.invoke(admin.cli, ["check-effective-permissions"])
+    assert result.exit_code == 0, result.output
+    assert "Effective permissions are consistent." in result.output
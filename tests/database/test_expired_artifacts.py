@@ -0,0 +1,142 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import anyio
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.configs import settings
+from app.models.user.password import PasswordResetMethod
+from app.repository.auth_revocation import AuthRevocationRepository
+from app.repository.rate_limit import RateLimitWindowRepository
+from app.repository.database.tables import AuthRevocation, PasswordResetToken, User
+from app.repository.user import UserRepository
+from app.repository.user_password import UserPasswordRepository
+from app.services.expired_artifacts import ExpiredArtifactPurger, PurgeReport
+
+
+def _create_user(test_session, test_user_data, email: str):
+    user_data = test_user_data["create_user"] | {"email": email}
+    return UserRepository(test_session).create_user(user_data)
+
+
+def _set_metadata(test_session, user_id, extra: dict) -> None:
+    user_row = test_session.get(User, user_id)
+    user_row.primary_meta_data = dict(user_row.primary_meta_data) | extra
+    test_session.commit()
+
+
+def _issue_reset_token(test_session, email: str, *, expired: bool) -> None:
+    UserPasswordRepository(test_session).create_password_reset_record(
+        email,
+        method=PasswordResetMethod.MAGIC_LINK,
+        token=f"token-{email}",
+        expires_in=timedelta(minutes=-1 if expired else 5),
+    )
+
+
+def test_purge_expired_tokens_keeps_live_ones(test_session, test_user_data):
+    emails = [f"purge-token-{index}@example.com" for index in range(4)]
+    for index, email in enumerate(emails):
+        _create_user(test_session, test_user_data, email)
+        _issue_reset_token(test_session, email, expired=index < 3)
+    repository = UserPasswordRepository(test_session)
+
+    assert repository.purge_expired_tokens(batch_size=2) == 3
+    assert test_session.query(PasswordResetToken).count() == 1
+    assert repository.purge_expired_tokens() == 0
+
+
+def test_compact_stale_metadata_rewrites_only_affected_users(
+    test_session, test_user_data
+):
+    stale, clean = (
+        _create_user(test_session, test_user_data, f"compact-{name}@example.com")
+        for name in ("stale", "clean")
+    )
+    _set_metadata(
+        test_session,
+        stale.id,
+        {"password_reset": {"token": "old"}, "refresh_token_version": 3},
+    )
+    repository = UserRepository(test_session)
+    selects = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            selects.append(statement)
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        compacted = repository.compact_stale_metadata(
+            ["password_reset", "refresh_token_version"], batch_size=1
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert compacted == 1
+    # Users without stale keys are filtered out rather than read batch by batch.
+    assert len(selects) == 2
+    test_session.expire_all()
+    assert test_session.get(User, stale.id).primary_meta_data == {
+        "status": stale.status
+    }
+    assert test_session.get(User, clean.id).primary_meta_data == {
+        "status": clean.status
+    }
+    assert repository.compact_stale_metadata(["password_reset"]) == 0
+
+
+def test_purger_reports_rows_touched(test_session, test_user_data, monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", True)
+    user = _create_user(test_session, test_user_data, "purge-report@example.com")
+    _set_metadata(test_session, user.id, {"password_reset": {}})
+    session_factory = sessionmaker(bind=test_session.get_bind())
+    # The in-process schedule leaves metadata compaction to the command.
+    assert ExpiredArtifactPurger(session_factory).purge_once().compacted_users == 0
+
+    _issue_reset_token(test_session, user.email, expired=True)
+    revocation = AuthRevocationRepository(test_session).record(
+        user.id, 0, reason="version_bump"
+    )
+    revocation.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    RateLimitWindowRepository(test_session).hit(
+        "purge", "key", limit=1, window_seconds=1, now=time.time() - 5
+    )
+    purger = ExpiredArtifactPurger(
+        session_factory, batch_size=10, compact_metadata=True
+    )
+
+    report = purger.purge_once()
+
+    assert (
+        report.reset_tokens,
+        report.revocations,
+        report.rate_limit_windows,
+        report.compacted_users,
+    ) == (1, 1, 1, 1)
+    assert report.rows_touched == 4
+    assert report.seconds >= 0
+    assert test_session.query(AuthRevocation).count() == 0
+
+
+def test_purger_run_survives_failures(monkeypatch):
+    monkeypatch.setattr(settings, "PURGE_EXPIRED_INTERVAL_SECONDS", 0)
+    purger = ExpiredArtifactPurger(lambda: None)
+    calls = []
+
+    def _purge_once():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+        return PurgeReport(0, 0, 0, 0, 0.0)
+
+    monkeypatch.setattr(purger, "purge_once", _purge_once)
+
+    async def _run():
+        with anyio.move_on_after(0.2):
+            await purger.run()
+
+    anyio.run(_run)
+    assert len(calls) >= 2
@@ -8,7 +8,7 @@ from app.configs import settings
 
 PROJECT_ROOT = Path(__file__).parents[2]
 LEGACY_DATA_REVISION = "9e858906b135"
-HEAD_REVISION = "e2f6a8c1d403"
+HEAD_REVISION = "c2e4a6b8d015"
 
 
 def _alembic_config() -> Config:
@@ -48,10 +48,13 @@ def test_full_migration_chain_from_empty_database_preserves_legacy_membership(
         inspector = inspect(connection)
         assert {
             "association_user_company",
+            "auth_revocation",
+            "cache_generation",
             "company",
             "company_permission",
             "company_role",
             "company_role_permission",
+            "effective_company_role_permission",
             "global_permission",
             "privileged_access_event",
             "role",
@@ -60,15 +63,30 @@ def test_full_migration_chain_from_empty_database_preserves_legacy_membership(
             "user",
             "user_role",
         }.issubset(inspector.get_table_names())
-        assert "is_superuser" in {
-            column["name"] for column in inspector.get_columns("user")
-        }
+        assert {
+            "ix_association_user_company_company_created",
+            "ix_association_user_company_user_created",
+        }.issubset(
+            {
+                index["name"]
+                for index in inspector.get_indexes("association_user_company")
+            }
+        )
+        assert {"is_superuser", "refresh_token_version"}.issubset(
+            {column["name"] for column in inspector.get_columns("user")}
+        )
         assert (
             connection.execute(
                 text("SELECT version_num FROM alembic_version")
             ).scalar_one()
             == HEAD_REVISION
         )
+        assert (
+            connection.execute(
+                text("SELECT COUNT(*) FROM cache_generation WHERE generation = 0")
+            ).scalar_one()
+            == 129
+        )
         assert connection.execute(text("""
                 SELECT role.name
                 FROM association_user_company AS membership
@@ -0,0 +1,140 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event
+
+from app.configs import settings
+from app.models.generic_pagination import (
+    PaginationParams,
+    TotalMode,
+    paginate_query,
+    planner_row_estimate,
+    supports_window_count,
+)
+from app.repository.database.tables import Role
+
+KEYS = [Role.name, Role.id]
+
+
+@pytest.fixture
+def selects(test_session):
+    executed = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT"):
+            executed.append(statement)
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def roles(test_session):
+    test_session.add_all(Role(name=f"Paged {index:02d}") for index in range(5))
+    test_session.commit()
+
+
+def _page(test_session, **params):
+    return paginate_query(
+        test_session.query(Role), PaginationParams(limit=2, **params), keys=KEYS
+    )
+
+
+def test_offset_pages_count_in_the_page_query(test_session, roles, selects):
+    records, meta = _page(test_session, page=2)
+
+    assert [role.name for role in records] == ["Paged 02", "Paged 03"]
+    assert (meta.total_records, meta.total_pages) == (5, 3)
+    assert len(selects) == 1
+    assert "OVER ()" in selects[0]
+
+    selects.clear()
+    records, meta = _page(test_session, page=4)
+    assert records == []
+    assert meta.total_records == 5
+    assert len(selects) == 2
+
+
+def test_empty_first_page_needs_no_count(test_session, selects):
+    records, meta = _page(test_session)
+
+    assert records == []
+    assert meta.total_records == 0
+    assert len(selects) == 1
+
+
+def test_cursor_pages_count_every_matching_row(test_session, roles, selects):
+    _, first = _page(test_session)
+    selects.clear()
+
+    records, meta = _page(test_session, cursor=first.next_cursor)
+
+    assert [role.name for role in records] == ["Paged 02", "Paged 03"]
+    assert meta.total_records == 5
+    assert len(selects) == 2
+
+
+def test_databases_without_window_functions_count_separately(
+    test_session, roles, selects, monkeypatch
+):
+    dialect = test_session.get_bind().dialect
+    monkeypatch.setattr(dialect, "server_version_info", (3, 24, 0))
+
+    _, meta = _page(test_session)
+
+    assert meta.total_records == 5
+    assert len(selects) == 2
+    assert not any("OVER ()" in statement for statement in selects)
+
+
+def test_window_counts_are_limited_to_known_dialects():
+    assert supports_window_count(SimpleNamespace(name="postgresql"))
+    assert not supports_window_count(SimpleNamespace(name="mysql"))
+
+
+def test_estimates_are_exact_outside_postgres(test_session, roles):
+    _, meta = _page(test_session, total=TotalMode.ESTIMATE)
+
+    assert meta.total_records == 5
+    assert meta.total_is_estimate is False
+
+
+def test_postgres_estimates_replace_counts_on_large_listings(
+    test_session, roles, selects, monkeypatch
+):
+    from app.models import generic_pagination
+
+    monkeypatch.setattr(test_session.get_bind().dialect, "name", "postgresql")
+    estimates = iter([250000, 3])
+    monkeypatch.setattr(
+        generic_pagination, "planner_row_estimate", lambda query: next(estimates)
+    )
+
+    _, meta = _page(test_session, total=TotalMode.ESTIMATE)
+    assert (meta.total_records, meta.total_is_estimate) == (250000, True)
+    assert not any("OVER ()" in statement for statement in selects)
+
+    # Below PAGINATION_ESTIMATE_MIN_ROWS the planner's guess is not trusted.
+    _, meta = _page(test_session, total=TotalMode.ESTIMATE)
+    assert (meta.total_records, meta.total_is_estimate) == (5, False)
+    assert settings.PAGINATION_ESTIMATE_MIN_ROWS > 3
+
+
+@pytest.mark.parametrize("decode", [False, True])
+def test_planner_row_estimate_reads_the_top_plan_node(decode):
+    plan = [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1200}}]
+    query = MagicMock()
+    query.statement.compile.return_value.params = {"name_1": "%a%"}
+    connection = query.session.connection.return_value
+    connection.exec_driver_sql.return_value.scalar.return_value = (
+        json.dumps(plan) if decode else plan
+    )
+
+    assert planner_row_estimate(query) == 1200
+    sql, parameters = connection.exec_driver_sql.call_args.args
+    assert sql.startswith("EXPLAIN (FORMAT JSON) ")
+    assert parameters == {"name_1": "%a%"}
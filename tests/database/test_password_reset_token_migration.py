@@ -0,0 +1,120 @@
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import (
+    JSON,
+    Column,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    create_engine,
+    inspect,
+    select,
+    text,
+)
+
+from app.models.user.password import PasswordResetMethod
+from app.repository.user_password import password_reset_token_hash
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "alembic/versions/7c3e9a1f5d42_add_password_reset_token.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location(
+        "add_password_reset_token_migration",
+        MIGRATION_PATH,
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def _record(method: str, token: str, expires_at) -> dict:
+    return {"method": method, "token": token, "expires_at": expires_at}
+
+
+def test_password_reset_token_migration_moves_live_records(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    metadata = MetaData()
+    user = Table(
+        "user",
+        metadata,
+        Column("id", Uuid(), primary_key=True),
+        Column("email", String(255), nullable=False),
+        Column("primary_meta_data", JSON(), nullable=True),
+    )
+    metadata.create_all(engine)
+    migration = _load_migration()
+    monkeypatch.setattr(migration, "BATCH_SIZE", 2)
+    future = (datetime.now(timezone.utc) + timedelta(minutes=30)).isoformat()
+    naive_future = (
+        datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=30)
+    ).isoformat()
+    past = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+    otp_id, magic_id, expired_id, broken_id, plain_id, empty_id = (
+        uuid4() for _ in range(6)
+    )
+    users = {
+        otp_id: {
+            "status": "Active",
+            "password_reset": _record("otp", "A1B2C3", future),
+        },
+        magic_id: {"password_reset": _record("magic_link", "magic", naive_future)},
+        expired_id: {"password_reset": _record("otp", "Z9Y8X7", past)},
+        broken_id: {"password_reset": _record("otp", "A1B2C3", "not-a-date")},
+        plain_id: {"status": "Active"},
+        empty_id: None,
+    }
+
+    with engine.begin() as connection:
+        connection.execute(
+            user.insert(),
+            [
+                {
+                    "id": user_id,
+                    "email": f"{user_id}@example.com",
+                    "primary_meta_data": data,
+                }
+                for user_id, data in users.items()
+            ],
+        )
+        migration.op = Operations(MigrationContext.configure(connection))
+        migration.upgrade()
+
+        rows = connection.execute(
+            text("SELECT user_id, method, token_hash FROM password_reset_token")
+        ).all()
+        assert {(row.method, row.token_hash) for row in rows} == {
+            (
+                "otp",
+                password_reset_token_hash(PasswordResetMethod.OTP, "A1B2C3", otp_id),
+            ),
+            (
+                "magic_link",
+                password_reset_token_hash(PasswordResetMethod.MAGIC_LINK, "magic"),
+            ),
+        }
+        remaining = dict(
+            connection.execute(select(user.c.id, user.c.primary_meta_data)).all()
+        )
+        assert remaining[otp_id] == {"status": "Active"}
+        assert remaining[expired_id] == {}
+        assert remaining[broken_id] == {}
+        assert remaining[plain_id] == {"status": "Active"}
+        assert remaining[empty_id] is None
+        assert (
+            migration._token_row(otp_id, "not-a-record", datetime.now(timezone.utc))
+            is None
+        )
+
+        migration.downgrade()
+        assert set(inspect(connection).get_table_names()) == {"user"}
@@ -5,6 +5,7 @@ import pytest
 from sqlalchemy.exc import IntegrityError
 
 from app.repository.database.tables import Role
+from app.repository.effective_permission import EffectivePermissionRepository
 from app.repository.permission import (
     CompanyPermissionRepository,
     RolePermissionRepository,
@@ -27,6 +28,9 @@ def test_company_permission_assignment_translates_constraint_race(monkeypatch):
 
     monkeypatch.setattr(repository, "_ensure_company_role", lambda *args: Mock())
     monkeypatch.setattr(repository, "_ensure_role", lambda role_id: role)
+    monkeypatch.setattr(
+        EffectivePermissionRepository, "refresh", lambda self, **kwargs: None
+    )
     monkeypatch.setattr(
         CompanyPermissionRepository,
         "ensure_record",
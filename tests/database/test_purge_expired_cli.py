@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from click.testing import CliRunner
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.cli import admin
+from app.repository.database import Base
+from app.repository.database.tables import (
+    PasswordResetToken,
+    RateLimitWindow,
+    User,
+)
+
+runner = CliRunner()
+
+
+def test_purge_expired_reports_rows_touched(monkeypatch, tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'purge-cli.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    user = User(
+        email="purge-cli@example.com",
+        password="never-printed-password",
+        primary_meta_data={"status": "Active", "refresh_token_version": 2},
+        secondary_meta_data={},
+    )
+    session.add(user)
+    session.flush()
+    session.add_all(
+        PasswordResetToken(
+            user_id=user.id,
+            method="magic_link",
+            token_hash=uuid4().hex,
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=offset),
+        )
+        for offset in (-10, -5, 5)
+    )
+    session.add(
+        RateLimitWindow(
+            key_hash=uuid4().hex,
+            namespace="user_login",
+            hits=[],
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+        )
+    )
+    session.commit()
+    session.close()
+    engine.dispose()
+
+    class TestDatabaseManager:
+        def __init__(self):
+            self.engine = create_engine(database_url)
+            self.session_object = sessionmaker(bind=self.engine)
+
+    monkeypatch.setattr(admin, "DatabaseSessionManager", TestDatabaseManager)
+
+    result = runner.invoke(admin.cli, ["purge-expired", "--batch-size", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "Expired password-reset tokens deleted: 2" in result.output
+    assert "Expired access-token revocations deleted: 0" in result.output
+    assert "Expired rate-limit windows deleted: 1" in result.output
+    assert "Users with stale metadata compacted: 1" in result.output
+    assert "Rows touched: 4 in " in result.output
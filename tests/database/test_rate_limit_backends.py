@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.configs import settings
+from app.repository.database import Base
+from app.repository.database.tables import RateLimitWindow
+from app.repository.rate_limit import SQLRateLimitBackend
+from app.utils import rate_limit_backends
+from app.utils.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+    get_rate_limit_backend,
+)
+
+
+@pytest.fixture
+def sql_session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'limits.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(params=["memory", "shared_memory", "sql"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryRateLimitBackend()
+    elif request.param == "shared_memory":
+        shared = SharedMemoryRateLimitBackend(str(tmp_path / "limits.shm"))
+        yield shared
+        shared.close()
+    else:
+        yield SQLRateLimitBackend(request.getfixturevalue("sql_session_factory"))
+
+
+def test_every_backend_applies_the_same_sliding_window(backend):
+    def hit(key, now, *, namespace="ns"):
+        return backend.hit(namespace, key, limit=2, window_seconds=10, now=now)
+
+    assert hit("a", 100.0) is None
+    assert hit("a", 105.0) is None
+    assert hit("a", 106.0) == 4.0
+    assert hit("a", 109.0) == 1.0
+    assert hit("b", 109.0) is None
+    assert hit("a", 109.0, namespace="other") is None
+    # A hit exactly ``window`` seconds old still counts.
+    assert hit("a", 110.0) == 0.0
+    assert hit("a", 110.5) is None
+    assert hit("a", 111.0) == 4.0
+
+    backend.reset("ns")
+    assert hit("a", 111.0) is None
+    assert hit("a", 111.0, namespace="other") is None
+    assert hit("a", 111.0, namespace="other") == 8.0
+
+
+def test_sql_backend_stores_hashed_keys_and_purges_expired_windows(
+    sql_session_factory,
+):
+    from app.repository.rate_limit import RateLimitWindowRepository
+
+    backend = SQLRateLimitBackend(sql_session_factory)
+    backend.hit("ns", "user@example.com", limit=1, window_seconds=1, now=1.0)
+    session = sql_session_factory()
+    try:
+        window = session.query(RateLimitWindow).one()
+        assert "user@example.com" not in window.key_hash
+        assert window.hits == [1.0]
+        assert RateLimitWindowRepository(session).purge_expired(batch_size=1) == 1
+        assert session.query(RateLimitWindow).count() == 0
+    finally:
+        session.close()
+
+
+@pytest.mark.parametrize(
+    ("dialect", "clause"),
+    [("postgresql", "ON CONFLICT DO NOTHING"), ("mysql", "INSERT IGNORE")],
+)
+def test_sql_backend_upserts_with_the_dialect_conflict_clause(dialect, clause):
+    from app.repository.rate_limit import RateLimitWindowRepository
+
+    executed = []
+
+    class _Dialect:
+        name = dialect
+
+    class _Session:
+        def get_bind(self):
+            return type("Bind", (), {"dialect": _Dialect()})()
+
+        def execute(self, statement):
+            executed.append(statement)
+
+    RateLimitWindowRepository(_Session())._insert_if_missing("hash", "ns", 1.0)
+
+    assert clause in str(executed[0])
+
+
+def test_sql_backend_is_selected_by_name(monkeypatch):
+    monkeypatch.setattr(rate_limit_backends, "_BACKENDS", {})
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "sql")
+
+    assert isinstance(get_rate_limit_backend(), SQLRateLimitBackend)
@@ -0,0 +1,126 @@
+import importlib.util
+from pathlib import Path
+from uuid import uuid4
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import (
+    JSON,
+    Column,
+    MetaData,
+    String,
+    Table,
+    Uuid,
+    create_engine,
+    event,
+    inspect,
+    select,
+)
+
+MIGRATION_PATH = (
+    Path(__file__).parents[2]
+    / "alembic/versions/38ff9bb67437_add_user_refresh_token_version.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location(
+        "add_user_refresh_token_version_migration",
+        MIGRATION_PATH,
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_refresh_token_version_migration_backfills_and_restores_metadata(
+    monkeypatch,
+):
+    engine = create_engine("sqlite:///:memory:")
+    metadata = MetaData()
+    user = Table(
+        "user",
+        metadata,
+        Column("id", Uuid(), primary_key=True),
+        Column("email", String(255), nullable=False),
+        Column("primary_meta_data", JSON(), nullable=True),
+    )
+    metadata.create_all(engine)
+    migration = _load_migration()
+    monkeypatch.setattr(migration, "BATCH_SIZE", 2)
+    versioned_id, invalid_id, missing_id, empty_id = (uuid4() for _ in range(4))
+
+    with engine.begin() as connection:
+        connection.execute(
+            user.insert(),
+            [
+                {
+                    "id": versioned_id,
+                    "email": "versioned@example.com",
+                    "primary_meta_data": {
+                        "status": "Active",
+                        "refresh_token_version": 7,
+                    },
+                },
+                {
+                    "id": invalid_id,
+                    "email": "invalid@example.com",
+                    "primary_meta_data": {"refresh_token_version": "bad"},
+                },
+                {
+                    "id": missing_id,
+                    "email": "missing@example.com",
+                    "primary_meta_data": {"status": "Active"},
+                },
+                {
+                    "id": empty_id,
+                    "email": "empty@example.com",
+                    "primary_meta_data": None,
+                },
+            ],
+        )
+        migration.op = Operations(MigrationContext.configure(connection))
+        migration.upgrade()
+
+        migrated = migration.user_table
+        rows = {
+            row.id: row
+            for row in connection.execute(
+                select(
+                    migrated.c.id,
+                    migrated.c.primary_meta_data,
+                    migrated.c.refresh_token_version,
+                )
+            )
+        }
+        assert rows[versioned_id].refresh_token_version == 7
+        assert rows[versioned_id].primary_meta_data == {"status": "Active"}
+        assert rows[invalid_id].refresh_token_version == 0
+        assert rows[invalid_id].primary_meta_data == {}
+        assert rows[missing_id].refresh_token_version == 0
+        assert rows[empty_id].refresh_token_version == 0
+
+        updates = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: (
+                updates.append(statement) if statement.startswith("UPDATE") else None
+            ),
+        )
+        migration.downgrade()
+        # One executemany per batch of BATCH_SIZE rows, not one UPDATE per user.
+        assert len(updates) == 2
+
+        assert "refresh_token_version" not in {
+            column["name"] for column in inspect(connection).get_columns("user")
+        }
+        restored = dict(
+            connection.execute(select(user.c.id, user.c.primary_meta_data)).all()
+        )
+        assert restored[versioned_id] == {
+            "status": "Active",
+            "refresh_token_version": 7,
+        }
+        assert restored[empty_id] == {"refresh_token_version": 0}
@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import event
+
+from app.repository.database.tables import GlobalPermission, Role, RoleGlobalPermission
+from app.repository.permission import RolePermissionRepository
+from app.utils.app_error import AppError
+from app.utils.request_cache import RequestLookupCache, memoized
+
+
+def _count_selects(session):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(session.bind, "before_cursor_execute", _record)
+    return statements
+
+
+def test_lookups_are_reused_until_the_transaction_ends(test_session):
+    role = Role(name="Cached Role", description=None)
+    permission = GlobalPermission(name="cache.view")
+    test_session.add_all([role, permission])
+    test_session.flush()
+    test_session.add(
+        RoleGlobalPermission(role_id=role.id, global_permission_id=permission.id)
+    )
+    test_session.commit()
+    role_id = role.id
+
+    lookups = RequestLookupCache(test_session)
+    repository = RolePermissionRepository(test_session, lookups=lookups)
+    statements = _count_selects(test_session)
+
+    for _ in range(3):
+        assert repository._ensure_role(role_id).id == role_id
+        assert [
+            p.name
+            for p in repository.global_permissions_by_role_ids({role_id})[role_id]
+        ] == ["cache.view"]
+    assert len(statements) == 2
+    assert len(lookups) == 2
+
+    test_session.commit()
+    repository._ensure_role(role_id)
+    assert len(statements) == 3
+    assert len(lookups) == 1
+
+    test_session.rollback()
+    with pytest.raises(AppError):
+        repository._ensure_company_role(role_id, role_id)
+    assert len(statements) == 4
+
+
+def test_loader_errors_are_not_cached(test_session):
+    lookups = RequestLookupCache(test_session)
+    calls = []
+
+    def _flaky():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return "loaded"
+
+    with pytest.raises(RuntimeError):
+        lookups.get_or_load("key", _flaky)
+    assert len(lookups) == 0
+    assert lookups.get_or_load("key", _flaky) == "loaded"
+    assert lookups.get_or_load("key", _flaky) == "loaded"
+    assert len(calls) == 2
+
+    assert memoized(None, "key", lambda: "direct") == "direct"
@@ -1,5 +1,6 @@
 import pytest
 from app.configs import settings
+from app.repository.database import Base
 from app.repository.database.session_manager import DatabaseSessionManager
 from sqlalchemy.pool import StaticPool
 from unittest.mock import Mock
@@ -269,3 +270,13 @@ def test_schema_matches_models_rejects_missing_required_columns():
 
 def test_expected_user_schema_includes_superuser_flag():
     assert "is_superuser" in DatabaseSessionManager.expected_columns["user"]
+
+
+def test_every_model_table_is_checked_at_startup():
+    manager = DatabaseSessionManager.__new__(DatabaseSessionManager)
+    manager._import_models()
+
+    assert set(DatabaseSessionManager.expected_tables) == set(Base.metadata.tables)
+    assert set(DatabaseSessionManager.expected_columns) == set(
+        DatabaseSessionManager.expected_tables
+    )
@@ -2,8 +2,10 @@ from uuid import uuid4
 
 import pytest
 
+from app.configs import settings
 from app.models.user.account_status import UserAccountStatus
 from app.repository.database.tables import (
+    AuthRevocation,
     PrivilegedAccessEvent,
     SuperuserBootstrapControl,
     User,
@@ -39,10 +41,8 @@ def _add_user(
         password="unchanged-password-hash",
         first_name=label,
         is_superuser=is_superuser,
-        primary_meta_data={
-            "status": status,
-            "refresh_token_version": refresh_token_version,
-        },
+        refresh_token_version=refresh_token_version,
+        primary_meta_data={"status": status},
         secondary_meta_data={},
     )
     test_session.add(user)
@@ -50,7 +50,10 @@ def _add_user(
     return user
 
 
-def test_bootstrap_promotes_existing_active_user_and_is_idempotent(test_session):
+def test_bootstrap_promotes_existing_active_user_and_is_idempotent(
+    test_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", True)
     control = _add_control(test_session)
     user = _add_user(test_session, label="initial-admin", refresh_token_version=4)
     service = SuperuserBootstrapService(test_session)
@@ -68,7 +71,9 @@ def test_bootstrap_promotes_existing_active_user_and_is_idempotent(test_session)
     assert result.changed is True
     assert user.is_superuser is True
     assert user.password == "unchanged-password-hash"
-    assert user.primary_meta_data["refresh_token_version"] == 5
+    assert user.refresh_token_version == 5
+    revocation = test_session.query(AuthRevocation).one()
+    assert (revocation.user_id, revocation.refresh_token_version) == (user.id, 4)
     assert control.bootstrap_user_id == user.id
     assert control.bootstrap_completed_at is not None
     assert control.bootstrap_method == service.SOURCE
@@ -90,7 +95,7 @@ def test_bootstrap_promotes_existing_active_user_and_is_idempotent(test_session)
     )
     test_session.refresh(user)
     assert repeated.changed is False
-    assert user.primary_meta_data["refresh_token_version"] == 5
+    assert user.refresh_token_version == 5
     assert test_session.query(PrivilegedAccessEvent).count() == 1
 
 
@@ -207,24 +212,6 @@ def test_completed_bootstrap_rejects_different_or_demoted_target(test_session):
     assert control.bootstrap_user_id == original.id
 
 
-def test_bootstrap_normalizes_invalid_refresh_token_version(test_session):
-    _add_control(test_session)
-    user = _add_user(
-        test_session,
-        label="invalid-version",
-        refresh_token_version="invalid",
-    )
-
-    SuperuserBootstrapService(test_session).bootstrap(
-        email=user.email,
-        reason="Initial bootstrap",
-        expected_user_id=user.id,
-    )
-
-    test_session.refresh(user)
-    assert user.primary_meta_data["refresh_token_version"] == 1
-
-
 def test_bootstrap_rolls_back_privilege_change_when_commit_fails(
     test_session,
     monkeypatch,
@@ -248,6 +235,6 @@ def test_bootstrap_rolls_back_privilege_change_when_commit_fails(
     persisted = test_session.query(User).filter_by(id=user.id).one()
     control = test_session.query(SuperuserBootstrapControl).one()
     assert persisted.is_superuser is False
-    assert persisted.primary_meta_data["refresh_token_version"] == 0
+    assert persisted.refresh_token_version == 0
     assert control.bootstrap_completed_at is None
     assert test_session.query(PrivilegedAccessEvent).count() == 0
@@ -27,10 +27,7 @@ def _configure_cli_database(monkeypatch, tmp_path):
         password="never-printed-password",
         first_name="CLI",
         is_superuser=False,
-        primary_meta_data={
-            "status": UserAccountStatus.ACTIVE.name_value,
-            "refresh_token_version": 0,
-        },
+        primary_meta_data={"status": UserAccountStatus.ACTIVE.name_value},
         secondary_meta_data={},
     )
     session.add_all(
@@ -69,7 +66,7 @@ def _read_state(database_url, user_id):
         user = session.query(User).filter_by(id=user_id).one()
         return (
             user.is_superuser,
-            user.primary_meta_data["refresh_token_version"],
+            user.refresh_token_version,
             session.query(PrivilegedAccessEvent).count(),
         )
     finally:
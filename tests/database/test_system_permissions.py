@@ -1,7 +1,9 @@
+from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
 
+from app.models.authorization import AccessCheckRequestModel
 from app.models.system_permissions import (
     SYSTEM_PERMISSION_BY_ID,
     SYSTEM_PERMISSION_DEFINITIONS,
@@ -10,6 +12,8 @@ from app.models.system_permissions import (
 from app.models.user.account_status import UserAccountStatus
 from app.models.user.user import UserReadModel
 from app.repository.company import CompanyRepository
+from app.repository.company_role import CompanyRoleAssignmentRepository
+from app.repository.company_user import CompanyUserRepository
 from app.repository.database.tables import (
     AssociationUserCompany,
     Company,
@@ -22,9 +26,15 @@ from app.repository.database.tables import (
     User,
     UserRole,
 )
-from app.repository.permission import SystemPermissionRepository
+from app.repository.default_catalog import DefaultRoleCatalogRepository
+from app.repository.effective_permission import EffectivePermissionRepository
+from app.repository.permission import (
+    RolePermissionRepository,
+    SystemPermissionRepository,
+)
 from app.services.company.authorization import CompanyAuthorizationService
 from app.utils.app_error import AppError
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
 from app.utils.shared_context import SharedContext
 
 
@@ -51,9 +61,7 @@ def _create_user(test_session, label: str) -> User:
 
 
 def test_default_roles_receive_exact_system_permission_matrix(test_session):
-    repository = CompanyRepository(test_session)
-
-    roles = repository._ensure_default_roles()
+    roles = DefaultRoleCatalogRepository(test_session).reconcile()
 
     permissions = test_session.query(GlobalPermission).all()
     assert {permission.id for permission in permissions} == set(SYSTEM_PERMISSION_BY_ID)
@@ -86,7 +94,7 @@ def test_default_roles_receive_exact_system_permission_matrix(test_session):
     test_session.delete(removed)
     test_session.commit()
 
-    repository._ensure_default_roles()
+    DefaultRoleCatalogRepository(test_session).reconcile()
 
     assert (
         test_session.query(RoleGlobalPermission)
@@ -136,7 +144,7 @@ def test_company_authorization_uses_exact_global_permission_identity(test_sessio
     )
     test_session.add(company)
     test_session.flush()
-    roles = CompanyRepository(test_session)._ensure_default_roles()
+    roles = DefaultRoleCatalogRepository(test_session).reconcile()
     for role in roles.values():
         test_session.add(CompanyRole(company_id=company.id, role_id=role.id))
 
@@ -151,6 +159,7 @@ def test_company_authorization_uses_exact_global_permission_identity(test_sessio
                 role_id=role.id,
             )
         )
+    EffectivePermissionRepository(test_session).refresh(company_id=company.id)
     test_session.commit()
 
     for role_name, user in users_by_role.items():
@@ -186,6 +195,7 @@ def test_company_authorization_uses_exact_global_permission_identity(test_sessio
             company_permission_id=local_delete.id,
         )
     )
+    EffectivePermissionRepository(test_session).refresh(company_id=company.id)
     test_session.commit()
 
     viewer_authorization = CompanyAuthorizationService(
@@ -221,6 +231,7 @@ def test_company_authorization_uses_exact_global_permission_identity(test_sessio
             ),
         ]
     )
+    EffectivePermissionRepository(test_session).refresh(company_id=company.id)
     test_session.commit()
     CompanyAuthorizationService(
         SharedContext(db_session=test_session, user=_user_model(custom_user))
@@ -231,16 +242,9 @@ def test_company_authorization_uses_exact_global_permission_identity(test_sessio
         SharedContext(db_session=test_session, user=_user_model(owner))
     )
     owner_authorization.require(company.id, SystemPermission.COMPANY_DELETE)
-    owner_delete_link = (
-        test_session.query(RoleGlobalPermission)
-        .filter_by(
-            role_id=roles["Owner"].id,
-            global_permission_id=SystemPermission.COMPANY_DELETE.permission_id,
-        )
-        .one()
+    RolePermissionRepository(test_session).remove_global_permission(
+        roles["Owner"].id, SystemPermission.COMPANY_DELETE.permission_id
     )
-    test_session.delete(owner_delete_link)
-    test_session.commit()
     with pytest.raises(AppError):
         owner_authorization.require(company.id, SystemPermission.COMPANY_DELETE)
 
@@ -251,3 +255,125 @@ def test_company_authorization_uses_exact_global_permission_identity(test_sessio
             user=_user_model(superuser, is_superuser=True),
         )
     ).require(uuid4(), SystemPermission.COMPANY_DELETE)
+
+
+def test_company_permission_cache_is_invalidated_by_write_paths(test_session):
+    company = Company(
+        name="Cached Authorization Company",
+        email=f"cached-authorization-{uuid4().hex}@example.com",
+    )
+    test_session.add(company)
+    test_session.flush()
+    roles = DefaultRoleCatalogRepository(test_session).reconcile()
+    for role in roles.values():
+        test_session.add(CompanyRole(company_id=company.id, role_id=role.id))
+    owner = _create_user(test_session, "cached-owner")
+    member = _create_user(test_session, "cached-member")
+    test_session.add_all(
+        [
+            AssociationUserCompany(
+                user_id=owner.id, company_id=company.id, role_id=roles["Owner"].id
+            ),
+            AssociationUserCompany(
+                user_id=member.id, company_id=company.id, role_id=roles["Viewer"].id
+            ),
+        ]
+    )
+    EffectivePermissionRepository(test_session).refresh(company_id=company.id)
+    test_session.commit()
+    owner_model, member_model = _user_model(owner), _user_model(member)
+    member_authorization = CompanyAuthorizationService(
+        SharedContext(db_session=test_session, user=member_model)
+    )
+    member_mask = member_authorization.permission_mask(company.id)
+
+    assert member_mask & SystemPermission.COMPANY_READ.bit
+    assert not member_mask & SystemPermission.COMPANY_UPDATE.bit
+    assert COMPANY_PERMISSION_CACHE.get(member.id, company.id) == member_mask
+
+    CompanyUserRepository(test_session).update_user_role(
+        company.id, member.id, "Administrator", owner_model
+    )
+    assert COMPANY_PERMISSION_CACHE.get(member.id, company.id) is None
+    member_authorization.require(company.id, SystemPermission.COMPANY_UPDATE)
+
+    with pytest.raises(AppError):
+        member_authorization.require(company.id, SystemPermission.COMPANY_DELETE)
+    RolePermissionRepository(test_session).assign_global_permission(
+        roles["Administrator"].id, SystemPermission.COMPANY_DELETE.permission_id
+    )
+    member_authorization.require(company.id, SystemPermission.COMPANY_DELETE)
+
+    CompanyUserRepository(test_session).remove_user_from_company(
+        company.id, member.id, owner_model
+    )
+    with pytest.raises(AppError):
+        member_authorization.require(company.id, SystemPermission.COMPANY_READ)
+
+    owner_authorization = CompanyAuthorizationService(
+        SharedContext(db_session=test_session, user=owner_model)
+    )
+    owner_authorization.require(company.id, SystemPermission.COMPANY_READ)
+    custom_role = Role(name=f"Cached Custom {uuid4().hex}", description=None)
+    test_session.add(custom_role)
+    test_session.commit()
+    assignments = CompanyRoleAssignmentRepository(company.id, test_session)
+    assignments.assign_role(custom_role, owner_model)
+    assert COMPANY_PERMISSION_CACHE.get(owner.id, company.id) is None
+
+    owner_authorization.require(company.id, SystemPermission.COMPANY_READ)
+    assignments.unassign_role(custom_role.id)
+    assert COMPANY_PERMISSION_CACHE.get(owner.id, company.id) is None
+
+    owner_authorization.require(company.id, SystemPermission.COMPANY_READ)
+    CompanyRepository(test_session).delete_company(company.id)
+    with pytest.raises(AppError):
+        owner_authorization.require(company.id, SystemPermission.COMPANY_READ)
+
+
+@pytest.mark.parametrize("closed", [Company, CompanyRole, Role])
+def test_closed_companies_and_roles_grant_nothing_without_a_refresh(
+    test_session, closed
+):
+    company = Company(
+        name="Closed Guard Company",
+        email=f"closed-guard-{uuid4().hex}@example.com",
+    )
+    test_session.add(company)
+    test_session.flush()
+    owner_role = DefaultRoleCatalogRepository(test_session).reconcile()["Owner"]
+    owner = _create_user(test_session, "closed-guard-owner")
+    test_session.add_all(
+        [
+            CompanyRole(company_id=company.id, role_id=owner_role.id),
+            AssociationUserCompany(
+                user_id=owner.id, company_id=company.id, role_id=owner_role.id
+            ),
+        ]
+    )
+    EffectivePermissionRepository(test_session).refresh(company_id=company.id)
+    test_session.commit()
+    rows = {
+        Company: company,
+        CompanyRole: test_session.get(CompanyRole, (company.id, owner_role.id)),
+        Role: owner_role,
+    }
+    # Close the row directly, as a write path that forgot to refresh would.
+    rows[closed]._closed_at = datetime.now(timezone.utc)
+    test_session.commit()
+
+    authorization = CompanyAuthorizationService(
+        SharedContext(db_session=test_session, user=_user_model(owner))
+    )
+    assert authorization.permission_mask(company.id) == 0
+    decision = authorization.check_access(
+        AccessCheckRequestModel(
+            checks=[
+                {
+                    "company_id": company.id,
+                    "permission": SystemPermission.COMPANY_READ,
+                }
+            ]
+        )
+    )
+    assert decision.results[0].allowed is False
@@ -0,0 +1,150 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from app.models.company.company import CompanyCreateModel
+from app.models.company.roles import CompanyDefaultRoles
+from app.models.company.user import CompanyUserAddModel
+from app.models.user.user import UserReadModel
+from app.repository.base import after_commit, unit_of_work
+from app.repository.company import CompanyRepository
+from app.repository.company_user import CompanyUserRepository
+from app.repository.database.tables import Company, User
+from app.repository.user import UserRepository
+from app.utils.auth_cache import AUTH_PRINCIPAL_CACHE
+from app.utils.permission_cache import COMPANY_PERMISSION_CACHE
+from app.utils.revocation_list import REVOCATION_LIST
+
+
+@pytest.fixture
+def commits(test_session):
+    committed = []
+
+    def _record(conn):
+        committed.append(conn)
+
+    event.listen(test_session.bind, "commit", _record)
+    yield committed
+    event.remove(test_session.bind, "commit", _record)
+
+
+def test_writes_inside_the_block_share_one_commit(test_session, commits):
+    repository = CompanyRepository(test_session)
+    calls = []
+
+    with repository.transaction():
+        company = repository.create(name="Uow Co", email="uow@example.com")
+        with unit_of_work(test_session):
+            repository.update_json_field(
+                company, column_name="primary_meta_data", key="step", value=1
+            )
+        after_commit(test_session, lambda: calls.append(len(commits)))
+        assert test_session.query(Company).filter_by(email="uow@example.com").one()
+        assert commits == []
+        assert calls == []
+
+    assert len(commits) == 1
+    assert calls == [1]
+    repository.update(company, name="Uow Co Renamed")
+    assert len(commits) == 2
+
+
+def test_errors_roll_back_the_block_and_drop_callbacks(test_session, commits):
+    repository = CompanyRepository(test_session)
+    calls = []
+
+    with pytest.raises(RuntimeError):
+        with repository.transaction():
+            repository.create(name="Gone Co", email="gone@example.com")
+            repository._after_commit(lambda: calls.append("ran"))
+            raise RuntimeError("abort")
+
+    assert commits == []
+    assert calls == []
+    assert test_session.query(Company).filter_by(email="gone@example.com").count() == 0
+    after_commit(test_session, lambda: calls.append("now"))
+    assert calls == ["now"]
+
+
+@pytest.fixture
+def side_effects(monkeypatch):
+    calls = []
+    for cache, name in (
+        (AUTH_PRINCIPAL_CACHE, "invalidate"),
+        (COMPANY_PERMISSION_CACHE, "invalidate"),
+        (REVOCATION_LIST, "add"),
+    ):
+        monkeypatch.setattr(
+            cache, name, lambda *args, name=name: calls.append((name, *args))
+        )
+    return calls
+
+
+def _user(test_session, test_user_data) -> UserReadModel:
+    return UserRepository(test_session).create_user(
+        test_user_data["create_user"] | {"email": f"{uuid4().hex}@example.com"}
+    )
+
+
+def test_user_writes_touch_caches_only_after_the_block_commits(
+    test_session, test_user_data, side_effects
+):
+    repository = UserRepository(test_session)
+    user = _user(test_session, test_user_data)
+    side_effects.clear()
+
+    with pytest.raises(RuntimeError):
+        with repository.transaction():
+            repository.update_user(user.id, {"first_name": "Rolled"})
+            repository.increment_refresh_token_version(user.id)
+            repository.delete_user(user.id)
+            raise RuntimeError("abort")
+
+    assert side_effects == []
+    record = test_session.get(User, user.id)
+    assert (record.first_name, record.refresh_token_version) == (
+        user.first_name,
+        0,
+    )
+    assert record._closed_at is None
+
+    with repository.transaction():
+        version = repository.increment_refresh_token_version(user.id)
+        assert side_effects == []
+    assert side_effects == [("invalidate", user.id), ("add", user.id, version - 1)]
+
+
+def test_membership_writes_touch_the_cache_only_after_the_block_commits(
+    test_session, test_user_data, side_effects
+):
+    owner, member = (_user(test_session, test_user_data) for _ in range(2))
+    suffix = uuid4().hex
+    company = CompanyRepository(test_session).create_company(
+        CompanyCreateModel(name=f"Uow {suffix}", email=f"{suffix}@example.com"),
+        owner,
+    )
+    repository = CompanyUserRepository(test_session)
+    repository.add_user_to_company(
+        company.id, CompanyUserAddModel(email=member.email), owner
+    )
+    side_effects.clear()
+
+    with pytest.raises(RuntimeError):
+        with repository.transaction():
+            repository.update_user_role(
+                company.id,
+                member.id,
+                CompanyDefaultRoles.ADMINISTRATOR.name_value,
+                owner,
+            )
+            repository.remove_user_from_company(company.id, member.id, owner)
+            raise RuntimeError("abort")
+
+    assert side_effects == []
+    assert repository.is_user_linked_to_company(member.id, company.id)
+
+    with repository.transaction():
+        repository.remove_user_from_company(company.id, member.id, owner)
+        assert side_effects == []
+    assert side_effects == [("invalidate", member.id, company.id)]
@@ -0,0 +1,118 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.user.password import PasswordResetMethod
+from app.repository.database.tables import PasswordResetToken
+from app.repository.user import UserRepository
+from app.repository.user_password import (
+    UserPasswordRepository,
+    password_reset_token_hash,
+)
+from app.utils.hash_password import verify_password
+
+
+def _create_user(test_session, test_user_data, email: str):
+    user_data = test_user_data["create_user"] | {"email": email}
+    return UserRepository(test_session).create_user(user_data)
+
+
+def test_reset_tokens_are_stored_hashed_and_replaced(test_session, test_user_data):
+    user = _create_user(test_session, test_user_data, "reset-hash@example.com")
+    repository = UserPasswordRepository(test_session)
+
+    for token in ("first-token", "second-token"):
+        repository.create_password_reset_record(
+            user.email,
+            method=PasswordResetMethod.MAGIC_LINK,
+            token=token,
+            expires_in=timedelta(minutes=5),
+        )
+
+    row = test_session.query(PasswordResetToken).one()
+    assert row.user_id == user.id
+    assert row.token_hash == password_reset_token_hash(
+        PasswordResetMethod.MAGIC_LINK, "second-token"
+    )
+    assert "second-token" not in row.token_hash
+    assert not repository.verify_password_reset_token(
+        user.email, method=PasswordResetMethod.MAGIC_LINK, token="first-token"
+    )
+    assert repository.verify_password_reset_token(
+        user.email, method=PasswordResetMethod.MAGIC_LINK, token="second-token"
+    )
+    assert not repository.verify_password_reset_token(
+        user.email, method=PasswordResetMethod.OTP, token="second-token"
+    )
+
+
+def test_identical_otps_for_different_users_do_not_collide(
+    test_session, test_user_data
+):
+    first = _create_user(test_session, test_user_data, "reset-otp-1@example.com")
+    second = _create_user(test_session, test_user_data, "reset-otp-2@example.com")
+    repository = UserPasswordRepository(test_session)
+
+    for user in (first, second):
+        repository.create_password_reset_record(
+            user.email,
+            method=PasswordResetMethod.OTP,
+            token="A1B2C3",
+            expires_in=timedelta(minutes=5),
+        )
+
+    assert test_session.query(PasswordResetToken).count() == 2
+    assert repository.verify_password_reset_token(
+        second.email, method=PasswordResetMethod.OTP, token="A1B2C3"
+    )
+    assert (
+        UserRepository(test_session).get_user_record_by_password_reset_token(
+            token="A1B2C3", method=PasswordResetMethod.OTP
+        )
+        is None
+    )
+
+
+def test_expired_tokens_are_rejected(test_session, test_user_data):
+    user = _create_user(test_session, test_user_data, "reset-expired@example.com")
+    repository = UserPasswordRepository(test_session)
+    repository.create_password_reset_record(
+        user.email,
+        method=PasswordResetMethod.MAGIC_LINK,
+        token="stale-token",
+        expires_in=timedelta(minutes=5),
+    )
+    row = test_session.query(PasswordResetToken).one()
+    row.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+    test_session.commit()
+
+    assert not repository.verify_password_reset_token(
+        user.email, method=PasswordResetMethod.MAGIC_LINK, token="stale-token"
+    )
+    assert (
+        UserRepository(test_session).get_user_record_by_password_reset_token(
+            token="stale-token", method=PasswordResetMethod.MAGIC_LINK
+        )
+        is None
+    )
+
+
+def test_magic_link_lookup_and_password_update_consume_the_token(
+    test_session, test_user_data
+):
+    user = _create_user(test_session, test_user_data, "reset-consume@example.com")
+    repository = UserPasswordRepository(test_session)
+    repository.create_password_reset_record(
+        user.email,
+        method=PasswordResetMethod.MAGIC_LINK,
+        token="magic-token",
+        expires_in=timedelta(minutes=5),
+    )
+
+    found = UserRepository(test_session).get_user_record_by_password_reset_token(
+        token="magic-token", method=PasswordResetMethod.MAGIC_LINK
+    )
+    assert found.id == user.id
+
+    repository.update_password(user.email, "N3wPassword!")
+
+    assert test_session.query(PasswordResetToken).count() == 0
+    assert verify_password("N3wPassword!", found.password)
@@ -0,0 +1,147 @@
+import time
+from uuid import uuid4
+
+from app.configs import settings
+from app.models.user.user import UserReadModel
+from app.utils.auth_cache import (
+    AUTH_CACHE_HITS,
+    TOKEN_CACHE_HITS,
+    AuthPrincipal,
+    AuthPrincipalCache,
+    VerifiedTokenCache,
+)
+
+KEYRING = object()
+
+
+def _principal(version: int = 0) -> AuthPrincipal:
+    return AuthPrincipal(
+        user=UserReadModel(id=uuid4(), email="cache@example.com", status="Active"),
+        refresh_token_version=version,
+    )
+
+
+def test_get_returns_fresh_principal_for_matching_version():
+    cache = AuthPrincipalCache(max_entries=10, ttl_seconds=60)
+    principal = _principal(version=2)
+    cache.set(principal)
+    hits_before = AUTH_CACHE_HITS._value.get()
+
+    assert cache.get(principal.user.id, refresh_token_version=2) is principal
+    assert principal.status == "Active"
+    assert AUTH_CACHE_HITS._value.get() == hits_before + 1
+
+
+def test_get_drops_entry_on_version_mismatch():
+    cache = AuthPrincipalCache(max_entries=10, ttl_seconds=60)
+    principal = _principal(version=1)
+    cache.set(principal)
+
+    assert cache.get(principal.user.id, refresh_token_version=2) is None
+    assert len(cache) == 0
+
+
+def test_get_drops_expired_entry(monkeypatch):
+    cache = AuthPrincipalCache(max_entries=10, ttl_seconds=5)
+    principal = _principal()
+    monkeypatch.setattr("app.utils.auth_cache.time.monotonic", lambda: 100.0)
+    cache.set(principal)
+    monkeypatch.setattr("app.utils.auth_cache.time.monotonic", lambda: 106.0)
+
+    assert cache.get(principal.user.id, refresh_token_version=0) is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used_entry():
+    cache = AuthPrincipalCache(max_entries=2, ttl_seconds=60)
+    first, second, third = _principal(), _principal(), _principal()
+    cache.set(first)
+    cache.set(second)
+    cache.get(first.user.id, refresh_token_version=0)
+    cache.set(third)
+
+    assert cache.get(second.user.id, refresh_token_version=0) is None
+    assert cache.get(first.user.id, refresh_token_version=0) is first
+    assert cache.get(third.user.id, refresh_token_version=0) is third
+
+
+def test_invalidate_and_clear_remove_entries():
+    cache = AuthPrincipalCache(max_entries=10, ttl_seconds=60)
+    first, second = _principal(), _principal()
+    cache.set(first)
+    cache.set(second)
+
+    cache.invalidate(first.user.id)
+    assert cache.get(first.user.id, refresh_token_version=0) is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_reads_limits_from_settings_and_can_be_disabled(monkeypatch):
+    cache = AuthPrincipalCache()
+    monkeypatch.setattr(settings, "AUTH_CACHE_TTL_SECONDS", 0)
+    monkeypatch.setattr(settings, "AUTH_CACHE_MAX_ENTRIES", 50)
+
+    cache.set(_principal())
+
+    assert cache.ttl_seconds == 0
+    assert cache.max_entries == 50
+    assert not cache.enabled
+    assert len(cache) == 0
+
+
+def test_verified_token_cache_serves_payload_until_ttl(monkeypatch):
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=5)
+    payload = {"sub": "user", "exp": time.time() + 3600}
+    monkeypatch.setattr("app.utils.auth_cache.time.monotonic", lambda: 100.0)
+    cache.set("token", payload, keyring=KEYRING)
+    hits_before = TOKEN_CACHE_HITS._value.get()
+
+    assert cache.get("token", keyring=KEYRING) is payload
+    assert TOKEN_CACHE_HITS._value.get() == hits_before + 1
+
+    monkeypatch.setattr("app.utils.auth_cache.time.monotonic", lambda: 106.0)
+    assert cache.get("token", keyring=KEYRING) is None
+    assert len(cache) == 0
+
+
+def test_verified_token_cache_expires_entries_at_token_exp(monkeypatch):
+    cache = VerifiedTokenCache(max_entries=10, ttl_seconds=300)
+    monkeypatch.setattr("app.utils.auth_cache.time.time", lambda: 1000.0)
+    monkeypatch.setattr("app.utils.auth_cache.time.monotonic", lambda: 50.0)
+    cache.set("short", {"exp": 1010}, keyring=KEYRING)
+    cache.set("expired", {"exp": 1000}, keyring=KEYRING)
+
+    assert len(cache) == 1
+    monkeypatch.setattr("app.utils.auth_cache.time.monotonic", lambda: 61.0)
+    assert cache.get("short", keyring=KEYRING) is None
+
+
+def test_verified_token_cache_clears_on_keyring_change_and_evicts_lru():
+    cache = VerifiedTokenCache(max_entries=2, ttl_seconds=60)
+    cache.set("first", {"n": 1}, keyring=KEYRING)
+    cache.set("second", {"n": 2}, keyring=KEYRING)
+    cache.get("first", keyring=KEYRING)
+    cache.set("third", {"n": 3}, keyring=KEYRING)
+
+    assert cache.get("second", keyring=KEYRING) is None
+    assert cache.get("first", keyring=KEYRING) == {"n": 1}
+    assert cache.get("third", keyring=object()) is None
+    assert len(cache) == 0
+
+    cache.set("first", {"n": 1}, keyring=KEYRING)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_verified_token_cache_reads_limits_from_settings(monkeypatch):
+    cache = VerifiedTokenCache()
+    monkeypatch.setattr(settings, "JWT_DECODE_CACHE_TTL_SECONDS", 0)
+    monkeypatch.setattr(settings, "JWT_DECODE_CACHE_MAX_ENTRIES", 25)
+
+    cache.set("token", {}, keyring=KEYRING)
+
+    assert cache.max_entries == 25
+    assert not cache.enabled
+    assert len(cache) == 0
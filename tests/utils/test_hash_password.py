@@ -3,10 +3,13 @@ import runpy
 
 import pytest
 
+from app.configs import settings
 from app.utils.hash_password import (
     UnknownHashError,
     _is_bcrypt_hash,
+    calibrate_rounds,
     hash_password,
+    needs_rehash,
     verify_password,
 )
 
@@ -19,6 +22,27 @@ def test_hash_password_and_verify_password_round_trip():
     assert verify_password("WrongPass", hashed) is False
 
 
+def test_hash_password_uses_the_configured_cost(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ROUNDS", 5)
+
+    hashed = hash_password("MyS3cret!")
+
+    assert hashed.startswith("$2b$05$")
+    assert needs_rehash(hashed) is False
+    monkeypatch.setattr(settings, "PASSWORD_HASH_ROUNDS", 6)
+    assert needs_rehash(hashed) is True
+    assert needs_rehash("plaintext-password") is True
+    assert needs_rehash(None) is True
+
+
+def test_calibrate_rounds_stops_after_the_first_cost_over_target():
+    assert [rounds for rounds, _ in calibrate_rounds(0)] == [4]
+
+    timings = calibrate_rounds(60_000, max_rounds=5)
+    assert [rounds for rounds, _ in timings] == [4, 5]
+    assert all(elapsed_ms > 0 for _, elapsed_ms in timings)
+
+
 def test_hash_password_rejects_empty_or_non_string_values():
     with pytest.raises(ValueError, match="Password must be a non-empty string"):
         hash_password("")
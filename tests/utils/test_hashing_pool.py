@@ -0,0 +1,100 @@
+import threading
+
+import anyio
+import pytest
+from fastapi import status
+from prometheus_client import REGISTRY
+
+from app.configs import settings
+from app.utils.hashing_pool import (
+    PASSWORD_HASH_QUEUE_DEPTH,
+    PASSWORD_HASH_REJECTIONS,
+    PasswordHashingBusy,
+    PasswordHashingPool,
+)
+
+
+def _sample_count(operation: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "userverse_password_hash_seconds_count", {"operation": operation}
+        )
+        or 0.0
+    )
+
+
+def test_run_returns_result_and_records_latency():
+    pool = PasswordHashingPool(max_workers=2, max_queue=2)
+    before = _sample_count("test")
+
+    try:
+        assert pool.run("test", lambda a, b: a + b, 2, 3) == 5
+    finally:
+        pool.shutdown()
+
+    assert _sample_count("test") == before + 1
+    assert PASSWORD_HASH_QUEUE_DEPTH._value.get() == 0
+
+
+def test_run_propagates_errors_from_the_worker():
+    pool = PasswordHashingPool(max_workers=1, max_queue=0)
+
+    def _fail():
+        raise ValueError("bad salt")
+
+    try:
+        with pytest.raises(ValueError, match="bad salt"):
+            pool.run("test", _fail)
+    finally:
+        pool.shutdown()
+
+
+def test_saturated_pool_rejects_immediately_with_retry_after():
+    pool = PasswordHashingPool(max_workers=1, max_queue=1)
+    started, release = threading.Event(), threading.Event()
+    rejections = PASSWORD_HASH_REJECTIONS._value.get()
+
+    def _block():
+        started.set()
+        release.wait(5)
+        return "hashed"
+
+    async def _run():
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(pool.offload, _block)
+            task_group.start_soon(pool.offload, lambda: "queued")
+            await anyio.to_thread.run_sync(started.wait, 5)
+            await anyio.sleep(0.05)
+            assert PASSWORD_HASH_QUEUE_DEPTH._value.get() == 2
+            try:
+                with pytest.raises(PasswordHashingBusy) as exc_info:
+                    await pool.offload(lambda: None)
+            finally:
+                release.set()
+        return exc_info.value
+
+    try:
+        error = anyio.run(_run)
+    finally:
+        pool.shutdown()
+
+    assert error.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert error.headers == {"Retry-After": "1"}
+    assert PASSWORD_HASH_REJECTIONS._value.get() == rejections + 1
+    assert PASSWORD_HASH_QUEUE_DEPTH._value.get() == 0
+
+
+def test_pool_is_sized_from_settings_and_restarts_after_shutdown(monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 3)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 5)
+    pool = PasswordHashingPool()
+
+    limiter, slots = pool._ensure_started()
+    assert limiter.total_tokens == 3
+    assert slots._value == 8
+
+    pool.shutdown()
+    pool.shutdown()
+    assert anyio.run(pool.offload, lambda: "again") == "again"
+    assert pool._ensure_started()[0] is not limiter
+    pool.shutdown()
@@ -7,6 +7,7 @@ from textwrap import dedent
 from unittest.mock import Mock
 from uuid import uuid4
 
+import anyio
 import pytest
 from pydantic import ValidationError
 
@@ -15,10 +16,14 @@ import app.exceptions as exceptions_module
 import app.main as main_module
 from app.api.routers import roles as global_roles_router
 from app.api.routers.company import roles as company_roles_router
-from app.configs import Settings, _SettingsProxy
+from app.configs import Settings, _SettingsProxy, settings
 import app.repository.database.session_manager as session_manager
 from app.repository.company import CompanyRepository
-from app.repository.company_role import CompanyRoleAssignmentRepository, RoleRepository
+from app.repository.company_role import (
+    CompanyRoleAssignmentRepository,
+    RoleAssignmentProgress,
+    RoleRepository,
+)
 from app.services.company.company import CompanyService
 from app.services.company.role import RoleService
 from app.services.company.user import CompanyUserService
@@ -208,6 +213,65 @@ def test_settings_normalize_server_url_and_cors_lists(monkeypatch):
     assert normalized.CORS_BLOCKED == ["http://two.test"]
 
 
+def test_settings_validates_asymmetric_jwt_keys(monkeypatch):
+    for name in ("TESTING", "JWT_SECRET", "JWT__SECRET"):
+        monkeypatch.delenv(name, raising=False)
+
+    with pytest.raises(ValidationError, match="JWT_PRIVATE_KEYS must define"):
+        Settings(JWT_ALGORITHM="RS256", _env_file=None)
+
+    with pytest.raises(ValidationError, match="JWT_ACTIVE_KEY_ID must name"):
+        Settings(
+            JWT_ALGORITHM="RS256",
+            JWT_PRIVATE_KEYS={"a": "/keys/a.pem"},
+            JWT_ACTIVE_KEY_ID="b",
+            _env_file=None,
+        )
+
+    monkeypatch.setenv("JWT__PRIVATE_KEYS", '{"a": "/keys/a.pem"}')
+    asymmetric_settings = Settings(
+        ENVIRONMENT="production",
+        JWT_ALGORITHM="RS256",
+        _env_file=None,
+    )
+    assert asymmetric_settings.JWT_PRIVATE_KEYS == {"a": "/keys/a.pem"}
+    assert asymmetric_settings.JWT_SECRET == "secret1234"
+
+
+def test_settings_pick_and_validate_password_hash_rounds(monkeypatch):
+    monkeypatch.delenv("PASSWORD_HASH_ROUNDS", raising=False)
+
+    assert Settings(TESTING=False, _env_file=None).PASSWORD_HASH_ROUNDS == 12
+    assert Settings(TESTING=True, _env_file=None).PASSWORD_HASH_ROUNDS == 4
+    assert Settings(PASSWORD_HASH_ROUNDS=10, _env_file=None).PASSWORD_HASH_ROUNDS == 10
+
+    with pytest.raises(ValidationError, match="PASSWORD_HASH_ROUNDS must be between"):
+        Settings(PASSWORD_HASH_ROUNDS=3, _env_file=None)
+
+
+def test_settings_normalize_and_validate_rate_limit_backend(monkeypatch):
+    monkeypatch.delenv("RATE_LIMIT_BACKEND", raising=False)
+
+    assert Settings(_env_file=None).RATE_LIMIT_BACKEND == "memory"
+    assert (
+        Settings(RATE_LIMIT_BACKEND=" SQL ", _env_file=None).RATE_LIMIT_BACKEND == "sql"
+    )
+    with pytest.raises(ValidationError, match="RATE_LIMIT_BACKEND must be one of"):
+        Settings(RATE_LIMIT_BACKEND="redis", _env_file=None)
+
+
+def test_settings_normalize_and_validate_rate_limit_algorithm(monkeypatch):
+    monkeypatch.delenv("RATE_LIMIT_ALGORITHM", raising=False)
+
+    assert Settings(_env_file=None).RATE_LIMIT_ALGORITHM == "sliding_window"
+    assert (
+        Settings(RATE_LIMIT_ALGORITHM=" GCRA ", _env_file=None).RATE_LIMIT_ALGORITHM
+        == "gcra"
+    )
+    with pytest.raises(ValidationError, match="RATE_LIMIT_ALGORITHM must be one of"):
+        Settings(RATE_LIMIT_ALGORITHM="token_bucket", _env_file=None)
+
+
 def test_settings_rejects_default_jwt_secret_outside_safe_environments(monkeypatch):
     monkeypatch.delenv("TESTING", raising=False)
 
@@ -527,7 +591,7 @@ def test_basic_auth_service_does_not_resend_for_active_user(monkeypatch):
     service.send_verification_email.assert_not_called()
 
 
-def test_user_password_repository_handles_missing_user_and_missing_expiry(monkeypatch):
+def test_user_password_repository_handles_missing_user(monkeypatch):
     from app.repository.user_password import UserPasswordRepository
 
     repository = UserPasswordRepository(Mock())
@@ -544,50 +608,6 @@ def test_user_password_repository_handles_missing_user_and_missing_expiry(monkey
         repository._get_user("missing@example.com")
     assert exc_info.value.status_code == 404
 
-    class FakeUser:
-        primary_meta_data = {
-            "password_reset": {
-                "method": PasswordResetMethod.OTP.value,
-                "token": "123456",
-            }
-        }
-
-    monkeypatch.setattr(repository, "_get_user", lambda email: FakeUser())
-    assert (
-        repository.verify_password_reset_token(
-            "user@example.com",
-            method=PasswordResetMethod.OTP,
-            token="123456",
-        )
-        is False
-    )
-
-
-def test_user_password_repository_verifies_unexpired_token(monkeypatch):
-    from app.repository.user_password import UserPasswordRepository
-
-    repository = UserPasswordRepository(Mock())
-    future_expiry = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
-
-    class FakeUser:
-        primary_meta_data = {
-            "password_reset": {
-                "method": PasswordResetMethod.MAGIC_LINK.value,
-                "token": "token123",
-                "expires_at": future_expiry,
-            }
-        }
-
-    monkeypatch.setattr(repository, "_get_user", lambda email: FakeUser())
-    assert (
-        repository.verify_password_reset_token(
-            "user@example.com",
-            method=PasswordResetMethod.MAGIC_LINK,
-            token="token123",
-        )
-        is True
-    )
-
 
 def test_verification_service_rejects_missing_email(monkeypatch):
     monkeypatch.setattr(
@@ -868,7 +888,7 @@ def test_user_repository_get_user_by_email_rehashes_plaintext_password(monkeypat
         primary_meta_data = {"status": UserAccountStatus.ACTIVE.name_value}
 
     fake_user = FakeUser()
-    session = Mock()
+    session = Mock(info={})
     repository = UserRepository(db_session=session)
 
     class FakeQuery:
@@ -902,7 +922,7 @@ def test_user_repository_create_user_handles_unique_constraint_integrity_error(
     from sqlalchemy.exc import IntegrityError
     from app.repository.user import UserRepository
 
-    session = Mock()
+    session = Mock(info={})
     repository = UserRepository(db_session=session)
     monkeypatch.setattr(
         repository,
@@ -976,29 +996,6 @@ def test_user_repository_update_user_status_raises_when_missing(monkeypatch):
     )
 
 
-def test_user_repository_increment_refresh_token_version_raises_when_missing(
-    monkeypatch,
-):
-    from app.repository.user import UserRepository
-
-    repository = UserRepository(db_session=object())
-
-    class FakeQuery:
-        def filter(self, *args, **kwargs):
-            return self
-
-        def first(self):
-            return None
-
-    monkeypatch.setattr(repository, "_active_user_query", lambda: FakeQuery())
-
-    with pytest.raises(AppError) as exc_info:
-        repository.increment_refresh_token_version(uuid4())
-
-    assert exc_info.value.status_code == 404
-    assert exc_info.value.detail["message"] == UserResponseMessages.USER_NOT_FOUND.value
-
-
 def test_user_repository_delete_user_raises_when_missing(monkeypatch):
     from app.repository.user import UserRepository
 
@@ -1590,7 +1587,10 @@ def test_role_service_happy_path_branches(monkeypatch):
     monkeypatch.setattr(
         CompanyRoleAssignmentRepository,
         "assign_role_to_companies",
-        lambda self, role, payload, user: {
+        lambda self, role, payload, user, progress: progress(
+            RoleAssignmentProgress(processed=1, total=1, assigned=1)
+        )
+        or {
             "role_id": str(role.id),
             "company_ids": payload.company_ids,
         },
@@ -1725,7 +1725,7 @@ def test_role_service_update_role_keyword_success(monkeypatch):
 
 
 def test_company_repository_wraps_integrity_error(monkeypatch):
-    repository = CompanyRepository(Mock())
+    repository = CompanyRepository(Mock(info={}))
     repository.db_session.rollback = Mock()
     monkeypatch.setattr(
         repository,
@@ -1853,6 +1853,120 @@ def test_lifespan_logs_startup_and_shutdown(monkeypatch):
     ]
 
 
+def test_lifespan_runs_revocation_sync_in_stateless_mode(monkeypatch):
+    started = []
+
+    class _Synchronizer:
+        async def run(self):
+            started.append(True)
+            await anyio.sleep_forever()
+
+    monkeypatch.setattr(main_module.logger, "info", lambda message: None)
+    monkeypatch.setattr(main_module, "get_engine", lambda: "engine")
+    monkeypatch.setattr(main_module, "RevocationListSynchronizer", _Synchronizer)
+    monkeypatch.setattr(settings, "AUTH_STATELESS_VERIFICATION", True)
+
+    async def _run():
+        async with main_module.lifespan(Mock()):
+            await anyio.sleep(0)
+
+    anyio.run(_run)
+    assert started == [True]
+
+
+def test_lifespan_schedules_the_expired_artifact_purge(monkeypatch):
+    started = []
+
+    class _Purger:
+        async def run(self):
+            started.append(True)
+            await anyio.sleep_forever()
+
+    monkeypatch.setattr(main_module.logger, "info", lambda message: None)
+    monkeypatch.setattr(main_module, "get_engine", lambda: "engine")
+    monkeypatch.setattr(main_module, "ExpiredArtifactPurger", _Purger)
+    monkeypatch.setattr(settings, "PURGE_EXPIRED_INTERVAL_SECONDS", 60)
+
+    async def _run():
+        async with main_module.lifespan(Mock()):
+            await anyio.sleep(0)
+
+    anyio.run(_run)
+    assert started == [True]
+
+
+def test_lifespan_sweeps_idle_keys_for_gcra_limiters(monkeypatch):
+    started = []
+
+    async def _sweeper():
+        started.append(True)
+        await anyio.sleep_forever()
+
+    monkeypatch.setattr(main_module.logger, "info", lambda message: None)
+    monkeypatch.setattr(main_module, "get_engine", lambda: "engine")
+    monkeypatch.setattr(main_module, "run_rate_limit_sweeper", _sweeper)
+    monkeypatch.setattr(settings, "RATE_LIMIT_ALGORITHM", "gcra")
+
+    async def _run():
+        async with main_module.lifespan(Mock()):
+            await anyio.sleep(0)
+
+    anyio.run(_run)
+    assert started == [True]
+
+
+def test_lifespan_runs_the_cache_invalidation_bus(monkeypatch):
+    started = []
+
+    class _Bus:
+        async def run(self):
+            started.append("run")
+            await anyio.sleep_forever()
+
+        async def listen(self):
+            started.append("listen")
+            await anyio.sleep_forever()
+
+    monkeypatch.setattr(main_module.logger, "info", lambda message: None)
+    monkeypatch.setattr(main_module, "get_engine", lambda: "engine")
+    monkeypatch.setattr(main_module, "CacheInvalidationBus", _Bus)
+    monkeypatch.setattr(
+        main_module.DEFAULT_ROLE_CATALOG,
+        "warm",
+        lambda session_factory: started.append("warm"),
+    )
+    monkeypatch.setattr(settings, "TESTING", False)
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_LISTEN", True)
+
+    async def _run():
+        async with main_module.lifespan(Mock()):
+            await anyio.sleep(0)
+
+    anyio.run(_run)
+    assert sorted(started) == ["listen", "run", "warm"]
+
+
+def test_lifespan_starts_when_the_default_role_catalog_fails(monkeypatch):
+    errors = []
+
+    def _warm(session_factory):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(main_module.logger, "info", lambda message: None)
+    monkeypatch.setattr(main_module.logger, "exception", errors.append)
+    monkeypatch.setattr(main_module, "get_engine", lambda: "engine")
+    monkeypatch.setattr(main_module.DEFAULT_ROLE_CATALOG, "warm", _warm)
+    monkeypatch.setattr(settings, "TESTING", False)
+    monkeypatch.setattr(settings, "CACHE_INVALIDATION_POLL_SECONDS", 0)
+
+    async def _run():
+        async with main_module.lifespan(Mock()):
+            await anyio.sleep(0)
+
+    anyio.run(_run)
+    assert errors == ["Failed to reconcile default roles; retrying on use"]
+
+
 def test_main_module_executes_click_entrypoint(monkeypatch):
     called = []
     monkeypatch.setattr(
@@ -0,0 +1,83 @@
+from uuid import uuid4
+
+from app.configs import settings
+from app.models.system_permissions import SystemPermission
+from app.utils.permission_cache import PERMISSION_CACHE_HITS, CompanyPermissionCache
+
+
+def test_get_returns_cached_mask_until_expiry(monkeypatch):
+    cache = CompanyPermissionCache(max_entries=10, ttl_seconds=5)
+    user_id, company_id = uuid4(), uuid4()
+    mask = SystemPermission.COMPANY_READ.bit | SystemPermission.COMPANY_UPDATE.bit
+    monkeypatch.setattr("app.utils.permission_cache.time.monotonic", lambda: 100.0)
+    cache.set(user_id, company_id, mask, generation=cache.generation)
+    hits_before = PERMISSION_CACHE_HITS._value.get()
+
+    assert cache.get(user_id, company_id) == mask
+    assert PERMISSION_CACHE_HITS._value.get() == hits_before + 1
+
+    monkeypatch.setattr("app.utils.permission_cache.time.monotonic", lambda: 106.0)
+    assert cache.get(user_id, company_id) is None
+    assert len(cache) == 0
+
+
+def test_set_skips_masks_loaded_before_an_invalidation():
+    cache = CompanyPermissionCache(max_entries=10, ttl_seconds=60)
+    user_id, company_id = uuid4(), uuid4()
+    generation = cache.generation
+
+    cache.invalidate(uuid4(), uuid4())
+    cache.set(user_id, company_id, 1, generation=generation)
+
+    assert cache.get(user_id, company_id) is None
+
+
+def test_invalidation_scopes():
+    cache = CompanyPermissionCache(max_entries=10, ttl_seconds=60)
+    user_one, user_two = uuid4(), uuid4()
+    company_one, company_two = uuid4(), uuid4()
+    for user_id in (user_one, user_two):
+        for company_id in (company_one, company_two):
+            cache.set(user_id, company_id, 1, generation=cache.generation)
+
+    cache.invalidate(user_one, company_one)
+    assert len(cache) == 3
+    cache.invalidate_company(company_two)
+    assert len(cache) == 1
+    assert cache.get(user_two, company_one) == 1
+    cache.invalidate_companies([company_one, uuid4()])
+    assert len(cache) == 0
+    cache.set(user_one, company_one, 1, generation=cache.generation)
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used_entry():
+    cache = CompanyPermissionCache(max_entries=2, ttl_seconds=60)
+    company_id = uuid4()
+    first, second, third = uuid4(), uuid4(), uuid4()
+    cache.set(first, company_id, 1, generation=cache.generation)
+    cache.set(second, company_id, 2, generation=cache.generation)
+    cache.get(first, company_id)
+    cache.set(third, company_id, 3, generation=cache.generation)
+
+    assert cache.get(first, company_id) == 1
+    assert cache.get(second, company_id) is None
+
+
+def test_limits_default_to_settings_and_zero_ttl_disables(monkeypatch):
+    monkeypatch.setattr(settings, "COMPANY_PERMISSION_CACHE_TTL_SECONDS", 0)
+    monkeypatch.setattr(settings, "COMPANY_PERMISSION_CACHE_MAX_ENTRIES", 7)
+    cache = CompanyPermissionCache()
+
+    assert cache.max_entries == 7
+    assert not cache.enabled
+    cache.set(uuid4(), uuid4(), 1, generation=cache.generation)
+    assert len(cache) == 0
+
+
+def test_permission_bits_are_distinct():
+    bits = [permission.bit for permission in SystemPermission]
+
+    assert len(set(bits)) == len(bits)
+    assert all(bit and bit & (bit - 1) == 0 for bit in bits)
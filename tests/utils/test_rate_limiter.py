@@ -1,12 +1,249 @@
 from collections import deque
 
-from app.utils.rate_limiter import SlidingWindowRateLimiter
+import anyio
+import pytest
+
+from app.configs import settings
+from app.utils import rate_limit_backends
+from app.utils.rate_limit_backends import (
+    MemoryRateLimitBackend,
+    SharedMemoryRateLimitBackend,
+    get_rate_limit_backend,
+)
+from app.utils.rate_limiter import (
+    GCRARateLimiter,
+    PasswordResetRateLimiter,
+    RateLimitExceeded,
+    SlidingWindowRateLimiter,
+    build_rate_limiter,
+    run_rate_limit_sweeper,
+    sweep_idle_rate_limit_keys,
+)
+
+
+@pytest.fixture
+def shared_backend(tmp_path):
+    backend = SharedMemoryRateLimitBackend(
+        str(tmp_path / "limits"), slots=8, capacity=4
+    )
+    yield backend
+    backend.close()
 
 
 def test_prune_removes_empty_key_from_internal_store():
-    limiter = SlidingWindowRateLimiter(limit=1, window_seconds=10)
-    limiter._events["email:test@example.com"] = deque([1.0])
+    backend = MemoryRateLimitBackend()
+    backend._events["ns"]["email:test@example.com"] = deque([1.0])
+
+    backend._prune("ns", "email:test@example.com", window_seconds=10, now=20.0)
+
+    assert "email:test@example.com" not in backend._events["ns"]
+
+
+def test_limiter_raises_with_retry_after_and_namespaces_are_isolated(monkeypatch):
+    backend = MemoryRateLimitBackend()
+    first = SlidingWindowRateLimiter(
+        limit=1, window_seconds=10, namespace="first", backend=backend
+    )
+    second = SlidingWindowRateLimiter(
+        limit=1, window_seconds=10, namespace="second", backend=backend
+    )
+    monkeypatch.setattr("app.utils.rate_limiter.time.time", lambda: 100.0)
+
+    first.hit("key")
+    second.hit("key")
+    monkeypatch.setattr("app.utils.rate_limiter.time.time", lambda: 104.0)
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        first.hit("key")
+
+    assert exc_info.value.retry_after == 6.0
+    first.reset()
+    first.hit("key")
+    with pytest.raises(RateLimitExceeded):
+        second.hit("key")
+
+
+def test_shared_memory_is_shared_between_mappings(shared_backend):
+    other = SharedMemoryRateLimitBackend(shared_backend.path, slots=8, capacity=4)
+    try:
+        assert (
+            shared_backend.hit("ns", "k", limit=2, window_seconds=10, now=1.0) is None
+        )
+        assert other.hit("ns", "k", limit=2, window_seconds=10, now=2.0) is None
+        assert shared_backend.hit("ns", "k", limit=2, window_seconds=10, now=3.0) == 8.0
+        assert other.hit("ns", "k", limit=2, window_seconds=10, now=11.5) is None
+    finally:
+        other.close()
+
+
+def test_shared_memory_reuses_expired_slots_and_evicts_when_full(shared_backend):
+    for index in range(8):
+        assert (
+            shared_backend.hit("ns", f"k{index}", limit=1, window_seconds=10, now=1.0)
+            is None
+        )
+
+    # Every slot is live, so a new key evicts one and starts a fresh window.
+    assert shared_backend.hit("ns", "new", limit=1, window_seconds=10, now=2.0) is None
+    assert shared_backend.hit("ns", "new", limit=1, window_seconds=10, now=3.0) == 9.0
+
+    # Once windows pass, expired slots are reclaimed.
+    assert (
+        shared_backend.hit("ns", "later", limit=1, window_seconds=10, now=50.0) is None
+    )
+
+
+def test_shared_memory_reset_and_capacity(shared_backend):
+    shared_backend.hit("keep", "k", limit=1, window_seconds=10, now=1.0)
+    shared_backend.hit("drop", "k", limit=1, window_seconds=10, now=1.0)
+
+    shared_backend.reset("drop")
+
+    assert shared_backend.hit("drop", "k", limit=1, window_seconds=10, now=2.0) is None
+    assert shared_backend.hit("keep", "k", limit=1, window_seconds=10, now=2.0) == 9.0
+    with pytest.raises(ValueError, match="exceeds the shared-memory capacity"):
+        shared_backend.hit("ns", "k", limit=5, window_seconds=10, now=1.0)
+
+
+def test_shared_memory_reinitializes_a_file_with_another_layout(shared_backend):
+    shared_backend.hit("ns", "k", limit=1, window_seconds=10, now=1.0)
+
+    resized = SharedMemoryRateLimitBackend(shared_backend.path, slots=16, capacity=4)
+    try:
+        assert resized.hit("ns", "k", limit=1, window_seconds=10, now=2.0) is None
+    finally:
+        resized.close()
+    reopened = SharedMemoryRateLimitBackend(shared_backend.path, slots=16, capacity=4)
+    try:
+        assert reopened.hit("ns", "k", limit=1, window_seconds=10, now=3.0) == 9.0
+    finally:
+        reopened.close()
+
+
+def test_backend_is_chosen_from_settings_and_reused(monkeypatch, tmp_path):
+    monkeypatch.setattr(rate_limit_backends, "_BACKENDS", {})
+    monkeypatch.setattr(settings, "RATE_LIMIT_BACKEND", "shared_memory")
+    monkeypatch.setattr(settings, "RATE_LIMIT_SHARED_MEMORY_PATH", None)
+    monkeypatch.setattr(
+        "app.utils.rate_limit_backends.tempfile.gettempdir", lambda: str(tmp_path)
+    )
+    monkeypatch.setattr(settings, "RATE_LIMIT_SHARED_MEMORY_SLOTS", 4)
+
+    backend = get_rate_limit_backend()
+    assert isinstance(backend, SharedMemoryRateLimitBackend)
+    assert backend.slots == 4
+    assert backend.path == str(tmp_path / "userverse-rate-limits")
+    assert get_rate_limit_backend() is backend
+    assert isinstance(get_rate_limit_backend("memory"), MemoryRateLimitBackend)
+    assert SlidingWindowRateLimiter(limit=1, window_seconds=1).backend is backend
+    with pytest.raises(ValueError, match="Unknown rate limit backend"):
+        get_rate_limit_backend("redis")
+    backend.close()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.utils.rate_limiter.time.monotonic", lambda: now[0])
+    return now
+
+
+def test_gcra_allows_a_burst_then_refills_one_hit_per_interval(clock):
+    limiter = GCRARateLimiter(limit=3, window_seconds=30)
+
+    for _ in range(3):
+        limiter.hit("key")
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        limiter.hit("key")
+    assert exc_info.value.retry_after == pytest.approx(10.0)
+
+    clock[0] += 10.0
+    limiter.hit("key")
+    with pytest.raises(RateLimitExceeded):
+        limiter.hit("key")
+    limiter.hit("other")
+    assert len(limiter) == 2
+
+    limiter.reset()
+    assert len(limiter) == 0
+
+
+def test_gcra_sweep_drops_only_idle_keys(clock):
+    limiter = GCRARateLimiter(limit=2, window_seconds=10, stripes=4)
+    limiter.hit("idle")
+    clock[0] += 4.0
+    limiter.hit("busy")
+    limiter.hit("busy")
+
+    clock[0] += 2.0
+    assert limiter.sweep() == 1
+    assert len(limiter) == 1
+    with pytest.raises(RateLimitExceeded):
+        limiter.hit("busy")
+
+
+def test_gcra_evicts_the_least_recently_hit_key_past_the_cap(clock):
+    limiter = GCRARateLimiter(limit=1, window_seconds=60, stripes=1, max_keys=2)
+    limiter.hit("first")
+    limiter.hit("second")
+    with pytest.raises(RateLimitExceeded):
+        limiter.hit("first")
+
+    limiter.hit("third")
+
+    assert len(limiter) == 2
+    limiter.hit("second")
+    with pytest.raises(RateLimitExceeded):
+        limiter.hit("third")
+
+
+def test_gcra_key_cap_defaults_to_settings(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_MAX_KEYS", 8)
+    limiter = GCRARateLimiter(limit=1, window_seconds=60, stripes=4)
+
+    for index in range(20):
+        limiter.hit(f"key-{index}")
+
+    assert len(limiter) <= 8
+
+
+def test_sweep_idle_keys_covers_every_live_gcra_limiter(clock):
+    limiter = GCRARateLimiter(limit=1, window_seconds=1)
+    limiter.hit("key")
+    clock[0] += 2.0
+
+    assert sweep_idle_rate_limit_keys() >= 1
+    assert len(limiter) == 0
+
+
+def test_sweeper_survives_sweep_failures(monkeypatch):
+    calls = []
+
+    def _sweep():
+        calls.append(len(calls))
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return 0
+
+    monkeypatch.setattr(settings, "RATE_LIMIT_SWEEP_SECONDS", 0)
+    monkeypatch.setattr("app.utils.rate_limiter.sweep_idle_rate_limit_keys", _sweep)
+
+    async def _run():
+        with anyio.move_on_after(0.2):
+            await run_rate_limit_sweeper()
+
+    anyio.run(_run)
+    assert len(calls) >= 2
+
 
-    limiter._prune("email:test@example.com", now=20.0)
+def test_build_rate_limiter_follows_the_algorithm_setting(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ALGORITHM", "gcra")
+    assert isinstance(
+        build_rate_limiter(limit=1, window_seconds=1, namespace="ns"),
+        GCRARateLimiter,
+    )
+    assert isinstance(PasswordResetRateLimiter()._per_email, GCRARateLimiter)
 
-    assert "email:test@example.com" not in limiter._events
+    monkeypatch.setattr(settings, "RATE_LIMIT_ALGORITHM", "sliding_window")
+    limiter = build_rate_limiter(limit=1, window_seconds=1, namespace="ns")
+    assert isinstance(limiter, SlidingWindowRateLimiter)
+    assert limiter.namespace == "ns"
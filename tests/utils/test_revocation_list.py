@@ -0,0 +1,99 @@
+from uuid import uuid4
+
+from app.configs import settings
+from app.utils.revocation_list import (
+    BloomFilter,
+    RevocationList,
+    RevocationStatus,
+)
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    members = [uuid4().bytes for _ in range(1000)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(uuid4().bytes in bloom for _ in range(10000))
+    assert false_positives < 300
+    assert bloom.nbytes < 1300
+
+
+def test_empty_bloom_filter_is_still_usable():
+    bloom = BloomFilter(0)
+
+    assert bloom.size == 64
+    assert b"anything" not in bloom
+
+
+def test_lookup_is_unknown_until_the_list_has_synced():
+    revocations = RevocationList(sync_seconds=5, rebuild_seconds=300)
+
+    assert revocations.lookup(uuid4(), 0) is RevocationStatus.UNKNOWN
+
+
+def test_lookup_separates_exact_bloom_and_clear_answers():
+    revocations = RevocationList(sync_seconds=5, rebuild_seconds=300)
+    in_bloom, in_recent = uuid4(), uuid4()
+    revocations.rebuild([(in_bloom, 3)])
+    revocations.merge([(in_recent, 1), (in_recent, 1)])
+
+    assert revocations.lookup(in_recent, 1) is RevocationStatus.REVOKED
+    assert revocations.lookup(in_bloom, 3) is RevocationStatus.UNKNOWN
+    assert revocations.lookup(in_bloom, 4) is RevocationStatus.CLEAR
+    assert revocations.lookup(uuid4(), 0) is RevocationStatus.CLEAR
+
+
+def test_local_revocations_apply_before_the_next_sync():
+    revocations = RevocationList(sync_seconds=5, rebuild_seconds=300)
+    user_id = uuid4()
+    revocations.add(user_id, 1)
+    revocations.rebuild([])
+    assert revocations.lookup(user_id, 1) is RevocationStatus.CLEAR
+
+    revocations.add(user_id, 2)
+
+    assert revocations.lookup(user_id, 2) is RevocationStatus.REVOKED
+
+
+def test_list_goes_stale_after_three_missed_syncs(monkeypatch):
+    revocations = RevocationList(sync_seconds=5, rebuild_seconds=300)
+    monkeypatch.setattr("app.utils.revocation_list.time.monotonic", lambda: 100.0)
+    revocations.rebuild([])
+    monkeypatch.setattr("app.utils.revocation_list.time.monotonic", lambda: 115.0)
+
+    assert revocations.is_fresh
+    monkeypatch.setattr("app.utils.revocation_list.time.monotonic", lambda: 116.0)
+    assert not revocations.is_fresh
+    assert revocations.lookup(uuid4(), 0) is RevocationStatus.UNKNOWN
+
+
+def test_needs_rebuild_on_interval_or_large_recent_set(monkeypatch):
+    revocations = RevocationList(sync_seconds=5, rebuild_seconds=300, max_recent=2)
+    assert revocations.needs_rebuild
+
+    monkeypatch.setattr("app.utils.revocation_list.time.monotonic", lambda: 100.0)
+    revocations.rebuild([])
+    assert not revocations.needs_rebuild
+
+    revocations.merge([(uuid4(), 0), (uuid4(), 0)])
+    assert revocations.needs_rebuild
+
+    revocations.rebuild([])
+    monkeypatch.setattr("app.utils.revocation_list.time.monotonic", lambda: 400.0)
+    assert revocations.needs_rebuild
+
+
+def test_intervals_default_to_settings_and_clear_resets(monkeypatch):
+    monkeypatch.setattr(settings, "AUTH_REVOCATION_SYNC_SECONDS", 7)
+    monkeypatch.setattr(settings, "AUTH_REVOCATION_REBUILD_SECONDS", 70)
+    revocations = RevocationList()
+    revocations.rebuild([(uuid4(), 0)])
+
+    assert revocations.sync_seconds == 7
+    assert revocations.rebuild_seconds == 70
+
+    revocations.clear()
+    assert not revocations.is_fresh
+    assert revocations.needs_rebuild